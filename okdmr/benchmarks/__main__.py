@@ -0,0 +1,6 @@
+import sys
+
+from okdmr.benchmarks.fec_crc_benchmark import FecCrcBenchmark
+
+if __name__ == "__main__":
+    sys.exit(FecCrcBenchmark.main())
@@ -0,0 +1,395 @@
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from argparse import ArgumentDefaultsHelpFormatter, ArgumentParser
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+import bitarray as bitarray_module
+import numpy
+from bitarray import bitarray
+from bitarray.util import ba2int
+
+from okdmr.dmrlib.etsi.crc.crc16 import CRC16
+from okdmr.dmrlib.etsi.crc.crc32 import CRC32
+from okdmr.dmrlib.etsi.crc.crc9 import CRC9
+from okdmr.dmrlib.etsi.fec.bptc_196_96 import BPTC19696
+from okdmr.dmrlib.etsi.fec.golay_20_8_7 import Golay2087
+from okdmr.dmrlib.etsi.fec.quadratic_residue_16_7_6 import QuadraticResidue1676
+from okdmr.dmrlib.etsi.fec.reed_solomon_12_9_4 import ReedSolomon1294
+from okdmr.dmrlib.etsi.fec.trellis import Trellis34
+from okdmr.dmrlib.etsi.fec.vbptc_128_72 import VBPTC12873
+from okdmr.dmrlib.etsi.fec.vbptc_32_11 import VBPTC3211
+from okdmr.dmrlib.etsi.fec.vbptc_68_28 import VBPTC6828
+from okdmr.dmrlib.etsi.layer2.elements.crc_masks import CrcMasks
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """
+    Single benchmarked operation, fed round-robin with pre-generated input vectors
+    """
+
+    name: str
+    operation: Callable[[Any], Any]
+    vectors: List[Any]
+
+
+class FecCrcBenchmark:
+    """
+    Micro-benchmarks of FEC and CRC implementations, with clean and noisy (bit-flipped) vectors generated at fixed seed
+    """
+
+    SEED: int = 102361
+    """numpy random generator seed, keeps vectors identical between runs"""
+    VECTORS: int = 64
+    """number of distinct input vectors per benchmark case"""
+
+    @staticmethod
+    def random_bits(rng: numpy.random.Generator, length: int) -> bitarray:
+        bits: bitarray = bitarray(endian="big")
+        bits.pack(rng.integers(0, 2, size=length, dtype=numpy.uint8).tobytes())
+        return bits
+
+    @staticmethod
+    def random_bytes(rng: numpy.random.Generator, length: int) -> bytes:
+        return rng.integers(0, 256, size=length, dtype=numpy.uint8).tobytes()
+
+    @staticmethod
+    def flip_bits(
+        rng: numpy.random.Generator, bits: bitarray, errors: int = 1
+    ) -> bitarray:
+        """
+        Returns copy of bits with given number of distinct bit positions inverted
+        """
+        noisy: bitarray = bits.copy()
+        for position in rng.choice(len(bits), size=errors, replace=False).tolist():
+            noisy.invert(position)
+        return noisy
+
+    @staticmethod
+    def cases(seed: int = SEED, vectors: int = VECTORS) -> List[BenchmarkCase]:
+        """
+        Builds all benchmark cases, vectors are drawn from single random generator in fixed order
+        :param seed:
+        :param vectors: number of input vectors per case
+        :return:
+        """
+        cases: List[BenchmarkCase] = []
+        rng: numpy.random.Generator = numpy.random.default_rng(seed)
+        flip: Callable = FecCrcBenchmark.flip_bits
+
+        def add(name: str, operation: Callable, clean: List, noisy_errors: int = 0):
+            cases.append(BenchmarkCase(f"{name}/clean", operation, clean))
+            if noisy_errors:
+                cases.append(
+                    BenchmarkCase(
+                        f"{name}/noisy",
+                        operation,
+                        [
+                            flip(rng, vector, noisy_errors)
+                            if isinstance(vector, bitarray)
+                            else vector
+                            for vector in clean
+                        ],
+                    )
+                )
+
+        bptc: List[bitarray] = [
+            BPTC19696.encode(FecCrcBenchmark.random_bits(rng, 96))
+            for _ in range(vectors)
+        ]
+        add("bptc19696.decode", BPTC19696.decode, bptc, noisy_errors=2)
+        cases.append(
+            BenchmarkCase(
+                "bptc19696.encode",
+                BPTC19696.encode,
+                [FecCrcBenchmark.random_bits(rng, 96) for _ in range(vectors)],
+            )
+        )
+
+        trellis_data: List[bytes] = [
+            FecCrcBenchmark.random_bytes(rng, 18) for _ in range(vectors)
+        ]
+        add(
+            "trellis34.decode",
+            Trellis34.decode,
+            [Trellis34.encode(data) for data in trellis_data],
+            noisy_errors=2,
+        )
+        cases.append(BenchmarkCase("trellis34.encode", Trellis34.encode, trellis_data))
+
+        golay: List[bitarray] = [
+            bitarray(
+                Golay2087.generate(FecCrcBenchmark.random_bits(rng, 8)).tolist(),
+                endian="big",
+            )
+            for _ in range(vectors)
+        ]
+        add(
+            "golay2087.correct",
+            lambda bits: Golay2087.correct_int(ba2int(bits)),
+            golay,
+            noisy_errors=3,
+        )
+
+        qr: List[bitarray] = [
+            bitarray(
+                QuadraticResidue1676.generate(
+                    FecCrcBenchmark.random_bits(rng, 7)
+                ).tolist(),
+                endian="big",
+            )
+            for _ in range(vectors)
+        ]
+        add(
+            "qr1676.correct",
+            lambda bits: QuadraticResidue1676.correct_int(ba2int(bits)),
+            qr,
+            noisy_errors=2,
+        )
+
+        rs_mask: bytes = CrcMasks.VoiceLCHeader.value.to_bytes(3, byteorder="big")
+        rs: List[bitarray] = [bitarray(endian="big") for _ in range(vectors)]
+        for bits in rs:
+            bits.frombytes(
+                ReedSolomon1294.generate(FecCrcBenchmark.random_bytes(rng, 9), rs_mask)
+            )
+        add(
+            "rs1294.decode",
+            lambda bits: ReedSolomon1294.decode(bits.tobytes(), rs_mask),
+            rs,
+            noisy_errors=1,
+        )
+
+        for vbptc in (VBPTC12873, VBPTC6828, VBPTC3211):
+            add(
+                f"{vbptc.__name__.lower()}.decode",
+                vbptc.decode,
+                [
+                    vbptc.encode(FecCrcBenchmark.random_bits(rng, vbptc.DATA_BITS))
+                    for _ in range(vectors)
+                ],
+                noisy_errors=1,
+            )
+
+        cases.append(
+            BenchmarkCase(
+                "crc9.calculate",
+                lambda bits: CRC9.calculate(bits, CrcMasks.Rate34DataContinuation),
+                [FecCrcBenchmark.random_bits(rng, 151) for _ in range(vectors)],
+            )
+        )
+        cases.append(
+            BenchmarkCase(
+                "crc16.calculate",
+                lambda data: CRC16.calculate(data, CrcMasks.CSBK),
+                [FecCrcBenchmark.random_bytes(rng, 10) for _ in range(vectors)],
+            )
+        )
+        cases.append(
+            BenchmarkCase(
+                "crc32.calculate",
+                CRC32.calculate,
+                [FecCrcBenchmark.random_bytes(rng, 64) for _ in range(vectors)],
+            )
+        )
+
+        return cases
+
+    @staticmethod
+    def run_case(
+        case: BenchmarkCase, min_time: float = 0.2, repeat: int = 3
+    ) -> Dict[str, float]:
+        """
+        Measures throughput (best of repeated rounds) and peak traced memory of single operation
+        :param case:
+        :param min_time: minimal duration (seconds) of single round
+        :param repeat: number of rounds
+        :return: dict with ops_per_sec and alloc_bytes_per_op (peak memory traced during single operation)
+        """
+        operation: Callable = case.operation
+        vectors: List = case.vectors
+
+        # warm-up, builds lazy tables and caches
+        for vector in vectors:
+            operation(vector)
+
+        # CPython does not expose cumulative allocation counters, peak of traced memory is used instead
+        tracemalloc.start()
+        peaks: List[int] = []
+        for vector in vectors:
+            tracemalloc.reset_peak()
+            start, _ = tracemalloc.get_traced_memory()
+            operation(vector)
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - start)
+        tracemalloc.stop()
+
+        best: float = 0.0
+        for _ in range(repeat):
+            operations: int = 0
+            started: float = time.perf_counter()
+            while True:
+                for vector in vectors:
+                    operation(vector)
+                operations += len(vectors)
+                elapsed: float = time.perf_counter() - started
+                if elapsed >= min_time:
+                    break
+            best = max(best, operations / elapsed)
+
+        return {
+            "ops_per_sec": round(best, 1),
+            "alloc_bytes_per_op": round(sum(peaks) / len(peaks), 1),
+        }
+
+    @staticmethod
+    def run(
+        cases: List[BenchmarkCase],
+        min_time: float = 0.2,
+        repeat: int = 3,
+        only: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Runs benchmark cases and returns results including environment description
+        :param cases:
+        :param min_time:
+        :param repeat:
+        :param only: run only cases which name contains this substring
+        :return:
+        """
+        results: Dict[str, Dict[str, float]] = {}
+        for case in cases:
+            if only and only not in case.name:
+                continue
+            results[case.name] = FecCrcBenchmark.run_case(
+                case, min_time=min_time, repeat=repeat
+            )
+            print(
+                f"{case.name:<32} {results[case.name]['ops_per_sec']:>14,.1f} ops/s "
+                f"{results[case.name]['alloc_bytes_per_op']:>12,.1f} B/op"
+            )
+
+        return {
+            "environment": {
+                "python": platform.python_version(),
+                "implementation": platform.python_implementation(),
+                "machine": platform.machine(),
+                "numpy": numpy.__version__,
+                "bitarray": bitarray_module.__version__,
+            },
+            "results": results,
+        }
+
+    @staticmethod
+    def compare(
+        current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float
+    ) -> List[str]:
+        """
+        Compares throughput of current results against baseline
+        :param current:
+        :param baseline:
+        :param tolerance: allowed relative slowdown, 0.25 means current may be up to 25% slower than baseline
+        :return: list of regression descriptions, empty if there are none
+        """
+        regressions: List[str] = []
+        for name, expected in baseline["results"].items():
+            measured: Optional[Dict[str, float]] = current["results"].get(name)
+            if not measured:
+                continue
+            ratio: float = measured["ops_per_sec"] / expected["ops_per_sec"]
+            print(f"{name:<32} {ratio:>8.2f}x baseline")
+            if ratio < 1 - tolerance:
+                regressions.append(
+                    f"{name}: {measured['ops_per_sec']:,.1f} ops/s is {(1 - ratio) * 100:.1f}% "
+                    f"slower than baseline {expected['ops_per_sec']:,.1f} ops/s"
+                )
+        return regressions
+
+    @staticmethod
+    def main(arguments: Optional[List[str]] = None) -> int:
+        parser = ArgumentParser(
+            description="FEC, CRC and burst processing micro-benchmarks",
+            formatter_class=ArgumentDefaultsHelpFormatter,
+        )
+        parser.add_argument(
+            "--output", type=str, help="Path to save results as JSON", default=None
+        )
+        parser.add_argument(
+            "--baseline",
+            type=str,
+            help="Path to JSON results to compare against",
+            default=None,
+        )
+        parser.add_argument(
+            "--tolerance",
+            type=float,
+            help="Allowed relative slowdown against baseline",
+            default=0.25,
+        )
+        parser.add_argument(
+            "--update-baseline",
+            action="store_true",
+            help="Overwrite baseline with current results instead of comparing, "
+            "with --only just the measured cases are replaced",
+        )
+        parser.add_argument(
+            "--min-time",
+            type=float,
+            help="Minimal duration (seconds) of each measurement round",
+            default=0.2,
+        )
+        parser.add_argument(
+            "--repeat", type=int, help="Number of measurement rounds", default=3
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            help="Seed of input vectors",
+            default=FecCrcBenchmark.SEED,
+        )
+        parser.add_argument(
+            "--only",
+            type=str,
+            help="Run only cases containing this string",
+            default=None,
+        )
+        args = parser.parse_args(arguments)
+
+        # prevent circular dependency
+        from okdmr.benchmarks.transmission_benchmark import TransmissionBenchmark
+
+        results: Dict[str, Any] = FecCrcBenchmark.run(
+            FecCrcBenchmark.cases(seed=args.seed)
+            + TransmissionBenchmark.cases(seed=args.seed),
+            min_time=args.min_time,
+            repeat=args.repeat,
+            only=args.only,
+        )
+
+        if args.output:
+            with open(args.output, "w") as output:
+                json.dump(results, output, indent=2, sort_keys=True)
+
+        if args.baseline and args.update_baseline:
+            if args.only:
+                # keep baseline of cases that were not measured
+                with open(args.baseline, "r") as baseline:
+                    previous: Dict[str, Any] = json.load(baseline)
+                previous["results"].update(results["results"])
+                results["results"] = previous["results"]
+            with open(args.baseline, "w") as output:
+                json.dump(results, output, indent=2, sort_keys=True)
+        elif args.baseline:
+            with open(args.baseline, "r") as baseline:
+                regressions: List[str] = FecCrcBenchmark.compare(
+                    results, json.load(baseline), tolerance=args.tolerance
+                )
+            for regression in regressions:
+                print(f"REGRESSION {regression}", file=sys.stderr)
+            return 1 if regressions else 0
+
+        return 0
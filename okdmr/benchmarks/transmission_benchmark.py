@@ -0,0 +1,215 @@
+from typing import List, Tuple
+
+import numpy
+from bitarray import bitarray
+from bitarray.util import int2ba
+
+from okdmr.benchmarks.fec_crc_benchmark import BenchmarkCase, FecCrcBenchmark
+from okdmr.dmrlib.etsi.fec.quadratic_residue_16_7_6 import QuadraticResidue1676
+from okdmr.dmrlib.etsi.fec.reed_solomon_12_9_4 import ReedSolomon1294
+from okdmr.dmrlib.etsi.layer2.burst import Burst
+from okdmr.dmrlib.etsi.layer2.burst_cache import BurstDecodeCache
+from okdmr.dmrlib.etsi.layer2.elements.burst_types import BurstTypes
+from okdmr.dmrlib.etsi.layer2.elements.crc_masks import CrcMasks
+from okdmr.dmrlib.etsi.layer2.elements.data_packet_formats import DataPacketFormats
+from okdmr.dmrlib.etsi.layer2.elements.data_types import DataTypes
+from okdmr.dmrlib.etsi.layer2.elements.feature_set_ids import FeatureSetIDs
+from okdmr.dmrlib.etsi.layer2.elements.flcos import FLCOs
+from okdmr.dmrlib.etsi.layer2.elements.fragment_sequence_number import (
+    FragmentSequenceNumber,
+)
+from okdmr.dmrlib.etsi.layer2.elements.full_message_flag import FullMessageFlag
+from okdmr.dmrlib.etsi.layer2.elements.lcss import LCSS
+from okdmr.dmrlib.etsi.layer2.elements.sap_identifier import SAPIdentifier
+from okdmr.dmrlib.etsi.layer2.elements.sync_patterns import SyncPatterns
+from okdmr.dmrlib.etsi.layer2.pdu.csbk import CSBK
+from okdmr.dmrlib.etsi.layer2.pdu.data_header import DataHeader
+from okdmr.dmrlib.etsi.layer2.pdu.full_link_control import FullLinkControl
+from okdmr.dmrlib.etsi.layer2.pdu.rate12_data import Rate12Data
+from okdmr.dmrlib.etsi.layer2.pdu.slot_type import SlotType
+from okdmr.dmrlib.etsi.layer3.elements.service_options import ServiceOptions
+from okdmr.dmrlib.transmission.transmission import Transmission
+from okdmr.dmrlib.transmission.transmission_generator import TransmissionGenerator
+
+
+class TransmissionBenchmark:
+    """
+    Throughput (bursts/sec) of burst parsing and transmission state machine, fed with synthetic traffic,
+    voice call (header, superframes, terminator) followed by data transmission (preambles, header, rate 1/2 blocks)
+    """
+
+    COLOUR_CODE: int = 1
+    SOURCE: int = 2308094
+    TARGET: int = 2308092
+
+    @staticmethod
+    def voice_lc_burst(data_type: DataTypes, flc: FullLinkControl) -> bytes:
+        mask: CrcMasks = (
+            CrcMasks.VoiceLCHeader
+            if data_type == DataTypes.VoiceLCHeader
+            else CrcMasks.TerminatorWithLC
+        )
+        flc.crc = bitarray(endian="big")
+        flc.crc.frombytes(
+            ReedSolomon1294.generate(
+                flc.as_bits()[:72].tobytes(), mask.value.to_bytes(3, byteorder="big")
+            )[9:]
+        )
+        burst: Burst = Burst(burst_type=BurstTypes.DataAndControl, lazy=True)
+        burst.has_emb = False
+        burst.sync_or_embedded_signalling = SyncPatterns.BsSourcedData
+        burst.slot_type = SlotType(
+            colour_code=TransmissionBenchmark.COLOUR_CODE, data_type=data_type
+        )
+        burst.data = flc
+        return burst.as_bytes()
+
+    @staticmethod
+    def voice_burst(rng: numpy.random.Generator, index: int) -> bytes:
+        """
+        :param rng:
+        :param index: position in superframe, 0 (burst A, with voice sync) to 5 (burst F)
+        :return: on-air burst with random vocoder payload
+        """
+        voice: bitarray = FecCrcBenchmark.random_bits(rng, 216)
+        if index == 0:
+            center: bitarray = SyncPatterns.BsSourcedVoice.as_bits()
+        else:
+            lcss: LCSS = (
+                LCSS.FirstFragmentLC
+                if index == 1
+                else LCSS.LastFragmentLCorCSBK
+                if index == 4
+                else LCSS.ContinuationFragmentLCorCSBK
+            )
+            emb: bitarray = int2ba(
+                QuadraticResidue1676.CODEWORDS[
+                    (TransmissionBenchmark.COLOUR_CODE << 3) | lcss.value
+                ],
+                length=16,
+            )
+            center: bitarray = emb[:8] + FecCrcBenchmark.random_bits(rng, 32) + emb[8:]
+        return (voice[:108] + center + voice[108:]).tobytes()
+
+    @staticmethod
+    def stream(
+        seed: int = FecCrcBenchmark.SEED, superframes: int = 3, data_octets: int = 48
+    ) -> List[Tuple[bytes, BurstTypes]]:
+        """
+        Builds single voice call and single data transmission
+        :param seed:
+        :param superframes: number of voice superframes (6 bursts each)
+        :param data_octets: length of user data of data transmission
+        :return: list of (burst bytes, burst type)
+        """
+        rng: numpy.random.Generator = numpy.random.default_rng(seed)
+        flc: FullLinkControl = FullLinkControl(
+            protect_flag=0,
+            flco=FLCOs.GroupVoiceChannelUser,
+            fid=FeatureSetIDs.StandardizedFID,
+            crc=bitarray(),
+            service_options=ServiceOptions(),
+            group_address=TransmissionBenchmark.TARGET,
+            source_address=TransmissionBenchmark.SOURCE,
+        )
+        stream: List[Tuple[bytes, BurstTypes]] = [
+            (
+                TransmissionBenchmark.voice_lc_burst(DataTypes.VoiceLCHeader, flc),
+                BurstTypes.DataAndControl,
+            )
+        ]
+        stream += [
+            (TransmissionBenchmark.voice_burst(rng, index), BurstTypes.Vocoder)
+            for _ in range(superframes)
+            for index in range(6)
+        ]
+        stream.append(
+            (
+                TransmissionBenchmark.voice_lc_burst(DataTypes.TerminatorWithLC, flc),
+                BurstTypes.DataAndControl,
+            )
+        )
+
+        userdata: bytes = FecCrcBenchmark.random_bytes(rng, data_octets)
+        _, pad_octet_count = TransmissionGenerator.generate_data_bursts(
+            packet_type=Rate12Data, userdata=userdata, is_confirmed=False
+        )
+        header: DataHeader = DataHeader(
+            dpf=DataPacketFormats.DataPacketUnconfirmed,
+            sap_identifier=SAPIdentifier.IP_PacketData,
+            is_response_requested=False,
+            pad_octet_count=pad_octet_count,
+            llid_destination=TransmissionBenchmark.TARGET,
+            llid_source=TransmissionBenchmark.SOURCE,
+            fragment_sequence_number=FragmentSequenceNumber.SINGLE_UNCONFIRMED_FRAGMENT_VALUE,
+            full_message_flag=FullMessageFlag.FirstTryToCompletePacket,
+        )
+        stream += [
+            (burst.as_bytes(), BurstTypes.DataAndControl)
+            for burst in TransmissionGenerator.generate_full_data_transmission(
+                packet_type=Rate12Data,
+                userdata=userdata,
+                data_header=header,
+                colour_code=TransmissionBenchmark.COLOUR_CODE,
+            )
+        ]
+        return stream
+
+    @staticmethod
+    def cases(seed: int = FecCrcBenchmark.SEED) -> List[BenchmarkCase]:
+        """
+        Each operation consumes single burst, ops/s reported by benchmark are bursts/s
+        :param seed:
+        :return:
+        """
+        stream: List[Tuple[bytes, BurstTypes]] = TransmissionBenchmark.stream(seed)
+        transmission: Transmission = Transmission()
+        cache: BurstDecodeCache = BurstDecodeCache(maxsize=len(stream))
+        decoded: List[Burst] = [Burst.from_bytes(*vector) for vector in stream]
+        buffer: bytearray = bytearray(Burst.BYTES_LENGTH)
+        csbks: List[bitarray] = [
+            burst.info_bits_deinterleaved
+            for burst in decoded
+            if isinstance(burst.data, CSBK)
+        ]
+
+        return [
+            BenchmarkCase(
+                "burst.from_bytes",
+                lambda vector: Burst.from_bytes(*vector),
+                stream,
+            ),
+            BenchmarkCase(
+                "burst.from_bytes/lazy",
+                lambda vector: Burst.from_bytes(*vector, lazy=True),
+                stream,
+            ),
+            BenchmarkCase(
+                # every burst is decoded only once, all other operations are cache hits
+                "burst.from_bytes/cached",
+                lambda vector: cache.get(*vector),
+                stream,
+            ),
+            BenchmarkCase(
+                # re-encodes FEC of every burst, as if its contents were changed
+                "burst.encode",
+                lambda burst: burst.encode(),
+                decoded,
+            ),
+            BenchmarkCase(
+                "burst.write_into/cached",
+                lambda burst: burst.write_into(buffer),
+                decoded,
+            ),
+            BenchmarkCase(
+                # info bits of preamble bursts, operation consumes single CSBK
+                "csbk.from_bits",
+                CSBK.from_bits,
+                csbks,
+            ),
+            BenchmarkCase(
+                "transmission.process_packet",
+                lambda vector: transmission.process_packet(Burst.from_bytes(*vector)),
+                stream,
+            ),
+        ]
@@ -5,8 +5,9 @@ import abc
 import enum
 import functools
 from dataclasses import dataclass
-from typing import Union
+from typing import List, Optional, Union
 
+import numpy
 from bitarray import bitarray
 from bitarray.util import int2ba, ba2int
 
@@ -286,6 +287,191 @@ class BitCrcCalculator:
         return ba2int(self.calculate_checksum(data)) == expected_checksum
 
 
+BYTE_BIT_REVERSAL: bytes = bytes(
+    int(f"{value:08b}"[::-1], 2) for value in range(0, 256)
+)
+"""byte -> same byte with reversed bit order, used to reflect input bytes"""
+
+
+class IntCrcCalculator:
+    """
+    CRC calculator working on Python ints and bytes-like objects instead of bitarray registers
+
+    Whole bytes are processed using 256-entry lookup table, trailing bits (less than 8) are fed bit-by-bit.
+    CRCs narrower than 8 bits (eg. CRC-7) are computed with register aligned to 8 bits, so the same table applies.
+    """
+
+    def __init__(self, configuration: Union[BitCrcConfiguration, enum.Enum]):
+        """
+        :param configuration: used for the crc algorithm, feed_width_bits is ignored
+        """
+        if isinstance(configuration, enum.Enum):
+            configuration = configuration.value
+        assert isinstance(
+            configuration, BitCrcConfiguration
+        ), f"BitCrcConfiguration not provided, got {type(configuration)} instead"
+        self._config: BitCrcConfiguration = configuration
+        self._width: int = configuration.width_bits
+        # register is kept left-aligned to at least 8 bits, alignment is shifted out in digest
+        self._alignment: int = max(8 - self._width, 0)
+        self._register_width: int = self._width + self._alignment
+        self._register_mask: int = (1 << self._register_width) - 1
+        self._topbit_shift: int = self._register_width - 1
+        self._polynomial: int = (
+            configuration.polynomial << self._alignment
+        ) & self._register_mask
+        self._init: int = (
+            configuration.init_value << self._alignment
+        ) & self._register_mask
+        self._final_xor: int = configuration.final_xor_value & ((1 << self._width) - 1)
+        self.table: List[int] = [
+            self._feed_bits(value << (self._register_width - 8), 0, 8)
+            for value in range(0, 256)
+        ]
+        """register after feeding single byte, indexed by (top byte of register) xor (input byte)"""
+        self.table_numpy: numpy.ndarray = numpy.array(self.table, dtype=numpy.uint32)
+        """same as table, used to process batches of blocks"""
+
+    def _feed_bits(self, register: int, value: int, length: int) -> int:
+        """
+        Feeds bits of value (MSB first) into register one at a time
+        :param register: aligned register value
+        :param value: int holding input bits
+        :param length: number of bits in value
+        :return: new aligned register value
+        """
+        for shift in range(length - 1, -1, -1):
+            top: int = ((register >> self._topbit_shift) ^ (value >> shift)) & 1
+            register = (register << 1) & self._register_mask
+            if top:
+                register ^= self._polynomial
+        return register
+
+    def update(
+        self,
+        register: int,
+        data: Union[bytes, bytearray, memoryview],
+        tail: int = 0,
+        tail_bits: int = 0,
+    ) -> int:
+        """
+        Feeds bytes followed by optional trailing bits into aligned register
+        :param register: aligned register value, use init() for fresh register
+        :param data: whole bytes of input
+        :param tail: int holding bits following the data bytes
+        :param tail_bits: number of bits in tail
+        :return: new aligned register value
+        """
+        if self._config.reverse_input_bytes:
+            data = bytes(data).translate(BYTE_BIT_REVERSAL)
+        table: List[int] = self.table
+        shift: int = self._register_width - 8
+        mask: int = self._register_mask
+        for byte in data:
+            register = table[(register >> shift) ^ byte] ^ ((register << 8) & mask)
+        if tail_bits:
+            register = self._feed_bits(register, tail, tail_bits)
+        return register
+
+    def init(self) -> int:
+        """
+        :return: initial (aligned) register value
+        """
+        return self._init
+
+    def digest(self, register: int) -> int:
+        """
+        :param register: aligned register value
+        :return: final crc checksum as int
+        """
+        register >>= self._alignment
+        if self._config.reverse_output_bytes:
+            register = int(f"{register:0{self._width}b}"[::-1], 2)
+        return register ^ self._final_xor
+
+    def calculate_bytes(
+        self,
+        data: Union[bytes, bytearray, memoryview],
+        tail: int = 0,
+        tail_bits: int = 0,
+    ) -> int:
+        """
+        Calculates checksum of data bytes followed by optional trailing bits
+        :param data: whole bytes of input
+        :param tail: int holding bits following the data bytes
+        :param tail_bits: number of bits in tail
+        :return: crc checksum as int
+        """
+        return self.digest(self.update(self._init, data, tail, tail_bits))
+
+    def calculate_checksum(self, data: bitarray) -> int:
+        """
+        Calculates checksum of bits, whole bytes are fed through lookup table, remaining bits one at a time
+        :param data: input bits (big-endian bitarray) of any length
+        :return: crc checksum as int
+        """
+        length: int = len(data)
+        if not length:
+            return self.digest(self._init)
+        value: int = ba2int(data)
+        tail_bits: int = length % 8
+        return self.calculate_bytes(
+            (value >> tail_bits).to_bytes(length // 8, byteorder="big"),
+            value & ((1 << tail_bits) - 1),
+            tail_bits,
+        )
+
+    def verify_checksum(self, data: bitarray, expected_checksum: int) -> bool:
+        return self.calculate_checksum(data) == expected_checksum
+
+    def calculate_many(
+        self,
+        data: numpy.ndarray,
+        tail: Optional[numpy.ndarray] = None,
+        tail_bits: int = 0,
+    ) -> numpy.ndarray:
+        """
+        Calculates checksums of N blocks of equal length at once, processing one byte column of all blocks per step
+        :param data: uint8 array of shape (N, length)
+        :param tail: optional array of N ints holding bits following each block
+        :param tail_bits: number of bits in tail
+        :return: uint32 array of N checksums
+        """
+        assert (
+            data.ndim == 2
+        ), f"Expected 2-dimensional array (N blocks, length), got shape {data.shape}"
+        data = data.astype(numpy.uint8, copy=False)
+        if self._config.reverse_input_bytes:
+            data = numpy.frombuffer(
+                data.tobytes().translate(BYTE_BIT_REVERSAL), dtype=numpy.uint8
+            ).reshape(data.shape)
+        table: numpy.ndarray = self.table_numpy
+        shift: int = self._register_width - 8
+        mask: numpy.uint32 = numpy.uint32(self._register_mask)
+        register: numpy.ndarray = numpy.full(
+            data.shape[0], self._init, dtype=numpy.uint32
+        )
+        for column in data.T:
+            register = table[(register >> shift) ^ column] ^ ((register << 8) & mask)
+
+        if tail_bits:
+            tail = numpy.asarray(tail, dtype=numpy.uint32)
+            polynomial: numpy.uint32 = numpy.uint32(self._polynomial)
+            for bit in range(tail_bits - 1, -1, -1):
+                top: numpy.ndarray = (
+                    (register >> self._topbit_shift) ^ (tail >> bit)
+                ) & 1
+                register = ((register << 1) & mask) ^ (top * polynomial)
+
+        register >>= self._alignment
+        if self._config.reverse_output_bytes:
+            reversed_register: numpy.ndarray = numpy.zeros_like(register)
+            for bit in range(0, self._width):
+                reversed_register |= ((register >> bit) & 1) << (self._width - 1 - bit)
+            register = reversed_register
+        return register ^ numpy.uint32(self._final_xor)
+
+
 @enum.unique
 class Crc7(enum.Enum):
     ETSI_DMR = BitCrcConfiguration(
@@ -1,8 +1,9 @@
-from bitarray.util import ba2int
+from typing import Union
 
-from okdmr.dmrlib.etsi.crc.crc import BitCrcCalculator, Crc16
+import numpy
+
+from okdmr.dmrlib.etsi.crc.crc import Crc16, IntCrcCalculator
 from okdmr.dmrlib.etsi.layer2.elements.crc_masks import CrcMasks
-from okdmr.dmrlib.utils.bits_bytes import bytes_to_bits
 
 
 class CRC16:
@@ -11,9 +12,7 @@ class CRC16:
     Also can be called CRC16-CCIT
     """
 
-    CALC: BitCrcCalculator = BitCrcCalculator(
-        table_based=True, configuration=Crc16.ETSI_DMR
-    )
+    CALC: IntCrcCalculator = IntCrcCalculator(configuration=Crc16.ETSI_DMR)
 
     @staticmethod
     def check(data: bytes, crc16: int, mask: CrcMasks) -> bool:
@@ -31,11 +30,35 @@ class CRC16:
         return CRC16.calculate(data, mask) == crc16
 
     @staticmethod
-    def calculate(data: bytes, mask: CrcMasks) -> int:
+    def calculate(data: Union[bytes, bytearray, memoryview], mask: CrcMasks) -> int:
         """
         Will perform bytes-swap of payload and returns CRC16 as int
         :param data: bytes object of data to be checksumed
         :param mask: crc mask to be applied
         :return: int crc16
         """
-        return ba2int(~CRC16.CALC.calculate_checksum(bytes_to_bits(data))) ^ mask.value
+        return CRC16.CALC.calculate_bytes(data) ^ 0xFFFF ^ mask.value
+
+    @staticmethod
+    def check_many(
+        blocks: numpy.ndarray, masks: Union[CrcMasks, numpy.ndarray]
+    ) -> numpy.ndarray:
+        """
+        Verifies CRC16 of many blocks at once, each block ends with its 16-bit CRC (eg. 12 bytes of CSBK or Data Header)
+        :param blocks: uint8 array of shape (N, length)
+        :param masks: single crc mask for all blocks or array of N mask values
+        :return: bool array of N check results
+        """
+        blocks = numpy.asarray(blocks, dtype=numpy.uint8)
+        assert (
+            blocks.ndim == 2 and blocks.shape[1] > 2
+        ), f"Expected blocks of shape (N, length > 2), got {blocks.shape}"
+        expected: numpy.ndarray = (blocks[:, -2].astype(numpy.uint32) << 8) | blocks[
+            :, -1
+        ]
+        mask: Union[int, numpy.ndarray] = (
+            masks.value
+            if isinstance(masks, CrcMasks)
+            else numpy.asarray(masks, dtype=numpy.uint32)
+        )
+        return (CRC16.CALC.calculate_many(blocks[:, :-2]) ^ 0xFFFF ^ mask) == expected
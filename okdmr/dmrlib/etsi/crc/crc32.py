@@ -1,7 +1,5 @@
-from bitarray.util import ba2int
-
-from okdmr.dmrlib.etsi.crc.crc import BitCrcCalculator, Crc32
-from okdmr.dmrlib.utils.bits_bytes import bytes_to_bits, byteswap_bytes
+from okdmr.dmrlib.etsi.crc.crc import Crc32, IntCrcCalculator
+from okdmr.dmrlib.utils.bits_bytes import byteswap_bytes
 
 
 class CRC32:
@@ -10,9 +8,7 @@ class CRC32:
     No CRC-mask is applied before transmission, no need to check it
     """
 
-    CALC: BitCrcCalculator = BitCrcCalculator(
-        table_based=True, configuration=Crc32.ETSI_DMR
-    )
+    CALC: IntCrcCalculator = IntCrcCalculator(configuration=Crc32.ETSI_DMR)
 
     @staticmethod
     def check(data: bytes, crc32: int) -> bool:
@@ -35,8 +31,4 @@ class CRC32:
         :param data: bytes object of data to be checksumed
         :return: int crc32
         """
-        return ba2int(
-            CRC32.CALC.calculate_checksum(bytes_to_bits(byteswap_bytes(data), "little"))
-        )
-        swi = CRC32.CALC.calculate_checksum(bytes_to_bits(byteswap_bytes(data), "little"))
-        print("CRC 32 IS ", swi)
+        return CRC32.CALC.calculate_bytes(byteswap_bytes(data))
@@ -1,7 +1,6 @@
 from bitarray import bitarray
-from bitarray.util import ba2int
 
-from okdmr.dmrlib.etsi.crc.crc import BitCrcCalculator, Crc8
+from okdmr.dmrlib.etsi.crc.crc import Crc8, IntCrcCalculator
 
 
 class CRC8:
@@ -9,9 +8,7 @@ class CRC8:
     B.3.7 8-bit CRC calculation - ETSI TS 102 361-1 V2.5.1 (2017-10)
     """
 
-    CALC: BitCrcCalculator = BitCrcCalculator(
-        table_based=True, configuration=Crc8.ETSI_DMR
-    )
+    CALC: IntCrcCalculator = IntCrcCalculator(configuration=Crc8.ETSI_DMR)
 
     @staticmethod
     def check(data: bitarray, crc8: int) -> bool:
@@ -34,4 +31,4 @@ class CRC8:
         :param data: bytes object of data to be checksumed
         :return: int crc8
         """
-        return ba2int(CRC8.CALC.calculate_checksum(data))
+        return CRC8.CALC.calculate_checksum(data)
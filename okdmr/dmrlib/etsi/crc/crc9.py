@@ -1,11 +1,10 @@
 from typing import Union
 
+import numpy
 from bitarray import bitarray
-from bitarray.util import int2ba, ba2int
 
-from okdmr.dmrlib.etsi.crc.crc import BitCrcCalculator, Crc9
+from okdmr.dmrlib.etsi.crc.crc import Crc9, IntCrcCalculator
 from okdmr.dmrlib.etsi.layer2.elements.crc_masks import CrcMasks
-from okdmr.dmrlib.utils.bits_bytes import bytes_to_bits
 
 
 class CRC9:
@@ -13,9 +12,12 @@ class CRC9:
     ETSI TS 102 361-1 V2.5.1 (2017-10) - B.3.10 CRC-9 calculation
     """
 
-    CALC: BitCrcCalculator = BitCrcCalculator(
-        table_based=True, configuration=Crc9.ETSI_DMR
+    CALC: IntCrcCalculator = IntCrcCalculator(configuration=Crc9.ETSI_DMR)
+
+    CRC9_BIT_REVERSAL: numpy.ndarray = numpy.array(
+        [int(f"{value:09b}"[::-1], 2) for value in range(0, 512)], dtype=numpy.uint32
     )
+    """9-bit value -> same value with reversed bit order, CRC-9 is transmitted in reversed bit order"""
 
     @staticmethod
     def check(
@@ -32,20 +34,50 @@ class CRC9:
     @staticmethod
     def calculate_from_parts(
         data: bytes, serial_number: int, mask: CrcMasks, crc32: Union[int, bytes] = None
-    ):
-        source_data: bitarray = bytes_to_bits(data, endian="big")
+    ) -> int:
+        register: int = CRC9.CALC.update(CRC9.CALC.init(), data)
 
         if crc32 is not None and crc32 != 0:
             if isinstance(crc32, int):
                 crc32 = crc32.to_bytes(4, byteorder="big")
             assert len(crc32) == 4, "32-bit CRC must be exactly 4-bytes long"
-            source_data += bytes_to_bits(crc32, endian="big")
+            register = CRC9.CALC.update(register, crc32)
 
-        dbsnba = int2ba(serial_number, length=7, endian="big", signed=False)
-        source_data += dbsnba
+        # data block serial number is 7-bit suffix, fed bit-by-bit after the table-driven bytes
+        register = CRC9.CALC.update(register, b"", tail=serial_number, tail_bits=7)
 
-        return CRC9.calculate(data=source_data, mask=mask)
+        return CRC9.CALC.digest(register) ^ 0x1FF ^ mask.value
 
     @staticmethod
     def calculate(data: bitarray, mask: CrcMasks) -> int:
-        return ba2int(~CRC9.CALC.calculate_checksum(data)) ^ mask.value
+        return CRC9.CALC.calculate_checksum(data) ^ 0x1FF ^ mask.value
+
+    @staticmethod
+    def check_many(
+        blocks: numpy.ndarray, masks: Union[CrcMasks, numpy.ndarray]
+    ) -> numpy.ndarray:
+        """
+        Verifies CRC9 of many confirmed data blocks at once (Rate 1/2 12 bytes, Rate 3/4 18 bytes, Rate 1 24 bytes),
+        each block starts with 7-bit data block serial number and 9-bit CRC, followed by user data
+        (and CRC32 in case of last block)
+        :param blocks: uint8 array of shape (N, length)
+        :param masks: single crc mask for all blocks or array of N mask values
+        :return: bool array of N check results
+        """
+        blocks = numpy.asarray(blocks, dtype=numpy.uint8)
+        assert (
+            blocks.ndim == 2 and blocks.shape[1] > 2
+        ), f"Expected blocks of shape (N, length > 2), got {blocks.shape}"
+        serial_numbers: numpy.ndarray = blocks[:, 0] >> 1
+        expected: numpy.ndarray = CRC9.CRC9_BIT_REVERSAL[
+            ((blocks[:, 0].astype(numpy.uint32) & 1) << 8) | blocks[:, 1]
+        ]
+        mask: Union[int, numpy.ndarray] = (
+            masks.value
+            if isinstance(masks, CrcMasks)
+            else numpy.asarray(masks, dtype=numpy.uint32)
+        )
+        calculated: numpy.ndarray = CRC9.CALC.calculate_many(
+            blocks[:, 2:], tail=serial_numbers, tail_bits=7
+        )
+        return (calculated ^ 0x1FF ^ mask) == expected
@@ -3,6 +3,7 @@ from typing import Dict, Tuple
 import numpy
 from bitarray import bitarray
 
+from okdmr.dmrlib.etsi.fec.fec_utils import bits_to_vector, vector_to_bits
 from okdmr.dmrlib.etsi.fec.hamming_13_9_3 import Hamming1393
 from okdmr.dmrlib.etsi.fec.hamming_15_11_3 import Hamming15113
 
@@ -283,6 +284,165 @@ class BPTC19696:
     )
     """Extract only (index -> interleave index) where it's not reserved or hamming bit"""
 
+    FULL_INTERLEAVE_INDICES: numpy.ndarray = numpy.array(
+        list(FULL_INTERLEAVING_MAP.values()), dtype=numpy.intp
+    )
+    """FULL_INTERLEAVING_MAP as index array, position of each deinterleaved bit (0-195) in interleaved bits"""
+    INFO_BITS_INTERLEAVE_INDICES: numpy.ndarray = numpy.array(
+        list(DEINTERLEAVE_INFO_BITS_ONLY_MAP.values()), dtype=numpy.intp
+    )
+    """DEINTERLEAVE_INFO_BITS_ONLY_MAP as index array, position of each info bit (0-95) in on-air bits"""
+    TABLE_INTERLEAVE_INDICES: numpy.ndarray = numpy.array(
+        [v[0] for k, v in INTERLEAVING_INDICES.items() if k > 0], dtype=numpy.intp
+    )
+    """Interleave index of each encoding table cell, row by row (13 rows, 15 columns), R(3) is skipped"""
+    TABLE_INFO_BITS_INDICES: numpy.ndarray = numpy.array(
+        [k - 1 for k, v in INTERLEAVING_INDICES.items() if not v[3] and not v[4]],
+        dtype=numpy.intp,
+    )
+    """Position of each info bit (0-95) in flattened encoding table"""
+    FULL_DEINTERLEAVED_INFO_BITS_INDICES: numpy.ndarray = FULL_INTERLEAVE_INDICES[
+        TABLE_INTERLEAVE_INDICES[TABLE_INFO_BITS_INDICES]
+    ]
+    """Position of each info bit (0-95) in output of deinterleave_all_bits"""
+    ROW_PARITY_CHECK: numpy.ndarray = Hamming15113.PARITY_CHECK_MATRIX.T.astype(
+        numpy.uint8
+    )
+    ROW_ERROR_POSITIONS: numpy.ndarray = Hamming15113.SYNDROME_ERROR_POSITIONS
+    """Row syndrome (Hamming 15,11,3) -> column index of erroneous bit"""
+    COLUMN_PARITY_CHECK: numpy.ndarray = Hamming1393.PARITY_CHECK_MATRIX.T.astype(
+        numpy.uint8
+    )
+    COLUMN_ERROR_POSITIONS: numpy.ndarray = Hamming1393.SYNDROME_ERROR_POSITIONS
+    """Column syndrome (Hamming 13,9,3) -> row index of erroneous bit"""
+    SYNDROME_WEIGHTS: numpy.ndarray = numpy.array([8, 4, 2, 1], dtype=numpy.intp)
+    ROW_PARITY_GENERATOR: numpy.ndarray = Hamming15113.GENERATOR_MATRIX[:, 11:].astype(
+        numpy.uint8
+    )
+    """Row data bits (11) -> row hamming bits (4)"""
+    COLUMN_PARITY_GENERATOR: numpy.ndarray = Hamming1393.GENERATOR_MATRIX[:, 9:].astype(
+        numpy.uint8
+    )
+    """Column data bits (9) -> column hamming bits (4)"""
+
+    @staticmethod
+    def correct_table(table: numpy.ndarray) -> Tuple[int, bool]:
+        """
+        Performs single pass of row (Hamming 15,11,3) and column (Hamming 13,9,3) corrections on 13x15 table
+        in place, using syndrome lookup tables
+        :param table: uint8 encoding table, will be modified
+        :return: (number of corrected bits, is uncorrectable)
+        """
+        positions = BPTC19696.ROW_ERROR_POSITIONS[
+            ((table @ BPTC19696.ROW_PARITY_CHECK) & 1) @ BPTC19696.SYNDROME_WEIGHTS
+        ]
+        rows = numpy.flatnonzero(positions >= 0)
+        table[rows, positions[rows]] ^= 1
+
+        positions = BPTC19696.COLUMN_ERROR_POSITIONS[
+            ((table.T @ BPTC19696.COLUMN_PARITY_CHECK) & 1) @ BPTC19696.SYNDROME_WEIGHTS
+        ]
+        columns = numpy.flatnonzero(positions >= 0)
+        table[positions[columns], columns] ^= 1
+
+        uncorrectable: bool = bool(
+            ((table @ BPTC19696.ROW_PARITY_CHECK) & 1).any()
+            or ((table.T @ BPTC19696.COLUMN_PARITY_CHECK) & 1).any()
+        )
+        return len(rows) + len(columns), uncorrectable
+
+    @staticmethod
+    def decode(bits: bitarray) -> Tuple[bitarray, int, bool]:
+        """
+        Will take BPTC interleaved (and FEC protected) bits, perform Hamming corrections and return 96 bits of data
+        :param bits: 196 bits of on-air payload
+        :return: (96 bits of data (info bits), number of corrected bits, is uncorrectable)
+        """
+        assert (
+            len(bits) == 196
+        ), f"BPTC 196,96 decode requires 196 bits, got {len(bits)}"
+
+        table: numpy.ndarray = bits_to_vector(bits)[
+            BPTC19696.TABLE_INTERLEAVE_INDICES
+        ].reshape(13, 15)
+        corrected, uncorrectable = BPTC19696.correct_table(table)
+
+        return (
+            vector_to_bits(table.ravel()[BPTC19696.TABLE_INFO_BITS_INDICES]),
+            corrected,
+            uncorrectable,
+        )
+
+    @staticmethod
+    def decode_batch(
+        bits: numpy.ndarray,
+    ) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        """
+        Vectorized variant of decode, for N bursts at once
+        :param bits: uint8 array of shape (N, 196), on-air (interleaved) bits, each value 0 or 1
+        :return: (info bits of shape (N, 96), number of corrected bits per burst, is uncorrectable per burst)
+        """
+        assert (
+            bits.ndim == 2 and bits.shape[1] == 196
+        ), f"BPTC 196,96 decode_batch requires array of shape (N, 196), got {bits.shape}"
+        count: int = bits.shape[0]
+        tables: numpy.ndarray = (
+            bits[:, BPTC19696.TABLE_INTERLEAVE_INDICES]
+            .astype(numpy.uint8)
+            .reshape(count, 13, 15)
+        )
+
+        positions = BPTC19696.ROW_ERROR_POSITIONS[
+            ((tables @ BPTC19696.ROW_PARITY_CHECK) & 1) @ BPTC19696.SYNDROME_WEIGHTS
+        ]
+        bursts, rows = numpy.nonzero(positions >= 0)
+        tables[bursts, rows, positions[bursts, rows]] ^= 1
+        corrected: numpy.ndarray = numpy.bincount(bursts, minlength=count)
+
+        transposed: numpy.ndarray = tables.transpose(0, 2, 1)
+        positions = BPTC19696.COLUMN_ERROR_POSITIONS[
+            ((transposed @ BPTC19696.COLUMN_PARITY_CHECK) & 1)
+            @ BPTC19696.SYNDROME_WEIGHTS
+        ]
+        bursts, columns = numpy.nonzero(positions >= 0)
+        tables[bursts, positions[bursts, columns], columns] ^= 1
+        corrected += numpy.bincount(bursts, minlength=count)
+
+        uncorrectable: numpy.ndarray = ((tables @ BPTC19696.ROW_PARITY_CHECK) & 1).any(
+            axis=(1, 2)
+        ) | ((transposed @ BPTC19696.COLUMN_PARITY_CHECK) & 1).any(axis=(1, 2))
+
+        return (
+            tables.reshape(count, 195)[:, BPTC19696.TABLE_INFO_BITS_INDICES],
+            corrected,
+            uncorrectable,
+        )
+
+    @staticmethod
+    def encode_batch(bits: numpy.ndarray) -> numpy.ndarray:
+        """
+        Vectorized variant of encode, for N bursts at once
+        :param bits: uint8 array of shape (N, 96), info bits, each value 0 or 1
+        :return: uint8 array of shape (N, 196), interleaved and FEC protected on-air bits
+        """
+        assert (
+            bits.ndim == 2 and bits.shape[1] == 96
+        ), f"BPTC 196,96 encode_batch requires array of shape (N, 96), got {bits.shape}"
+        count: int = bits.shape[0]
+        tables: numpy.ndarray = numpy.zeros((count, 13, 15), dtype=numpy.uint8)
+        tables.reshape(count, 195)[:, BPTC19696.TABLE_INFO_BITS_INDICES] = bits
+
+        # rows 1-9 hamming, then columns hamming (rows 10-13) computed over the row hamming as well
+        tables[:, :9, 11:] = (tables[:, :9, :11] @ BPTC19696.ROW_PARITY_GENERATOR) & 1
+        tables[:, 9:, :] = (
+            (tables[:, :9, :].transpose(0, 2, 1) @ BPTC19696.COLUMN_PARITY_GENERATOR)
+            & 1
+        ).transpose(0, 2, 1)
+
+        out: numpy.ndarray = numpy.zeros((count, 196), dtype=numpy.uint8)
+        out[:, BPTC19696.TABLE_INTERLEAVE_INDICES] = tables.reshape(count, 195)
+        return out
+
     @staticmethod
     def deinterleave_all_bits(bits: bitarray) -> bitarray:
         """
@@ -293,13 +453,10 @@ class BPTC19696:
         assert (
             len(bits) == 196
         ), f"BPTC 196,96 deinterleave_all_bits requires 196 bits, got {len(bits)}"
-        mapping = BPTC19696.FULL_DEINTERLEAVING_MAP
+        out: numpy.ndarray = numpy.empty(196, dtype=numpy.uint8)
+        out[BPTC19696.FULL_INTERLEAVE_INDICES] = bits_to_vector(bits)
 
-        out = bitarray([0] * len(mapping), endian="big")
-        for i, n in mapping.items():
-            out[i] = bits[n]
-
-        return out
+        return vector_to_bits(out)
 
     @staticmethod
     def deinterleave_data_bits(
@@ -314,16 +471,12 @@ class BPTC19696:
         assert (
             len(bits) == 196
         ), f"BPTC 196,96 decode requires 196 bits, got {len(bits)}"
-        mapping = BPTC19696.DEINTERLEAVE_INFO_BITS_ONLY_MAP
-
         if repair_if_necessary:
-            bits = BPTC19696.repair_if_necessary(bits=bits)
-
-        out = bitarray([0] * len(mapping.keys()), endian="big")
-        for i, n in mapping.items():
-            out[i] = bits[n]
+            return BPTC19696.decode(bits)[0]
 
-        return out
+        return vector_to_bits(
+            bits_to_vector(bits)[BPTC19696.INFO_BITS_INTERLEAVE_INDICES]
+        )
 
     @staticmethod
     def repair_if_necessary(bits: bitarray, deinterleaved: bool = False) -> bitarray:
@@ -339,37 +492,23 @@ class BPTC19696:
             len(bits) == 196
         ), f"BPTC 196,96 can repair only full 196 bits, got {len(bits)}"
 
-        if not deinterleaved:
-            bits = BPTC19696.deinterleave_all_bits(bits)
-
-        table = BPTC19696.make_encoding_table()
-        table = BPTC19696.fill_encoding_table(table, bits)
-
-        for row in range(0, table.shape[0]):
-            table[row] = Hamming15113.correct_numpy_array(table[row])
-            for col in range(0, table.shape[1]):
-                table[:, col] = Hamming1393.correct_numpy_array(table[:, col])
-
-        for data_index, (
-            interleave_index,
-            row,
-            column,
-            is_reserved,
-            is_hamming,
-        ) in BPTC19696.INTERLEAVING_INDICES.items():
-            bits[data_index if deinterleaved else interleave_index] = table[row - 1][
-                column
-            ]
+        # position of each table cell in provided bits, R(3) is not part of table and is kept as-is
+        positions: numpy.ndarray = (
+            numpy.arange(1, 196, dtype=numpy.intp)
+            if deinterleaved
+            else BPTC19696.TABLE_INTERLEAVE_INDICES
+        )
+        out: numpy.ndarray = bits_to_vector(bits).copy()
+        table: numpy.ndarray = out[positions].reshape(13, 15)
+        BPTC19696.correct_table(table)
+        out[positions] = table.ravel()
 
-        return bits
+        return vector_to_bits(out)
 
     @staticmethod
     def make_encoding_table() -> numpy.ndarray:
         # create table 13 rows, 15 columns, for FEC encoding
-        table: numpy.ndarray = numpy.ndarray(shape=(13, 15), dtype=int)
-        table.fill(0)
-
-        return table
+        return numpy.zeros(shape=(13, 15), dtype=numpy.uint8)
 
     @staticmethod
     def fill_encoding_table(
@@ -379,26 +518,15 @@ class BPTC19696:
             len(bits_deinterleaved) == 96 or len(bits_deinterleaved) == 196
         ), f"Can fill encoding table only with data bits (len 96) or full bits (len 196), got {len(bits_deinterleaved)}"
 
-        # make bitarray of size 196, fill with provided bits
-        mapping = (
-            BPTC19696.DEINTERLEAVE_INFO_BITS_ONLY_MAP
-            if len(bits_deinterleaved) == 96
-            else BPTC19696.FULL_DEINTERLEAVING_MAP
-        )
-        bits_interleaved: bitarray = bitarray([0] * 196, endian="big")
-
-        for index, interleave_index in mapping.items():
-            bits_interleaved[interleave_index] = bits_deinterleaved[index]
+        # interleave provided bits into 196 bits, hamming bits are left zero if only data bits are provided
+        bits: numpy.ndarray = bits_to_vector(bits_deinterleaved)
+        if len(bits) == 96:
+            bits_interleaved: numpy.ndarray = numpy.zeros(196, dtype=numpy.uint8)
+            bits_interleaved[BPTC19696.INFO_BITS_INTERLEAVE_INDICES] = bits
+        else:
+            bits_interleaved: numpy.ndarray = bits[BPTC19696.FULL_INTERLEAVE_INDICES]
 
-        for data_index, (
-            interleave_index,
-            rownum,
-            colnum,
-            is_reserved,
-            is_hamming,
-        ) in BPTC19696.INTERLEAVING_INDICES.items():
-            # info_tuple structure: interleave index, row (numbered from 1), column (numbered from 0), is reserved, is hamming
-            table[rownum - 1][colnum] = bits_interleaved[interleave_index]
+        table.flat[:] = bits_interleaved[BPTC19696.TABLE_INTERLEAVE_INDICES]
 
         return table
 
@@ -409,29 +537,11 @@ class BPTC19696:
         :param bits_deinterleaved:
         :return:
         """
-        table: numpy.ndarray = BPTC19696.make_encoding_table()
-        table = BPTC19696.fill_encoding_table(
-            table=table, bits_deinterleaved=bits_deinterleaved
-        )
-
-        # fill rows with hamming
-        for row in range(0, 13):
-            table[row] = Hamming15113.generate(table[row][0:11])
-
-        # fill columns with hamming
-        for column in range(0, 15):
-            table[:, column] = Hamming1393.generate(table[:, column][0:9])
-
-        out: bitarray = bitarray([0] * 196)
-        for index, (
-            interleave_index,
-            row,
-            column,
-            is_reserved,
-            is_hamming,
-        ) in BPTC19696.INTERLEAVING_INDICES.items():
-            if is_reserved:
-                continue
-            out[interleave_index] = table[row - 1][column]
+        assert (
+            len(bits_deinterleaved) == 96 or len(bits_deinterleaved) == 196
+        ), f"BPTC 196,96 encode requires data bits (len 96) or full bits (len 196), got {len(bits_deinterleaved)}"
+        data: numpy.ndarray = bits_to_vector(bits_deinterleaved)
+        if len(data) == 196:
+            data = data[BPTC19696.FULL_DEINTERLEAVED_INFO_BITS_INDICES]
 
-        return out
+        return vector_to_bits(BPTC19696.encode_batch(data.reshape(1, 96))[0])
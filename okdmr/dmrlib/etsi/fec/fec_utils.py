@@ -1,4 +1,71 @@
 import numpy
+from bitarray import bitarray
+
+# Internal bit-vector representation of etsi.fec is unpacked numpy uint8 array of 0/1 values, MSB (first on-air bit)
+# first, which can be indexed by precompiled permutation tables and multiplied with generator/parity-check matrices,
+# bitarray is used only on public API boundary, packed uint8 arrays (8 bits per octet) are used for batch storage
+
+
+def bits_to_vector(bits: bitarray) -> numpy.ndarray:
+    """
+    Converts bitarray to bit-vector, using single C-level unpack
+    :param bits:
+    :return: read-only uint8 array of 0/1 values, same length as bits
+    """
+    return numpy.frombuffer(bits.unpack(), dtype=numpy.uint8)
+
+
+def vector_to_bits(vector: numpy.ndarray) -> bitarray:
+    """
+    Converts bit-vector (any 1-D array of 0/1 values) back to big endian bitarray
+    :param vector:
+    :return:
+    """
+    out: bitarray = bitarray(endian="big")
+    out.pack(numpy.ascontiguousarray(vector, dtype=numpy.uint8).tobytes())
+    return out
+
+
+def int_to_vector(value: int, length: int) -> numpy.ndarray:
+    """
+    Converts non-negative int to bit-vector of given length, MSB first
+    :param value:
+    :param length: number of bits
+    :return: uint8 array of 0/1 values
+    """
+    octets: bytes = value.to_bytes((length + 7) // 8, byteorder="big")
+    return numpy.unpackbits(numpy.frombuffer(octets, dtype=numpy.uint8))[
+        len(octets) * 8 - length :
+    ]
+
+
+def vector_to_int(vector: numpy.ndarray) -> int:
+    """
+    Converts bit-vector to int, first item being MSB
+    :param vector:
+    :return:
+    """
+    pad: int = -len(vector) % 8
+    return int.from_bytes(numpy.packbits(vector).tobytes(), byteorder="big") >> pad
+
+
+def pack_vectors(vectors: numpy.ndarray) -> numpy.ndarray:
+    """
+    Packs bit-vectors (along last axis) into octets, last octet is zero padded
+    :param vectors: uint8 array of shape (..., bits)
+    :return: uint8 array of shape (..., ceil(bits / 8))
+    """
+    return numpy.packbits(vectors, axis=-1)
+
+
+def unpack_vectors(packed: numpy.ndarray, length: int) -> numpy.ndarray:
+    """
+    Reverse of pack_vectors
+    :param packed: uint8 array of shape (..., octets)
+    :param length: number of bits in each vector
+    :return: uint8 array of shape (..., length)
+    """
+    return numpy.unpackbits(packed, axis=-1, count=length)
 
 
 def derive_parity_check_matrix_from_generator(
@@ -17,3 +84,21 @@ def get_syndrome_for_word(
 ) -> numpy.ndarray:
     # @ is matrix multiplication, PEP 0465, https://www.python.org/dev/peps/pep-0465/
     return (codeword @ parity_check_matrix.T) % fieldsize
+
+
+def derive_syndrome_error_positions(
+    parity_check_matrix: numpy.ndarray,
+) -> numpy.ndarray:
+    """
+    Builds lookup table, where index is syndrome (as int, first row of parity check matrix being MSB)
+    and value is index of single erroneous bit, -1 for zero syndrome (no error) and -2 if syndrome
+    does not match any single bit error (uncorrectable)
+    :param parity_check_matrix:
+    :return: table of 2^(n-k) error positions
+    """
+    syndrome_bits: int = parity_check_matrix.shape[0]
+    positions: numpy.ndarray = numpy.full(1 << syndrome_bits, -2, dtype=numpy.intp)
+    positions[0] = -1
+    for index, column in enumerate(parity_check_matrix.T.tolist()):
+        positions[int("".join(map(str, column)), 2)] = index
+    return positions
@@ -1,9 +1,13 @@
+from itertools import combinations
+from typing import List, Optional, Tuple
+
 import numpy
 from bitarray import bitarray
+from bitarray.util import ba2int
 
 from okdmr.dmrlib.etsi.fec.fec_utils import (
     derive_parity_check_matrix_from_generator,
-    get_syndrome_for_word,
+    int_to_vector,
 )
 
 
@@ -31,6 +35,51 @@ class Golay2087:
 
     CORRECT_SYNDROME: numpy.ndarray = numpy.array([0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0])
 
+    CODEWORDS: List[int] = (
+        (numpy.arange(256)[:, None] >> numpy.arange(7, -1, -1) & 1)
+        @ GENERATOR_MATRIX
+        % 2
+        @ (1 << numpy.arange(19, -1, -1))
+    ).tolist()
+    """data byte (int) -> full 20-bit codeword (int)"""
+
+    DECODE_TABLE: Optional[bytes] = None
+    """received 20-bit word (int) -> nearest data byte, built lazily by Golay2087.decode_table()"""
+
+    @staticmethod
+    def decode_table() -> bytes:
+        """
+        Returns (and builds on first use) table mapping every 20-bit word to data byte of codeword within
+        3 bit errors, uncorrectable words map to their own (uncorrected) data bits
+        :return: 2^20 bytes long table
+        """
+        if Golay2087.DECODE_TABLE is None:
+            table: numpy.ndarray = (numpy.arange(1 << 20) >> 12).astype(numpy.uint8)
+            error_patterns: List[int] = [0] + [
+                sum(1 << bit for bit in bits)
+                for weight in range(1, 4)
+                for bits in combinations(range(20), weight)
+            ]
+            table[
+                numpy.array(Golay2087.CODEWORDS)[None, :]
+                ^ numpy.array(error_patterns)[:, None]
+            ] = numpy.arange(256, dtype=numpy.uint8)[None, :]
+            Golay2087.DECODE_TABLE = table.tobytes()
+        return Golay2087.DECODE_TABLE
+
+    @staticmethod
+    def correct_int(codeword: int) -> Tuple[bool, int, int]:
+        """
+        Will check codeword given as int and repair up to 3 bit errors
+        :param codeword: 20-bit int, first bit of codeword being MSB
+        :return: (status where False means it is unrepairable, codeword, number of bit errors (4 means 4 or more))
+        """
+        corrected: int = Golay2087.CODEWORDS[Golay2087.decode_table()[codeword]]
+        errors: int = bin(corrected ^ codeword).count("1")
+        if errors > 3:
+            return False, codeword, 4
+        return True, corrected, errors
+
     @staticmethod
     def check(bits: bitarray) -> bool:
         """
@@ -39,12 +88,8 @@ class Golay2087:
         :return: check result
         """
         assert len(bits) == 20, "Golay (20,8,7) expects exactly 20 bits"
-        return numpy.array_equal(
-            get_syndrome_for_word(
-                numpy.array(bits.tolist()), Golay2087.PARITY_CHECK_MATRIX
-            ),
-            Golay2087.CORRECT_SYNDROME,
-        )
+        codeword: int = ba2int(bits)
+        return Golay2087.CODEWORDS[codeword >> 12] == codeword
 
     @staticmethod
     def generate(bits: bitarray) -> numpy.ndarray:
@@ -56,6 +101,4 @@ class Golay2087:
         assert (
             len(bits) == 8
         ), "Golay (20,8,7) expects 8 bits of data to add 12 bits of parity"
-        return divmod(
-            numpy.dot(Golay2087.GENERATOR_MATRIX.T, numpy.array(bits.tolist())), 2
-        )[1]
+        return int_to_vector(Golay2087.CODEWORDS[ba2int(bits)], 20)
@@ -1,10 +1,13 @@
+from typing import List, Tuple, Union
+
 import numpy
 from bitarray import bitarray
+from bitarray.util import ba2int
 
-from okdmr.dmrlib.etsi.fec.fec_utils import get_syndrome_for_word
-from okdmr.dmrlib.utils.bits_bytes import (
-    numpy_array_to_bitarray,
-    bitarray_to_numpy_array,
+from okdmr.dmrlib.etsi.fec.fec_utils import (
+    derive_syndrome_error_positions,
+    int_to_vector,
+    vector_to_int,
 )
 
 
@@ -16,6 +19,87 @@ class HammingCommon:
     CODE_DIMENSION: int
     MINIMUM_HAMMING_DISTANCE: int
 
+    SYNDROME_ERROR_POSITIONS: numpy.ndarray
+    """syndrome (int) -> index of erroneous bit, -1 for no error, -2 for uncorrectable"""
+    SYNDROME_ERROR_MASKS: List[int]
+    """syndrome (int) -> error mask to be xor-ed with codeword, -1 for uncorrectable"""
+    SYNDROME_HIGH: List[int]
+    """syndrome contribution of codeword bits above lowest 8 bits"""
+    SYNDROME_LOW: List[int]
+    """syndrome contribution of lowest 8 bits of codeword"""
+    CODEWORD_ROWS: List[int]
+    """codeword (int) for each single data bit, first item being MSB of data"""
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Precomputes integer syndrome and correction tables when Hamming code class is defined
+        """
+        super().__init_subclass__(**kwargs)
+        n: int = cls.CODEWORD_LENGTH
+        columns: List[int] = [
+            int("".join(map(str, column)), 2)
+            for column in cls.PARITY_CHECK_MATRIX.T.tolist()
+        ]
+        cls.CODEWORD_ROWS = [
+            int("".join(map(str, row)), 2) for row in cls.GENERATOR_MATRIX.tolist()
+        ]
+
+        def syndrome_of(value: int, offset: int) -> int:
+            # offset is bit position (from LSB) of the lowest bit in value
+            syndrome: int = 0
+            for bit in range(0, value.bit_length()):
+                if (value >> bit) & 1:
+                    syndrome ^= columns[n - 1 - (bit + offset)]
+            return syndrome
+
+        cls.SYNDROME_LOW = [syndrome_of(value, 0) for value in range(0, 256)]
+        cls.SYNDROME_HIGH = [
+            syndrome_of(value, 8) for value in range(0, 1 << max(n - 8, 0))
+        ]
+        cls.SYNDROME_ERROR_POSITIONS = derive_syndrome_error_positions(
+            cls.PARITY_CHECK_MATRIX
+        )
+        cls.SYNDROME_ERROR_MASKS = [
+            -1 if position == -2 else (0 if position == -1 else 1 << (n - 1 - position))
+            for position in cls.SYNDROME_ERROR_POSITIONS.tolist()
+        ]
+
+    @classmethod
+    def syndrome_int(cls, codeword: int) -> int:
+        """
+        Computes syndrome of codeword given as int (first bit of codeword being MSB)
+        :param codeword:
+        :return: syndrome as int, 0 means codeword is valid
+        """
+        return cls.SYNDROME_HIGH[codeword >> 8] ^ cls.SYNDROME_LOW[codeword & 0xFF]
+
+    @classmethod
+    def correct_int(cls, codeword: int) -> Tuple[bool, int, int]:
+        """
+        Will check codeword given as int and repair single bit-flip if necessary
+        :param codeword: int, first bit of codeword being MSB
+        :return: (status where False means it is unrepairable, codeword, number of errors (2 means 2 or more))
+        """
+        mask: int = cls.SYNDROME_ERROR_MASKS[
+            cls.SYNDROME_HIGH[codeword >> 8] ^ cls.SYNDROME_LOW[codeword & 0xFF]
+        ]
+        if mask < 0:
+            return False, codeword, 2
+        return True, codeword ^ mask, 1 if mask else 0
+
+    @classmethod
+    def generate_int(cls, data: int) -> int:
+        """
+        Returns codeword (data with added parity bits) as int
+        :param data: int, first data bit being MSB
+        :return: full codeword
+        """
+        codeword: int = 0
+        for i, row in enumerate(cls.CODEWORD_ROWS):
+            if (data >> (cls.CODE_DIMENSION - 1 - i)) & 1:
+                codeword ^= row
+        return codeword
+
     @classmethod
     def check(cls, bits: bitarray) -> bool:
         """
@@ -26,10 +110,7 @@ class HammingCommon:
         assert (
             len(bits) == cls.CODEWORD_LENGTH
         ), f"Hamming ({cls.CODEWORD_LENGTH},{cls.CODE_DIMENSION},{cls.MINIMUM_HAMMING_DISTANCE}) expects exactly {cls.CODEWORD_LENGTH} bits, got {len(bits)}"
-        return numpy.array_equal(
-            get_syndrome_for_word(numpy.array(bits.tolist()), cls.PARITY_CHECK_MATRIX),
-            cls.CORRECT_SYNDROME,
-        )
+        return cls.syndrome_int(ba2int(bits)) == 0
 
     @classmethod
     def correct_numpy_array(cls, bits: numpy.ndarray) -> numpy.ndarray:
@@ -38,8 +119,14 @@ class HammingCommon:
         :param bits:
         :return:
         """
-        is_correct, correct_bits = cls.check_and_correct(numpy_array_to_bitarray(bits))
-        return bitarray_to_numpy_array(correct_bits) if is_correct else bits
+        position: int = int(
+            cls.SYNDROME_ERROR_POSITIONS[cls.syndrome_int(vector_to_int(bits))]
+        )
+        if position < 0:
+            return bits
+        corrected: numpy.ndarray = bits.copy()
+        corrected[position] ^= 1
+        return corrected
 
     @classmethod
     def check_and_correct(cls, bits: bitarray) -> (bool, bitarray):
@@ -48,24 +135,20 @@ class HammingCommon:
         :param bits:
         :return: (status of returned message where False means it is unrepairable, message)
         """
-        check = cls.check(bits)
+        position: int = int(
+            cls.SYNDROME_ERROR_POSITIONS[cls.syndrome_int(ba2int(bits))]
+        )
 
-        if not check:
-            # if check does not pass, find index of flipped bit, and correct it
-            syndrome = get_syndrome_for_word(
-                numpy.array(bits.tolist()), cls.PARITY_CHECK_MATRIX
-            ).tolist()
-            try:
-                bits.invert(cls.PARITY_CHECK_MATRIX.T.tolist().index(syndrome))
-                check = True
-            except ValueError as e:
-                # ValueError is thrown in case syndrome is not found in parity check result, making the message uncorrectable
-                return False, bits
+        if position == -2:
+            # syndrome is not found in parity check matrix, making the message uncorrectable
+            return False, bits
+        elif position >= 0:
+            bits.invert(position)
 
-        return check, bits
+        return True, bits
 
     @classmethod
-    def generate(cls, bits: bitarray) -> numpy.ndarray:
+    def generate(cls, bits: Union[bitarray, numpy.ndarray]) -> numpy.ndarray:
         """
         Returns codeword with added parity bits
         :param bits:
@@ -74,6 +157,7 @@ class HammingCommon:
         assert (
             len(bits) == cls.CODE_DIMENSION
         ), f"Hamming ({cls.CODEWORD_LENGTH},{cls.CODE_DIMENSION},{cls.MINIMUM_HAMMING_DISTANCE}) expects {cls.CODE_DIMENSION} bits of data to add parity bits, got {len(bits)}"
-        return divmod(numpy.dot(cls.GENERATOR_MATRIX.T, numpy.array(bits.tolist())), 2)[
-            1
-        ]
+        codeword: int = cls.generate_int(
+            ba2int(bits) if isinstance(bits, bitarray) else vector_to_int(bits)
+        )
+        return int_to_vector(codeword, cls.CODEWORD_LENGTH)
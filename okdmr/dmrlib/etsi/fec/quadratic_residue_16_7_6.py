@@ -1,9 +1,13 @@
+from itertools import combinations
+from typing import List, Optional, Tuple
+
 import numpy
 from bitarray import bitarray
+from bitarray.util import ba2int
 
 from okdmr.dmrlib.etsi.fec.fec_utils import (
     derive_parity_check_matrix_from_generator,
-    get_syndrome_for_word,
+    int_to_vector,
 )
 
 
@@ -30,6 +34,53 @@ class QuadraticResidue1676:
 
     CORRECT_SYNDROME: numpy.ndarray = numpy.array([0, 0, 0, 0, 0, 0, 0, 0, 0])
 
+    CODEWORDS: List[int] = (
+        (numpy.arange(128)[:, None] >> numpy.arange(6, -1, -1) & 1)
+        @ GENERATOR_MATRIX
+        % 2
+        @ (1 << numpy.arange(15, -1, -1))
+    ).tolist()
+    """data (7-bit int) -> full 16-bit codeword (int)"""
+
+    DECODE_TABLE: Optional[bytes] = None
+    """received 16-bit word (int) -> nearest 7-bit data, built lazily by QuadraticResidue1676.decode_table()"""
+
+    @staticmethod
+    def decode_table() -> bytes:
+        """
+        Returns (and builds on first use) table mapping every 16-bit word to data of codeword within
+        2 bit errors, uncorrectable words map to their own (uncorrected) data bits
+        :return: 2^16 bytes long table
+        """
+        if QuadraticResidue1676.DECODE_TABLE is None:
+            table: numpy.ndarray = (numpy.arange(1 << 16) >> 9).astype(numpy.uint8)
+            error_patterns: List[int] = [0] + [
+                sum(1 << bit for bit in bits)
+                for weight in range(1, 3)
+                for bits in combinations(range(16), weight)
+            ]
+            table[
+                numpy.array(QuadraticResidue1676.CODEWORDS)[None, :]
+                ^ numpy.array(error_patterns)[:, None]
+            ] = numpy.arange(128, dtype=numpy.uint8)[None, :]
+            QuadraticResidue1676.DECODE_TABLE = table.tobytes()
+        return QuadraticResidue1676.DECODE_TABLE
+
+    @staticmethod
+    def correct_int(codeword: int) -> Tuple[bool, int, int]:
+        """
+        Will check codeword given as int and repair up to 2 bit errors
+        :param codeword: 16-bit int, first bit of codeword being MSB
+        :return: (status where False means it is unrepairable, codeword, number of bit errors (3 means 3 or more))
+        """
+        corrected: int = QuadraticResidue1676.CODEWORDS[
+            QuadraticResidue1676.decode_table()[codeword]
+        ]
+        errors: int = bin(corrected ^ codeword).count("1")
+        if errors > 2:
+            return False, codeword, 3
+        return True, corrected, errors
+
     @staticmethod
     def check(bits: bitarray) -> bool:
         """
@@ -40,12 +91,8 @@ class QuadraticResidue1676:
         assert (
             len(bits) == 16
         ), f"Quadratic Residue (16,7,6) expects exactly 16 bits, got {len(bits)}"
-        return numpy.array_equal(
-            get_syndrome_for_word(
-                numpy.array(bits.tolist()), QuadraticResidue1676.PARITY_CHECK_MATRIX
-            ),
-            QuadraticResidue1676.CORRECT_SYNDROME,
-        )
+        codeword: int = ba2int(bits)
+        return QuadraticResidue1676.CODEWORDS[codeword >> 9] == codeword
 
     @staticmethod
     def generate(bits: bitarray) -> numpy.ndarray:
@@ -57,9 +104,4 @@ class QuadraticResidue1676:
         assert (
             len(bits) == 7
         ), f"Quadratic Residue (16,7,6) expects 7 bits of data to add 9 bits of parity, got {len(bits)}"
-        return divmod(
-            numpy.dot(
-                QuadraticResidue1676.GENERATOR_MATRIX.T, numpy.array(bits.tolist())
-            ),
-            2,
-        )[1]
+        return int_to_vector(QuadraticResidue1676.CODEWORDS[ba2int(bits)], 16)
@@ -1,3 +1,8 @@
+from typing import List, Optional, Tuple
+
+import numpy
+
+
 class ReedSolomon1294:
     """
     ETSI TS 102 361-1 V2.5.1 (2017-10) - B.3.6  Reed-Solomon (12,9)
@@ -62,6 +67,25 @@ class ReedSolomon1294:
 
     # fmt:on
 
+    MULTIPLICATION_TABLE_NUMPY: numpy.ndarray = numpy.array(
+        EXPONENTIAL_TABLE, dtype=numpy.uint8
+    )[numpy.add.outer(LOG_TABLE, LOG_TABLE)] * (
+        numpy.arange(256)[:, None] * numpy.arange(256)[None, :] > 0
+    ).astype(
+        numpy.uint8
+    )
+    """GF(256) product of a and b, indexed [a, b]"""
+    MULTIPLICATION_TABLE: List[bytes] = [
+        row.tobytes() for row in MULTIPLICATION_TABLE_NUMPY
+    ]
+    """GF(256) product of a and b, indexed [a][b]"""
+    PARITY_SYMBOLS: int = 3
+    """number of parity symbols, syndromes are evaluated at roots alpha^1 .. alpha^3"""
+    SYNDROME_POWERS: numpy.ndarray = numpy.array(EXPONENTIAL_TABLE, dtype=numpy.intp)[
+        (numpy.arange(1, 4)[:, None] * numpy.arange(11, -1, -1)[None, :]) % 255
+    ]
+    """alpha^(j * (11 - i)) for syndrome j (1-3) and byte i (0-11)"""
+
     @staticmethod
     def log_multiply(a: int, b: int) -> int:
         if a == 0 or b == 0:
@@ -70,6 +94,15 @@ class ReedSolomon1294:
             ReedSolomon1294.LOG_TABLE[a] + ReedSolomon1294.LOG_TABLE[b]
         ]
 
+    @staticmethod
+    def divide(a: int, b: int) -> int:
+        assert b != 0, "Division by zero in GF(256)"
+        if a == 0:
+            return 0
+        return ReedSolomon1294.EXPONENTIAL_TABLE[
+            (ReedSolomon1294.LOG_TABLE[a] - ReedSolomon1294.LOG_TABLE[b]) % 255
+        ]
+
     @staticmethod
     def xor_bytes(data: bytes, mask: bytes) -> bytes:
         return bytes(a ^ b for a, b in zip(data, mask))
@@ -99,16 +132,187 @@ class ReedSolomon1294:
         assert (
             len(data) == 9
         ), f"Reed-Solomon (12,9,4) expects 9 bytes of data to add 3 bytes of parity, got {len(data)}"
-        parity = [0x00, 0x00, 0x00]
-        for i in range(len(data)):
-            single: int = data[i] ^ parity[2]
-            parity[2] = parity[1] ^ ReedSolomon1294.log_multiply(
-                ReedSolomon1294.POLYNOMIAL[2], single
-            )
-            parity[1] = parity[0] ^ ReedSolomon1294.log_multiply(
-                ReedSolomon1294.POLYNOMIAL[1], single
-            )
-            parity[0] = ReedSolomon1294.log_multiply(
-                ReedSolomon1294.POLYNOMIAL[0], single
+        multiply_p0: bytes = ReedSolomon1294.MULTIPLICATION_TABLE[
+            ReedSolomon1294.POLYNOMIAL[0]
+        ]
+        multiply_p1: bytes = ReedSolomon1294.MULTIPLICATION_TABLE[
+            ReedSolomon1294.POLYNOMIAL[1]
+        ]
+        multiply_p2: bytes = ReedSolomon1294.MULTIPLICATION_TABLE[
+            ReedSolomon1294.POLYNOMIAL[2]
+        ]
+        parity0: int = 0
+        parity1: int = 0
+        parity2: int = 0
+        for byte in data:
+            single: int = byte ^ parity2
+            parity2 = parity1 ^ multiply_p2[single]
+            parity1 = parity0 ^ multiply_p1[single]
+            parity0 = multiply_p0[single]
+        return data[:9] + bytes(
+            (parity2 ^ mask[0], parity1 ^ mask[1], parity0 ^ mask[2])
+        )
+
+    @staticmethod
+    def syndromes(data: bytes, mask: bytes = b"\x00\x00\x00") -> List[int]:
+        """
+        Computes syndromes S1, S2 and S3 of received block, all zero means block is valid
+        :param data: 12 bytes (9 data + 3 masked parity)
+        :param mask:
+        :return: list of 3 syndromes
+        """
+        assert (
+            len(data) == 12
+        ), f"Reed-Solomon (12,9,4) expects exactly 12 bytes, got {len(data)}"
+        syndromes: List[int] = []
+        for root in ReedSolomon1294.EXPONENTIAL_TABLE[1 : 1 + 3]:
+            multiply_root: bytes = ReedSolomon1294.MULTIPLICATION_TABLE[root]
+            syndrome: int = 0
+            for byte in data[:9]:
+                syndrome = multiply_root[syndrome] ^ byte
+            for byte, mask_byte in zip(data[9:], mask):
+                syndrome = multiply_root[syndrome] ^ byte ^ mask_byte
+            syndromes.append(syndrome)
+        return syndromes
+
+    @staticmethod
+    def decode(
+        data: bytes, mask: bytes = b"\x00\x00\x00", erasures: Optional[List[int]] = None
+    ) -> Tuple[bool, bytes, int]:
+        """
+        Corrects e symbol errors and f erasures as long as 2e + f <= 3, eg. one error, three erasures or one error
+        and one erasure (Berlekamp-Massey, Chien search, Forney algorithm)
+        :param data: 12 bytes (9 data + 3 masked parity)
+        :param mask:
+        :param erasures: indexes (0-11) of bytes known to be unreliable
+        :return: (status where False means it is unrepairable, 12 bytes repaired, number of repaired bytes)
+        """
+        syndromes: List[int] = ReedSolomon1294.syndromes(data, mask)
+        if not any(syndromes):
+            return True, data, 0
+
+        exp: tuple = ReedSolomon1294.EXPONENTIAL_TABLE
+        mul: List[bytes] = ReedSolomon1294.MULTIPLICATION_TABLE
+        nsym: int = ReedSolomon1294.PARITY_SYMBOLS
+        erasures = erasures or []
+        if len(erasures) > nsym:
+            return False, data, 0
+
+        # erasure locator, polynomials are stored lowest degree first, byte i has locator alpha^(11-i)
+        locator: List[int] = [1]
+        for position in erasures:
+            root: int = exp[11 - position]
+            locator = [
+                coefficient ^ (mul[root][locator[i - 1]] if i > 0 else 0)
+                for i, coefficient in enumerate(locator + [0])
+            ]
+
+        # Berlekamp-Massey, initialized with erasure locator
+        previous: List[int] = list(locator)
+        errors: int = len(erasures)
+        shift: int = 1
+        previous_discrepancy: int = 1
+        for n in range(len(erasures), nsym):
+            discrepancy: int = syndromes[n]
+            for i in range(1, min(errors, n) + 1):
+                if i < len(locator):
+                    discrepancy ^= mul[locator[i]][syndromes[n - i]]
+            if discrepancy == 0:
+                shift += 1
+                continue
+            scale: int = ReedSolomon1294.divide(discrepancy, previous_discrepancy)
+            updated: List[int] = locator + [0] * max(
+                0, len(previous) + shift - len(locator)
             )
-        return data[:9] + ReedSolomon1294.xor_bytes(bytes(parity[::-1]), mask)
+            for i, coefficient in enumerate(previous):
+                updated[i + shift] ^= mul[scale][coefficient]
+            if 2 * errors <= n + len(erasures):
+                previous, errors = locator, n + 1 + len(erasures) - errors
+                previous_discrepancy, shift = discrepancy, 1
+            else:
+                shift += 1
+            locator = updated
+
+        while len(locator) > 1 and locator[-1] == 0:
+            locator.pop()
+        if 2 * (len(locator) - 1) - len(erasures) > nsym:
+            return False, data, 0
+
+        # Chien search, locator roots are inverses of error locations
+        positions: List[int] = []
+        for position in range(0, 12):
+            inverse: int = exp[(255 - (11 - position)) % 255]
+            value: int = 0
+            for coefficient in reversed(locator):
+                value = mul[value][inverse] ^ coefficient
+            if value == 0:
+                positions.append(position)
+        if len(positions) != len(locator) - 1:
+            return False, data, 0
+
+        # Forney algorithm, evaluator = syndromes * locator mod x^nsym
+        evaluator: List[int] = [0] * nsym
+        for i, coefficient in enumerate(locator[:nsym]):
+            for j in range(0, nsym - i):
+                evaluator[i + j] ^= mul[coefficient][syndromes[j]]
+        corrected: bytearray = bytearray(data)
+        for position in positions:
+            inverse: int = exp[(255 - (11 - position)) % 255]
+            numerator: int = 0
+            for coefficient in reversed(evaluator):
+                numerator = mul[numerator][inverse] ^ coefficient
+            denominator: int = 0
+            for i in range(len(locator) - 1 - ((len(locator) - 1) % 2 == 0), 0, -2):
+                denominator = mul[mul[denominator][inverse]][inverse] ^ locator[i]
+            if denominator == 0:
+                return False, data, 0
+            corrected[position] ^= ReedSolomon1294.divide(numerator, denominator)
+
+        if any(ReedSolomon1294.syndromes(bytes(corrected), mask)):
+            return False, data, 0
+        return (
+            True,
+            bytes(corrected),
+            sum(1 for a, b in zip(corrected, data) if a != b),
+        )
+
+    @staticmethod
+    def decode_batch(
+        blocks: numpy.ndarray, mask: bytes = b"\x00\x00\x00"
+    ) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        """
+        Corrects up to one symbol error in each of N blocks at once
+        :param blocks: uint8 array of shape (N, 12), each row 9 data bytes + 3 masked parity bytes
+        :param mask:
+        :return: (repaired blocks (N, 12), status (N,) where False means unrepairable, number of repaired bytes (N,))
+        """
+        assert (
+            blocks.ndim == 2 and blocks.shape[1] == 12
+        ), f"Reed-Solomon (12,9,4) batch expects array of shape (N, 12), got {blocks.shape}"
+        exp: numpy.ndarray = numpy.array(
+            ReedSolomon1294.EXPONENTIAL_TABLE, dtype=numpy.intp
+        )
+        log: numpy.ndarray = numpy.array(ReedSolomon1294.LOG_TABLE, dtype=numpy.intp)
+        mul: numpy.ndarray = ReedSolomon1294.MULTIPLICATION_TABLE_NUMPY
+
+        codewords: numpy.ndarray = blocks.astype(numpy.intp)
+        codewords[:, 9:] ^= numpy.frombuffer(mask, dtype=numpy.uint8)
+        s1, s2, s3 = numpy.bitwise_xor.reduce(
+            mul[codewords[None, :, :], ReedSolomon1294.SYNDROME_POWERS[:, None, :]],
+            axis=2,
+        ).astype(numpy.intp)
+
+        valid: numpy.ndarray = (s1 | s2 | s3) == 0
+        # single error of value e at locator X gives S1 = e*X, S2 = e*X^2, S3 = e*X^3
+        degree: numpy.ndarray = (log[s2] - log[s1]) % 255
+        locator: numpy.ndarray = exp[degree]
+        single: numpy.ndarray = (
+            (s1 != 0) & (s2 != 0) & (degree < 12) & (mul[s2, locator] == s3)
+        )
+        rows: numpy.ndarray = numpy.nonzero(single)[0]
+        repaired: numpy.ndarray = blocks.copy()
+        repaired[rows, 11 - degree[rows]] ^= exp[
+            (log[s1[rows]] - degree[rows]) % 255
+        ].astype(numpy.uint8)
+
+        return repaired, valid | single, single.astype(numpy.intp)
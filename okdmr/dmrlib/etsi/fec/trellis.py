@@ -1,8 +1,24 @@
 from array import array
 from typing import Union, List, Dict, Tuple
 
+import numpy
 from bitarray import bitarray
-from bitarray.util import ba2int
+from bitarray.util import ba2int, int2ba
+
+from okdmr.dmrlib.etsi.fec.fec_utils import bits_to_vector
+
+
+def derive_nibble_tribits(transition_nibbles: List[int]) -> List[List[int]]:
+    """
+    Inverts encoder transitions, so received nibble can be decoded to tribit by single lookup
+    :param transition_nibbles: (state * 8 + tribit) -> 4 on-air bits of resulting constellation point
+    :return: (state, nibble) -> tribit, -1 if nibble is not valid transition from given state
+    """
+    table: numpy.ndarray = numpy.full((8, 16), -1)
+    table[numpy.repeat(numpy.arange(8), 8), transition_nibbles] = numpy.tile(
+        numpy.arange(8), 8
+    )
+    return table.tolist()
 
 
 class Trellis34:
@@ -59,8 +75,65 @@ class Trellis34:
     TRELLIS34_CONSTELLATION_POINTS_REVERSE: Dict[int, Tuple[int, int]] = dict(
         (v, k) for k, v in TRELLIS34_CONSTELLATION_POINTS.items())
 
+    TRELLIS34_POINT_NIBBLES: numpy.ndarray = numpy.array([
+        0b0010, 0b1010, 0b0111, 0b1111, 0b1110, 0b0110, 0b1011, 0b0011,
+        0b1101, 0b0101, 0b1000, 0b0000, 0b0001, 0b1001, 0b0100, 0b1100,
+    ], dtype=numpy.intp)
+    """Constellation point (index) -> 4 on-air bits of its two dibits"""
+
     # fmt: on
 
+    TRELLIS34_NIBBLE_BITS_INDICES: numpy.ndarray = (
+        2 * numpy.argsort(TRELLIS34_INTERLEAVE_MATRIX)[:, None] + numpy.arange(2)
+    ).reshape(49, 4)
+    """For each of 49 de-interleaved constellation points, indices of its 4 bits in 196 bits on-air payload"""
+    TRELLIS34_BRANCH_METRICS: numpy.ndarray = numpy.array(
+        [0, 1, 1, 2, 1, 2, 2, 3, 1, 2, 2, 3, 2, 3, 3, 4], dtype=numpy.int32
+    )[
+        numpy.arange(16)[:, None, None]
+        ^ TRELLIS34_POINT_NIBBLES[
+            numpy.array(TRELLIS34_ENCODER_STATE_TRANSITION).reshape(8, 8)
+        ]
+    ]
+    """Hamming distance for (received nibble, state, tribit) between received and expected 4 bits"""
+    TRELLIS34_STEP_METRICS: numpy.ndarray = (TRELLIS34_BRANCH_METRICS << 3) | (
+        numpy.arange(8)[None, :, None]
+    )
+    """(received nibble, state, tribit) -> branch metric << 3 | state"""
+    TRELLIS34_PAIR_METRICS: numpy.ndarray = (
+        (
+            (
+                (
+                    TRELLIS34_BRANCH_METRICS[:, None, :, :, None]
+                    + TRELLIS34_BRANCH_METRICS[None, :, None, :, :]
+                )
+                << 3
+            )
+            | numpy.arange(8)[None, None, None, :, None]
+        ).min(axis=3)
+        << 3
+    ) | numpy.arange(8)[None, None, :, None]
+    """(two received nibbles, state, state after two steps) -> best metric << 6 | middle state << 3 | state"""
+    TRELLIS34_TRANSITION_NIBBLES: List[int] = TRELLIS34_POINT_NIBBLES[
+        TRELLIS34_ENCODER_STATE_TRANSITION
+    ].tolist()
+    """(state * 8 + tribit) -> 4 on-air bits of resulting constellation point"""
+    TRELLIS34_NIBBLE_MASKS: List[List[int]] = (
+        (
+            (numpy.arange(16)[:, None] >> numpy.arange(3, -1, -1) & 1).astype(object)[
+                None, :, :
+            ]
+            << (195 - TRELLIS34_NIBBLE_BITS_INDICES[:, None, :]).astype(object)
+        )
+        .sum(axis=2)
+        .tolist()
+    )
+    """(de-interleaved point index, nibble) -> on-air payload (as 196-bit int) with nibble bits placed"""
+    TRELLIS34_NIBBLE_TRIBITS: List[List[int]] = derive_nibble_tribits(
+        TRELLIS34_TRANSITION_NIBBLES
+    )
+    """(state, received nibble) -> tribit, -1 if received nibble is not valid transition from given state"""
+
     @staticmethod
     def bits_to_dibits(stream: bitarray) -> array:
         """
@@ -242,6 +315,64 @@ class Trellis34:
 
         return out
 
+    @staticmethod
+    def viterbi_decode(encoded: bitarray) -> Tuple[bitarray, int]:
+        """
+        Maximum-likelihood (Viterbi) decode of Trellis3/4 encoded bitstream, tolerates corrupted constellation points
+
+        :param encoded: 196 bits of on-air payload
+        :return: (144 bits of decoded data, path metric as number of on-air bits not matching decoded path)
+        """
+        assert (
+            len(encoded) == 196
+        ), f"trellis_34_decode requires 24.5 bytes (196 bits), got {len(encoded)} bits"
+
+        nibbles: numpy.ndarray = bits_to_vector(encoded)[
+            Trellis34.TRELLIS34_NIBBLE_BITS_INDICES
+        ] @ numpy.array([8, 4, 2, 1], dtype=numpy.intp)
+
+        # fast path, uncorrupted data follows trellis without any decisions
+        tribits: List[int] = []
+        state: int = 0
+        for nibble in nibbles.tolist():
+            state = Trellis34.TRELLIS34_NIBBLE_TRIBITS[state][nibble]
+            if state < 0:
+                break
+            tribits.append(state)
+        path_metric: int = 0
+
+        if len(tribits) != 49 or state != 0:
+            # add-compare-select over two trellis steps at once, survivors carry both previous states
+            pair_metrics: numpy.ndarray = Trellis34.TRELLIS34_PAIR_METRICS[
+                nibbles[0:48:2], nibbles[1:49:2]
+            ]
+            # encoder starts in state 0
+            metrics: numpy.ndarray = numpy.array([0] + [1 << 16] * 7, dtype=numpy.int64)
+            survivors: numpy.ndarray = numpy.empty((24, 8), dtype=numpy.int64)
+            for i in range(0, 24):
+                survivors[i] = ((metrics << 6)[:, None] + pair_metrics[i]).min(axis=0)
+                metrics = survivors[i] >> 6
+
+            # last tribit is always 0, so the encoder always ends in state 0
+            last: int = int(
+                (
+                    (metrics << 3) + Trellis34.TRELLIS34_STEP_METRICS[nibbles[48], :, 0]
+                ).min()
+            )
+            path_metric = last >> 3
+            tribits = [0] * 49
+            state = last & 7
+            for i, previous in reversed(list(enumerate(survivors.tolist()))):
+                tribits[2 * i + 1] = state
+                tribits[2 * i] = (previous[state] >> 3) & 7
+                state = previous[state] & 7
+
+        value: int = 0
+        for tribit in tribits[:48]:
+            value = (value << 3) | tribit
+
+        return int2ba(value, length=144, endian="big"), path_metric
+
     @staticmethod
     def decode(encoded: bitarray, as_bytes: bool = False) -> Union[bitarray, bytes]:
         """
@@ -255,11 +386,7 @@ class Trellis34:
             len(encoded) == 196
         ), f"trellis_34_decode requires 24.5 bytes (196 bits), got {len(encoded)} bits"
 
-        dibits: array = Trellis34.bits_to_dibits(encoded)
-        deinterleaved_dibits: array = Trellis34.deinterleave(dibits)
-        points: array = Trellis34.dibits_to_points(deinterleaved_dibits)
-        tribits: array = Trellis34.points_to_tribits(points)
-        decoded: bitarray = Trellis34.tribits_to_bits(tribits)
+        decoded, _ = Trellis34.viterbi_decode(encoded)
         return decoded.tobytes() if as_bytes else decoded
 
     @staticmethod
@@ -271,18 +398,23 @@ class Trellis34:
         :return:
         """
         if isinstance(decoded, bytes):
-            bits: bitarray = bitarray(endian="big")
-            bits.frombytes(decoded)
-            decoded = bits
+            assert (
+                len(decoded) >= 18
+            ), f"trellis_34_encode requires 18 bytes (144 bits), got {len(decoded) * 8} bits"
+            value: int = int.from_bytes(decoded[:18], byteorder="big")
+        else:
+            assert (
+                len(decoded) >= 144
+            ), f"trellis_34_encode requires 18 bytes (144 bits), got {len(decoded)} bits"
+            # ba2int follows bitarray endianness, copy keeps bit order of input while forcing big endian
+            value: int = ba2int(bitarray(decoded[:144], endian="big"), signed=False)
 
-        assert (
-            len(decoded) >= 144
-        ), f"trellis_34_encode requires 18 bytes (144 bits), got {len(decoded)} bits"
-        decoded = decoded[:144]
-
-        tribits: array = Trellis34.bits_to_tribits(decoded)
-        points: array = Trellis34.tribits_to_points(tribits)
-        dibits: array = Trellis34.points_to_dibits(points)
-        interleaved_dibits: array = Trellis34.interleave(dibits)
-        encoded: bitarray = Trellis34.dibits_to_bits(interleaved_dibits)
-        return encoded
+        encoded: int = 0
+        state: int = 0
+        for i, masks in enumerate(Trellis34.TRELLIS34_NIBBLE_MASKS):
+            # 49th tribit is always 0 (flushes encoder state)
+            tribit: int = (value >> (141 - 3 * i)) & 0x7 if i < 48 else 0
+            encoded |= masks[Trellis34.TRELLIS34_TRANSITION_NIBBLES[state * 8 + tribit]]
+            state = tribit
+
+        return int2ba(encoded, length=196, endian="big")
@@ -1,14 +1,15 @@
-from typing import Dict, Tuple
+from typing import Dict, Tuple, Type
 
-import numpy
 from bitarray import bitarray
 from bitarray.util import int2ba
 
 from okdmr.dmrlib.etsi.fec.five_bit_checksum import FiveBitChecksum
 from okdmr.dmrlib.etsi.fec.hamming_16_11_4 import Hamming16114
+from okdmr.dmrlib.etsi.fec.hamming_common import HammingCommon
+from okdmr.dmrlib.etsi.fec.vbptc_common import VBPTCCommon
 
 
-class VBPTC12873:
+class VBPTC12873(VBPTCCommon):
     """
     ETSI TS 102 361-1 V2.5.1 (2017-10) - B.2.1 Variable length BPTC for embedded signalling
 
@@ -183,27 +184,11 @@ class VBPTC12873:
     # @formatter:on
     # fmt: on
 
-    FULL_INTERLEAVING_MAP: Dict[int, int] = dict(
-        (k, v[0]) for k, v in INTERLEAVING_INDICES.items()
-    )
-    """Extract only (table index -> interleave index)"""
-    FULL_DEINTERLEAVING_MAP: Dict[int, int] = dict(
-        (v[0], k) for k, v in INTERLEAVING_INDICES.items()
-    )
-    """Extract only (interleave index -> index)"""
-    DEINTERLEAVE_INFO_BITS_ONLY_MAP: Dict[int, int] = dict(
-        (i, l)
-        for i, l in enumerate(
-            dict(
-                (k, v[0])
-                for k, v in INTERLEAVING_INDICES.items()
-                if not v[3]
-                and not v[4]
-                and v[1] != 8  # not reserved or hamming bits or row 8 (parity bits)
-            ).values()
-        )
-    )
-    """Extract only (interleave index -> index) where it's not reserved or hamming bit"""
+    ROWS: int = 8
+    COLUMNS: int = 16
+    ROW_HAMMING: Type[HammingCommon] = Hamming16114
+    CHECKSUM_BITS: int = 5
+
     DEINTERLEAVE_5BIT_CHECKSUM: Dict[int, int] = dict(
         (i, l)
         for i, l in enumerate(
@@ -217,37 +202,10 @@ class VBPTC12873:
         )
     )
     """Extract only (interleave index -> index) where 5-bit checksum"""
-    INTERLEAVE_INFO_BITS_ONLY_MAP: Dict[int, int] = dict(
-        (i, l)
-        for i, l in enumerate(
-            dict(
-                (v[0], k)
-                for k, v in INTERLEAVING_INDICES.items()
-                if not v[3]
-                and not v[4]
-                and v[1] != 8  # not reserved or hamming bits or row 8 (parity bits)
-            ).values()
-        )
-    )
-    """Extract only (index -> interleave index) where it's not reserved or hamming bit"""
 
-    @staticmethod
-    def deinterleave_all_bits(bits: bitarray) -> bitarray:
-        """
-        Will take BPTC interleaved (and FEC protected) bits and return 128 bits of deinterleaved bits
-        :param bits:
-        :return:
-        """
-        assert (
-            len(bits) == 128
-        ), f"BPTC 128,72 deinterleave_all_bits requires 128 bits, got {len(bits)}"
-        mapping = VBPTC12873.FULL_DEINTERLEAVING_MAP
-
-        out = bitarray([0] * len(mapping), endian="big")
-        for i, n in mapping.items():
-            out[i] = bits[n]
-
-        return out
+    @classmethod
+    def calculate_checksum(cls, data: bitarray) -> bitarray:
+        return int2ba(FiveBitChecksum.calculate(data.tobytes()), length=5)
 
     @staticmethod
     def deinterleave_data_bits(bits: bitarray, include_cs5: bool = True) -> bitarray:
@@ -260,16 +218,8 @@ class VBPTC12873:
         assert (
             len(bits) == 128
         ), f"BPTC 128,72 decode requires 128 bits, got {len(bits)}"
-        mapping = VBPTC12873.DEINTERLEAVE_INFO_BITS_ONLY_MAP
-
-        out = bitarray([0] * len(mapping.keys()), endian="big")
-        for i, n in mapping.items():
-            out[i] = bits[n]
-
-        if include_cs5:
-            out.extend(VBPTC12873.deinterleave_cs5_bits(bits))
-
-        return out
+        data, _, _ = VBPTC12873.decode(bits)
+        return data if include_cs5 else data[:72]
 
     @staticmethod
     def deinterleave_cs5_bits(bits: bitarray) -> bitarray:
@@ -281,122 +231,4 @@ class VBPTC12873:
         assert (
             len(bits) == 128
         ), f"BPTC 128,72 decode requires 128 bits, got {len(bits)}"
-        mapping = VBPTC12873.DEINTERLEAVE_5BIT_CHECKSUM
-
-        out = bitarray([0] * len(mapping.keys()), endian="big")
-        for i, n in mapping.items():
-            out[i] = bits[n]
-
-        return out
-
-    @staticmethod
-    def make_encoding_table() -> numpy.ndarray:
-        # create table 8 rows, 16 columns, for FEC encoding
-        table: numpy.ndarray = numpy.ndarray(shape=(8, 16), dtype=int)
-        table.fill(0)
-
-        return table
-
-    @staticmethod
-    def fill_encoding_table(
-        table: numpy.ndarray, bits_deinterleaved: bitarray
-    ) -> numpy.ndarray:
-        assert (
-            len(bits_deinterleaved) == 72 or len(bits_deinterleaved) == 128
-        ), f"Can fill encoding table only with data bits (len 72) or full bits (len 128), got {len(bits_deinterleaved)}"
-
-        # make bitarray of size 128, fill with provided bits
-        mapping = (
-            VBPTC12873.DEINTERLEAVE_INFO_BITS_ONLY_MAP
-            if len(bits_deinterleaved) == 72
-            else VBPTC12873.FULL_DEINTERLEAVING_MAP
-        )
-        bits_interleaved: bitarray = bitarray([0] * 128, endian="big")
-
-        for index, interleave_index in mapping.items():
-            bits_interleaved[interleave_index] = bits_deinterleaved[index]
-
-        for data_index, (
-            interleave_idx,
-            row_no,
-            col_no,
-            is_hamming,
-            is_cs5,
-        ) in VBPTC12873.INTERLEAVING_INDICES.items():
-            table[row_no - 1][col_no] = bits_interleaved[interleave_idx]
-
-        return table
-
-    @staticmethod
-    def encode(bits_deinterleaved: bitarray) -> bitarray:
-        """
-        Takes 72 bits of data (info bits) and return interleaved and FEC protected 128 bits
-        :param bits_deinterleaved:
-        :return:
-        """
-        if len(bits_deinterleaved) == 77:
-            # cut out cs5
-            bits_deinterleaved = bits_deinterleaved[:72]
-        elif len(bits_deinterleaved) == 128:
-            # full deinterleaved data including cs5, hamming and parity
-            # interleave again and deinterleave only data bits
-            interleaved: bitarray = bitarray([0] * 128)
-            for data_index, (
-                interleave_index,
-                _,
-                _,
-                _,
-                _,
-            ) in VBPTC12873.INTERLEAVING_INDICES.items():
-                interleaved[data_index] = bits_deinterleaved[interleave_index]
-            bits_deinterleaved = VBPTC12873.deinterleave_data_bits(
-                interleaved, include_cs5=False
-            )
-
-        assert (
-            len(bits_deinterleaved) == 72
-        ), f"Unexpected number of bits fed to VBPTC12872.encode, expected 72, 77 or 128, got {len(bits_deinterleaved)}"
-
-        table: numpy.ndarray = VBPTC12873.make_encoding_table()
-        table = VBPTC12873.fill_encoding_table(
-            table=table, bits_deinterleaved=bits_deinterleaved
-        )
-
-        # calculate 5-bit checksum and put bits in correct table positions
-        cs5 = FiveBitChecksum.calculate(bits_deinterleaved.tobytes())
-        cs5_bits = int2ba(cs5, length=5)
-        table[2][10] = cs5_bits[4]
-        table[3][10] = cs5_bits[3]
-        table[4][10] = cs5_bits[2]
-        table[5][10] = cs5_bits[1]
-        table[6][10] = cs5_bits[0]
-
-        # fill rows 0 - 6 with hamming
-        for row in range(0, 7):
-            table[row] = Hamming16114.generate(table[row][:11])
-
-        # fill columns with parity bit
-        for column in range(0, 16):
-            table[:, column] = VBPTC12873.set_parity(table[:7, column])
-
-        out: bitarray = bitarray([0] * 128)
-        for index, info_tuple in VBPTC12873.INTERLEAVING_INDICES.items():
-            out[info_tuple[0]] = table[info_tuple[1] - 1][info_tuple[2]]
-
-        return out
-
-    @staticmethod
-    def set_parity(column: numpy.array) -> numpy.array:
-        assert len(column) in (7, 8)
-        if len(column) == 7:
-            column = numpy.append(column, [0])
-        column[7] = (
-            column[0]
-            ^ column[1]
-            ^ column[2]
-            ^ column[3]
-            ^ column[4]
-            ^ column[5]
-            ^ column[6]
-        )
-        return column
+        return VBPTC12873.decode(bits)[0][72:]
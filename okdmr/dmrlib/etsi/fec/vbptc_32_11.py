@@ -1,11 +1,13 @@
-from typing import Dict, Tuple
+from typing import Dict, Tuple, Type
 
-import numpy
 from bitarray import bitarray
+
 from okdmr.dmrlib.etsi.fec.hamming_16_11_4 import Hamming16114
+from okdmr.dmrlib.etsi.fec.hamming_common import HammingCommon
+from okdmr.dmrlib.etsi.fec.vbptc_common import VBPTCCommon
 
 
-class VBPTC3211:
+class VBPTC3211(VBPTCCommon):
     """
     ETSI TS 102 361-1 V2.5.1 (2017-10) - B.2.2  Single Burst Variable length BPTC
     """
@@ -58,66 +60,9 @@ class VBPTC3211:
     # @formatter:on
     # fmt: on
 
-    FULL_INTERLEAVING_MAP: Dict[int, int] = dict(
-        (k, v[0]) for k, v in INTERLEAVING_INDICES.items()
-    )
-    """Extract only (table index -> interleave index)"""
-    FULL_DEINTERLEAVING_MAP: Dict[int, int] = dict(
-        (v[0], k) for k, v in INTERLEAVING_INDICES.items()
-    )
-    """Extract only (interleave index -> index)"""
-    DEINTERLEAVE_INFO_BITS_ONLY_MAP: Dict[int, int] = dict(
-        (i, l)
-        for i, l in enumerate(
-            dict(
-                (idx, interleave_idx)
-                for idx, (
-                    interleave_idx,
-                    row,
-                    col,
-                    is_hamming,
-                    is_parity,
-                ) in INTERLEAVING_INDICES.items()
-                if not is_hamming and not is_parity  # not parity bits or hamming
-            ).values()
-        )
-    )
-    """Extract only (interleave index -> index) where it's not reserved or hamming bit"""
-    INTERLEAVE_INFO_BITS_ONLY_MAP: Dict[int, int] = dict(
-        (i, l)
-        for i, l in enumerate(
-            dict(
-                (interleave_idx, idx)
-                for idx, (
-                    interleave_idx,
-                    row,
-                    col,
-                    is_hamming,
-                    is_parity,
-                ) in INTERLEAVING_INDICES.items()
-                if not is_hamming and not is_parity
-            ).values()
-        )
-    )
-    """Extract only (index -> interleave index) where it's not reserved or hamming bit"""
-
-    @staticmethod
-    def deinterleave_all_bits(bits: bitarray) -> bitarray:
-        """
-        Will take BPTC interleaved (and FEC protected) bits and return 11 bits of deinterleaved bits
-        :param bits: 32 bits of on-air payload
-        :return:
-        """
-        assert (
-            len(bits) == 32
-        ), f"VBPTC 31,11 deinterleave_all_bits requires 32 bits, got {len(bits)}"
-        mapping = VBPTC3211.FULL_DEINTERLEAVING_MAP
-
-        out = bitarray([0] * len(mapping), endian="big")
-        for i, n in mapping.items():
-            out[i] = bits[n]
-
-        return out
+    ROWS: int = 2
+    COLUMNS: int = 16
+    ROW_HAMMING: Type[HammingCommon] = Hamming16114
 
     @staticmethod
     def deinterleave_data_bits(bits: bitarray) -> bitarray:
@@ -127,104 +72,4 @@ class VBPTC3211:
         :return: bitarray with 11 (data bits)
         """
         assert len(bits) == 32, f"VBPTC 32,11 decode requires 32 bits, got {len(bits)}"
-        mapping = VBPTC3211.DEINTERLEAVE_INFO_BITS_ONLY_MAP
-
-        out = bitarray([0] * len(mapping.keys()), endian="big")
-        for i, n in mapping.items():
-            out[i] = bits[n]
-
-        return out
-
-    @staticmethod
-    def make_encoding_table() -> numpy.ndarray:
-        # create table 4 rows, 17 columns, for FEC encoding
-        table: numpy.ndarray = numpy.ndarray(shape=(2, 16), dtype=int)
-        table.fill(0)
-
-        return table
-
-    @staticmethod
-    def fill_encoding_table(
-        table: numpy.ndarray, bits_deinterleaved: bitarray
-    ) -> numpy.ndarray:
-        assert (
-            len(bits_deinterleaved) == 11 or len(bits_deinterleaved) == 32
-        ), f"Can fill encoding table only with data bits (len 11) or full bits (len 32), got {len(bits_deinterleaved)}"
-
-        # make bitarray of size 32, fill with provided bits
-        mapping = (
-            VBPTC3211.DEINTERLEAVE_INFO_BITS_ONLY_MAP
-            if len(bits_deinterleaved) == 11
-            else VBPTC3211.FULL_DEINTERLEAVING_MAP
-        )
-        bits_interleaved: bitarray = bitarray([0] * 32, endian="big")
-
-        for index, interleave_index in mapping.items():
-            bits_interleaved[interleave_index] = bits_deinterleaved[index]
-
-        for data_index, (
-            interleave_idx,
-            row_no,
-            col_no,
-            is_hamming,
-            is_parity,
-        ) in VBPTC3211.INTERLEAVING_INDICES.items():
-            table[row_no - 1][col_no] = bits_interleaved[interleave_idx]
-
-        return table
-
-    @staticmethod
-    def encode(bits_deinterleaved: bitarray) -> bitarray:
-        """
-        Takes 11 bits of data (info bits) and return interleaved and FEC protected 32 bits
-        :param bits_deinterleaved:
-        :return:
-        """
-        if len(bits_deinterleaved) == 32:
-            # full deinterleaved data including hamming and parity
-            # interleave again and deinterleave only data bits
-            interleaved: bitarray = bitarray([0] * 32)
-            for data_index, (
-                interleave_index,
-                _,
-                _,
-                _,
-                _,
-            ) in VBPTC3211.INTERLEAVING_INDICES.items():
-                interleaved[data_index] = bits_deinterleaved[interleave_index]
-            bits_deinterleaved = VBPTC3211.deinterleave_data_bits(interleaved)
-
-        assert (
-            len(bits_deinterleaved) == 11
-        ), f"Unexpected number of bits fed to VBPTC3211.encode, expected 11 or 32, got {len(bits_deinterleaved)}"
-
-        table: numpy.ndarray = VBPTC3211.make_encoding_table()
-        table = VBPTC3211.fill_encoding_table(
-            table=table, bits_deinterleaved=bits_deinterleaved
-        )
-
-        # fill row 0 with hamming
-        for row in range(0, 1):
-            table[row] = Hamming16114.generate(table[row][:11])
-
-        # fill columns with parity bit
-        for column in range(0, 16):
-            table[:, column] = VBPTC3211.set_parity(table[:, column])
-
-        out: bitarray = bitarray([0] * 32)
-        for index, (
-            interleave_index,
-            row,
-            col,
-            is_hamming,
-            is_parity,
-        ) in VBPTC3211.INTERLEAVING_INDICES.items():
-            out[interleave_index] = table[row - 1][col]
-
-        return out
-
-    @staticmethod
-    def set_parity(column: numpy.ndarray) -> numpy.ndarray:
-        assert len(column) == 2
-        column[1] = column[0]
-        return column
+        return VBPTC3211.decode(bits)[0]
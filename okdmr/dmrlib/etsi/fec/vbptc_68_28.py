@@ -1,14 +1,15 @@
-from typing import Dict, Tuple
+from typing import Dict, Tuple, Type
 
-import numpy
 from bitarray import bitarray
 from bitarray.util import int2ba
 
 from okdmr.dmrlib.etsi.crc.crc8 import CRC8
 from okdmr.dmrlib.etsi.fec.hamming_17_12_3 import Hamming17123
+from okdmr.dmrlib.etsi.fec.hamming_common import HammingCommon
+from okdmr.dmrlib.etsi.fec.vbptc_common import VBPTCCommon
 
 
-class VBPTC6828:
+class VBPTC6828(VBPTCCommon):
     """
     ETSI TS 102 361-1 V2.5.1 (2017-10) - B.2.3 Variable length BPTC for CACH signalling
 
@@ -107,31 +108,11 @@ class VBPTC6828:
     # @formatter:on
     # fmt: on
 
-    FULL_INTERLEAVING_MAP: Dict[int, int] = dict(
-        (k, v[0]) for k, v in INTERLEAVING_INDICES.items()
-    )
-    """Extract only (table index -> interleave index)"""
-    FULL_DEINTERLEAVING_MAP: Dict[int, int] = dict(
-        (v[0], k) for k, v in INTERLEAVING_INDICES.items()
-    )
-    """Extract only (interleave index -> index)"""
-    DEINTERLEAVE_INFO_BITS_ONLY_MAP: Dict[int, int] = dict(
-        (i, l)
-        for i, l in enumerate(
-            dict(
-                (idx, interleave_idx)
-                for idx, (
-                    interleave_idx,
-                    row,
-                    col,
-                    is_hamming,
-                    is_crc,
-                ) in INTERLEAVING_INDICES.items()
-                if not is_hamming and not is_crc and row != 4  # not parity bits / row 4
-            ).values()
-        )
-    )
-    """Extract only (interleave index -> index) where it's not reserved or hamming bit"""
+    ROWS: int = 4
+    COLUMNS: int = 17
+    ROW_HAMMING: Type[HammingCommon] = Hamming17123
+    CHECKSUM_BITS: int = 8
+
     DEINTERLEAVE_8BIT_CHECKSUM: Dict[int, int] = dict(
         (i, l)
         for i, l in enumerate(
@@ -149,43 +130,10 @@ class VBPTC6828:
         )
     )
     """Extract only (interleave index -> index) where 8-bit checksum"""
-    INTERLEAVE_INFO_BITS_ONLY_MAP: Dict[int, int] = dict(
-        (i, l)
-        for i, l in enumerate(
-            dict(
-                (interleave_idx, idx)
-                for idx, (
-                    interleave_idx,
-                    row,
-                    col,
-                    is_hamming,
-                    is_crc,
-                ) in INTERLEAVING_INDICES.items()
-                if not is_hamming
-                and not is_crc
-                and row != 4  # not reserved or hamming bits or row 8 (parity bits)
-            ).values()
-        )
-    )
-    """Extract only (index -> interleave index) where it's not reserved or hamming bit"""
-
-    @staticmethod
-    def deinterleave_all_bits(bits: bitarray) -> bitarray:
-        """
-        Will take BPTC interleaved (and FEC protected) bits and return 68 bits of deinterleaved bits
-        :param bits:
-        :return:
-        """
-        assert (
-            len(bits) == 68
-        ), f"VBPTC 68,28 deinterleave_all_bits requires 68 bits, got {len(bits)}"
-        mapping = VBPTC6828.FULL_DEINTERLEAVING_MAP
 
-        out = bitarray([0] * len(mapping), endian="big")
-        for i, n in mapping.items():
-            out[i] = bits[n]
-
-        return out
+    @classmethod
+    def calculate_checksum(cls, data: bitarray) -> bitarray:
+        return int2ba(CRC8.calculate(data), length=8)
 
     @staticmethod
     def deinterleave_data_bits(bits: bitarray, include_crc8: bool = True) -> bitarray:
@@ -196,14 +144,12 @@ class VBPTC6828:
         :return: bitarray with 28 (data bits) or 36 (data+crc, aka. info bits)
         """
         assert len(bits) == 68, f"VBPTC 68,28 decode requires 68 bits, got {len(bits)}"
-        mapping = VBPTC6828.DEINTERLEAVE_INFO_BITS_ONLY_MAP
-
-        out = bitarray([0] * len(mapping.keys()), endian="big")
-        for i, n in mapping.items():
-            out[i] = bits[n]
-
+        data, _, _ = VBPTC6828.decode(bits)
+        out: bitarray = data[:28]
         if include_crc8:
-            out.extend(VBPTC6828.deinterleave_crc8_bits(bits))
+            crc8: bitarray = data[28:]
+            crc8.bytereverse()
+            out.extend(crc8)
 
         return out
 
@@ -215,124 +161,7 @@ class VBPTC6828:
         :return: 8 bits of data (CRC-8)
         """
         assert len(bits) == 68, f"VBPTC 68,28 decode requires 68 bits, got {len(bits)}"
-        mapping = VBPTC6828.DEINTERLEAVE_8BIT_CHECKSUM
-
-        out = bitarray([0] * len(mapping.keys()), endian="big")
-        for i, n in mapping.items():
-            out[i] = bits[n]
-
+        out: bitarray = VBPTC6828.decode(bits)[0][28:]
         out.bytereverse()
 
         return out
-
-    @staticmethod
-    def make_encoding_table() -> numpy.ndarray:
-        # create table 4 rows, 17 columns, for FEC encoding
-        table: numpy.ndarray = numpy.ndarray(shape=(4, 17), dtype=int)
-        table.fill(0)
-
-        return table
-
-    @staticmethod
-    def fill_encoding_table(
-        table: numpy.ndarray, bits_deinterleaved: bitarray
-    ) -> numpy.ndarray:
-        assert (
-            len(bits_deinterleaved) == 28 or len(bits_deinterleaved) == 68
-        ), f"Can fill encoding table only with data bits (len 28) or full bits (len 68), got {len(bits_deinterleaved)}"
-
-        # make bitarray of size 68, fill with provided bits
-        mapping = (
-            VBPTC6828.DEINTERLEAVE_INFO_BITS_ONLY_MAP
-            if len(bits_deinterleaved) == 28
-            else VBPTC6828.FULL_DEINTERLEAVING_MAP
-        )
-        bits_interleaved: bitarray = bitarray([0] * 68, endian="big")
-
-        for index, interleave_index in mapping.items():
-            bits_interleaved[interleave_index] = bits_deinterleaved[index]
-
-        for data_index, (
-            interleave_idx,
-            row_no,
-            col_no,
-            is_hamming,
-            is_crc8,
-        ) in VBPTC6828.INTERLEAVING_INDICES.items():
-            table[row_no - 1][col_no] = bits_interleaved[interleave_idx]
-
-        return table
-
-    @staticmethod
-    def encode(bits_deinterleaved: bitarray) -> bitarray:
-        """
-        Takes 28 bits of data (info bits) and return interleaved and FEC protected 68 bits
-        :param bits_deinterleaved:
-        :return:
-        """
-        if len(bits_deinterleaved) == 36:
-            # cut out crc8
-            bits_deinterleaved = bits_deinterleaved[:28]
-        elif len(bits_deinterleaved) == 68:
-            # full deinterleaved data including crc8, hamming and parity
-            # interleave again and deinterleave only data bits
-            interleaved: bitarray = bitarray([0] * 68)
-            for data_index, (
-                interleave_index,
-                _,
-                _,
-                _,
-                _,
-            ) in VBPTC6828.INTERLEAVING_INDICES.items():
-                interleaved[data_index] = bits_deinterleaved[interleave_index]
-            bits_deinterleaved = VBPTC6828.deinterleave_data_bits(
-                interleaved, include_crc8=False
-            )
-
-        assert (
-            len(bits_deinterleaved) == 28
-        ), f"Unexpected number of bits fed to VBPTC6828.encode, expected 28, 36 or 68, got {len(bits_deinterleaved)}"
-
-        table: numpy.ndarray = VBPTC6828.make_encoding_table()
-        table = VBPTC6828.fill_encoding_table(
-            table=table, bits_deinterleaved=bits_deinterleaved
-        )
-        # calculate 8-bit checksum and put bits in correct table positions
-        crc8 = CRC8.calculate(bits_deinterleaved)
-        crc8_bits = int2ba(crc8, length=8)
-        table[2][4] = crc8_bits[0]
-        table[2][5] = crc8_bits[1]
-        table[2][6] = crc8_bits[2]
-        table[2][7] = crc8_bits[3]
-        table[2][8] = crc8_bits[4]
-        table[2][9] = crc8_bits[5]
-        table[2][10] = crc8_bits[6]
-        table[2][11] = crc8_bits[7]
-
-        # fill rows 0 - 2 with hamming
-        for row in range(0, 3):
-            table[row] = Hamming17123.generate(table[row][:12])
-
-        # fill columns with parity bit
-        for column in range(0, 17):
-            table[:, column] = VBPTC6828.set_parity(table[:3, column])
-
-        out: bitarray = bitarray([0] * 68)
-        for index, (
-            interleave_index,
-            row,
-            col,
-            is_hamming,
-            is_crc,
-        ) in VBPTC6828.INTERLEAVING_INDICES.items():
-            out[interleave_index] = table[row - 1][col]
-
-        return out
-
-    @staticmethod
-    def set_parity(column: numpy.ndarray) -> numpy.ndarray:
-        assert len(column) in (3, 4)
-        if len(column) == 3:
-            column = numpy.append(column, [0])
-        column[3] = column[0] ^ column[1] ^ column[2]
-        return column
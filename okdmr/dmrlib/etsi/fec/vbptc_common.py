@@ -0,0 +1,362 @@
+from typing import Dict, List, Tuple, Type
+
+import numpy
+from bitarray import bitarray
+
+from okdmr.dmrlib.etsi.fec.fec_utils import bits_to_vector, vector_to_bits
+from okdmr.dmrlib.etsi.fec.hamming_common import HammingCommon
+
+
+class VBPTCCommon:
+    """
+    Generic (table-compiled) Variable length BPTC engine
+
+    Code is described by INTERLEAVING_INDICES (same format as in ETSI tables, rows numbered from 1), table dimensions,
+    Hamming code protecting each row (except the last one, which holds column parity bits)
+    and number of checksum bits, each subclass gets permutation index arrays compiled when class is defined
+    """
+
+    INTERLEAVING_INDICES: Dict[int, Tuple[int, int, int, bool, bool]]
+    """Interleave table as key(index) => value(interleave index, row, column, is row hamming, is checksum)"""
+    ROWS: int
+    COLUMNS: int
+    ROW_HAMMING: Type[HammingCommon]
+    CHECKSUM_BITS: int = 0
+
+    FULL_INTERLEAVING_MAP: Dict[int, int]
+    """Extract only (table index -> interleave index)"""
+    FULL_DEINTERLEAVING_MAP: Dict[int, int]
+    """Extract only (interleave index -> index)"""
+    DEINTERLEAVE_INFO_BITS_ONLY_MAP: Dict[int, int]
+    """Extract only (interleave index -> index) where it's not checksum, hamming or column parity bit"""
+    INTERLEAVE_INFO_BITS_ONLY_MAP: Dict[int, int]
+    """Extract only (index -> interleave index) where it's not checksum, hamming or column parity bit"""
+
+    TOTAL_BITS: int
+    DATA_BITS: int
+    CELL_INTERLEAVE_INDICES: numpy.ndarray
+    """table cell (row-major) -> on-air bit index"""
+    DATA_CELLS: numpy.ndarray
+    """table cells (row-major) holding data bits, in order of data bits"""
+    CHECKSUM_CELLS: numpy.ndarray
+    """table cells (row-major) holding checksum bits, in order of checksum bits"""
+    ROW_WEIGHTS: numpy.ndarray
+    """weights to convert table row to int (first column being MSB)"""
+    ROW_PARITY_CHECK: numpy.ndarray
+    """transposed parity check matrix of row Hamming code"""
+    ROW_PARITY_GENERATOR: numpy.ndarray
+    """parity part of generator matrix of row Hamming code"""
+    SYNDROME_WEIGHTS: numpy.ndarray
+    """weights to convert syndrome bits to int (first bit being MSB)"""
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Compiles code description into index arrays when VBPTC code class is defined
+        """
+        super().__init_subclass__(**kwargs)
+        cls.TOTAL_BITS = cls.ROWS * cls.COLUMNS
+        assert (
+            len(cls.INTERLEAVING_INDICES) == cls.TOTAL_BITS
+        ), f"{cls.__name__} expects {cls.TOTAL_BITS} interleaving indices, got {len(cls.INTERLEAVING_INDICES)}"
+        assert (
+            cls.ROW_HAMMING.CODEWORD_LENGTH == cls.COLUMNS
+        ), f"{cls.__name__} row Hamming code length must match {cls.COLUMNS} columns"
+
+        cells: List[Tuple[int, int, bool, bool]] = [
+            (
+                interleave_index,
+                (row - 1) * cls.COLUMNS + column,
+                row != cls.ROWS and not is_hamming and not is_checksum,
+                row != cls.ROWS and is_checksum,
+            )
+            for _, (
+                interleave_index,
+                row,
+                column,
+                is_hamming,
+                is_checksum,
+            ) in sorted(cls.INTERLEAVING_INDICES.items())
+        ]
+        info_cells: List[Tuple[int, int, bool, bool]] = [
+            cell for cell in cells if cell[2]
+        ]
+
+        cls.FULL_INTERLEAVING_MAP = dict(
+            (k, v[0]) for k, v in cls.INTERLEAVING_INDICES.items()
+        )
+        cls.FULL_DEINTERLEAVING_MAP = dict(
+            (v[0], k) for k, v in cls.INTERLEAVING_INDICES.items()
+        )
+        cls.DEINTERLEAVE_INFO_BITS_ONLY_MAP = dict(
+            (i, cell[0]) for i, cell in enumerate(info_cells)
+        )
+        cls.INTERLEAVE_INFO_BITS_ONLY_MAP = dict(
+            (i, cell[1]) for i, cell in enumerate(info_cells)
+        )
+
+        cls.DATA_BITS = len(info_cells)
+        cls.CELL_INTERLEAVE_INDICES = numpy.empty(cls.TOTAL_BITS, dtype=numpy.intp)
+        cls.CELL_INTERLEAVE_INDICES[[cell[1] for cell in cells]] = [
+            cell[0] for cell in cells
+        ]
+        cls.DATA_CELLS = numpy.array([cell[1] for cell in info_cells], dtype=numpy.intp)
+        cls.CHECKSUM_CELLS = numpy.array(
+            [cell[1] for cell in cells if cell[3]], dtype=numpy.intp
+        )
+        assert (
+            len(cls.CHECKSUM_CELLS) == cls.CHECKSUM_BITS
+        ), f"{cls.__name__} expects {cls.CHECKSUM_BITS} checksum bits, got {len(cls.CHECKSUM_CELLS)}"
+
+        cls.ROW_WEIGHTS = 1 << numpy.arange(cls.COLUMNS - 1, -1, -1, dtype=numpy.int64)
+        cls.ROW_PARITY_CHECK = cls.ROW_HAMMING.PARITY_CHECK_MATRIX.T.astype(numpy.uint8)
+        cls.ROW_PARITY_GENERATOR = cls.ROW_HAMMING.GENERATOR_MATRIX[
+            :, cls.ROW_HAMMING.CODE_DIMENSION :
+        ].astype(numpy.uint8)
+        cls.SYNDROME_WEIGHTS = 1 << numpy.arange(
+            cls.ROW_PARITY_CHECK.shape[1] - 1, -1, -1, dtype=numpy.intp
+        )
+
+    @classmethod
+    def calculate_checksum(cls, data: bitarray) -> bitarray:
+        """
+        Calculates checksum bits (in order of checksum cells in table) for data bits, codes without checksum return
+        empty bitarray
+        :param data: data bits
+        :return: CHECKSUM_BITS long bitarray
+        """
+        return bitarray(endian="big")
+
+    @classmethod
+    def deinterleave_all_bits(cls, bits: bitarray) -> bitarray:
+        """
+        Will take BPTC interleaved (and FEC protected) bits and return deinterleaved bits of same length
+        :param bits: on-air payload
+        :return:
+        """
+        assert (
+            len(bits) == cls.TOTAL_BITS
+        ), f"{cls.__name__} deinterleave_all_bits requires {cls.TOTAL_BITS} bits, got {len(bits)}"
+        out: numpy.ndarray = numpy.empty(cls.TOTAL_BITS, dtype=numpy.uint8)
+        out[cls.CELL_INTERLEAVE_INDICES] = bits_to_vector(bits)
+        return vector_to_bits(out)
+
+    @classmethod
+    def deinterleave_table(cls, bits: bitarray) -> numpy.ndarray:
+        """
+        Will take BPTC interleaved bits and return encoding table without any correction
+        :param bits: on-air payload
+        :return: uint8 array of shape (ROWS, COLUMNS)
+        """
+        assert (
+            len(bits) == cls.TOTAL_BITS
+        ), f"{cls.__name__} requires {cls.TOTAL_BITS} bits, got {len(bits)}"
+        return bits_to_vector(bits)[cls.CELL_INTERLEAVE_INDICES].reshape(
+            cls.ROWS, cls.COLUMNS
+        )
+
+    @classmethod
+    def make_encoding_table(cls) -> numpy.ndarray:
+        return numpy.zeros(shape=(cls.ROWS, cls.COLUMNS), dtype=numpy.uint8)
+
+    @classmethod
+    def fill_encoding_table(
+        cls, table: numpy.ndarray, bits_deinterleaved: bitarray
+    ) -> numpy.ndarray:
+        assert len(bits_deinterleaved) in (
+            cls.DATA_BITS,
+            cls.TOTAL_BITS,
+        ), f"Can fill encoding table only with data bits (len {cls.DATA_BITS}) or full bits (len {cls.TOTAL_BITS}), got {len(bits_deinterleaved)}"
+        bits: numpy.ndarray = bits_to_vector(bits_deinterleaved)
+        if len(bits_deinterleaved) == cls.DATA_BITS:
+            table.flat[cls.DATA_CELLS] = bits
+        else:
+            table.flat[:] = bits[
+                cls.CELL_INTERLEAVE_INDICES[cls.CELL_INTERLEAVE_INDICES]
+            ]
+        return table
+
+    @classmethod
+    def set_parity(cls, column: numpy.ndarray) -> numpy.ndarray:
+        assert len(column) in (cls.ROWS - 1, cls.ROWS)
+        if len(column) == cls.ROWS - 1:
+            column = numpy.append(column, [0])
+        column[-1] = numpy.bitwise_xor.reduce(column[:-1])
+        return column
+
+    @classmethod
+    def correct_table(cls, table: numpy.ndarray) -> Tuple[int, bool]:
+        """
+        Repairs table in-place, single bit error in each row is repaired by row Hamming code,
+        bits of one row with uncorrectable Hamming syndrome are then repaired using column parity,
+        column parity mismatch left after row repairs is blamed on last row only if no more than 2 bits get
+        repaired in total (or no data row was repaired), otherwise row Hamming code likely miscorrected 2 bit errors
+        :param table: uint8 array of shape (ROWS, COLUMNS)
+        :return: (number of repaired bits, True if table is still not valid)
+        """
+        rows: List[int] = (table[: cls.ROWS - 1] @ cls.ROW_WEIGHTS).tolist()
+        corrected: int = 0
+        failed: List[int] = []
+        uncorrectable: bool = False
+        for row, codeword in enumerate(rows):
+            ok, repaired, errors = cls.ROW_HAMMING.correct_int(codeword)
+            if not ok:
+                failed.append(row)
+                continue
+            rows[row] = repaired
+            corrected += errors
+
+        column_parity: int = int(table[cls.ROWS - 1] @ cls.ROW_WEIGHTS)
+        for codeword in rows:
+            column_parity ^= codeword
+        if len(failed) == 1 and column_parity:
+            repaired: int = rows[failed[0]] ^ column_parity
+            if cls.ROW_HAMMING.syndrome_int(repaired) == 0:
+                rows[failed[0]] = repaired
+                corrected += bin(column_parity).count("1")
+                failed = []
+        elif not failed and column_parity:
+            mismatches: int = bin(column_parity).count("1")
+            if corrected == 0 or corrected + mismatches <= 2:
+                # all rows are valid, so errors are in column parity bits (last row)
+                corrected += mismatches
+                rows.append(int(table[cls.ROWS - 1] @ cls.ROW_WEIGHTS) ^ column_parity)
+            else:
+                uncorrectable = True
+
+        if corrected:
+            table[: len(rows)] = (
+                numpy.array(rows, dtype=numpy.int64)[:, None]
+                >> cls.COLUMNS - 1 - numpy.arange(cls.COLUMNS)
+            ) & 1
+        return corrected, uncorrectable or len(failed) > 0
+
+    @classmethod
+    def decode(cls, bits: bitarray) -> Tuple[bitarray, int, bool]:
+        """
+        Takes on-air bits, repairs what can be repaired and returns data bits followed by checksum bits
+        :param bits: on-air payload
+        :return: (data and checksum bits, number of repaired bits, True if payload was not repairable)
+        """
+        table: numpy.ndarray = cls.deinterleave_table(bits).copy()
+        corrected, uncorrectable = cls.correct_table(table)
+        return (
+            vector_to_bits(
+                numpy.concatenate(
+                    (table.flat[cls.DATA_CELLS], table.flat[cls.CHECKSUM_CELLS])
+                )
+            ),
+            corrected,
+            uncorrectable,
+        )
+
+    @classmethod
+    def decode_batch(
+        cls, bits: numpy.ndarray
+    ) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        """
+        Decodes N on-air payloads at once, repairing single bit error in each row
+        :param bits: uint8 array of shape (N, TOTAL_BITS)
+        :return: (data and checksum bits (N, DATA_BITS + CHECKSUM_BITS), number of repaired bits (N,), not repairable (N,))
+        """
+        assert (
+            bits.ndim == 2 and bits.shape[1] == cls.TOTAL_BITS
+        ), f"{cls.__name__} decode_batch expects array of shape (N, {cls.TOTAL_BITS}), got {bits.shape}"
+        count: int = bits.shape[0]
+        table: numpy.ndarray = bits[:, cls.CELL_INTERLEAVE_INDICES].reshape(
+            count, cls.ROWS, cls.COLUMNS
+        )
+        positions: numpy.ndarray = cls.ROW_HAMMING.SYNDROME_ERROR_POSITIONS[
+            ((table[:, :-1] @ cls.ROW_PARITY_CHECK) & 1) @ cls.SYNDROME_WEIGHTS
+        ]
+        blocks, rows = numpy.nonzero(positions >= 0)
+        table[blocks, rows, positions[blocks, rows]] ^= 1
+        corrected: numpy.ndarray = numpy.bincount(blocks, minlength=count)
+
+        failed: numpy.ndarray = positions == -2
+        column_parity: numpy.ndarray = numpy.bitwise_xor.reduce(table, axis=1)
+        mismatches: numpy.ndarray = column_parity.sum(axis=1, dtype=numpy.intp)
+        # all rows valid, errors are in column parity bits (last row), unless row Hamming code likely miscorrected
+        parity_row: numpy.ndarray = ~failed.any(axis=1) & (mismatches > 0)
+        miscorrected: numpy.ndarray = (
+            parity_row & (corrected > 0) & (corrected + mismatches > 2)
+        )
+        corrected += mismatches * (parity_row & ~miscorrected)
+        # one row with uncorrectable syndrome, try to repair it using column parity
+        blocks = numpy.nonzero((failed.sum(axis=1) == 1) & (mismatches > 0))[0]
+        rows = failed[blocks].argmax(axis=1)
+        repaired: numpy.ndarray = table[blocks, rows] ^ column_parity[blocks]
+        valid: numpy.ndarray = (
+            ((repaired @ cls.ROW_PARITY_CHECK) & 1) @ cls.SYNDROME_WEIGHTS
+        ) == 0
+        blocks, rows = blocks[valid], rows[valid]
+        table[blocks, rows] = repaired[valid]
+        failed[blocks, rows] = False
+        corrected[blocks] += mismatches[blocks]
+
+        return (
+            table.reshape(count, cls.TOTAL_BITS)[
+                :, numpy.concatenate((cls.DATA_CELLS, cls.CHECKSUM_CELLS))
+            ],
+            corrected,
+            failed.any(axis=1) | miscorrected,
+        )
+
+    @classmethod
+    def encode_batch(cls, data: numpy.ndarray) -> numpy.ndarray:
+        """
+        Encodes N blocks of data bits at once
+        :param data: uint8 array of shape (N, DATA_BITS)
+        :return: uint8 array of shape (N, TOTAL_BITS), on-air payloads
+        """
+        assert (
+            data.ndim == 2 and data.shape[1] == cls.DATA_BITS
+        ), f"{cls.__name__} encode_batch expects array of shape (N, {cls.DATA_BITS}), got {data.shape}"
+        count: int = data.shape[0]
+        table: numpy.ndarray = numpy.zeros(
+            (count, cls.ROWS, cls.COLUMNS), dtype=numpy.uint8
+        )
+        flat: numpy.ndarray = table.reshape(count, cls.TOTAL_BITS)
+        flat[:, cls.DATA_CELLS] = data
+        if cls.CHECKSUM_BITS:
+            flat[:, cls.CHECKSUM_CELLS] = [
+                cls.calculate_checksum(vector_to_bits(block)).tolist() for block in data
+            ]
+        dimension: int = cls.ROW_HAMMING.CODE_DIMENSION
+        table[:, :-1, dimension:] = (
+            table[:, :-1, :dimension] @ cls.ROW_PARITY_GENERATOR
+        ) & 1
+        table[:, -1] = numpy.bitwise_xor.reduce(table[:, :-1], axis=1)
+
+        out: numpy.ndarray = numpy.empty((count, cls.TOTAL_BITS), dtype=numpy.uint8)
+        out[:, cls.CELL_INTERLEAVE_INDICES] = flat
+        return out
+
+    @classmethod
+    def encode(cls, bits_deinterleaved: bitarray) -> bitarray:
+        """
+        Takes data bits (optionally followed by checksum bits, which are re-calculated)
+        or all deinterleaved bits and return interleaved and FEC protected on-air bits
+        :param bits_deinterleaved:
+        :return:
+        """
+        if len(bits_deinterleaved) == cls.TOTAL_BITS:
+            # full deinterleaved data including checksum, hamming and parity, as returned by deinterleave_all_bits
+            data: numpy.ndarray = bits_to_vector(bits_deinterleaved)[
+                cls.CELL_INTERLEAVE_INDICES[cls.CELL_INTERLEAVE_INDICES[cls.DATA_CELLS]]
+            ]
+        else:
+            assert len(bits_deinterleaved) in (
+                cls.DATA_BITS,
+                cls.DATA_BITS + cls.CHECKSUM_BITS,
+            ), f"Unexpected number of bits fed to {cls.__name__}.encode, expected {cls.DATA_BITS}, {cls.DATA_BITS + cls.CHECKSUM_BITS} or {cls.TOTAL_BITS}, got {len(bits_deinterleaved)}"
+            data: numpy.ndarray = bits_to_vector(bits_deinterleaved[: cls.DATA_BITS])
+        return vector_to_bits(cls.encode_batch(data[None, :])[0])
+
+    @staticmethod
+    def numpy_to_bits(bits: numpy.ndarray) -> bitarray:
+        """
+        Converts array of 0/1 values to (big endian) bitarray
+        :param bits:
+        :return:
+        """
+        return vector_to_bits(bits)
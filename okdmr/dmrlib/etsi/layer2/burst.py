@@ -1,6 +1,8 @@
-from typing import Optional, Literal
+from typing import TYPE_CHECKING, Literal, Optional, Tuple
 
+import numpy
 from bitarray import bitarray
+from bitarray.util import ba2int
 from okdmr.kaitai.homebrew.mmdvm2020 import Mmdvm2020
 from okdmr.kaitai.hytera.ip_site_connect_protocol import IpSiteConnectProtocol
 
@@ -19,33 +21,82 @@ from okdmr.dmrlib.etsi.layer2.pdu.rate12_data import Rate12Data
 from okdmr.dmrlib.etsi.layer2.pdu.rate1_data import Rate1Data
 from okdmr.dmrlib.etsi.layer2.pdu.rate34_data import Rate34Data
 from okdmr.dmrlib.etsi.layer2.pdu.slot_type import SlotType
+from okdmr.dmrlib.etsi.layer2.sync_classifier import SyncClassifier
 from okdmr.dmrlib.hytera.hytera_constants import IPSC_KAITAI_VOICE_SLOTS
 from okdmr.dmrlib.transmission.transmission_types import TransmissionTypes
-from okdmr.dmrlib.utils.bits_bytes import bits_to_bytes, bytes_to_bits, byteswap_bytes
+from okdmr.dmrlib.utils.bits_bytes import bits_view, byteswap_numpy
 from okdmr.dmrlib.utils.bits_interface import BitsInterface
 from okdmr.dmrlib.utils.bytes_interface import BytesInterface
 
+if TYPE_CHECKING:
+    from okdmr.dmrlib.etsi.layer2.burst_cache import BurstDecodeCache
+
 
 class Burst(BytesInterface):
     """
     ETSI TS 102 361-1 V2.5.1 (2017-10) - 4.2.2   Burst and frame structure
+
+    In lazy mode, emb, slot_type, info_bits_deinterleaved and data are decoded on first access (and cached),
+    so callers, which filter bursts by sync, timeslot or other cheap fields, do not pay for FEC decoding
+
+    Encoded form (see Burst.encode) is cached as well, until emb, slot_type or data is replaced,
+    PDUs changed in place require explicit Burst.invalidate_encoded
     """
 
+    UNDECODED: object = object()
+    """Marker of lazy field, that was not decoded yet"""
+
+    BYTES_LENGTH: int = 33
+    """Burst length in bytes (264 bits)"""
+
+    CENTER_MASK: int = ((1 << 48) - 1) << 108
+    """SYNC or EMB + embedded signalling (bits 108-155) within 264-bit int"""
+
+    INFO_LOW_MASK: int = (1 << 98) - 1
+    """Second half of 196 info bits (or first half in 264-bit int)"""
+
+    __slots__ = (
+        "full_bits",
+        "sync_or_embedded_signalling",
+        "sync_distance",
+        "is_voice_superframe_start",
+        "is_vocoder",
+        "voice_burst",
+        "is_data_or_control",
+        "has_emb",
+        "has_slot_type",
+        "_emb",
+        "_slot_type",
+        "_info_bits_deinterleaved",
+        "_data",
+        "timeslot",
+        "source_radio_id",
+        "_target_radio_id",
+        "_target_radio_id_resolve_attempt",
+        "sequence_no",
+        "stream_no",
+        "transmission_type",
+        "_encoded",
+    )
+
     def __init__(
         self,
         full_bits: bitarray = bitarray([0] * 264),
         burst_type: BurstTypes = BurstTypes.Undefined,
+        lazy: bool = False,
+        sync_max_distance: Optional[int] = None,
     ):
         assert (
             len(full_bits) == 264
         ), f"DMR Layer 2 burst must be 264 bits, got {len(full_bits)}"
         self.full_bits: bitarray = full_bits
-        self.embedded_signalling_bits: bitarray = self.full_bits[116:148]
-        self.sync_or_embedded_signalling: SyncPatterns = SyncPatterns.resolve_bytes(
-            bits_to_bytes(self.full_bits[108:156])
+        # tolerates few bit errors in SYNC (SyncClassifier.DEFAULT_MAX_DISTANCE unless given), see SyncClassifier
+        sync, sync_distance = SyncClassifier.classify(
+            (self.full_int >> 108) & 0xFFFFFFFFFFFF, max_distance=sync_max_distance
         )
-        self.voice_bits: bitarray = full_bits[:108] + full_bits[156:]
-        self.info_bits_original: bitarray = full_bits[:98] + full_bits[166:]
+        self.sync_or_embedded_signalling: SyncPatterns = sync
+        # bit errors in SYNC, for embedded signalling (no SYNC within tolerance) it is max distance + 1
+        self.sync_distance: int = sync_distance
 
         self.is_voice_superframe_start: bool = self.sync_or_embedded_signalling in [
             SyncPatterns.Tdma2Voice,
@@ -75,28 +126,12 @@ class Burst(BytesInterface):
             self.sync_or_embedded_signalling == SyncPatterns.EmbeddedSignalling
             and not self.is_voice_superframe_start
         )
-        self.emb: Optional[EmbeddedSignalling] = (
-            None
-            if not self.has_emb
-            else EmbeddedSignalling.from_bits(
-                self.full_bits[108:116] + self.full_bits[148:156]
-            )
-        )
-
         self.has_slot_type: bool = self.is_data_or_control
-        self.slot_type: Optional[SlotType] = (
-            None
-            if not self.has_slot_type
-            else SlotType.from_bits(self.full_bits[98:108] + self.full_bits[156:166])
-        )
 
-        self.info_bits_deinterleaved: Optional[bitarray] = (
-            None
-            if not self.is_data_or_control
-            else self.__class__.deinterleave(
-                bits=self.info_bits_original, data_type=self.data_type
-            )
-        )
+        self._emb: Optional[EmbeddedSignalling] = Burst.UNDECODED
+        self._slot_type: Optional[SlotType] = Burst.UNDECODED
+        self._info_bits_deinterleaved: Optional[bitarray] = Burst.UNDECODED
+        self._data: Optional[BitsInterface] = Burst.UNDECODED
         # variables not standardized in ETSI, used for various DMR protocols processing
         self.timeslot: int = 1
         self.source_radio_id: int = 0
@@ -105,9 +140,108 @@ class Burst(BytesInterface):
         self.sequence_no: int = 0
         self.stream_no: bytes = bytes(4)
         self.transmission_type: TransmissionTypes = TransmissionTypes.Idle
-        self.data: Optional[BitsInterface] = (
-            self.extract_data() if self.is_data_or_control else None
-        )
+        # (inputs not covered by setters, 33 bytes), see Burst.encode
+        self._encoded: Optional[Tuple[tuple, bytes]] = None
+
+        if not lazy:
+            self.decode()
+
+    @property
+    def full_int(self) -> int:
+        """
+        :return: whole burst as 264-bit int, short fields (sync, emb, slot type) are extracted from it by shifts
+        """
+        return ba2int(self.full_bits)
+
+    @property
+    def embedded_signalling_bits(self) -> bitarray:
+        return self.full_bits[116:148]
+
+    @property
+    def voice_bits(self) -> bitarray:
+        return self.full_bits[:108] + self.full_bits[156:]
+
+    @property
+    def info_bits_original(self) -> bitarray:
+        return self.full_bits[:98] + self.full_bits[166:]
+
+    def copy(self) -> "Burst":
+        """
+        Shallow copy, decoded contents (full_bits, emb, slot_type, info bits and data) are shared with original,
+        metadata (timeslot, sequence_no, radio ids, ...) can be changed independently
+        :return:
+        """
+        clone: Burst = self.__class__.__new__(self.__class__)
+        for name in Burst.__slots__:
+            setattr(clone, name, getattr(self, name))
+        return clone
+
+    def decode(self) -> "Burst":
+        """
+        Decodes all lazy fields, that were not accessed yet
+        :return: self
+        """
+        _ = self.emb, self.slot_type, self.info_bits_deinterleaved, self.data
+        return self
+
+    @property
+    def emb(self) -> Optional[EmbeddedSignalling]:
+        if self._emb is Burst.UNDECODED:
+            self._emb = None
+            if self.has_emb:
+                full_int: int = self.full_int
+                self._emb = EmbeddedSignalling.from_int(
+                    (((full_int >> 148) & 0xFF) << 8) | ((full_int >> 108) & 0xFF)
+                )
+        return self._emb
+
+    @emb.setter
+    def emb(self, emb: Optional[EmbeddedSignalling]) -> None:
+        self._emb = emb
+        self._encoded = None
+
+    @property
+    def slot_type(self) -> Optional[SlotType]:
+        if self._slot_type is Burst.UNDECODED:
+            self._slot_type = None
+            if self.has_slot_type:
+                full_int: int = self.full_int
+                self._slot_type = SlotType.from_int(
+                    (((full_int >> 156) & 0x3FF) << 10) | ((full_int >> 98) & 0x3FF)
+                )
+        return self._slot_type
+
+    @slot_type.setter
+    def slot_type(self, slot_type: Optional[SlotType]) -> None:
+        self._slot_type = slot_type
+        self._encoded = None
+
+    @property
+    def info_bits_deinterleaved(self) -> Optional[bitarray]:
+        if self._info_bits_deinterleaved is Burst.UNDECODED:
+            self._info_bits_deinterleaved = (
+                self.__class__.deinterleave(
+                    bits=self.info_bits_original, data_type=self.data_type
+                )
+                if self.is_data_or_control
+                else None
+            )
+        return self._info_bits_deinterleaved
+
+    @info_bits_deinterleaved.setter
+    def info_bits_deinterleaved(self, info_bits_deinterleaved: Optional[bitarray]):
+        self._info_bits_deinterleaved = info_bits_deinterleaved
+
+    @property
+    def data(self) -> Optional[BitsInterface]:
+        if self._data is Burst.UNDECODED:
+            self._data = self.extract_data() if self.is_data_or_control else None
+        return self._data
+
+    @data.setter
+    def data(self, data: Optional[BitsInterface]) -> None:
+        self._data = data
+        self._encoded = None
 
     @property
     def target_radio_id(self) -> int:
@@ -200,51 +334,123 @@ class Burst(BytesInterface):
 
         return status
 
-    def as_bits(self) -> bitarray:
+    def invalidate_encoded(self) -> "Burst":
+        """
+        Drops cached encoded form, needed only after emb, slot_type or data was changed in place
+        :return: self
+        """
+        self._encoded = None
+        return self
+
+    def encode(self) -> bytes:
+        """
+        Builds on-air burst (re-encoding EMB, SLOT and data FEC) as single 264-bit int, using shifts and masks
+        :return: 33 bytes
+        """
+        if self.has_emb:
+            emb: int = self.emb.as_int()
+            center: int = (
+                ((emb >> 8) << 40)
+                | (ba2int(self.full_bits[116:148]) << 8)
+                | (emb & 0xFF)
+            )
+        else:
+            center: int = self.sync_or_embedded_signalling.value
+
         if self.is_data_or_control:
-            data_bits_interleaved = self.interleave()
-            slot_bits = self.slot_type.as_bits()
-            return (
-                data_bits_interleaved[:98]
-                + slot_bits[:10]
-                + (
-                    self.emb.as_bits()
-                    if self.has_emb
-                    else self.sync_or_embedded_signalling.as_bits()
-                )
-                + slot_bits[10:]
-                + data_bits_interleaved[98:]
+            info: int = ba2int(self.interleave())
+            slot: int = self.slot_type.as_int()
+            value: int = (
+                ((info >> 98) << 166)
+                | ((slot >> 10) << 156)
+                | (center << 108)
+                | ((slot & 0x3FF) << 98)
+                | (info & Burst.INFO_LOW_MASK)
             )
-        emb_bits = self.emb.as_bits() if self.has_emb else None
-        center_bits = (
-            (emb_bits[:8] + self.embedded_signalling_bits + emb_bits[8:])
-            if self.has_emb
-            else self.sync_or_embedded_signalling.as_bits()
+        else:
+            value: int = (ba2int(self.full_bits) & ~Burst.CENTER_MASK) | (center << 108)
+        return value.to_bytes(Burst.BYTES_LENGTH, byteorder="big")
+
+    @property
+    def encoded(self) -> bytes:
+        """
+        Cached result of Burst.encode
+        :return: 33 bytes
+        """
+        inputs: tuple = (
+            self.full_bits,
+            self.sync_or_embedded_signalling,
+            self.has_emb,
+            self.is_data_or_control,
         )
-        return self.voice_bits[:108] + center_bits + self.voice_bits[108:]
+        # tuple comparison checks identity first, so unchanged full_bits are not compared bit by bit
+        if self._encoded is None or self._encoded[0] != inputs:
+            self._encoded = (inputs, self.encode())
+        return self._encoded[1]
+
+    def write_into(self, buf: bytearray, offset: int = 0) -> int:
+        """
+        Writes encoded burst into preallocated buffer, without intermediate bitarray
+        :param buf: bytearray (or other writable buffer) with at least offset + 33 bytes
+        :param offset: position of first byte of burst within buf
+        :return: offset just after written burst
+        """
+        end: int = offset + Burst.BYTES_LENGTH
+        assert 0 <= offset and end <= len(
+            buf
+        ), f"Burst needs {Burst.BYTES_LENGTH} bytes at offset {offset}, buffer has {len(buf)}"
+        buf[offset:end] = self.encoded
+        return end
+
+    def as_bits(self) -> bitarray:
+        # copy, as callers may modify returned bits
+        bits: bitarray = bitarray(endian="big")
+        bits.frombytes(self.encoded)
+        return bits
 
     def as_bytes(self, endian: Literal["big", "little"] = "big") -> bytes:
-        return bits_to_bytes(self.as_bits())
+        return self.encoded
 
     @staticmethod
-    def from_bits(bits: bitarray, burst_type: BurstTypes) -> "Burst":
-        return Burst(full_bits=bits, burst_type=burst_type)
+    def from_bits(
+        bits: bitarray, burst_type: BurstTypes, lazy: bool = False
+    ) -> "Burst":
+        return Burst(full_bits=bits, burst_type=burst_type, lazy=lazy)
 
     @staticmethod
     def from_bytes(
-        data: bytes, burst_type: BurstTypes = BurstTypes.DataAndControl
+        data: bytes,
+        burst_type: BurstTypes = BurstTypes.DataAndControl,
+        lazy: bool = False,
     ) -> "Burst":
-        return Burst(full_bits=bytes_to_bits(data), burst_type=burst_type)
+        # bytearray copy is the only backing store, full_bits is view over it
+        return Burst(
+            full_bits=bits_view(bytearray(data)), burst_type=burst_type, lazy=lazy
+        )
 
     @staticmethod
-    def from_mmdvm(mmdvm: Mmdvm2020.TypeDmrData) -> "Burst":
-        b = Burst(
-            full_bits=bytes_to_bits(mmdvm.dmr_data),
-            burst_type=(
-                BurstTypes.DataAndControl
-                if mmdvm.frame_type == 2
-                else BurstTypes.Vocoder
-            ),
+    def from_mmdvm(
+        mmdvm: Mmdvm2020.TypeDmrData,
+        lazy: bool = False,
+        cache: Optional["BurstDecodeCache"] = None,
+    ) -> "Burst":
+        """
+        :param mmdvm:
+        :param lazy: ignored if cache is used, cached bursts are always fully decoded
+        :param cache: if provided, burst is decoded only if not already in cache, contents are shared with cache
+        :return:
+        """
+        burst_type: BurstTypes = (
+            BurstTypes.DataAndControl if mmdvm.frame_type == 2 else BurstTypes.Vocoder
+        )
+        b = (
+            cache.get(bytes(mmdvm.dmr_data), burst_type)
+            if cache is not None
+            else Burst(
+                full_bits=bits_view(bytearray(mmdvm.dmr_data)),
+                burst_type=burst_type,
+                lazy=lazy,
+            )
         )
         b.set_stream_no(mmdvm.stream_id)
         b.set_sequence_no(mmdvm.sequence_no)
@@ -254,9 +460,20 @@ class Burst(BytesInterface):
         return b
 
     @staticmethod
-    def from_hytera_ipsc(ipsc: IpSiteConnectProtocol) -> "Burst":
-        fullbytes: bytes = byteswap_bytes(ipsc.ipsc_payload)[:-1]
-        fullbits: bitarray = bytes_to_bits(fullbytes)
+    def from_hytera_ipsc(
+        ipsc: IpSiteConnectProtocol,
+        lazy: bool = False,
+        cache: Optional["BurstDecodeCache"] = None,
+    ) -> "Burst":
+        """
+        :param ipsc:
+        :param lazy: ignored if cache is used, cached bursts are always fully decoded
+        :param cache: if provided, burst is decoded only if not already in cache (IPSC Sync/Wakeup are never cached)
+        :return:
+        """
+        # swapped payload is the only backing store, last (padding) byte is not part of the burst
+        payload: numpy.ndarray = byteswap_numpy(ipsc.ipsc_payload)[:-1]
+        fullbits: bitarray = bits_view(payload)
 
         # special cases for IPSC Sync / Wakeup
         if ipsc.slot_type == IpSiteConnectProtocol.SlotTypes.slot_type_sync:
@@ -274,13 +491,15 @@ class Burst(BytesInterface):
                 bits=fullbits, burst_type=BurstTypes.Undefined
             )
 
-        b = Burst(
-            full_bits=fullbits,
-            burst_type=(
-                BurstTypes.Vocoder
-                if ipsc.slot_type in IPSC_KAITAI_VOICE_SLOTS
-                else BurstTypes.DataAndControl
-            ),
+        burst_type: BurstTypes = (
+            BurstTypes.Vocoder
+            if ipsc.slot_type in IPSC_KAITAI_VOICE_SLOTS
+            else BurstTypes.DataAndControl
+        )
+        b = (
+            cache.get(payload.tobytes(), burst_type)
+            if cache is not None
+            else Burst(full_bits=fullbits, burst_type=burst_type, lazy=lazy)
         )
         b.set_sequence_no(ipsc.sequence_number)
         b.source_radio_id = ipsc.source_radio_id
@@ -321,4 +540,4 @@ class Burst(BytesInterface):
             # response header/data blocks, mbc header/continuation/last block, udt header/continuation/last block
             # unified single block data and more
             # See section B.0 table B.1, FEC and CRC summary, ETSI TS 102 361-1 V2.5.1 (2017-10)
-            return BPTC19696.deinterleave_data_bits(bits=bits)
+            return BPTC19696.decode(bits=bits)[0]
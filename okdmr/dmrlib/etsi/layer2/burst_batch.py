@@ -0,0 +1,405 @@
+from typing import Iterator, Optional, Tuple, Union
+
+import numpy
+from okdmr.kaitai.homebrew.mmdvm2020 import Mmdvm2020
+from okdmr.kaitai.hytera.ip_site_connect_protocol import IpSiteConnectProtocol
+
+from okdmr.dmrlib.etsi.fec.golay_20_8_7 import Golay2087
+from okdmr.dmrlib.etsi.fec.quadratic_residue_16_7_6 import QuadraticResidue1676
+from okdmr.dmrlib.etsi.layer2.burst import Burst
+from okdmr.dmrlib.etsi.layer2.elements.burst_types import BurstTypes
+from okdmr.dmrlib.etsi.layer2.elements.data_types import DataTypes
+from okdmr.dmrlib.etsi.layer2.elements.sync_patterns import SyncPatterns
+from okdmr.dmrlib.etsi.layer2.sync_classifier import SyncClassifier
+from okdmr.dmrlib.hytera.hytera_constants import IPSC_KAITAI_VOICE_SLOTS
+from okdmr.dmrlib.utils.bits_bytes import bits_view, byteswap_numpy
+
+
+class BurstBatch:
+    """
+    Structure-of-arrays container of N raw bursts (uint8[N,33]) with per-burst metadata arrays
+
+    Sync pattern, EMB, slot type, data type and colour code are computed for whole batch at once, using
+    table lookups (same tables as Burst uses per burst), Burst objects are created only on request (see burst())
+    """
+
+    BURST_BYTES: int = 33
+    """On-air burst length (264 bits)"""
+
+    BURST_TYPES: Tuple[BurstTypes, ...] = (
+        BurstTypes.Undefined,
+        BurstTypes.Vocoder,
+        BurstTypes.DataAndControl,
+    )
+    """burst_types array holds index into this tuple"""
+
+    SYNC_VALUES: numpy.ndarray = numpy.array(
+        [pattern.value for pattern in SyncPatterns if pattern.value >= 0],
+        dtype=numpy.int64,
+    )
+    """48-bit values of all SYNC patterns"""
+
+    POPCOUNT: numpy.ndarray = numpy.frombuffer(
+        SyncClassifier.POPCOUNT, dtype=numpy.uint8
+    )
+
+    VOICE_SYNC_VALUES: numpy.ndarray = numpy.array(
+        [
+            SyncPatterns.Tdma2Voice.value,
+            SyncPatterns.Tdma1Voice.value,
+            SyncPatterns.MsSourcedVoice.value,
+            SyncPatterns.BsSourcedVoice.value,
+        ],
+        dtype=numpy.int64,
+    )
+
+    DATA_SYNC_VALUES: numpy.ndarray = numpy.array(
+        [
+            SyncPatterns.Tdma1Data.value,
+            SyncPatterns.Tdma2Data.value,
+            SyncPatterns.BsSourcedData.value,
+            SyncPatterns.MsSourcedData.value,
+        ],
+        dtype=numpy.int64,
+    )
+
+    def __init__(self, capacity: int = 1024):
+        assert capacity > 0, f"BurstBatch capacity must be positive, got {capacity}"
+        self.length: int = 0
+        self._payloads: numpy.ndarray = numpy.zeros(
+            (capacity, BurstBatch.BURST_BYTES), dtype=numpy.uint8
+        )
+        self._burst_types: numpy.ndarray = numpy.zeros(capacity, dtype=numpy.uint8)
+        self._timestamps: numpy.ndarray = numpy.zeros(capacity, dtype=numpy.float64)
+        self._source_ids: numpy.ndarray = numpy.zeros(capacity, dtype=numpy.uint32)
+        self._target_ids: numpy.ndarray = numpy.zeros(capacity, dtype=numpy.uint32)
+        self._timeslots: numpy.ndarray = numpy.ones(capacity, dtype=numpy.uint8)
+        self._sequence_nos: numpy.ndarray = numpy.zeros(capacity, dtype=numpy.uint32)
+        self._stream_ids: numpy.ndarray = numpy.zeros(capacity, dtype=numpy.uint32)
+
+    def __len__(self) -> int:
+        return self.length
+
+    @property
+    def capacity(self) -> int:
+        return len(self._payloads)
+
+    def reserve(self, capacity: int) -> "BurstBatch":
+        """
+        Grows all arrays to (at least) given capacity, existing bursts are kept
+        :param capacity:
+        :return: self
+        """
+        if capacity <= self.capacity:
+            return self
+        for name in (
+            "_payloads",
+            "_burst_types",
+            "_timestamps",
+            "_source_ids",
+            "_target_ids",
+            "_timeslots",
+            "_sequence_nos",
+            "_stream_ids",
+        ):
+            old: numpy.ndarray = getattr(self, name)
+            new: numpy.ndarray = numpy.zeros(
+                (capacity,) + old.shape[1:], dtype=old.dtype
+            )
+            new[: self.length] = old[: self.length]
+            setattr(self, name, new)
+        return self
+
+    def append(
+        self,
+        payload: Union[bytes, bytearray, memoryview, numpy.ndarray],
+        burst_type: BurstTypes = BurstTypes.DataAndControl,
+        timestamp: float = 0.0,
+        source_id: int = 0,
+        target_id: int = 0,
+        timeslot: int = 1,
+        sequence_no: int = 0,
+        stream_id: int = 0,
+    ) -> int:
+        """
+        :param payload: 33 bytes of on-air burst
+        :param burst_type:
+        :param timestamp: capture time (seconds since epoch), or any other monotonic value
+        :param source_id:
+        :param target_id:
+        :param timeslot:
+        :param sequence_no:
+        :param stream_id: 32-bit stream id (as used by MMDVM/Homebrew)
+        :return: index of appended burst
+        """
+        assert (
+            len(payload) == BurstBatch.BURST_BYTES
+        ), f"DMR Layer 2 burst must be 33 bytes, got {len(payload)}"
+        if self.length == self.capacity:
+            self.reserve(self.capacity * 2)
+        index: int = self.length
+        self._payloads[index] = numpy.frombuffer(payload, dtype=numpy.uint8)
+        self._burst_types[index] = BurstBatch.BURST_TYPES.index(burst_type)
+        self._timestamps[index] = timestamp
+        self._source_ids[index] = source_id
+        self._target_ids[index] = target_id
+        self._timeslots[index] = timeslot
+        self._sequence_nos[index] = sequence_no
+        self._stream_ids[index] = stream_id
+        self.length += 1
+        return index
+
+    def append_mmdvm(self, mmdvm: Mmdvm2020.TypeDmrData, timestamp: float = 0.0) -> int:
+        """
+        Same burst type and metadata as Burst.from_mmdvm
+        :param mmdvm:
+        :param timestamp:
+        :return: index of appended burst
+        """
+        return self.append(
+            payload=mmdvm.dmr_data,
+            burst_type=(
+                BurstTypes.DataAndControl
+                if mmdvm.frame_type == 2
+                else BurstTypes.Vocoder
+            ),
+            timestamp=timestamp,
+            source_id=mmdvm.source_id,
+            target_id=mmdvm.target_id,
+            timeslot=1 if mmdvm.slot_no == Mmdvm2020.Timeslots.timeslot_1 else 2,
+            sequence_no=mmdvm.sequence_no,
+            stream_id=mmdvm.stream_id,
+        )
+
+    def append_hytera_ipsc(
+        self, ipsc: IpSiteConnectProtocol, timestamp: float = 0.0
+    ) -> int:
+        """
+        Same burst type and metadata as Burst.from_hytera_ipsc, IPSC Sync and Wakeup (not on-air bursts) are skipped
+        :param ipsc:
+        :param timestamp:
+        :return: index of appended burst, -1 if skipped
+        """
+        if ipsc.slot_type in (
+            IpSiteConnectProtocol.SlotTypes.slot_type_sync,
+            IpSiteConnectProtocol.SlotTypes.slot_type_wakeup_request,
+        ):
+            return -1
+        return self.append(
+            payload=byteswap_numpy(ipsc.ipsc_payload)[:-1],
+            burst_type=(
+                BurstTypes.Vocoder
+                if ipsc.slot_type in IPSC_KAITAI_VOICE_SLOTS
+                else BurstTypes.DataAndControl
+            ),
+            timestamp=timestamp,
+            source_id=ipsc.source_radio_id,
+            target_id=ipsc.destination_radio_id,
+            timeslot=(
+                1
+                if ipsc.timeslot_raw == IpSiteConnectProtocol.Timeslots.timeslot_1
+                else 2
+            ),
+            sequence_no=ipsc.sequence_number,
+        )
+
+    @property
+    def payloads(self) -> numpy.ndarray:
+        """
+        :return: uint8[N,33] view of bursts
+        """
+        return self._payloads[: self.length]
+
+    @property
+    def burst_types(self) -> numpy.ndarray:
+        """
+        :return: index into BurstBatch.BURST_TYPES per burst
+        """
+        return self._burst_types[: self.length]
+
+    @property
+    def timestamps(self) -> numpy.ndarray:
+        return self._timestamps[: self.length]
+
+    @property
+    def source_ids(self) -> numpy.ndarray:
+        return self._source_ids[: self.length]
+
+    @property
+    def target_ids(self) -> numpy.ndarray:
+        return self._target_ids[: self.length]
+
+    @property
+    def timeslots(self) -> numpy.ndarray:
+        return self._timeslots[: self.length]
+
+    @property
+    def sequence_nos(self) -> numpy.ndarray:
+        return self._sequence_nos[: self.length]
+
+    @property
+    def stream_ids(self) -> numpy.ndarray:
+        return self._stream_ids[: self.length]
+
+    def sync_values(self) -> numpy.ndarray:
+        """
+        :return: int64[N] raw 48-bit center of each burst (bits 108-155), SYNC or embedded signalling
+        """
+        # bits 108-155 are low nibble of byte 13, bytes 14-18 and high nibble of byte 19
+        center: numpy.ndarray = self.payloads[:, 13:20].astype(numpy.int64)
+        value: numpy.ndarray = numpy.zeros(self.length, dtype=numpy.int64)
+        for column in range(7):
+            value = (value << 8) | center[:, column]
+        return (value >> 4) & 0xFFFFFFFFFFFF
+
+    def classify_syncs(
+        self, max_distance: Optional[int] = None
+    ) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Vectorized SyncClassifier.classify
+        :param max_distance: see SyncClassifier.classify
+        :return: (int64[N] SyncPatterns value per burst, SyncPatterns.EmbeddedSignalling (-1) if no SYNC matched,
+                  uint8[N] bit errors in SYNC, max_distance + 1 if no SYNC matched)
+        """
+        if max_distance is None:
+            max_distance = SyncClassifier.DEFAULT_MAX_DISTANCE
+        diff: numpy.ndarray = numpy.ascontiguousarray(
+            self.sync_values()[:, None] ^ BurstBatch.SYNC_VALUES[None, :]
+        )
+        distances: numpy.ndarray = (
+            BurstBatch.POPCOUNT[diff.view(numpy.uint8)]
+            .reshape(diff.shape + (8,))
+            .sum(axis=2, dtype=numpy.uint8)
+        )
+        nearest: numpy.ndarray = distances.argmin(axis=1)
+        distance: numpy.ndarray = distances[numpy.arange(self.length), nearest]
+        matched: numpy.ndarray = distance <= max_distance
+        return (
+            numpy.where(
+                matched,
+                BurstBatch.SYNC_VALUES[nearest],
+                SyncPatterns.EmbeddedSignalling.value,
+            ),
+            numpy.where(matched, distance, max_distance + 1).astype(numpy.uint8),
+        )
+
+    def sync_patterns(self, max_distance: Optional[int] = None) -> numpy.ndarray:
+        """
+        :param max_distance: see SyncClassifier.classify
+        :return: int64[N] SyncPatterns value per burst, SyncPatterns.EmbeddedSignalling (-1) if no SYNC matched
+        """
+        return self.classify_syncs(max_distance=max_distance)[0]
+
+    def is_data_or_control(self) -> numpy.ndarray:
+        """
+        :return: bool[N], same as Burst.is_data_or_control (and Burst.has_slot_type)
+        """
+        return (
+            self.burst_types == BurstBatch.BURST_TYPES.index(BurstTypes.DataAndControl)
+        ) | numpy.isin(self.sync_patterns(), BurstBatch.DATA_SYNC_VALUES)
+
+    def is_voice_superframe_start(self) -> numpy.ndarray:
+        """
+        :return: bool[N], same as Burst.is_voice_superframe_start
+        """
+        return numpy.isin(self.sync_patterns(), BurstBatch.VOICE_SYNC_VALUES)
+
+    def has_emb(self) -> numpy.ndarray:
+        """
+        :return: bool[N], same as Burst.has_emb
+        """
+        return self.sync_patterns() == SyncPatterns.EmbeddedSignalling.value
+
+    def emb_codewords(self) -> numpy.ndarray:
+        """
+        :return: int64[N] raw 16-bit EMB (bits 108-115 and 148-155), meaningful only where has_emb()
+        """
+        payloads: numpy.ndarray = self.payloads.astype(numpy.int64)
+        return (
+            ((payloads[:, 13] & 0x0F) << 12)
+            | ((payloads[:, 14] >> 4) << 8)
+            | ((payloads[:, 18] & 0x0F) << 4)
+            | (payloads[:, 19] >> 4)
+        )
+
+    def emb_data(self) -> numpy.ndarray:
+        """
+        :return: uint8[N] FEC corrected 7 bits of EMB (colour code, PI, LCSS), meaningful only where has_emb()
+        """
+        return numpy.frombuffer(QuadraticResidue1676.decode_table(), dtype=numpy.uint8)[
+            self.emb_codewords()
+        ]
+
+    def slot_type_codewords(self) -> numpy.ndarray:
+        """
+        :return: int64[N] raw 20-bit slot type (bits 98-107 and 156-165), meaningful only where is_data_or_control()
+        """
+        payloads: numpy.ndarray = self.payloads.astype(numpy.int64)
+        return (
+            ((payloads[:, 12] & 0x3F) << 14)
+            | ((payloads[:, 13] >> 4) << 10)
+            | ((payloads[:, 19] & 0x0F) << 6)
+            | (payloads[:, 20] >> 2)
+        )
+
+    def slot_type_data(self) -> numpy.ndarray:
+        """
+        :return: uint8[N] FEC corrected 8 bits of slot type (colour code, data type), meaningful only where is_data_or_control()
+        """
+        return numpy.frombuffer(Golay2087.decode_table(), dtype=numpy.uint8)[
+            self.slot_type_codewords()
+        ]
+
+    def data_types(self) -> numpy.ndarray:
+        """
+        :return: uint8[N] DataTypes value per burst, DataTypes.Reserved for bursts without slot type
+        """
+        data_type: numpy.ndarray = self.slot_type_data() & 0x0F
+        # values 12-15 are all reserved
+        data_type[data_type > DataTypes.Reserved.value] = DataTypes.Reserved.value
+        data_type[~self.is_data_or_control()] = DataTypes.Reserved.value
+        return data_type
+
+    def colour_codes(self) -> numpy.ndarray:
+        """
+        :return: int8[N] colour code from EMB or slot type, -1 for bursts carrying neither (Burst raises ValueError)
+        """
+        colour_code: numpy.ndarray = numpy.full(self.length, -1, dtype=numpy.int8)
+        has_slot_type: numpy.ndarray = self.is_data_or_control()
+        colour_code[has_slot_type] = self.slot_type_data()[has_slot_type] >> 4
+        has_emb: numpy.ndarray = self.has_emb()
+        colour_code[has_emb] = self.emb_data()[has_emb] >> 3
+        return colour_code
+
+    def burst(self, index: int, lazy: bool = False) -> Burst:
+        """
+        Creates single Burst object, with metadata from batch
+        :param index:
+        :param lazy: see Burst
+        :return:
+        """
+        assert (
+            -self.length <= index < self.length
+        ), f"BurstBatch index {index} out of range, batch has {self.length} bursts"
+        burst: Burst = Burst(
+            full_bits=bits_view(self.payloads[index].tobytes()),
+            burst_type=BurstBatch.BURST_TYPES[self.burst_types[index]],
+            lazy=lazy,
+        )
+        burst.timeslot = int(self.timeslots[index])
+        burst.source_radio_id = int(self.source_ids[index])
+        burst.target_radio_id = int(self.target_ids[index])
+        burst.sequence_no = int(self.sequence_nos[index])
+        burst.set_stream_no(int(self.stream_ids[index]))
+        return burst
+
+    def bursts(self, lazy: bool = False) -> Iterator[Burst]:
+        """
+        :param lazy: see Burst
+        :return: Burst objects, created one by one
+        """
+        for index in range(self.length):
+            yield self.burst(index, lazy=lazy)
+
+    def __repr__(self) -> str:
+        return f"[BurstBatch] [BURSTS {self.length}/{self.capacity}]"
@@ -0,0 +1,73 @@
+from collections import OrderedDict
+from typing import Tuple
+
+from okdmr.dmrlib.etsi.layer2.burst import Burst
+from okdmr.dmrlib.etsi.layer2.elements.burst_types import BurstTypes
+from okdmr.dmrlib.utils.bits_bytes import bits_view
+
+
+class BurstDecodeCache:
+    """
+    Bounded LRU cache of decoded bursts, keyed by on-air payload (33 bytes) and burst type
+
+    DMR traffic repeats a lot (CSBK preambles, idle bursts, voice LC headers and terminators),
+    cache decodes each distinct payload only once, callers get cheap copies (see Burst.copy) with their own
+    per-packet metadata (timeslot, sequence_no, radio ids, ...), while decoded contents (emb, slot_type, data)
+    are shared between all copies and must be treated as read-only
+    """
+
+    DEFAULT_MAXSIZE: int = 1024
+    """Number of distinct bursts kept, when not configured otherwise"""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        assert maxsize > 0, f"BurstDecodeCache maxsize must be positive, got {maxsize}"
+        self.maxsize: int = maxsize
+        self.entries: OrderedDict[Tuple[bytes, BurstTypes], Burst] = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def get(self, payload: bytes, burst_type: BurstTypes) -> Burst:
+        """
+        :param payload: 33 bytes of on-air burst
+        :param burst_type:
+        :return: copy of cached burst, decoded now if payload was not seen yet (or was already evicted)
+        """
+        key: Tuple[bytes, BurstTypes] = (payload, burst_type)
+        burst: Burst = self.entries.get(key)
+        if burst is None:
+            self.misses += 1
+            # cached burst is never handed out, so its metadata stay at defaults
+            burst = Burst(
+                full_bits=bits_view(payload), burst_type=burst_type, lazy=False
+            )
+            self.entries[key] = burst
+            if len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+        else:
+            self.hits += 1
+            self.entries.move_to_end(key)
+        return burst.copy()
+
+    def clear(self) -> "BurstDecodeCache":
+        """
+        Drops all cached bursts and resets hit/miss counters
+        :return: self
+        """
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+        return self
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups: int = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __repr__(self) -> str:
+        return (
+            f"[BurstDecodeCache] [SIZE {len(self)}/{self.maxsize}] "
+            f"[HITS {self.hits}] [MISSES {self.misses}]"
+        )
@@ -0,0 +1,296 @@
+from typing import BinaryIO, Dict, Iterator, List, Literal, Optional, Tuple
+
+import numpy
+
+from okdmr.dmrlib.etsi.layer2.burst import Burst
+from okdmr.dmrlib.etsi.layer2.elements.burst_types import BurstTypes
+from okdmr.dmrlib.etsi.layer2.elements.sync_patterns import SyncPatterns
+from okdmr.dmrlib.etsi.layer2.elements.voice_bursts import VoiceBursts
+from okdmr.dmrlib.etsi.layer2.sync_classifier import SyncClassifier
+from okdmr.dmrlib.utils.bits_bytes import bits_view
+
+
+class BurstFramer:
+    """
+    Streaming framer, extracts bursts from continuous demodulated bitstream (recorded or live receiver output)
+    ETSI TS 102 361-1 V2.5.1 (2017-10) - 4.2.2 Burst and frame structure
+
+    While not locked, SYNC patterns are searched by sliding correlation over whole buffered chunk (numpy),
+    once SYNC is found, framer locks onto 30 ms TDMA slot timing (288 bits, 264 bits of burst and 24 bits of CACH
+    or guard/RC) and cuts bursts at fixed positions, alternating timeslots. Lock is dropped, if no SYNC was seen
+    within max_slots_without_sync slots.
+
+    Only bits not yet consumed (less than one chunk plus one slot) are buffered, so memory stays constant
+    regardless of stream length.
+    """
+
+    BURST_BITS: int = 264
+    """Burst length (27.5 ms)"""
+
+    SLOT_BITS: int = 288
+    """TDMA slot length (30 ms at 4800 symbols/s)"""
+
+    SYNC_OFFSET: int = 108
+    """Position of SYNC (or embedded signalling) within burst"""
+
+    SYNC_BITS: int = 48
+
+    SEARCH_WINDOW: int = 4096
+    """Number of positions correlated at once, while searching for SYNC"""
+
+    PATTERN_NAMES: List[SyncPatterns] = [
+        pattern
+        for pattern in SyncPatterns
+        if pattern != SyncPatterns.EmbeddedSignalling
+    ]
+    """SYNC patterns searched for, in order of rows of BurstFramer.PATTERNS_BIPOLAR"""
+
+    PATTERNS_BIPOLAR: numpy.ndarray = (
+        (
+            numpy.array(
+                [pattern.value for pattern in PATTERN_NAMES], dtype=numpy.int64
+            )[:, None]
+            >> numpy.arange(47, -1, -1)
+        )
+        & 1
+    ) * 2.0 - 1.0
+    """SYNC patterns as +1/-1 (float) vectors, first on-air bit first"""
+
+    TIMESLOT_SYNC: Dict[SyncPatterns, int] = {
+        SyncPatterns.Tdma1Voice: 1,
+        SyncPatterns.Tdma1Data: 1,
+        SyncPatterns.Tdma2Voice: 2,
+        SyncPatterns.Tdma2Data: 2,
+    }
+    """SYNC patterns (TDMA direct mode) carrying timeslot number"""
+
+    def __init__(
+        self,
+        max_distance: Optional[int] = None,
+        max_slots_without_sync: int = 24,
+        first_timeslot: int = 1,
+    ):
+        """
+        :param max_distance: SYNC bit errors tolerated, both while searching and when classifying cut bursts,
+                             see SyncClassifier.classify
+        :param max_slots_without_sync: lock is dropped after this many slots (both timeslots counted) without SYNC,
+                                       default covers two voice superframes on single timeslot with other one unused
+        :param first_timeslot: timeslot of first burst after lock, if it cannot be inferred from SYNC pattern
+        """
+        assert first_timeslot in (
+            1,
+            2,
+        ), f"Timeslot must be 1 or 2, got {first_timeslot}"
+        self.max_distance: int = (
+            SyncClassifier.DEFAULT_MAX_DISTANCE
+            if max_distance is None
+            else max_distance
+        )
+        self.max_slots_without_sync: int = max_slots_without_sync
+        self.first_timeslot: int = first_timeslot
+        self.buffer: numpy.ndarray = numpy.zeros(0, dtype=numpy.uint8)
+        self.locked: bool = False
+        # start of next burst within buffer (may be beyond buffer end), while locked
+        self.position: int = 0
+        self.timeslot: int = first_timeslot
+        self.slots_without_sync: int = 0
+        self.voice_burst_index: Dict[int, Optional[int]] = {1: None, 2: None}
+        self.bursts: int = 0
+        self.bits_consumed: int = 0
+
+    def reset(self) -> "BurstFramer":
+        """
+        Drops buffered bits and lock
+        :return: self
+        """
+        self.buffer = numpy.zeros(0, dtype=numpy.uint8)
+        self.locked = False
+        self.position = 0
+        self.timeslot = self.first_timeslot
+        self.slots_without_sync = 0
+        self.voice_burst_index = {1: None, 2: None}
+        return self
+
+    @staticmethod
+    def dibits_to_bits(dibits: numpy.ndarray) -> numpy.ndarray:
+        """
+        :param dibits: one dibit (symbol, 0-3) per item, more significant bit is first on-air bit
+        :return: bits (0/1), twice the length of input
+        """
+        bits: numpy.ndarray = numpy.empty(len(dibits) * 2, dtype=numpy.uint8)
+        bits[0::2] = (dibits >> 1) & 1
+        bits[1::2] = dibits & 1
+        return bits
+
+    def find_sync(self, bits: numpy.ndarray) -> Optional[Tuple[int, SyncPatterns]]:
+        """
+        Sliding correlation of bits against all SYNC patterns, window by window, so search stops soon after first SYNC
+        :param bits: 0/1 values
+        :return: (position of first SYNC within max_distance, pattern) or None
+        """
+        # correlation of +1/-1 vectors is 48 - 2 * (number of differing bits)
+        min_correlation: float = BurstFramer.SYNC_BITS - 2 * self.max_distance
+        for window in range(0, len(bits), BurstFramer.SEARCH_WINDOW):
+            segment: numpy.ndarray = bits[
+                window : window + BurstFramer.SEARCH_WINDOW + BurstFramer.SYNC_BITS - 1
+            ]
+            if len(segment) < BurstFramer.SYNC_BITS:
+                return None
+            bipolar: numpy.ndarray = segment * 2.0 - 1.0
+            best: Optional[Tuple[int, SyncPatterns]] = None
+            for pattern, pattern_bipolar in zip(
+                BurstFramer.PATTERN_NAMES, BurstFramer.PATTERNS_BIPOLAR
+            ):
+                hits: numpy.ndarray = numpy.flatnonzero(
+                    numpy.correlate(bipolar, pattern_bipolar, mode="valid")
+                    >= min_correlation
+                )
+                if len(hits) and (best is None or hits[0] < best[0]):
+                    best = (window + int(hits[0]), pattern)
+            if best is not None:
+                return best
+        return None
+
+    def feed_bits(self, bits: numpy.ndarray) -> Iterator[Burst]:
+        """
+        :param bits: next chunk of stream, one bit (0/1) per item
+        :return: bursts completed by this chunk
+        """
+        self.buffer = numpy.concatenate(
+            (self.buffer, numpy.asarray(bits, dtype=numpy.uint8))
+        )
+        while True:
+            if not self.locked and not self._search():
+                return
+            while self.position + BurstFramer.BURST_BITS <= len(self.buffer):
+                yield self._cut_burst()
+                if not self.locked:
+                    break
+            if self.locked:
+                # keep only bits of bursts not yet complete, position can point beyond buffer end
+                consumed: int = min(self.position, len(self.buffer))
+                self.buffer = self.buffer[consumed:]
+                self.bits_consumed += consumed
+                self.position -= consumed
+                return
+
+    def feed_dibits(self, dibits: numpy.ndarray) -> Iterator[Burst]:
+        """
+        :param dibits: next chunk of stream, one dibit (0-3) per item
+        :return: bursts completed by this chunk
+        """
+        return self.feed_bits(BurstFramer.dibits_to_bits(numpy.asarray(dibits)))
+
+    def feed_bytes(self, data: bytes) -> Iterator[Burst]:
+        """
+        :param data: next chunk of stream, 8 bits per byte, first on-air bit being MSB
+        :return: bursts completed by this chunk
+        """
+        return self.feed_bits(
+            numpy.unpackbits(numpy.frombuffer(data, dtype=numpy.uint8))
+        )
+
+    def read(
+        self,
+        stream: BinaryIO,
+        input_format: Literal["packed", "bits", "dibits"] = "packed",
+        chunk_size: int = 65536,
+    ) -> Iterator[Burst]:
+        """
+        Reads file or pipe until EOF, in constant memory
+        :param stream: binary file object (opened file, sys.stdin.buffer, ...)
+        :param input_format: packed (8 bits per byte), bits (one bit per byte) or dibits (one symbol per byte)
+        :param chunk_size: number of bytes read at once
+        :return: all bursts found in stream
+        """
+        assert input_format in (
+            "packed",
+            "bits",
+            "dibits",
+        ), f"Unknown input format {input_format}"
+        while True:
+            chunk: bytes = stream.read(chunk_size)
+            if not chunk:
+                return
+            if input_format == "packed":
+                yield from self.feed_bytes(chunk)
+            elif input_format == "bits":
+                yield from self.feed_bits(
+                    numpy.frombuffer(chunk, dtype=numpy.uint8) & 1
+                )
+            else:
+                yield from self.feed_dibits(
+                    numpy.frombuffer(chunk, dtype=numpy.uint8) & 0b11
+                )
+
+    def _search(self) -> bool:
+        """
+        Searches buffer for SYNC, on success locks to burst containing it
+        :return: True if locked
+        """
+        found: Optional[Tuple[int, SyncPatterns]] = self.find_sync(
+            self.buffer[BurstFramer.SYNC_OFFSET :]
+        )
+        if found is None:
+            # any SYNC starting in last bits can still be completed by next chunk
+            keep: int = BurstFramer.BURST_BITS - 1
+            consumed: int = max(0, len(self.buffer) - keep)
+            self.buffer = self.buffer[consumed:]
+            self.bits_consumed += consumed
+            return False
+        position, pattern = found
+        self.locked = True
+        self.position = position
+        self.slots_without_sync = 0
+        self.timeslot = BurstFramer.TIMESLOT_SYNC.get(pattern, self.first_timeslot)
+        self.voice_burst_index = {1: None, 2: None}
+        return True
+
+    def _cut_burst(self) -> Burst:
+        start: int = self.position
+        burst: Burst = Burst(
+            full_bits=bits_view(
+                numpy.packbits(self.buffer[start : start + BurstFramer.BURST_BITS])
+            ),
+            burst_type=BurstTypes.Undefined,
+            lazy=True,
+            sync_max_distance=self.max_distance,
+        )
+        sync: SyncPatterns = burst.sync_or_embedded_signalling
+        if sync == SyncPatterns.EmbeddedSignalling:
+            self.slots_without_sync += 1
+        else:
+            self.slots_without_sync = 0
+            # direct mode SYNC carries timeslot, re-align alternation
+            self.timeslot = BurstFramer.TIMESLOT_SYNC.get(sync, self.timeslot)
+
+        burst.timeslot = self.timeslot
+        burst.set_sequence_no(self.bursts)
+        self._mark_voice(burst)
+
+        self.bursts += 1
+        self.position += BurstFramer.SLOT_BITS
+        self.timeslot = 2 if self.timeslot == 1 else 1
+        if self.slots_without_sync > self.max_slots_without_sync:
+            # search again from the burst following the last one
+            self.locked = False
+            consumed: int = min(self.position, len(self.buffer))
+            self.buffer = self.buffer[consumed:]
+            self.bits_consumed += consumed
+            self.position = 0
+        return burst
+
+    def _mark_voice(self, burst: Burst) -> None:
+        """
+        Voice superframe (bursts A-F) of each timeslot is tracked from burst A (voice SYNC),
+        following 5 bursts of the same timeslot carrying embedded signalling are marked as voice bursts B-F
+        """
+        if burst.is_voice_superframe_start:
+            self.voice_burst_index[burst.timeslot] = 0
+            return
+        index: Optional[int] = self.voice_burst_index[burst.timeslot]
+        if burst.has_emb and index is not None and index < 5:
+            self.voice_burst_index[burst.timeslot] = index + 1
+            burst.set_is_voice(VoiceBursts(VoiceBursts.VoiceBurstA.value + index + 1))
+        else:
+            self.voice_burst_index[burst.timeslot] = None
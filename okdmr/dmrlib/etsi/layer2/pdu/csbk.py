@@ -1,4 +1,4 @@
-from typing import Union, Optional, Dict, Literal
+from typing import Any, Union, Optional, Dict, Literal, Tuple, Type
 
 from bitarray import bitarray
 from bitarray.util import ba2int, int2ba
@@ -20,14 +20,19 @@ from okdmr.dmrlib.etsi.layer3.elements.random_access_service_function import (
 from okdmr.dmrlib.etsi.layer3.elements.reason_code import ReasonCode
 from okdmr.dmrlib.etsi.layer3.elements.service_options import ServiceOptions
 from okdmr.dmrlib.etsi.layer3.elements.source_type import SourceType
+from okdmr.dmrlib.utils.bit_fields import BitField, BitLayout
 from okdmr.dmrlib.utils.bits_bytes import bits_to_bytes, bytes_to_bits
 from okdmr.dmrlib.utils.bits_interface import BitsInterface
 from okdmr.dmrlib.utils.bytes_interface import BytesInterface
+from okdmr.dmrlib.utils.sparse_field import SparseField
 
 
 class CSBK(BitsInterface, BytesInterface):
     """
     ETSI TS 102 361-2 V2.4.1 (2017-10) - 7.1.2  Control Signalling BlocK (CSBK) PDUs
+
+    CSBK.from_bits returns instance of per-opcode record class (subclass of CSBK, see PreambleCSBK and others below),
+    record classes declare their fields and are registered by CSBKO (and FID for manufacturer specific CSBKs)
     """
 
     TSCC_BACKOFF_MAP: Dict[int, int] = {
@@ -48,6 +53,78 @@ class CSBK(BitsInterface, BytesInterface):
         15: 100,
     }
 
+    HEADER: BitLayout = BitLayout(
+        80,
+        BitField("last_block", 0, 1, decode=bool),
+        BitField("protect_flag", 1, 1, decode=bool),
+        BitField("csbko", 2, 6, decode=CsbkOpcodes),
+        BitField("feature_set", 8, 8, decode=FeatureSetIDs),
+    )
+    """LB, PF, CSBKO and FID, common to all CSBKs (first 80 bits, without CRC)"""
+
+    CSBKO: Optional[CsbkOpcodes] = None
+    """CSBKO of record class, None for generic CSBK"""
+
+    FEATURE_SET: Optional[FeatureSetIDs] = None
+    """FID of manufacturer specific record class, None if CSBKO has the same meaning regardless of FID"""
+
+    FIELDS: Tuple[BitField, ...] = ()
+    """CSBKO specific fields of record class, positions within 80 bits of CSBK"""
+
+    CODECS: Dict[Tuple[int, Optional[int]], "CsbkCodec"] = {}
+    """(CSBKO value, FID value or None) -> codec, filled by record classes"""
+
+    __slots__ = (
+        "last_block",
+        "protect_flag",
+        "csbko",
+        "feature_set",
+        "crc",
+        "crc_ok",
+        "source_address",
+        "target_address",
+        "_sparse",
+    )
+    # opcode specific fields, only values different from default are stored per instance
+    bs_address: int = SparseField(0)
+    service_options: Optional[ServiceOptions] = SparseField(None)
+    answer_response: Optional[AnswerResponse] = SparseField(None)
+    additional_information_field: Optional[AdditionalInformationField] = SparseField(
+        None
+    )
+    source_type: Optional[SourceType] = SparseField(None)
+    service_type: Optional[CsbkOpcodes] = SparseField(None)
+    reason_code: Optional[ReasonCode] = SparseField(None)
+    csbk_content_follows_preambles: bool = SparseField(False)
+    target_address_is_individual: bool = SparseField(False)
+    blocks_to_follow: int = SparseField(0)
+    sync_age: int = SparseField(0)
+    generation: int = SparseField(0)
+    leader_identifier: int = SparseField(0)
+    new_leader: int = SparseField(0)
+    leader_dynamic_identifier: DynamicIdentifier = SparseField(DynamicIdentifier(0))
+    channel_timing_opcode: ChannelTimingOpcode = SparseField(ChannelTimingOpcode(0))
+    source_identifier: int = SparseField(0)
+    source_dynamic_identifier: DynamicIdentifier = SparseField(DynamicIdentifier(0))
+    raw_data: bytes = SparseField(b"")
+    tsccas_support: bool = SparseField(False)
+    site_timeslot_synchronized: bool = SparseField(False)
+    document_version_control: int = SparseField(3)
+    tscc_is_offset_timing: bool = SparseField(False)
+    ts_active_connection: bool = SparseField(False)
+    aloha_mask: int = SparseField(0)
+    service_function: RandomAccessServiceFunction = SparseField(
+        RandomAccessServiceFunction(0)
+    )
+    nrand_wait: int = SparseField(0)
+    tscc_reg_required: bool = SparseField(False)
+    tscc_backoff: int = SparseField(1)
+    system_identity_code: int = SparseField(0)
+    broadcast_params: bitarray = SparseField(bitarray())
+    announcement_type: AnnouncementType = SparseField(
+        AnnouncementType.GeneralSiteParams
+    )
+
     def __init__(
         self,
         csbko: CsbkOpcodes,
@@ -129,6 +206,7 @@ class CSBK(BitsInterface, BytesInterface):
         :param source_identifier: value 0-1048575, ms derived identifier
         :param source_dynamic_identifier: DynamicIdentifier or value 0-3
         """
+        self._sparse: Optional[Dict] = None
         self.last_block: bool = last_block in (True, 1)
         self.protect_flag: bool = protect_flag in (True, 1)
         self.csbko: CsbkOpcodes = csbko
@@ -198,104 +276,71 @@ class CSBK(BitsInterface, BytesInterface):
 
         if self.crc <= 0:
             self.calculate_crc_ccit()
+        else:
+            self.crc_ok: bool = CRC16.check(
+                self.pack().to_bytes(10, byteorder="big"), self.crc, CrcMasks.CSBK
+            )
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.CSBKO is not None:
+            CSBK.register(CsbkCodec(cls))
+
+    @staticmethod
+    def register(codec: "CsbkCodec") -> None:
+        """
+        Registers (or replaces) codec for its CSBKO and FID
+        :param codec: compiled codec of record class
+        """
+        CSBK.CODECS[
+            (
+                codec.record.CSBKO.value,
+                codec.record.FEATURE_SET.value
+                if codec.record.FEATURE_SET is not None
+                else None,
+            )
+        ] = codec
+
+    @staticmethod
+    def get_codec(csbko: int, feature_set: int) -> Optional["CsbkCodec"]:
+        """
+        :param csbko: CSBKO value
+        :param feature_set: FID value
+        :return: codec registered for CSBKO and FID, or for CSBKO regardless of FID, None if not registered
+        """
+        codec: Optional[CsbkCodec] = CSBK.CODECS.get((csbko, feature_set))
+        return codec if codec is not None else CSBK.CODECS.get((csbko, None))
 
     def calculate_crc_ccit(self) -> "CSBK":
-        self.crc = CRC16.calculate(self.as_bits()[0:80].tobytes(), CrcMasks.CSBK)
+        self.crc = CRC16.calculate(
+            self.pack().to_bytes(10, byteorder="big"), CrcMasks.CSBK
+        )
+        self.crc_ok = True
         return self
 
-    def as_bits(self) -> bitarray:
-        pdu: bitarray = (
-            bitarray([self.last_block, self.protect_flag])
-            + self.csbko.as_bits()
-            + self.feature_set.as_bits()
+    def get_layout(self) -> BitLayout:
+        """
+        :return: layout of registered CSBKO (and FID), CSBK.HEADER if CSBKO is not registered
+        """
+        codec: Optional[CsbkCodec] = CSBK.get_codec(
+            self.csbko.value, self.feature_set.value
         )
-        if self.csbko == CsbkOpcodes.BSOutboundActivation:
-            pdu += (
-                int2ba(0, length=16)
-                + int2ba(self.bs_address, length=24)
-                + int2ba(self.source_address, length=24)
-            )
-        elif self.csbko == CsbkOpcodes.UnitToUnitVoiceServiceRequest:
-            pdu += (
-                self.service_options.as_bits()
-                + int2ba(0, length=8)
-                + int2ba(self.target_address, length=24)
-                + int2ba(self.source_address, length=24)
-            )
-        elif self.csbko == CsbkOpcodes.UnitToUnitVoiceServiceAnswerResponse:
-            pdu += (
-                self.service_options.as_bits()
-                + self.answer_response.as_bits()
-                + int2ba(self.target_address, length=24)
-                + int2ba(self.source_address, length=24)
-            )
-        elif self.csbko == CsbkOpcodes.NegativeAcknowledgementResponse:
-            pdu += (
-                bitarray([1, self.source_type == SourceType.MSSourced])
-                + self.service_type.as_bits()
-                + self.reason_code.as_bits()
-                + int2ba(self.source_address, length=24)
-                + int2ba(self.target_address, length=24)
-            )
-        elif self.csbko == CsbkOpcodes.PreambleCSBK:
-            pdu += (
-                bitarray(
-                    [
-                        not self.csbk_content_follows_preambles,
-                        not self.target_address_is_individual,
-                    ]
-                )
-                + int2ba(0, length=6)
-                + int2ba(self.blocks_to_follow, length=8)
-                + int2ba(self.target_address, length=24)
-                + int2ba(self.source_address, length=24)
-            )
-        elif self.csbko == CsbkOpcodes.ChannelTimingCSBK:
-            cto = self.channel_timing_opcode.as_bits()
-            pdu += (
-                int2ba(self.sync_age, length=11)
-                + int2ba(self.generation, length=5)
-                + int2ba(self.leader_identifier, length=20)
-                + int2ba(self.new_leader, length=1)
-                + self.leader_dynamic_identifier.as_bits()
-                + bitarray([cto[0]])
-                + int2ba(self.source_identifier, length=20)
-                + bitarray([0])
-                + self.source_dynamic_identifier.as_bits()
-                + bitarray([cto[1]])
-            )
-        elif self.csbko == CsbkOpcodes.HyteraIPSCSync:
-            pdu += bytes_to_bits(self.raw_data)
-        elif self.csbko == CsbkOpcodes.AlohaPDUsForRandomAccessProtocol:
-            pdu += (
-                bitarray(
-                    [
-                        0,  # reserved bit
-                        self.tsccas_support,
-                        self.site_timeslot_synchronized,
-                    ]
-                )
-                + int2ba(self.document_version_control, length=3)
-                + bitarray([self.tscc_is_offset_timing, self.ts_active_connection])
-                + int2ba(self.aloha_mask, length=5)
-                + int2ba(self.service_function.value, length=2)
-                + int2ba(self.nrand_wait, length=4)
-                + bitarray([self.tscc_reg_required])
-                + int2ba(self.tscc_backoff, length=4)
-                + int2ba(self.system_identity_code, length=16)
-                + int2ba(self.target_address, length=24)
-            )
-        elif self.csbko == CsbkOpcodes.AnnouncementPDUsWithoutResponse:
-            pdu += (
-                int2ba(self.announcement_type.value, length=5)
-                + self.broadcast_params[:14]
-                + bitarray([self.tscc_reg_required])
-                + int2ba(self.tscc_backoff, length=4)
-                + int2ba(self.system_identity_code, length=16)
-                + self.broadcast_params[14:38]
-            )
+        return codec.layout if codec else CSBK.HEADER
+
+    def pack(self) -> int:
+        """
+        :return: first 80 bits (without CRC) as int, CSBKO specific fields are zero, if CSBKO is not registered
+        """
+        return self.get_layout().pack(self)
+
+    def as_bits(self) -> bitarray:
+        return int2ba((self.pack() << 16) | self.crc, length=96)
 
-        return pdu + int2ba(self.crc, length=16)
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        :return: header and CSBKO specific fields, by attribute name
+        """
+        return self.get_layout().as_dict(self)
 
     @staticmethod
     def from_bytes(
@@ -311,183 +356,389 @@ class CSBK(BitsInterface, BytesInterface):
         assert (
             len(bits) >= 96
         ), f"A single CSBK PDU has a length of 96 bits, got only {len(bits)}"
-        lb: int = bits[0]
-        pf: int = bits[1]
-        csbko: CsbkOpcodes = CsbkOpcodes(ba2int(bits[2:8]))
-        fid: FeatureSetIDs = FeatureSetIDs(ba2int(bits[8:16]))
-        crc_ccit: int = ba2int(bits[80:96])
-        if csbko == CsbkOpcodes.BSOutboundActivation:
-            return CSBK(
-                last_block=lb,
-                protect_flag=pf,
-                manufacturers_feature_set_id=fid,
-                crc=crc_ccit,
-                csbko=csbko,
-                bs_address=ba2int(bits[32:56]),
-                source_address=ba2int(bits[56:80]),
-            )
-        elif csbko == CsbkOpcodes.UnitToUnitVoiceServiceRequest:
-            return CSBK(
-                last_block=lb,
-                protect_flag=pf,
-                manufacturers_feature_set_id=fid,
-                crc=crc_ccit,
-                csbko=csbko,
-                service_options=ServiceOptions.from_bits(bits[16:24]),
-                target_address=ba2int(bits[32:56]),
-                source_address=ba2int(bits[56:80]),
-            )
-        elif csbko == CsbkOpcodes.UnitToUnitVoiceServiceAnswerResponse:
-            return CSBK(
-                last_block=lb,
-                protect_flag=pf,
-                manufacturers_feature_set_id=fid,
-                crc=crc_ccit,
-                csbko=csbko,
-                service_options=ServiceOptions.from_bits(bits[16:24]),
-                answer_response=AnswerResponse(ba2int(bits[24:32])),
-                target_address=ba2int(bits[32:56]),
-                source_address=ba2int(bits[56:80]),
-            )
-        elif csbko == CsbkOpcodes.NegativeAcknowledgementResponse:
-            return CSBK(
-                last_block=lb,
-                protect_flag=pf,
-                manufacturers_feature_set_id=fid,
-                crc=crc_ccit,
-                csbko=csbko,
-                additional_information_field=AdditionalInformationField(bits[16]),
-                source_type=SourceType(bits[17]),
-                service_type=CsbkOpcodes.from_bits(bits[18:24]),
-                reason_code=ReasonCode(ba2int(bits[24:32])),
-                source_address=ba2int(bits[32:56]),
-                target_address=ba2int(bits[56:80]),
-            )
-        elif csbko == CsbkOpcodes.PreambleCSBK:
-            return CSBK(
-                last_block=lb,
-                protect_flag=pf,
-                manufacturers_feature_set_id=fid,
-                crc=crc_ccit,
-                csbko=csbko,
-                csbk_content_follows_preambles=not bits[16],
-                target_address_is_individual=not bits[17],
-                blocks_to_follow=ba2int(bits[24:32]),
-                target_address=ba2int(bits[32:56]),
-                source_address=ba2int(bits[56:80]),
-            )
-        elif csbko == CsbkOpcodes.ChannelTimingCSBK:
-            return CSBK(
-                last_block=lb,
-                protect_flag=pf,
-                manufacturers_feature_set_id=fid,
-                crc=crc_ccit,
-                csbko=csbko,
-                sync_age=ba2int(bits[16:27]),
-                generation=ba2int(bits[27:32]),
-                leader_identifier=ba2int(bits[32:52]),
-                new_leader=bits[52],
-                leader_dynamic_identifier=DynamicIdentifier.from_bits(bits[53:55]),
-                channel_timing_opcode=ba2int(bitarray([bits[55], bits[79]])),
-                source_identifier=ba2int(bits[56:76]),
-                source_dynamic_identifier=DynamicIdentifier.from_bits(bits[77:79]),
-            )
-        elif csbko == CsbkOpcodes.HyteraIPSCSync:
-            return CSBK(
-                last_block=lb,
-                protect_flag=pf,
-                manufacturers_feature_set_id=fid,
-                crc=crc_ccit,
-                csbko=csbko,
-                raw_data=bits[16:80],
-            )
-        elif csbko == CsbkOpcodes.AnnouncementPDUsWithoutResponse:
-            return CSBK(
-                last_block=lb,
-                protect_flag=pf,
-                manufacturers_feature_set_id=fid,
-                crc=crc_ccit,
-                csbko=csbko,
-                announcement_type=AnnouncementType(ba2int(bits[16:21])),
-                tscc_reg_required=bits[35] == 1,
-                tscc_backoff=ba2int(bits[36:40]),
-                system_identity_code=ba2int(bits[40:56]),
-                broadcast_params=bits[21:35] + bits[56:80],
-            )
-        elif csbko == CsbkOpcodes.AlohaPDUsForRandomAccessProtocol:
-            return CSBK(
-                protect_flag=pf,
-                manufacturers_feature_set_id=fid,
-                crc=crc_ccit,
-                csbko=csbko,
-                tsccas_support=bits[17] == 1,
-                site_timeslot_synchronized=bits[18] == 1,
-                document_version_control=ba2int(bits[19:22]),
-                tscc_is_offset_timing=bits[22] == 1,
-                ts_active_connection=bits[23] == 1,
-                aloha_mask=ba2int(bits[24:29]),
-                service_function=ba2int(bits[29:31]),
-                nrand_wait=ba2int(bits[31:35]),
-                tscc_reg_required=bits[35] == 1,
-                tscc_backoff=ba2int(bits[36:40]),
-                system_identity_code=ba2int(bits[40:56]),
-                target_address=ba2int(bits[56:80]),
+        value: int = ba2int(bits) >> (len(bits) - 96)
+        codec: Optional[CsbkCodec] = CSBK.get_codec(
+            (value >> 88) & 0x3F, (value >> 80) & 0xFF
+        )
+        if codec is None:
+            csbko: CsbkOpcodes = CsbkOpcodes((value >> 88) & 0x3F)
+            raise NotImplementedError(
+                f"Not-implemented CSBKO {csbko} PDU {bits_to_bytes(bits).hex()}"
             )
+        return codec.decode(value)
+
+    def describe(self) -> str:
+        """
+        :return: description of CSBKO specific fields, used by __repr__
+        """
+        return ""
+
+    def __repr__(self) -> str:
+        codec: Optional[CsbkCodec] = CSBK.get_codec(
+            self.csbko.value, self.feature_set.value
+        )
+        return (
+            f"[{self.csbko}] [LB: {int(self.last_block)}] [PF: {int(self.protect_flag)}] [{self.feature_set}] "
+            + (codec.record.describe(self) if codec else "")
+            + ("" if self.crc_ok else " [CRC INVALID]")
+        )
+
 
-        raise NotImplementedError(
-            f"Not-implemented CSBKO {csbko} PDU {bits_to_bytes(bits).hex()}"
+class CsbkCodec:
+    """
+    Parser and serializer of single CSBKO (and FID), compiled from fields of record class
+    """
+
+    __slots__ = ("record", "layout")
+
+    def __init__(self, record: Type[CSBK]):
+        """
+        :param record: subclass of CSBK, with CSBKO, FIELDS and __slots__ for fields not stored by CSBK itself
+        """
+        self.record: Type[CSBK] = record
+        self.layout: BitLayout = BitLayout(80, *CSBK.HEADER.fields, *record.FIELDS)
+        for name in self.layout.names:
+            assert (
+                name in CSBK.__slots__ or name in record.__slots__
+            ), f"{record.__name__} field {name} must be listed in __slots__"
+
+    def decode(self, value: int) -> CSBK:
+        """
+        CRC is checked against received bits, zero CRC is replaced by calculated one
+        :param value: 96 bits of CSBK (with CRC) as int
+        :return: instance of record class
+        """
+        csbk: CSBK = object.__new__(self.record)
+        csbk._sparse = None
+        csbk.source_address = 0
+        csbk.target_address = 0
+        for name, field in self.layout.unpack(value >> 16).items():
+            setattr(csbk, name, field)
+        crc: int = value & 0xFFFF
+        calculated: int = CRC16.calculate(
+            (value >> 16).to_bytes(10, byteorder="big"), CrcMasks.CSBK
         )
+        csbk.crc = crc or calculated
+        csbk.crc_ok = crc in (0, calculated)
+        return csbk
 
     def __repr__(self) -> str:
-        description = f"[{self.csbko}] [LB: {int(self.last_block)}] [PF: {int(self.protect_flag)}] [{self.feature_set}] "
-        if self.csbko == CsbkOpcodes.BSOutboundActivation:
-            description += (
-                f"[BS ADDR: {self.bs_address}] [SRC ADDR: {self.source_address}]"
-            )
-        elif self.csbko == CsbkOpcodes.UnitToUnitVoiceServiceRequest:
-            description += f"[{self.service_options}] [DST ADDR: {self.target_address}] [SRC ADDR: {self.source_address}]"
-        elif self.csbko == CsbkOpcodes.UnitToUnitVoiceServiceAnswerResponse:
-            description += f"[{self.service_options}] [{self.answer_response}] [DST ADDR: {self.target_address}] [SRC ADDR: {self.source_address}]"
-        elif self.csbko == CsbkOpcodes.NegativeAcknowledgementResponse:
-            description += f"[{self.source_type}] [{self.service_type}] [{self.reason_code}] [SRC ADDR: {self.source_address}] [DST ADDR: {self.target_address}]"
-        elif self.csbko == CsbkOpcodes.PreambleCSBK:
-            description += (
-                f"[TARGET IS {'INDIVIDUAL' if self.target_address_is_individual else 'GROUP'}] "
-                f"[FOLLOWED BY {'CSBK' if self.csbk_content_follows_preambles else 'DATA'}] "
-                f"[BTF: {self.blocks_to_follow}] [DST ADDR: {self.target_address}] [SRC ADDR: {self.source_address}]"
-            )
-        elif self.csbko == CsbkOpcodes.ChannelTimingCSBK:
-            description += (
-                f"[AGE: {500 * self.sync_age}ms] [GENERATION: {self.generation}] "
-                f"[LEADER IDENTIFIER: {self.leader_identifier}] [NEW LEADER: {self.new_leader}] "
-                f"[LEADER DYN IDENTIFIER: {self.leader_dynamic_identifier}] "
-                f"[SOURCE IDENTIFIER: {self.source_identifier}] "
-                f"[SOURCE DYN IDENTIFIER: {self.source_dynamic_identifier}] "
-                f"[CTO: {self.channel_timing_opcode}]"
-            )
-        elif self.csbko == CsbkOpcodes.HyteraIPSCSync:
-            description += f"[MFID DATA HEX({self.raw_data.hex()})]"
-        elif self.csbko == CsbkOpcodes.AnnouncementPDUsWithoutResponse:
-            description += (
-                f"[{self.announcement_type}] "
-                f"[PARAMS1: {self.broadcast_params[:14].to01()}] [PARAMS2: {self.broadcast_params[14:].to01()}] "
-                f"[REGISTRATION REQUIRED: {self.tscc_reg_required}] "
-                f"[BACKOFF: TDMA Frame Length = {CSBK.TSCC_BACKOFF_MAP.get(self.tscc_backoff)}] "
-                f"[SYSTEM IDENTITY: {self.system_identity_code}] "
-            )
-        elif self.csbko == CsbkOpcodes.AlohaPDUsForRandomAccessProtocol:
-            description += (
-                f"[TSCCAS support: {self.tsccas_support}] "
-                f"[Timeslot sync enabled: {self.site_timeslot_synchronized}] "
-                f"[DOC: v{self.document_version_control}] "
-                f"[TIMING: {'offset' if self.tscc_is_offset_timing else 'aligned'}] "
-                f"[TS ACTIVE CONNECTION: {self.ts_active_connection}] "
-                f"[MASK: {self.aloha_mask}] "
-                f"[SERVICE: {self.service_function}] "
-                f"[NRAND_WAIT: {self.nrand_wait}] "
-                f"[REGISTRATION REQUIRED: {self.tscc_reg_required}] "
-                f"[BACKOFF: TDMA Frame Length = {CSBK.TSCC_BACKOFF_MAP.get(self.tscc_backoff)}] "
-                f"[SYSTEM IDENTITY: {self.system_identity_code}] "
-                f"[MS ADDRESS: {self.target_address}]"
-            )
-        return description
+        return f"[CsbkCodec {self.record.__name__}] {self.layout}"
+
+
+def _inverted(value: int) -> bool:
+    return not value
+
+
+def _inverted_bit(flag: bool) -> int:
+    return int(not flag)
+
+
+class BSOutboundActivationCSBK(CSBK):
+    """
+    BS_Dwn_Act - ETSI TS 102 361-2 V2.4.1 (2017-10) - 7.1.2  CSBK PDUs
+    """
+
+    __slots__ = ("bs_address",)
+    CSBKO = CsbkOpcodes.BSOutboundActivation
+    FIELDS = (
+        BitField("bs_address", 32, 24),
+        BitField("source_address", 56, 24),
+    )
+
+    def describe(self) -> str:
+        return f"[BS ADDR: {self.bs_address}] [SRC ADDR: {self.source_address}]"
+
+
+class UnitToUnitVoiceServiceRequestCSBK(CSBK):
+    """
+    UU_V_Req - ETSI TS 102 361-2 V2.4.1 (2017-10) - 7.1.2  CSBK PDUs
+    """
+
+    __slots__ = ("service_options",)
+    CSBKO = CsbkOpcodes.UnitToUnitVoiceServiceRequest
+    FIELDS = (
+        BitField(
+            "service_options",
+            16,
+            8,
+            decode=ServiceOptions.from_int,
+            encode=ServiceOptions.as_int,
+        ),
+        BitField("target_address", 32, 24),
+        BitField("source_address", 56, 24),
+    )
+
+    def describe(self) -> str:
+        return f"[{self.service_options}] [DST ADDR: {self.target_address}] [SRC ADDR: {self.source_address}]"
+
+
+class UnitToUnitVoiceServiceAnswerResponseCSBK(CSBK):
+    """
+    UU_Ans_Rsp - ETSI TS 102 361-2 V2.4.1 (2017-10) - 7.1.2  CSBK PDUs
+    """
+
+    __slots__ = ("service_options", "answer_response")
+    CSBKO = CsbkOpcodes.UnitToUnitVoiceServiceAnswerResponse
+    FIELDS = (
+        BitField(
+            "service_options",
+            16,
+            8,
+            decode=ServiceOptions.from_int,
+            encode=ServiceOptions.as_int,
+        ),
+        BitField("answer_response", 24, 8, decode=AnswerResponse),
+        BitField("target_address", 32, 24),
+        BitField("source_address", 56, 24),
+    )
+
+    def describe(self) -> str:
+        return f"[{self.service_options}] [{self.answer_response}] [DST ADDR: {self.target_address}] [SRC ADDR: {self.source_address}]"
+
+
+class NegativeAcknowledgementResponseCSBK(CSBK):
+    """
+    NACK_Rsp - ETSI TS 102 361-2 V2.4.1 (2017-10) - 7.1.2  CSBK PDUs
+    """
+
+    __slots__ = (
+        "additional_information_field",
+        "source_type",
+        "service_type",
+        "reason_code",
+    )
+    CSBKO = CsbkOpcodes.NegativeAcknowledgementResponse
+    FIELDS = (
+        # missing (optional) values are packed as they were, before fields were declared
+        BitField(
+            "additional_information_field",
+            16,
+            1,
+            decode=AdditionalInformationField,
+            encode=lambda aif: 1 if aif is None else aif.value,
+        ),
+        BitField(
+            "source_type",
+            17,
+            1,
+            decode=SourceType,
+            encode=lambda source_type: int(source_type == SourceType.MSSourced),
+        ),
+        BitField(
+            "service_type",
+            18,
+            6,
+            decode=CsbkOpcodes,
+            encode=lambda service_type: service_type.value if service_type else 0,
+        ),
+        BitField(
+            "reason_code",
+            24,
+            8,
+            decode=ReasonCode,
+            encode=lambda reason_code: reason_code.value if reason_code else 0,
+        ),
+        BitField("source_address", 32, 24),
+        BitField("target_address", 56, 24),
+    )
+
+    def describe(self) -> str:
+        return f"[{self.source_type}] [{self.service_type}] [{self.reason_code}] [SRC ADDR: {self.source_address}] [DST ADDR: {self.target_address}]"
+
+
+class PreambleCSBK(CSBK):
+    """
+    Pre_CSBK - ETSI TS 102 361-2 V2.4.1 (2017-10) - 7.1.2  CSBK PDUs
+    """
+
+    __slots__ = (
+        "csbk_content_follows_preambles",
+        "target_address_is_individual",
+        "blocks_to_follow",
+    )
+    CSBKO = CsbkOpcodes.PreambleCSBK
+    FIELDS = (
+        # both flags are transmitted inverted, 0 means CSBK content / individual target
+        BitField(
+            "csbk_content_follows_preambles",
+            16,
+            1,
+            decode=_inverted,
+            encode=_inverted_bit,
+        ),
+        BitField(
+            "target_address_is_individual",
+            17,
+            1,
+            decode=_inverted,
+            encode=_inverted_bit,
+        ),
+        BitField("blocks_to_follow", 24, 8),
+        BitField("target_address", 32, 24),
+        BitField("source_address", 56, 24),
+    )
+
+    def describe(self) -> str:
+        return (
+            f"[TARGET IS {'INDIVIDUAL' if self.target_address_is_individual else 'GROUP'}] "
+            f"[FOLLOWED BY {'CSBK' if self.csbk_content_follows_preambles else 'DATA'}] "
+            f"[BTF: {self.blocks_to_follow}] [DST ADDR: {self.target_address}] [SRC ADDR: {self.source_address}]"
+        )
+
+
+class ChannelTimingCSBK(CSBK):
+    """
+    CT_CSBK - ETSI TS 102 361-2 V2.4.1 (2017-10) - 7.1.2  CSBK PDUs
+    """
+
+    __slots__ = (
+        "sync_age",
+        "generation",
+        "leader_identifier",
+        "new_leader",
+        "leader_dynamic_identifier",
+        "channel_timing_opcode",
+        "source_identifier",
+        "source_dynamic_identifier",
+    )
+    CSBKO = CsbkOpcodes.ChannelTimingCSBK
+    FIELDS = (
+        BitField("sync_age", 16, 11),
+        BitField("generation", 27, 5),
+        BitField("leader_identifier", 32, 20),
+        BitField("new_leader", 52, 1),
+        BitField("leader_dynamic_identifier", 53, 2, decode=DynamicIdentifier),
+        BitField(
+            "channel_timing_opcode",
+            55,
+            1,
+            decode=ChannelTimingOpcode,
+            more_segments=((79, 1),),
+        ),
+        BitField("source_identifier", 56, 20),
+        BitField("source_dynamic_identifier", 77, 2, decode=DynamicIdentifier),
+    )
+
+    def describe(self) -> str:
+        return (
+            f"[AGE: {500 * self.sync_age}ms] [GENERATION: {self.generation}] "
+            f"[LEADER IDENTIFIER: {self.leader_identifier}] [NEW LEADER: {self.new_leader}] "
+            f"[LEADER DYN IDENTIFIER: {self.leader_dynamic_identifier}] "
+            f"[SOURCE IDENTIFIER: {self.source_identifier}] "
+            f"[SOURCE DYN IDENTIFIER: {self.source_dynamic_identifier}] "
+            f"[CTO: {self.channel_timing_opcode}]"
+        )
+
+
+class HyteraIPSCSyncCSBK(CSBK):
+    """
+    Hytera manufacturer specific CSBK, content is not decoded
+
+    Hytera IPSC repeaters were seen sending it with FID of other manufacturers, so it is registered for any FID
+    """
+
+    __slots__ = ("raw_data",)
+    CSBKO = CsbkOpcodes.HyteraIPSCSync
+    FIELDS = (
+        BitField(
+            "raw_data",
+            16,
+            64,
+            decode=lambda value: value.to_bytes(8, byteorder="big"),
+            encode=lambda data: int.from_bytes(data, byteorder="big"),
+        ),
+    )
+
+    def describe(self) -> str:
+        return f"[MFID DATA HEX({self.raw_data.hex()})]"
+
+
+class AlohaCSBK(CSBK):
+    """
+    C_ALOHA - ETSI TS 102 361-4 V1.10.1 (2019-08) - 7.1.1.1.1  Aloha PDUs for Random Access Protocol
+    """
+
+    __slots__ = (
+        "tsccas_support",
+        "site_timeslot_synchronized",
+        "document_version_control",
+        "tscc_is_offset_timing",
+        "ts_active_connection",
+        "aloha_mask",
+        "service_function",
+        "nrand_wait",
+        "tscc_reg_required",
+        "tscc_backoff",
+        "system_identity_code",
+    )
+    CSBKO = CsbkOpcodes.AlohaPDUsForRandomAccessProtocol
+    FIELDS = (
+        BitField("tsccas_support", 17, 1, decode=bool),
+        BitField("site_timeslot_synchronized", 18, 1, decode=bool),
+        BitField("document_version_control", 19, 3),
+        BitField("tscc_is_offset_timing", 22, 1, decode=bool),
+        BitField("ts_active_connection", 23, 1, decode=bool),
+        BitField("aloha_mask", 24, 5),
+        BitField("service_function", 29, 2, decode=RandomAccessServiceFunction),
+        BitField("nrand_wait", 31, 4),
+        BitField("tscc_reg_required", 35, 1, decode=bool),
+        BitField("tscc_backoff", 36, 4),
+        BitField("system_identity_code", 40, 16),
+        BitField("target_address", 56, 24),
+    )
+
+    def describe(self) -> str:
+        return (
+            f"[TSCCAS support: {self.tsccas_support}] "
+            f"[Timeslot sync enabled: {self.site_timeslot_synchronized}] "
+            f"[DOC: v{self.document_version_control}] "
+            f"[TIMING: {'offset' if self.tscc_is_offset_timing else 'aligned'}] "
+            f"[TS ACTIVE CONNECTION: {self.ts_active_connection}] "
+            f"[MASK: {self.aloha_mask}] "
+            f"[SERVICE: {self.service_function}] "
+            f"[NRAND_WAIT: {self.nrand_wait}] "
+            f"[REGISTRATION REQUIRED: {self.tscc_reg_required}] "
+            f"[BACKOFF: TDMA Frame Length = {CSBK.TSCC_BACKOFF_MAP.get(self.tscc_backoff)}] "
+            f"[SYSTEM IDENTITY: {self.system_identity_code}] "
+            f"[MS ADDRESS: {self.target_address}]"
+        )
+
+
+class AnnouncementCSBK(CSBK):
+    """
+    C_BCAST - ETSI TS 102 361-4 V1.10.1 (2019-08) - 7.1.1.1.2  Announcement PDUs without response
+    """
+
+    __slots__ = (
+        "announcement_type",
+        "broadcast_params",
+        "tscc_reg_required",
+        "tscc_backoff",
+        "system_identity_code",
+    )
+    CSBKO = CsbkOpcodes.AnnouncementPDUsWithoutResponse
+    FIELDS = (
+        BitField("announcement_type", 16, 5, decode=AnnouncementType),
+        # 14 bits of Broadcast_Parms1 and 24 bits of Broadcast_Parms2, kept together as 38 bits
+        BitField(
+            "broadcast_params",
+            21,
+            14,
+            decode=lambda value: int2ba(value, length=38),
+            encode=lambda params: ba2int(params) if len(params) else 0,
+            more_segments=((56, 24),),
+        ),
+        BitField("tscc_reg_required", 35, 1, decode=bool),
+        BitField("tscc_backoff", 36, 4),
+        BitField("system_identity_code", 40, 16),
+    )
+
+    def describe(self) -> str:
+        return (
+            f"[{self.announcement_type}] "
+            f"[PARAMS1: {self.broadcast_params[:14].to01()}] [PARAMS2: {self.broadcast_params[14:].to01()}] "
+            f"[REGISTRATION REQUIRED: {self.tscc_reg_required}] "
+            f"[BACKOFF: TDMA Frame Length = {CSBK.TSCC_BACKOFF_MAP.get(self.tscc_backoff)}] "
+            f"[SYSTEM IDENTITY: {self.system_identity_code}] "
+        )
@@ -1,4 +1,4 @@
-from typing import Union, Optional, Literal
+from typing import Any, Dict, Union, Optional, Literal
 
 from bitarray import bitarray
 from bitarray.util import ba2int, int2ba
@@ -18,9 +18,11 @@ from okdmr.dmrlib.etsi.layer2.elements.sarq import SARQ
 from okdmr.dmrlib.etsi.layer2.elements.supplementary_flag import SupplementaryFlag
 from okdmr.dmrlib.etsi.layer2.elements.udt_format import UDTFormat
 from okdmr.dmrlib.etsi.layer3.elements.udt_option_flag import UDTOptionFlag
+from okdmr.dmrlib.utils.bit_fields import BitField, BitLayout
 from okdmr.dmrlib.utils.bits_bytes import bytes_to_bits, bits_to_bytes
 from okdmr.dmrlib.utils.bits_interface import BitsInterface
 from okdmr.dmrlib.utils.bytes_interface import BytesInterface
+from okdmr.dmrlib.utils.sparse_field import SparseField
 
 
 class DataHeader(BitsInterface, BytesInterface):
@@ -28,6 +30,122 @@ class DataHeader(BitsInterface, BytesInterface):
     ETSI TS 102 361-1 V2.5.1 (2017-10) - 8.2.1 Header block structure
     """
 
+    __slots__ = (
+        "data_packet_format",
+        "crc",
+        "crc_ok",
+        "is_group",
+        "is_response_requested",
+        "pad_octet_count",
+        "sap_identifier",
+        "llid_destination",
+        "llid_source",
+        "full_message_flag",
+        "blocks_to_follow",
+        "resynchronize_flag",
+        "send_sequence_number",
+        "fragment_sequence_number",
+        "_sparse",
+    )
+    # C_RHEAD, DD_HEAD and UDT_HEAD specific fields, only values different from default are stored per instance
+    response_class: int = SparseField(0)
+    response_type: int = SparseField(0)
+    response_status: int = SparseField(0)
+    appended_blocks: int = SparseField(0)
+    defined_data_format: Optional[DefinedDataFormats] = SparseField(None)
+    sarq: Optional[SARQ] = SparseField(None)
+    bit_padding: bitarray = SparseField(bitarray())
+    is_emergency: bool = SparseField(False)
+    udt_option_flag: Optional[UDTOptionFlag] = SparseField(None)
+    pad_nibbles_count: int = SparseField(0)
+    udt_format: Optional[UDTFormat] = SparseField(None)
+    udt_opcode: Optional[CsbkOpcodes] = SparseField(None)
+    supplementary_flag: Optional[SupplementaryFlag] = SparseField(None)
+
+    HEADER: BitLayout = BitLayout(
+        80, BitField("data_packet_format", 4, 4, decode=DataPacketFormats)
+    )
+    """DPF, common to all formats (first 80 bits, without CRC)"""
+
+    LAYOUTS: Dict[DataPacketFormats, BitLayout] = {
+        DataPacketFormats.DataPacketConfirmed: BitLayout(
+            80,
+            BitField("is_group", 0, 1, decode=bool),
+            BitField("is_response_requested", 1, 1, decode=bool),
+            BitField("pad_octet_count", 3, 1, more_segments=((12, 4),)),
+            BitField("sap_identifier", 8, 4, decode=SAPIdentifier),
+            BitField("llid_destination", 16, 24),
+            BitField("llid_source", 40, 24),
+            BitField("full_message_flag", 64, 1, decode=FullMessageFlag),
+            BitField("blocks_to_follow", 65, 7),
+            BitField("resynchronize_flag", 72, 1, decode=ResynchronizeFlag),
+            BitField("send_sequence_number", 73, 3),
+            BitField("fragment_sequence_number", 76, 4, decode=FragmentSequenceNumber),
+        ),
+        DataPacketFormats.DataPacketUnconfirmed: BitLayout(
+            80,
+            BitField("is_group", 0, 1, decode=bool),
+            BitField("is_response_requested", 1, 1, decode=bool),
+            BitField("pad_octet_count", 3, 1, more_segments=((12, 4),)),
+            BitField("sap_identifier", 8, 4, decode=SAPIdentifier),
+            BitField("llid_destination", 16, 24),
+            BitField("llid_source", 40, 24),
+            BitField("full_message_flag", 64, 1, decode=FullMessageFlag),
+            BitField("blocks_to_follow", 65, 7),
+            BitField("fragment_sequence_number", 76, 4, decode=FragmentSequenceNumber),
+        ),
+        # Confirmed Response packet Header (C_RHEAD) PDU
+        DataPacketFormats.ResponsePacket: BitLayout(
+            80,
+            BitField("is_response_requested", 1, 1, decode=bool),
+            BitField("sap_identifier", 8, 4, decode=SAPIdentifier),
+            BitField("llid_destination", 16, 24),
+            BitField("llid_source", 40, 24),
+            BitField("full_message_flag", 64, 1, decode=FullMessageFlag),
+            BitField("blocks_to_follow", 65, 7),
+            BitField("response_class", 72, 2),
+            BitField("response_type", 74, 3),
+            BitField("response_status", 77, 3),
+        ),
+        # Defined Data short data packet Header (DD_HEAD) PDU
+        DataPacketFormats.ShortDataDefined: BitLayout(
+            80,
+            BitField("is_group", 0, 1, decode=bool),
+            BitField("is_response_requested", 1, 1, decode=bool),
+            BitField("appended_blocks", 2, 2, more_segments=((12, 4),)),
+            BitField("sap_identifier", 8, 4, decode=SAPIdentifier),
+            BitField("llid_destination", 16, 24),
+            BitField("llid_source", 40, 24),
+            BitField("defined_data_format", 64, 6, decode=DefinedDataFormats),
+            BitField("sarq", 70, 1, decode=SARQ),
+            BitField("full_message_flag", 71, 1, decode=FullMessageFlag),
+            BitField(
+                "bit_padding",
+                72,
+                8,
+                decode=lambda value: int2ba(value, length=8),
+                encode=lambda bits: ba2int(bits) if len(bits) else 0,
+            ),
+        ),
+        # Unified Data Transport Header (UDT_HEAD) PDU
+        DataPacketFormats.UnifiedDataTransport: BitLayout(
+            80,
+            BitField("is_group", 0, 1, decode=bool),
+            BitField("is_response_requested", 1, 1, decode=bool),
+            BitField("is_emergency", 2, 1, decode=bool),
+            BitField("udt_option_flag", 3, 1, decode=UDTOptionFlag),
+            BitField("sap_identifier", 8, 4, decode=SAPIdentifier),
+            BitField("udt_format", 12, 4, decode=UDTFormat),
+            BitField("llid_destination", 16, 24),
+            BitField("llid_source", 40, 24),
+            BitField("pad_nibbles_count", 64, 5),
+            BitField("appended_blocks", 70, 2),
+            BitField("supplementary_flag", 72, 1, decode=SupplementaryFlag),
+            BitField("udt_opcode", 74, 6, decode=CsbkOpcodes),
+        ),
+    }
+    """Format specific fields (first 80 bits, without CRC)"""
+
     def __init__(
         self,
         dpf: DataPacketFormats,
@@ -61,6 +179,7 @@ class DataHeader(BitsInterface, BytesInterface):
         udt_opcode: Optional[CsbkOpcodes] = None,
         supplementary_flag: Optional[SupplementaryFlag] = None,
     ):
+        self._sparse: Optional[Dict] = None
         self.data_packet_format: DataPacketFormats = dpf
         self.crc: bitarray = crc or bitarray([0] * 16)
         self.is_group: bool = is_group in (True, 1)
@@ -95,16 +214,37 @@ class DataHeader(BitsInterface, BytesInterface):
         self.udt_opcode: Optional[CsbkOpcodes] = udt_opcode
         self.supplementary_flag: Optional[SupplementaryFlag] = supplementary_flag
 
+        header: bytes = self.pack().to_bytes(10, byteorder="big")
         if len(self.crc) != 16 or ba2int(self.crc) <= 0:
             self.crc_ok: bool = True
             self.crc = int2ba(
-                CRC16.calculate(self.as_bits()[:-16].tobytes(), CrcMasks.DataHeader),
+                CRC16.calculate(header, CrcMasks.DataHeader),
                 length=16,
             )
         else:
             self.crc_ok: bool = CRC16.check(
-                self.as_bits()[:-16].tobytes(), ba2int(self.crc), CrcMasks.DataHeader
+                header, ba2int(self.crc), CrcMasks.DataHeader
+            )
+
+    def pack(self) -> int:
+        """
+        :return: header without CRC, as 80-bit int
+        """
+        layout: Optional[BitLayout] = DataHeader.LAYOUTS.get(self.data_packet_format)
+        if layout is None:
+            raise NotImplementedError(
+                f"as_bits not implemented for {self.data_packet_format}"
             )
+        return DataHeader.HEADER.pack(self) | layout.pack(self)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        :return: DPF and format specific fields, by attribute name
+        """
+        return {
+            **DataHeader.HEADER.as_dict(self),
+            **DataHeader.LAYOUTS[self.data_packet_format].as_dict(self),
+        }
 
     def get_blocks_to_follow(self) -> Optional[int]:
         if self.data_packet_format == DataPacketFormats.UnifiedDataTransport:
@@ -174,91 +314,7 @@ class DataHeader(BitsInterface, BytesInterface):
         return bits_to_bytes(self.as_bits())
 
     def as_bits(self) -> bitarray:
-        if self.data_packet_format == DataPacketFormats.DataPacketConfirmed:
-            poc = int2ba(self.pad_octet_count, length=5)
-            return (
-                bitarray([self.is_group, self.is_response_requested, 0, poc[0]])
-                + self.data_packet_format.as_bits()
-                + self.sap_identifier.as_bits()
-                + poc[1:]
-                + int2ba(self.llid_destination, length=24)
-                + int2ba(self.llid_source, length=24)
-                + bitarray([self.full_message_flag.value])
-                + int2ba(self.blocks_to_follow, length=7)
-                + bitarray([self.resynchronize_flag.value])
-                + int2ba(self.send_sequence_number, length=3)
-                + self.fragment_sequence_number.as_bits()
-                + self.crc
-            )
-        elif self.data_packet_format == DataPacketFormats.DataPacketUnconfirmed:
-            poc = int2ba(self.pad_octet_count, length=5)
-            return (
-                bitarray([self.is_group, self.is_response_requested, 0, poc[0]])
-                + self.data_packet_format.as_bits()
-                + self.sap_identifier.as_bits()
-                + poc[1:]
-                + int2ba(self.llid_destination, length=24)
-                + int2ba(self.llid_source, length=24)
-                + bitarray([self.full_message_flag.value])
-                + int2ba(self.blocks_to_follow, length=7)
-                + bitarray([0] * 4)
-                + self.fragment_sequence_number.as_bits()
-                + self.crc
-            )
-        elif self.data_packet_format == DataPacketFormats.ResponsePacket:
-            return (
-                bitarray([0] * 4)
-                + self.data_packet_format.as_bits()
-                + self.sap_identifier.as_bits()
-                + bitarray([0] * 4)
-                + int2ba(self.llid_destination, length=24)
-                + int2ba(self.llid_source, length=24)
-                + bitarray([self.full_message_flag.value])
-                + int2ba(self.blocks_to_follow, length=7)
-                + int2ba(self.response_class, length=2)
-                + int2ba(self.response_type, length=3)
-                + int2ba(self.response_status, length=3)
-                + self.crc
-            )
-        elif self.data_packet_format == DataPacketFormats.ShortDataDefined:
-            ab = int2ba(self.appended_blocks, length=6)
-            return (
-                bitarray([self.is_group, self.is_response_requested, ab[0], ab[1]])
-                + self.data_packet_format.as_bits()
-                + self.sap_identifier.as_bits()
-                + ab[2:]
-                + int2ba(self.llid_destination, length=24)
-                + int2ba(self.llid_source, length=24)
-                + self.defined_data_format.as_bits()
-                + bitarray([self.sarq.value, self.full_message_flag.value])
-                + self.bit_padding
-                + self.crc
-            )
-        elif self.data_packet_format == DataPacketFormats.UnifiedDataTransport:
-            return (
-                bitarray(
-                    [
-                        self.is_group,
-                        self.is_response_requested,
-                        self.is_emergency,
-                        self.udt_option_flag.value,
-                    ]
-                )
-                + self.data_packet_format.as_bits()
-                + self.sap_identifier.as_bits()
-                + self.udt_format.as_bits()
-                + int2ba(self.llid_destination, length=24)
-                + int2ba(self.llid_source, length=24)
-                + int2ba(self.pad_nibbles_count, length=5)
-                + bitarray([0])
-                + int2ba(self.appended_blocks, length=2)
-                + bitarray([self.supplementary_flag.value, 0])
-                + self.udt_opcode.as_bits()
-                + self.crc
-            )
-        raise NotImplementedError(
-            f"as_bits not implemented for {self.data_packet_format}"
-        )
+        return int2ba(self.pack(), length=80) + self.crc
 
     @staticmethod
     def from_bytes(
@@ -269,83 +325,11 @@ class DataHeader(BitsInterface, BytesInterface):
     @staticmethod
     def from_bits(bits: bitarray) -> "DataHeader":
         dpf: DataPacketFormats = DataPacketFormats.from_bits(bits[4:8])
-        if dpf == DataPacketFormats.DataPacketConfirmed:
-            return DataHeader(
-                dpf=dpf,
-                crc=bits[80:96],
-                is_group=bits[0],
-                is_response_requested=bits[1],
-                pad_octet_count=(bits[3] << 4) + ba2int(bits[12:16]),
-                sap_identifier=SAPIdentifier.from_bits(bits[8:12]),
-                llid_destination=ba2int(bits[16:40]),
-                llid_source=ba2int(bits[40:64]),
-                full_message_flag=FullMessageFlag(bits[64]),
-                blocks_to_follow=ba2int(bits[65:72]),
-                resynchronize_flag=ResynchronizeFlag(bits[72]),
-                send_sequence_number=ba2int(bits[73:76]),
-                fragment_sequence_number=ba2int(bits[76:80]),
-            )
-        elif dpf == DataPacketFormats.ResponsePacket:
-            return DataHeader(
-                dpf=dpf,
-                crc=bits[80:96],
-                is_response_requested=bits[1],
-                sap_identifier=SAPIdentifier.from_bits(bits[8:12]),
-                llid_destination=ba2int(bits[16:40]),
-                llid_source=ba2int(bits[40:64]),
-                full_message_flag=FullMessageFlag(bits[64]),
-                blocks_to_follow=ba2int(bits[65:72]),
-                response_class=ba2int(bits[72:74]),
-                response_type=ba2int(bits[74:77]),
-                response_status=ba2int(bits[77:80]),
-            )
-        elif dpf == DataPacketFormats.ShortDataDefined:
-            return DataHeader(
-                dpf=dpf,
-                crc=bits[80:96],
-                is_group=bits[0],
-                is_response_requested=bits[1],
-                appended_blocks=ba2int(bits[2:4] + bits[12:16]),
-                sap_identifier=SAPIdentifier.from_bits(bits[8:12]),
-                llid_destination=ba2int(bits[16:40]),
-                llid_source=ba2int(bits[40:64]),
-                defined_data_format=DefinedDataFormats.from_bits(bits[64:70]),
-                sarq=SARQ(bits[70]),
-                full_message_flag=FullMessageFlag(bits[71]),
-                bit_padding=bits[72:80],
-            )
-        elif dpf == DataPacketFormats.DataPacketUnconfirmed:
-            return DataHeader(
-                dpf=dpf,
-                crc=bits[80:96],
-                is_group=bits[0],
-                is_response_requested=bits[1],
-                pad_octet_count=(bits[3] << 4) + ba2int(bits[12:16]),
-                sap_identifier=SAPIdentifier.from_bits(bits[8:12]),
-                llid_destination=ba2int(bits[16:40]),
-                llid_source=ba2int(bits[40:64]),
-                full_message_flag=FullMessageFlag(bits[64]),
-                blocks_to_follow=ba2int(bits[65:72]),
-                fragment_sequence_number=ba2int(bits[76:80]),
-            )
-        elif dpf == DataPacketFormats.UnifiedDataTransport:
-            return DataHeader(
-                dpf=dpf,
-                crc=bits[80:96],
-                is_group=bits[0],
-                is_response_requested=bits[1],
-                is_emergency=bits[2],
-                udt_option_flag=UDTOptionFlag(bits[3]),
-                sap_identifier=SAPIdentifier.from_bits(bits[8:12]),
-                udt_format=UDTFormat.from_bits(bits[12:16]),
-                llid_destination=ba2int(bits[16:40]),
-                llid_source=ba2int(bits[40:64]),
-                pad_nibbles_count=ba2int(bits[64:69]),
-                appended_blocks=ba2int(bits[70:72]),
-                supplementary_flag=SupplementaryFlag(bits[72]),
-                udt_opcode=CsbkOpcodes.from_bits(bits[74:80]),
-            )
-        else:
+        layout: Optional[BitLayout] = DataHeader.LAYOUTS.get(dpf)
+        if layout is None:
             raise NotImplementedError(
                 f"from_bits not implemented for {dpf} (val {bits[4:8]})"
             )
+        return DataHeader(
+            dpf=dpf, crc=bits[80:96], **layout.unpack(layout.int_from_bits(bits))
+        )
@@ -8,7 +8,6 @@ from okdmr.dmrlib.etsi.layer2.elements.lcss import LCSS
 from okdmr.dmrlib.etsi.layer2.elements.preemption_power_indicator import (
     PreemptionPowerIndicator,
 )
-from okdmr.dmrlib.utils.bits_bytes import numpy_array_to_int
 from okdmr.dmrlib.utils.bits_interface import BitsInterface
 
 
@@ -17,12 +16,22 @@ class EmbeddedSignalling(BitsInterface):
     ETSI TS 102 361-1 V2.5.1 (2017-10) - 9.1.2 Embedded signalling (EMB) PDU
     """
 
+    __slots__ = (
+        "colour_code",
+        "preemption_and_power_control_indicator",
+        "link_control_start_stop",
+        "emb_parity",
+        "emb_errors_corrected",
+        "emb_parity_ok",
+    )
+
     def __init__(
         self,
         colour_code: int,
         preemption_and_power_control_indicator: int,
         link_control_start_stop: Union[LCSS, int],
         emb_parity: Union[int, bool] = 0,
+        emb_errors_corrected: int = 0,
     ):
         """
 
@@ -30,6 +39,7 @@ class EmbeddedSignalling(BitsInterface):
         :param preemption_and_power_control_indicator: value 0/1
         :param link_control_start_stop:
         :param emb_parity: value 0-511
+        :param emb_errors_corrected: number of bit errors repaired by QR (16,7,6) when decoding
         """
         assert (
             0b0 <= colour_code <= 0b1111
@@ -52,20 +62,25 @@ class EmbeddedSignalling(BitsInterface):
             else link_control_start_stop
         )
         self.emb_parity: int = emb_parity if isinstance(emb_parity, int) else -1
+        self.emb_errors_corrected: int = emb_errors_corrected
 
+        codeword: int = QuadraticResidue1676.CODEWORDS[
+            (self.colour_code << 3)
+            | (self.preemption_and_power_control_indicator.value << 2)
+            | self.link_control_start_stop.value
+        ]
         if self.emb_parity <= 0:
             # generate parity if not provided
-            self.emb_parity = numpy_array_to_int(
-                QuadraticResidue1676.generate(self.as_bits()[:7])[7:16]
-            )
+            self.emb_parity = codeword & 0x1FF
 
         # check parity
-        self.emb_parity_ok: bool = QuadraticResidue1676.check(self.as_bits())
+        self.emb_parity_ok: bool = self.emb_parity == codeword & 0x1FF
 
     def __repr__(self) -> str:
         return (
             f"[{self.link_control_start_stop}] [{self.preemption_and_power_control_indicator}] "
             f"[CC: {self.colour_code}]{'' if self.emb_parity_ok else ' [EMB FEC: INVALID]'}"
+            f"{f' [EMB FEC: CORRECTED {self.emb_errors_corrected}]' if self.emb_errors_corrected else ''}"
         )
 
     def as_bits(self) -> bitarray:
@@ -76,14 +91,36 @@ class EmbeddedSignalling(BitsInterface):
             + int2ba(self.emb_parity, length=9)
         )
 
+    def as_int(self) -> int:
+        """
+        :return: 16-bit int, first bit of colour code being MSB (inverse of EmbeddedSignalling.from_int)
+        """
+        return (
+            (self.colour_code << 12)
+            | (self.preemption_and_power_control_indicator.value << 11)
+            | (self.link_control_start_stop.value << 9)
+            | self.emb_parity
+        )
+
     @staticmethod
     def from_bits(bits: bitarray) -> "EmbeddedSignalling":
         assert (
             len(bits) == 16
         ), "EMB (Embedded Signalling) should be exactly 16 bits long"
+        return EmbeddedSignalling.from_int(ba2int(bits))
+
+    @staticmethod
+    def from_int(codeword: int) -> "EmbeddedSignalling":
+        """
+        Decodes EMB from 16-bit int, repairs up to 2 bit errors using QR (16,7,6)
+        :param codeword: 16-bit int, first bit of colour code being MSB
+        :return:
+        """
+        ok, corrected, errors = QuadraticResidue1676.correct_int(codeword)
         return EmbeddedSignalling(
-            colour_code=ba2int(bits[0:4]),
-            preemption_and_power_control_indicator=bits[4],
-            link_control_start_stop=ba2int(bits[5:7]),
-            emb_parity=ba2int(bits[7:16]),
+            colour_code=corrected >> 12,
+            preemption_and_power_control_indicator=(corrected >> 11) & 0b1,
+            link_control_start_stop=(corrected >> 9) & 0b11,
+            emb_parity=corrected & 0x1FF,
+            emb_errors_corrected=errors if ok else 0,
         )
@@ -1,7 +1,7 @@
-from typing import Union, Optional, Literal
+from typing import Any, Dict, Union, Optional, Literal
 
 from bitarray import bitarray
-from bitarray.util import ba2int, int2ba
+from bitarray.util import int2ba
 
 from okdmr.dmrlib.etsi.layer2.elements.feature_set_ids import FeatureSetIDs
 from okdmr.dmrlib.etsi.layer2.elements.flcos import FLCOs
@@ -10,9 +10,11 @@ from okdmr.dmrlib.etsi.layer3.elements.service_options import ServiceOptions
 from okdmr.dmrlib.etsi.layer3.elements.talker_alias_data_format import (
     TalkerAliasDataFormat,
 )
+from okdmr.dmrlib.utils.bit_fields import BitField, BitLayout
 from okdmr.dmrlib.utils.bits_bytes import bytes_to_bits, bits_to_bytes
 from okdmr.dmrlib.utils.bits_interface import BitsInterface
 from okdmr.dmrlib.utils.bytes_interface import BytesInterface
+from okdmr.dmrlib.utils.sparse_field import SparseField
 
 
 class FullLinkControl(BytesInterface, BitsInterface):
@@ -21,6 +23,114 @@ class FullLinkControl(BytesInterface, BitsInterface):
     ETSI TS 102 361-2 V2.4.1 (2017-10) - 7.1.1  Full Link Control PDUs
     """
 
+    __slots__ = (
+        "protect_flag",
+        "full_link_control_opcode",
+        "feature_set_id",
+        "crc",
+        "service_options",
+        "source_address",
+        "group_address",
+        "target_address",
+        "_sparse",
+    )
+    # GPS and talker alias fields, only values different from default are stored per instance
+    position_error: Optional[PositionError] = SparseField(None)
+    longitude: float = SparseField(0)
+    latitude: float = SparseField(0)
+    talker_alias_data_format: Optional[TalkerAliasDataFormat] = SparseField(None)
+    talker_alias_data_length: int = SparseField(0)
+    talker_alias_data_msb: bool = SparseField(False)
+    talker_alias_data: bytes = SparseField(b"")
+
+    HEADER: BitLayout = BitLayout(
+        72,
+        BitField("protect_flag", 0, 1, decode=bool),
+        BitField("full_link_control_opcode", 2, 6, decode=FLCOs),
+        BitField("feature_set_id", 8, 8, decode=FeatureSetIDs),
+    )
+    """PF, FLCO and FID, common to all FLCOs (first 72 bits, without CRC)"""
+
+    TALKER_ALIAS_BLOCK: BitLayout = BitLayout(
+        72,
+        BitField(
+            "talker_alias_data",
+            16,
+            56,
+            decode=lambda value: value.to_bytes(7, byteorder="big"),
+            encode=lambda data: int.from_bytes(data, byteorder="big"),
+        ),
+    )
+
+    LAYOUTS: Dict[FLCOs, BitLayout] = {
+        # Table 7.2: UU_V_Ch_Usr PDU content
+        FLCOs.UnitToUnitVoiceChannelUser: BitLayout(
+            72,
+            BitField(
+                "service_options",
+                16,
+                8,
+                decode=ServiceOptions.from_int,
+                encode=ServiceOptions.as_int,
+            ),
+            BitField("target_address", 24, 24),
+            BitField("source_address", 48, 24),
+        ),
+        # Table 7.1: Grp_V_Ch_Usr PDU content
+        FLCOs.GroupVoiceChannelUser: BitLayout(
+            72,
+            BitField(
+                "service_options",
+                16,
+                8,
+                decode=ServiceOptions.from_int,
+                encode=ServiceOptions.as_int,
+            ),
+            BitField("group_address", 24, 24),
+            BitField("source_address", 48, 24),
+        ),
+        # Table 7.3: GPS Info PDU content
+        FLCOs.GPSInfo: BitLayout(
+            72,
+            BitField("position_error", 20, 3, decode=PositionError),
+            BitField(
+                "longitude",
+                23,
+                25,
+                signed=True,
+                decode=lambda value: (360 / 2**25) * value,
+                encode=lambda longitude: int(longitude / (360 / 2**25)),
+            ),
+            BitField(
+                "latitude",
+                48,
+                24,
+                signed=True,
+                decode=lambda value: (180 / 2**24) * value,
+                encode=lambda latitude: int(latitude / (180 / 2**24)),
+            ),
+        ),
+        # Table 7.4: Talker Alias header Info PDU content
+        FLCOs.TalkerAliasHeader: BitLayout(
+            72,
+            BitField("talker_alias_data_format", 16, 2, decode=TalkerAliasDataFormat),
+            BitField("talker_alias_data_length", 18, 5),
+            BitField("talker_alias_data_msb", 23, 1, decode=bool),
+            BitField(
+                "talker_alias_data",
+                24,
+                48,
+                decode=lambda value: value.to_bytes(6, byteorder="big"),
+                encode=lambda data: int.from_bytes(data, byteorder="big"),
+            ),
+        ),
+        # Table 7.5: Talker Alias block Info PDU content
+        FLCOs.TalkerAliasBlock1: TALKER_ALIAS_BLOCK,
+        FLCOs.TalkerAliasBlock2: TALKER_ALIAS_BLOCK,
+        FLCOs.TalkerAliasBlock3: TALKER_ALIAS_BLOCK,
+    }
+    """FLCO specific fields (bits 16-72)"""
+
     def __init__(
         self,
         protect_flag: Union[int, bool],
@@ -46,6 +156,7 @@ class FullLinkControl(BytesInterface, BitsInterface):
         # Table 7.5: Talker Alias block Info PDU content
         # talker alias blocks 1,2,3 use "talker_alias_data" field, since data are 56bits (7bytes)
     ):
+        self._sparse: Optional[Dict] = None
         self.protect_flag: bool = protect_flag in (True, 1)
         self.full_link_control_opcode: FLCOs = flco
         self.feature_set_id: FeatureSetIDs = fid
@@ -110,108 +221,40 @@ class FullLinkControl(BytesInterface, BitsInterface):
             96,
             77,
         ), f"Unexpected Full LC bits length, expected 96 (reed-solomon) or 77 (5-bit checksum), got {len(bits)}"
-        flco: FLCOs = FLCOs.from_bits(bits[2:8])
-        pf: int = bits[0]
-        fid: FeatureSetIDs = FeatureSetIDs.from_bits(bits[8:16])
-        crc: bitarray = bits[72:96] if len(bits) >= 96 else bits[72:77]
-        if flco == FLCOs.UnitToUnitVoiceChannelUser:
-            return FullLinkControl(
-                protect_flag=pf,
-                fid=fid,
-                crc=crc,
-                flco=flco,
-                service_options=ServiceOptions.from_bits(bits[16:24]),
-                target_address=ba2int(bits[24:48]),
-                source_address=ba2int(bits[48:72]),
-            )
-        elif flco == FLCOs.GroupVoiceChannelUser:
-            return FullLinkControl(
-                protect_flag=pf,
-                fid=fid,
-                crc=crc,
-                flco=flco,
-                service_options=ServiceOptions.from_bits(bits[16:24]),
-                group_address=ba2int(bits[24:48]),
-                source_address=ba2int(bits[48:72]),
-            )
-        elif flco == FLCOs.GPSInfo:
-            return FullLinkControl(
-                protect_flag=pf,
-                fid=fid,
-                crc=crc,
-                flco=flco,
-                position_error=PositionError.from_bits(bits[20:23]),
-                longitude=(360 / 2**25) * ba2int(bits[23:48], signed=True),
-                latitude=(180 / 2**24) * ba2int(bits[48:72], signed=True),
-            )
-        elif flco == FLCOs.TalkerAliasHeader:
-            return FullLinkControl(
-                protect_flag=pf,
-                fid=fid,
-                crc=crc,
-                flco=flco,
-                talker_alias_data_format=TalkerAliasDataFormat.from_bits(bits[16:18]),
-                talker_alias_data_length=ba2int(bits[18:23]),
-                talker_alias_data_msb=bits[23],
-                talker_alias_data=bits[24:72].tobytes(),
-            )
-        elif flco in (
-            FLCOs.TalkerAliasBlock1,
-            FLCOs.TalkerAliasBlock2,
-            FLCOs.TalkerAliasBlock3,
-        ):
-            return FullLinkControl(
-                protect_flag=pf,
-                fid=fid,
-                crc=crc,
-                flco=flco,
-                talker_alias_data=bits[16:72].tobytes(),
-            )
+        value: int = FullLinkControl.HEADER.int_from_bits(bits)
+        header: Dict[str, Any] = FullLinkControl.HEADER.unpack(value)
+        flco: FLCOs = header["full_link_control_opcode"]
+        layout: Optional[BitLayout] = FullLinkControl.LAYOUTS.get(flco)
+        if layout is None:
+            raise KeyError(f"Not-implemented FLCO {flco}")
 
-        raise KeyError(f"Not-implemented FLCO {flco}")
+        return FullLinkControl(
+            protect_flag=header["protect_flag"],
+            flco=flco,
+            fid=header["feature_set_id"],
+            crc=bits[72:96] if len(bits) >= 96 else bits[72:77],
+            **layout.unpack(value),
+        )
 
     def as_bits(self) -> bitarray:
-        common: bitarray = (
-            bitarray([self.protect_flag, 0])
-            + self.full_link_control_opcode.as_bits()
-            + self.feature_set_id.as_bits()
+        layout: Optional[BitLayout] = FullLinkControl.LAYOUTS.get(
+            self.full_link_control_opcode
         )
-
-        if self.full_link_control_opcode == FLCOs.UnitToUnitVoiceChannelUser:
-            common += (
-                self.service_options.as_bits()
-                + int2ba(self.target_address, length=24)
-                + int2ba(self.source_address, length=24)
-            )
-        elif self.full_link_control_opcode == FLCOs.GroupVoiceChannelUser:
-            common += (
-                self.service_options.as_bits()
-                + int2ba(self.group_address, length=24)
-                + int2ba(self.source_address, length=24)
-            )
-        elif self.full_link_control_opcode == FLCOs.GPSInfo:
-            common += (
-                bitarray([0] * 4)
-                + self.position_error.as_bits()
-                + int2ba(int(self.longitude / (360 / 2**25)), length=25, signed=True)
-                + int2ba(int(self.latitude / (180 / 2**24)), length=24, signed=True)
-            )
-        elif self.full_link_control_opcode == FLCOs.TalkerAliasHeader:
-            common += (
-                self.talker_alias_data_format.as_bits()
-                + int2ba(self.talker_alias_data_length, length=5)
-                + bitarray([self.talker_alias_data_msb])
-                + bytes_to_bits(self.talker_alias_data)
-            )
-        elif self.full_link_control_opcode in (
-            FLCOs.TalkerAliasBlock1,
-            FLCOs.TalkerAliasBlock2,
-            FLCOs.TalkerAliasBlock3,
-        ):
-            common += bytes_to_bits(self.talker_alias_data)
-        else:
+        if layout is None:
             raise KeyError(
                 f"as_bits unimplemented FLCO {self.full_link_control_opcode}"
             )
 
-        return common + self.crc
+        return (
+            int2ba(FullLinkControl.HEADER.pack(self) | layout.pack(self), length=72)
+            + self.crc
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        :return: header and FLCO specific fields, by attribute name
+        """
+        return {
+            **FullLinkControl.HEADER.as_dict(self),
+            **FullLinkControl.LAYOUTS[self.full_link_control_opcode].as_dict(self),
+        }
@@ -50,6 +50,15 @@ class Rate1Data(BitsInterface):
     ETSI TS 102 361-1 V2.5.1 (2017-10) - 9.2.16 Rate 1 coded Last Data block (R_1_LDATA) PDU
     """
 
+    __slots__ = (
+        "data",
+        "dbsn",
+        "packet_type",
+        "crc32",
+        "crc9",
+        "crc9_ok",
+    )
+
     def __init__(
         self,
         data: Union[bytes, bitarray],
@@ -39,6 +39,15 @@ class Rate34Data(BitsInterface):
     ETSI TS 102 361-1 V2.5.1 (2017-10) - 9.2.3 Rate ¾ coded Last Data block (R_3_4_LDATA) PDU
     """
 
+    __slots__ = (
+        "data",
+        "dbsn",
+        "packet_type",
+        "crc32",
+        "crc9",
+        "crc9_ok",
+    )
+
     def __init__(
         self,
         data: Union[bytes, bitarray],
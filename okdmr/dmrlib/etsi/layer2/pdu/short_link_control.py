@@ -1,4 +1,4 @@
-from typing import Union, Optional
+from typing import Any, Dict, Union, Optional
 
 from bitarray import bitarray
 from bitarray.util import int2ba, ba2int
@@ -6,6 +6,7 @@ from bitarray.util import int2ba, ba2int
 from okdmr.dmrlib.etsi.crc.crc8 import CRC8
 from okdmr.dmrlib.etsi.layer2.elements.slcos import SLCOs
 from okdmr.dmrlib.etsi.layer3.elements.activity_id import ActivityID
+from okdmr.dmrlib.utils.bit_fields import BitField, BitLayout
 from okdmr.dmrlib.utils.bits_interface import BitsInterface
 
 
@@ -14,6 +15,35 @@ class ShortLinkControl(BitsInterface):
     ETSI TS 102 361-1 V2.5.1 (2017-10) - 9.1.7 Short Link Control (SHORT LC) PDU
     """
 
+    HEADER: BitLayout = BitLayout(28, BitField("slco", 0, 4, decode=SLCOs))
+    """SLCO, common to all SLCOs (first 28 bits, without CRC)"""
+
+    LAYOUTS: Dict[SLCOs, BitLayout] = {
+        # 7.1.3.1 Null Message - does not have any more data
+        SLCOs.NullMessage: BitLayout(28),
+        # 7.1.3.2 Activity Update
+        SLCOs.ActivityUpdate: BitLayout(
+            28,
+            BitField("ts1_activity_id", 4, 4, decode=ActivityID),
+            BitField("ts2_activity_id", 8, 4, decode=ActivityID),
+            BitField(
+                "ts1_address",
+                12,
+                8,
+                decode=lambda value: int2ba(value, length=8),
+                encode=ba2int,
+            ),
+            BitField(
+                "ts2_address",
+                20,
+                8,
+                decode=lambda value: int2ba(value, length=8),
+                encode=ba2int,
+            ),
+        ),
+    }
+    """SLCO specific fields (bits 4-28)"""
+
     def __init__(
         self,
         slco: SLCOs,
@@ -60,32 +90,29 @@ class ShortLinkControl(BitsInterface):
         assert (
             len(bits) >= 36
         ), f"Expected at least 36 bits (including 8-bit CRC), got {len(bits)}"
-        slco: SLCOs = SLCOs.from_bits(bits[:4])
-        if slco == SLCOs.NullMessage:
-            return ShortLinkControl(slco=slco, crc_8bit=bits[28:36])
-        elif slco == SLCOs.ActivityUpdate:
-            return ShortLinkControl(
-                slco=slco,
-                crc_8bit=bits[28:36],
-                ts1_activity_id=ActivityID.from_bits(bits[4:8]),
-                ts2_activity_id=ActivityID.from_bits(bits[8:12]),
-                ts1_address=bits[12:20],
-                ts2_address=bits[20:28],
-            )
+        value: int = ShortLinkControl.HEADER.int_from_bits(bits)
+        slco: SLCOs = ShortLinkControl.HEADER.unpack(value)["slco"]
+        layout: Optional[BitLayout] = ShortLinkControl.LAYOUTS.get(slco)
+        if layout is None:
+            raise KeyError(f"from_bits not implemented for {slco}")
 
-        raise KeyError(f"from_bits not implemented for {slco}")
+        return ShortLinkControl(slco=slco, crc_8bit=bits[28:36], **layout.unpack(value))
 
     def as_bits(self) -> bitarray:
-        if self.slco == SLCOs.NullMessage:
-            return self.slco.as_bits() + bitarray([0] * 24) + self.crc_8bit
-        elif self.slco == SLCOs.ActivityUpdate:
-            return (
-                self.slco.as_bits()
-                + self.ts1_activity_id.as_bits()
-                + self.ts2_activity_id.as_bits()
-                + self.ts1_address
-                + self.ts2_address
-                + self.crc_8bit
-            )
+        layout: Optional[BitLayout] = ShortLinkControl.LAYOUTS.get(self.slco)
+        if layout is None:
+            raise KeyError(f"as_bits not implemented for {self.slco}")
+
+        return (
+            int2ba(ShortLinkControl.HEADER.pack(self) | layout.pack(self), length=28)
+            + self.crc_8bit
+        )
 
-        raise KeyError(f"as_bits not implemented for {self.slco}")
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        :return: SLCO and its specific fields, by attribute name
+        """
+        return {
+            **ShortLinkControl.HEADER.as_dict(self),
+            **ShortLinkControl.LAYOUTS[self.slco].as_dict(self),
+        }
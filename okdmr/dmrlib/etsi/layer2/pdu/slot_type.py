@@ -5,7 +5,6 @@ from bitarray.util import ba2int, int2ba
 
 from okdmr.dmrlib.etsi.fec.golay_20_8_7 import Golay2087
 from okdmr.dmrlib.etsi.layer2.elements.data_types import DataTypes
-from okdmr.dmrlib.utils.bits_bytes import numpy_array_to_int
 from okdmr.dmrlib.utils.bits_interface import BitsInterface
 
 
@@ -14,14 +13,27 @@ class SlotType(BitsInterface):
     ETSI TS 102 361-1 V2.5.1 (2017-10) - 9.1.3 Slot Type (SLOT) PDU
     """
 
+    __slots__ = (
+        "colour_code",
+        "data_type",
+        "fec_parity",
+        "fec_errors_corrected",
+        "fec_parity_ok",
+    )
+
     def __init__(
-        self, colour_code: int, data_type: Union[int, DataTypes], parity: int = 0
+        self,
+        colour_code: int,
+        data_type: Union[int, DataTypes],
+        parity: int = 0,
+        fec_errors_corrected: int = 0,
     ):
         """
 
         :param colour_code: value 0-15
         :param data_type: DataTypes or value 0-15
         :param parity: value 0-4095
+        :param fec_errors_corrected: number of bit errors repaired by Golay (20,8,7) when decoding
         """
         assert (
             0b0 <= colour_code <= 0b1111
@@ -40,15 +52,17 @@ class SlotType(BitsInterface):
         )
 
         self.fec_parity: int = parity
+        self.fec_errors_corrected: int = fec_errors_corrected
 
+        codeword: int = Golay2087.CODEWORDS[
+            (self.colour_code << 4) | self.data_type.value
+        ]
         if parity < 1:
             # generate parity if not provided
-            self.fec_parity = numpy_array_to_int(
-                Golay2087.generate(self.as_bits()[:8])[8:]
-            )
+            self.fec_parity = codeword & 0xFFF
 
         # check parity
-        self.fec_parity_ok: bool = Golay2087.check(self.as_bits())
+        self.fec_parity_ok: bool = self.fec_parity == codeword & 0xFFF
 
     def as_bits(self) -> bitarray:
         return (
@@ -57,14 +71,31 @@ class SlotType(BitsInterface):
             + int2ba(self.fec_parity, length=12)
         )
 
+    def as_int(self) -> int:
+        """
+        :return: 20-bit int, first bit of colour code being MSB (inverse of SlotType.from_int)
+        """
+        return (self.colour_code << 16) | (self.data_type.value << 12) | self.fec_parity
+
     def __repr__(self) -> str:
-        return f"[{self.data_type}] [CC: {self.colour_code}]{'' if self.fec_parity_ok else ' [SLOT FEC: INVALID]'}"
+        return f"[{self.data_type}] [CC: {self.colour_code}]{'' if self.fec_parity_ok else ' [SLOT FEC: INVALID]'}{f' [SLOT FEC: CORRECTED {self.fec_errors_corrected}]' if self.fec_errors_corrected else ''}"
 
     @staticmethod
     def from_bits(bits: bitarray) -> "SlotType":
         assert len(bits) == 20, "SlotType must be 20 bits"
+        return SlotType.from_int(ba2int(bits))
+
+    @staticmethod
+    def from_int(codeword: int) -> "SlotType":
+        """
+        Decodes SlotType from 20-bit int, repairs up to 3 bit errors using Golay (20,8,7)
+        :param codeword: 20-bit int, first bit of colour code being MSB
+        :return:
+        """
+        ok, corrected, errors = Golay2087.correct_int(codeword)
         return SlotType(
-            colour_code=ba2int(bits[:4]),
-            data_type=ba2int(bits[4:8]),
-            parity=ba2int(bits[8:]),
+            colour_code=corrected >> 16,
+            data_type=(corrected >> 12) & 0xF,
+            parity=corrected & 0xFFF,
+            fec_errors_corrected=errors if ok else 0,
         )
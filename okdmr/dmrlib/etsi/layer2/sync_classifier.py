@@ -0,0 +1,97 @@
+from typing import Dict, Optional, Tuple
+
+from okdmr.dmrlib.etsi.layer2.elements.sync_patterns import SyncPatterns
+
+
+class SyncClassifier:
+    """
+    Error-tolerant classification of 48-bit burst center (SYNC or embedded signalling)
+    ETSI TS 102 361-1 V2.5.1 (2017-10) - 9.1.1 Synchronization (SYNC) PDU
+
+    Exact match is single dict lookup, otherwise center is matched against all SYNC patterns by Hamming distance,
+    SYNC patterns are at least 10 bits apart from each other, so up to 4 bit errors are never ambiguous
+    """
+
+    DEFAULT_MAX_DISTANCE: int = 4
+    """Number of bit errors tolerated, if not given explicitly (as by Burst)"""
+
+    POPCOUNT: bytes = bytes(bin(value).count("1") for value in range(256))
+    """byte (int) -> number of bits set"""
+
+    PATTERNS: Dict[int, SyncPatterns] = {
+        pattern.value: pattern for pattern in SyncPatterns if pattern.value >= 0
+    }
+    """48-bit value (int) -> SYNC pattern"""
+
+    PATTERN_ITEMS: Tuple[Tuple[int, SyncPatterns], ...] = tuple(PATTERNS.items())
+    """(48-bit value, SYNC pattern) pairs, for iteration"""
+
+    @staticmethod
+    def distance(value: int, pattern: int) -> int:
+        """
+        :param value: 48-bit int
+        :param pattern: 48-bit int
+        :return: Hamming distance (number of differing bits)
+        """
+        diff: int = value ^ pattern
+        popcount: bytes = SyncClassifier.POPCOUNT
+        return (
+            popcount[diff & 0xFF]
+            + popcount[(diff >> 8) & 0xFF]
+            + popcount[(diff >> 16) & 0xFF]
+            + popcount[(diff >> 24) & 0xFF]
+            + popcount[(diff >> 32) & 0xFF]
+            + popcount[diff >> 40]
+        )
+
+    @staticmethod
+    def classify(
+        value: int, max_distance: Optional[int] = None
+    ) -> Tuple[SyncPatterns, int]:
+        """
+        :param value: 48-bit burst center, first on-air bit being MSB
+        :param max_distance: maximum number of bit errors, 0 means only exact match is accepted,
+                             None means SyncClassifier.DEFAULT_MAX_DISTANCE
+        :return: (nearest SYNC pattern, distance) if within max_distance,
+                 otherwise (SyncPatterns.EmbeddedSignalling, max_distance + 1)
+        """
+        pattern: SyncPatterns = SyncClassifier.PATTERNS.get(value)
+        if pattern is not None:
+            return pattern, 0
+
+        nearest: SyncPatterns = SyncPatterns.EmbeddedSignalling
+        nearest_distance: int = (
+            SyncClassifier.DEFAULT_MAX_DISTANCE
+            if max_distance is None
+            else max_distance
+        ) + 1
+        popcount: bytes = SyncClassifier.POPCOUNT
+        for pattern_value, pattern in SyncClassifier.PATTERN_ITEMS:
+            diff: int = value ^ pattern_value
+            # most patterns are rejected by first two bytes, without counting the rest
+            distance: int = popcount[diff >> 40] + popcount[(diff >> 32) & 0xFF]
+            if distance >= nearest_distance:
+                continue
+            distance += popcount[(diff >> 24) & 0xFF] + popcount[(diff >> 16) & 0xFF]
+            if distance >= nearest_distance:
+                continue
+            distance += popcount[(diff >> 8) & 0xFF] + popcount[diff & 0xFF]
+            if distance < nearest_distance:
+                nearest, nearest_distance = pattern, distance
+        return nearest, nearest_distance
+
+    @staticmethod
+    def classify_bytes(
+        value: bytes, max_distance: Optional[int] = None
+    ) -> Tuple[SyncPatterns, int]:
+        """
+        :param value: 6 bytes of burst center
+        :param max_distance: see classify
+        :return: see classify
+        """
+        assert (
+            len(value) == 6
+        ), f"SYNC or embedded signalling must be 6 bytes (48 bits), got {len(value)}"
+        return SyncClassifier.classify(
+            int.from_bytes(value, byteorder="big"), max_distance=max_distance
+        )
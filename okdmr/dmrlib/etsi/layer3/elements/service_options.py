@@ -52,6 +52,34 @@ class ServiceOptions(BitsInterface):
             priority_level=ba2int(bits[6:8]),
         )
 
+    @staticmethod
+    def from_int(value: int) -> "ServiceOptions":
+        """
+        :param value: 8-bit int, emergency flag being MSB
+        :return:
+        """
+        return ServiceOptions(
+            is_emergency=value >> 7,
+            is_privacy=(value >> 6) & 0b1,
+            reserved=int2ba((value >> 4) & 0b11, length=2),
+            is_broadcast=(value >> 3) & 0b1,
+            is_open_voice_call_mode=(value >> 2) & 0b1,
+            priority_level=value & 0b11,
+        )
+
+    def as_int(self) -> int:
+        """
+        :return: 8-bit int, inverse of ServiceOptions.from_int
+        """
+        return (
+            (self.is_emergency << 7)
+            | (self.is_privacy << 6)
+            | (ba2int(self.reserved) << 4)
+            | (self.is_broadcast << 3)
+            | (self.is_open_voice_call_mode << 2)
+            | self.priority_level
+        )
+
     def as_bits(self) -> bitarray:
         return bitarray(
             [
@@ -1,16 +1,28 @@
-from typing import Union, Optional, Literal
+from typing import Any, Dict, Union, Optional, Literal
 
 from bitarray import bitarray
 from bitarray.util import ba2int, int2ba
 
 from okdmr.dmrlib.etsi.layer3.elements.ip_address_identifier import IPAddressIdentifier
 from okdmr.dmrlib.etsi.layer3.elements.udp_port_identifier import UDPPortIdentifier
+from okdmr.dmrlib.utils.bit_fields import BitField, BitLayout
 from okdmr.dmrlib.utils.bits_bytes import bits_to_bytes, bytes_to_bits
 from okdmr.dmrlib.utils.bits_interface import BitsInterface
 from okdmr.dmrlib.utils.bytes_interface import BytesInterface
 
 
 class UDPIPv4CompressedHeader(BitsInterface, BytesInterface):
+    HEADER: BitLayout = BitLayout(
+        40,
+        BitField("ipv4_identification", 0, 16),
+        BitField("source_ip_address_id", 16, 4, decode=IPAddressIdentifier),
+        BitField("destination_ip_address_id", 20, 4, decode=IPAddressIdentifier),
+        # port ids are kept as raw values, multiple values map to single UDPPortIdentifier
+        BitField("udp_source_port_id", 25, 7),
+        BitField("udp_destination_port_id", 33, 7),
+    )
+    """Fixed part of header, before optional extended headers (UDP port numbers)"""
+
     def __init__(
         self,
         ipv4_identification: int,
@@ -90,8 +102,9 @@ class UDPIPv4CompressedHeader(BitsInterface, BytesInterface):
         assert (
             len(bits) >= 40
         ), f"UDP/IPv4 compressed header must be at least 40 bits, got {len(bits)} instead"
-        spid = UDPPortIdentifier.from_bits(bits[25:32])
-        dpid = UDPPortIdentifier.from_bits(bits[33:40])
+        header: Dict[str, Any] = UDPIPv4CompressedHeader.HEADER.unpack_bits(bits)
+        spid = UDPPortIdentifier(header["udp_source_port_id"])
+        dpid = UDPPortIdentifier(header["udp_destination_port_id"])
         e1: Optional[int] = None
         e2: Optional[int] = None
         data_start: int = 40
@@ -119,25 +132,30 @@ class UDPIPv4CompressedHeader(BitsInterface, BytesInterface):
             data_start += 16
 
         return UDPIPv4CompressedHeader(
-            ipv4_identification=ba2int(bits[0:16]),
-            source_ip_address_id=ba2int(bits[16:20]),
-            destination_ip_address_id=ba2int(bits[20:24]),
-            udp_source_port_id=ba2int(bits[25:32]),
-            udp_destination_port_id=ba2int(bits[33:40]),
             extended_header_1=e1,
             extended_header_2=e2,
             user_data=bits[data_start:],
+            **header,
         )
 
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        :return: fixed header fields, by attribute name
+        """
+        return UDPIPv4CompressedHeader.HEADER.as_dict(self)
+
     def as_bits(self) -> bitarray:
+        header: int = UDPIPv4CompressedHeader.HEADER.pack_dict(
+            {
+                "ipv4_identification": self.ipv4_identification,
+                "source_ip_address_id": self.source_ip_address_id,
+                "destination_ip_address_id": self.destination_ip_address_id,
+                "udp_source_port_id": self.udp_source_port_original,
+                "udp_destination_port_id": self.udp_destination_port_original,
+            }
+        )
         return (
-            int2ba(self.ipv4_identification, length=16)
-            + self.source_ip_address_id.as_bits()
-            + self.destination_ip_address_id.as_bits()
-            + bitarray("0")
-            + int2ba(self.udp_source_port_original, length=7)
-            + bitarray("0")
-            + int2ba(self.udp_destination_port_original, length=7)
+            int2ba(header, length=40)
             + (
                 int2ba(self.extended_header_1, 16)
                 if self.extended_header_1 is not None
@@ -45,8 +45,9 @@ class HyteraIPSCSync(Burst):
         # IPSC Sync is not interleaved
         return bits
 
-    def as_bits(self) -> bitarray:
-        return self.full_bits
+    def encode(self) -> bytes:
+        # transmitted as received, there is no EMB, SLOT or FEC to re-encode
+        return self.full_bits.tobytes()
 
     def __repr__(self):
         return f"[IPSC SYNC] [SOURCE: {self.source}] [TARGET: {self.target}]"
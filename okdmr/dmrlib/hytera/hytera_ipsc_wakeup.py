@@ -26,8 +26,9 @@ class HyteraIPSCWakeup(Burst):
         # IPSC Sync is not interleaved
         return bits
 
-    def as_bits(self) -> bitarray:
-        return self.full_bits
+    def encode(self) -> bytes:
+        # transmitted as received, there is no EMB, SLOT or FEC to re-encode
+        return self.full_bits.tobytes()
 
     def __repr__(self):
         return f"[IPSC WAKEUP]"
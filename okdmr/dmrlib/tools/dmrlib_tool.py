@@ -1,7 +1,9 @@
 import sys
 from argparse import ArgumentParser, ArgumentDefaultsHelpFormatter
+from typing import Optional, Tuple
 
 from okdmr.dmrlib.etsi.layer2.burst import Burst
+from okdmr.dmrlib.etsi.layer2.burst_batch import BurstBatch
 from okdmr.dmrlib.etsi.layer2.elements.burst_types import BurstTypes
 from okdmr.dmrlib.etsi.layer2.pdu.csbk import CSBK
 from okdmr.dmrlib.etsi.layer2.pdu.data_header import DataHeader
@@ -37,6 +39,55 @@ class DmrlibTool(ProtocolTool):
     def full_lc() -> None:
         ProtocolTool._impl(protocol="DMR Full Link Control", impl=FullLinkControl)
 
+    @staticmethod
+    def parse_dsdfme_line(line: str) -> Optional[Tuple[int, BurstTypes, bytes]]:
+        """
+        Parses single line of DSD-FME Structured DSP output ("<timeslot> <burst type> <hex payload>")
+        :param line: DSP output line
+        :return: (timeslot, burst type, 33 bytes payload) or None for RC/CACH bursts and malformed lines
+        """
+        parts = line.split(" ")
+        if len(parts) != 3:
+            return None
+        try:
+            timeslot = int(parts[0])
+            burst_type = int(parts[1])
+            payload = bytes.fromhex(parts[2])
+        except ValueError:
+            return None
+        if burst_type in (99, 98) or len(payload) != BurstBatch.BURST_BYTES:
+            return None
+        return (
+            timeslot,
+            BurstTypes.Vocoder if burst_type == 10 else BurstTypes.DataAndControl,
+            payload,
+        )
+
+    @staticmethod
+    def read_dsdfme(file: str, batch: Optional[BurstBatch] = None) -> BurstBatch:
+        """
+        Reads DSD-FME Structured DSP output (lines "<timeslot> <burst type> <hex payload>") into batch,
+        RC and CACH bursts and malformed lines are skipped, line number is used as timestamp
+        :param file: DSP output file (dsd-fme "-Q" option)
+        :param batch: bursts are appended to this batch, if provided
+        :return: batch
+        """
+        if batch is None:
+            batch = BurstBatch()
+        with open(file, "r") as lines:
+            for line_no, line in enumerate(lines):
+                parsed = DmrlibTool.parse_dsdfme_line(line)
+                if not parsed:
+                    continue
+                timeslot, burst_type, payload = parsed
+                batch.append(
+                    payload=payload,
+                    burst_type=burst_type,
+                    timestamp=line_no,
+                    timeslot=timeslot,
+                )
+        return batch
+
     @staticmethod
     def dsdfme() -> None:
         parser: ArgumentParser = ArgumentParser(
@@ -58,32 +109,22 @@ class DmrlibTool(ProtocolTool):
                 if not line:
                     break
 
-                parts = line.split(" ")
-                if len(parts) == 3:
-                    timeslot = int(parts[0])
-                    burst_type = int(parts[1])
-                    burst_data = bytes.fromhex(parts[2])
-                    if burst_type not in (99, 98):
-                        try:
-                            from scapy.layers.inet import IP, UDP
-                            from scapy.packet import Raw
+                parsed = DmrlibTool.parse_dsdfme_line(line)
+                if parsed:
+                    timeslot, burst_type, burst_data = parsed
+                    try:
+                        from scapy.layers.inet import IP, UDP
+                        from scapy.packet import Raw
 
-                            b = Burst.from_bytes(
-                                data=burst_data,
-                                burst_type=(
-                                    BurstTypes.Vocoder
-                                    if burst_type == 10
-                                    else BurstTypes.DataAndControl
-                                ),
-                            )
-                            b.timeslot = timeslot
+                        b = Burst.from_bytes(data=burst_data, burst_type=burst_type)
+                        b.timeslot = timeslot
 
-                            b = watcher.process_burst(b)
-                            if b:
-                                print(repr(b))
-                                emb_extractor.process_packet(
-                                    data=b.as_bytes(),
-                                    packet=IP() / UDP() / Raw(burst_data),
-                                )
-                        except Exception as e:
-                            print(e)
+                        b = watcher.process_burst(b)
+                        if b:
+                            print(repr(b))
+                            emb_extractor.process_packet(
+                                data=b.as_bytes(),
+                                packet=IP() / UDP() / Raw(burst_data),
+                            )
+                    except Exception as e:
+                        print(e)
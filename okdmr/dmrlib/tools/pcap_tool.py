@@ -8,6 +8,8 @@ from bitarray import bitarray
 from kaitaistruct import KaitaiStruct
 from okdmr.dmrlib.etsi.fec.vbptc_128_72 import VBPTC12873
 from okdmr.dmrlib.etsi.layer2.burst import Burst
+from okdmr.dmrlib.etsi.layer2.burst_batch import BurstBatch
+from okdmr.dmrlib.etsi.layer2.burst_cache import BurstDecodeCache
 from okdmr.dmrlib.etsi.layer2.elements.lcss import LCSS
 from okdmr.dmrlib.etsi.layer2.elements.preemption_power_indicator import (
     PreemptionPowerIndicator,
@@ -22,6 +24,7 @@ from okdmr.kaitai.tools.prettyprint import prettyprint
 from scapy.data import UDP_SERVICES
 from scapy.layers.inet import UDP, IP
 from scapy.layers.l2 import Ether
+from scapy.packet import Packet
 from scapy.utils import PcapReader
 
 
@@ -35,7 +38,7 @@ class EmbeddedExtractor:
 
     def process_packet(self, data: bytes, packet: IP) -> Optional[FullLinkControl]:
         burst: Optional[Burst] = PcapTool.debug_packet(
-            data=data, packet=packet, hide_unknown=True, silent=True
+            data=data, packet=packet, hide_unknown=True, silent=True, lazy=True
         )
 
         if (
@@ -79,7 +82,7 @@ class IPSCAnalyze:
     def process_packet(self, data: bytes, packet: IP) -> None:
         kaitai_pkt: Optional[KaitaiStruct] = try_parse_packet(udpdata=data)
         burst: Optional[Burst] = PcapTool.debug_packet(
-            data=data, packet=packet, hide_unknown=True, silent=True
+            data=data, packet=packet, hide_unknown=True, silent=True, lazy=True
         )
         if isinstance(kaitai_pkt, IpSiteConnectProtocol) and burst:
             rowkey = (kaitai_pkt.slot_type, kaitai_pkt.frame_type)
@@ -141,13 +144,22 @@ class PcapTool:
 
     @staticmethod
     def debug_packet(
-        data: bytes, packet: IP, hide_unknown: bool = False, silent: bool = False
+        data: bytes,
+        packet: IP,
+        hide_unknown: bool = False,
+        silent: bool = False,
+        lazy: bool = False,
+        cache: Optional[BurstDecodeCache] = None,
     ) -> Optional[Burst]:
+        """
+        :param lazy: if True, burst contents (emb, slot type, data) are decoded only when accessed by caller
+        :param cache: if provided, repeated bursts are not decoded again, see BurstDecodeCache
+        """
         pkt = try_parse_packet(udpdata=data)
         burst: Optional[Burst] = None
         ip_str: str = f"{packet.src}:{packet.getlayer(UDP).sport}\t-> {packet.dst}:{packet.getlayer(UDP).dport}\t"
         if isinstance(pkt, IpSiteConnectProtocol):
-            burst: Burst = Burst.from_hytera_ipsc(pkt)
+            burst: Burst = Burst.from_hytera_ipsc(pkt, lazy=lazy, cache=cache)
             if not silent:
                 print(
                     f"{ip_str} IPSC TS:{1 if pkt.timeslot_raw == IpSiteConnectProtocol.Timeslots.timeslot_1 else 2} "
@@ -155,7 +167,9 @@ class PcapTool:
                 )
         elif isinstance(pkt, Mmdvm2020):
             if isinstance(pkt.command_data, Mmdvm2020.TypeDmrData):
-                burst: Burst = Burst.from_mmdvm(pkt.command_data)
+                burst: Burst = Burst.from_mmdvm(
+                    pkt.command_data, lazy=lazy, cache=cache
+                )
                 if not silent:
                     print(
                         f"{ip_str} MMDVM TS:{1 if pkt.command_data.slot_no == Mmdvm2020.Timeslots.timeslot_1 else 2} "
@@ -178,6 +192,59 @@ class PcapTool:
 
         return burst
 
+    @staticmethod
+    def fill_burst_batch(data: bytes, packet: IP, batch: BurstBatch) -> Optional[int]:
+        """
+        Appends MMDVM or Hytera IPSC burst from packet to batch, without creating Burst object
+        :param data: UDP payload
+        :param packet: IP layer of captured packet, capture time is taken from its outermost layer
+        :param batch:
+        :return: index of appended burst or None if packet does not carry one
+        """
+        pkt = try_parse_packet(udpdata=data)
+        captured: Packet = packet
+        while captured.underlayer is not None:
+            captured = captured.underlayer
+        timestamp: float = float(captured.time)
+        if isinstance(pkt, IpSiteConnectProtocol):
+            index: int = batch.append_hytera_ipsc(pkt, timestamp=timestamp)
+            return index if index >= 0 else None
+        elif isinstance(pkt, Mmdvm2020) and isinstance(
+            pkt.command_data, Mmdvm2020.TypeDmrData
+        ):
+            return batch.append_mmdvm(pkt.command_data, timestamp=timestamp)
+        return None
+
+    @staticmethod
+    def read_burst_batch(
+        files: List[str],
+        batch: Optional[BurstBatch] = None,
+        ports_whitelist: List[int] = [],
+        ports_blacklist: List[int] = [],
+        ip_whitelist: List[str] = [],
+    ) -> BurstBatch:
+        """
+        Reads all MMDVM and Hytera IPSC bursts from pcap/pcapng files into (new or provided) batch
+        :param files:
+        :param batch: bursts are appended to this batch, if provided
+        :param ports_whitelist:
+        :param ports_blacklist:
+        :param ip_whitelist:
+        :return: batch
+        """
+        if batch is None:
+            batch = BurstBatch()
+        PcapTool.iter_pcap(
+            files=files,
+            callback=lambda data, packet: PcapTool.fill_burst_batch(
+                data=data, packet=packet, batch=batch
+            ),
+            ports_whitelist=ports_whitelist,
+            ports_blacklist=ports_blacklist,
+            ip_whitelist=ip_whitelist,
+        )
+        return batch
+
     # noinspection PyUnusedLocal
     @staticmethod
     def void_packet_callback(data: bytes, packet: IP):
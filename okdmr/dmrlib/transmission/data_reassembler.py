@@ -0,0 +1,96 @@
+from typing import Optional, Union
+
+from okdmr.dmrlib.etsi.crc.crc32 import CRC32
+from okdmr.dmrlib.etsi.layer2.pdu.rate12_data import Rate12Data
+from okdmr.dmrlib.etsi.layer2.pdu.rate1_data import Rate1Data
+from okdmr.dmrlib.etsi.layer2.pdu.rate34_data import Rate34Data
+from okdmr.dmrlib.utils.bits_bytes import byteswap_bytes
+
+
+class DataReassembler:
+    """
+    Streaming re-assembly of user data carried by Rate 1/2, Rate 3/4 and Rate 1 data blocks
+    ETSI TS 102 361-1 V2.5.1 (2017-10) - 8.2.0 Datagram fragmentation and re-assembly
+
+    Each block is written into buffer preallocated from blocks_to_follow and fed into running CRC32,
+    which is verified as soon as the last block arrives
+    """
+
+    def __init__(self, blocks_to_follow: int = 0):
+        self.blocks_to_follow: int = 0
+        self.buffer: bytearray = bytearray()
+        self.length: int = 0
+        self.blocks: int = 0
+        self.crc32_register: int = CRC32.CALC.init()
+        self.crc32_calculated: Optional[int] = None
+        self.crc32_expected: Optional[int] = None
+        self.reset(blocks_to_follow=blocks_to_follow)
+
+    def reset(self, blocks_to_follow: Optional[int] = 0) -> "DataReassembler":
+        """
+        Prepares for new transmission, buffer is allocated with first block, once octets per block are known
+        :param blocks_to_follow: number of data blocks announced by data header, 0 or None if unknown
+        :return: self
+        """
+        self.blocks_to_follow = blocks_to_follow or 0
+        self.buffer = bytearray()
+        self.length = 0
+        self.blocks = 0
+        self.crc32_register = CRC32.CALC.init()
+        self.crc32_calculated = None
+        self.crc32_expected = None
+        return self
+
+    def add_block(self, block: Union[Rate12Data, Rate34Data, Rate1Data]) -> bool:
+        """
+        Appends block user data, updates running CRC32 and checks it, if block is the last one
+        :param block:
+        :return: True if block was the last block of transmission
+        """
+        data: bytes = block.data
+        end: int = self.length + len(data)
+        if end > len(self.buffer):
+            # first block (or more blocks than announced or unknown count), last block is shorter by CRC32 length
+            self.buffer.extend(
+                bytes(
+                    max(
+                        end - len(self.buffer),
+                        (self.blocks_to_follow - self.blocks) * len(data),
+                    )
+                )
+            )
+        self.buffer[self.length : end] = data
+        self.length = end
+        self.blocks += 1
+        # CRC32 is calculated over byte-swapped octet pairs, every block carries even number of octets
+        self.crc32_register = CRC32.CALC.update(
+            self.crc32_register, byteswap_bytes(data)
+        )
+
+        if not block.is_last_block():
+            return False
+
+        self.crc32_calculated = CRC32.CALC.digest(self.crc32_register)
+        # CRC32 is transmitted least significant octet first
+        self.crc32_expected = int.from_bytes(
+            block.crc32.to_bytes(4, byteorder="big"), byteorder="little"
+        )
+        return True
+
+    @property
+    def finished(self) -> bool:
+        return self.crc32_calculated is not None
+
+    @property
+    def crc32_ok(self) -> bool:
+        """
+        :return: True if last block was received and transmitted CRC32 matches calculated one
+        """
+        return self.finished and self.crc32_calculated == self.crc32_expected
+
+    @property
+    def user_data(self) -> memoryview:
+        """
+        :return: view of re-assembled user data (including pad octets), valid until reset
+        """
+        return memoryview(self.buffer)[: self.length]
@@ -1,7 +1,6 @@
 import secrets
 from typing import List, Optional, Union
 
-from okdmr.dmrlib.etsi.fec.bptc_196_96 import BPTC19696
 from okdmr.dmrlib.etsi.layer2.burst import Burst
 from okdmr.dmrlib.etsi.layer2.elements.csbk_opcodes import CsbkOpcodes
 from okdmr.dmrlib.etsi.layer2.elements.data_types import DataTypes
@@ -17,6 +16,7 @@ from okdmr.dmrlib.etsi.layer2.pdu.rate34_data import Rate34Data, Rate34DataTypes
 from okdmr.dmrlib.etsi.layer3.pdu.udp_ipv4_compressed_header import (
     UDPIPv4CompressedHeader,
 )
+from okdmr.dmrlib.transmission.data_reassembler import DataReassembler
 from okdmr.dmrlib.transmission.transmission_observer_interface import (
     TransmissionObserverInterface,
     WithObservers,
@@ -44,6 +44,7 @@ class Transmission(WithObservers, LoggingTrait):
         self.blocks: List[BitsInterface] = list()
         self.header: Optional[DataHeader] = None
         self.stream_no: bytes = secrets.token_bytes(4)
+        self.reassembler: DataReassembler = DataReassembler()
 
     def new_transmission(self, newtype: TransmissionTypes):
         if (
@@ -60,6 +61,7 @@ class Transmission(WithObservers, LoggingTrait):
         self.blocks = list()
         self.header = None
         self.stream_no = secrets.token_bytes(4)
+        self.reassembler = DataReassembler()
 
         if newtype != TransmissionTypes.Idle:
             self.transmission_started(transmission_type=newtype)
@@ -90,6 +92,11 @@ class Transmission(WithObservers, LoggingTrait):
                 #    f"[Blocks To Follow / Appended Blocks] DMR Data Header block count mismatch [{self.blocks_expected} - {self.blocks_received} != {data_header.blocks_to_follow}]"
                 # )
 
+        if not self.reassembler.blocks:
+            # UDT header does not announce blocks to follow, buffer then grows block by block
+            self.reassembler.reset(
+                blocks_to_follow=data_header.get_blocks_to_follow() or 0
+            )
         self.header = data_header
         self.blocks_received += 1
         self.blocks.append(data_header)
@@ -122,6 +129,11 @@ class Transmission(WithObservers, LoggingTrait):
     def process_data(self, data: Union[Rate12Data, Rate34Data, Rate1Data]):
         self.blocks_received += 1
         self.blocks.append(data)
+        if self.reassembler.add_block(data) and not self.reassembler.crc32_ok:
+            self.log_warning(
+                f"[DATA] CRC32 mismatch, calculated {self.reassembler.crc32_calculated:08x} "
+                f"expected {self.reassembler.crc32_expected:08x}"
+            )
         if data.is_last_block():
             self.end_data_transmission()
 
@@ -170,14 +182,10 @@ class Transmission(WithObservers, LoggingTrait):
         self.data_transmission_ended(self.header, self.blocks)
         self.log_info(repr(self.header))
 
-        user_data: bytes = b""
-        for block in self.blocks:
-            if (
-                isinstance(block, Rate12Data)
-                or isinstance(block, Rate34Data)
-                or isinstance(block, Rate1Data)
-            ):
-                user_data += block.data
+        user_data: memoryview = self.reassembler.user_data
+        self.data_transmission_user_data(
+            self.header, user_data, self.reassembler.crc32_ok
+        )
 
         if (
             hasattr(self.header, "sap_identifier")
@@ -219,18 +227,20 @@ class Transmission(WithObservers, LoggingTrait):
     def process_packet(self, burst: Burst) -> Burst:
         burst = self.fix_voice_burst_type(burst)
 
-        lc_info_bits = BPTC19696.deinterleave_data_bits(
-            burst.full_bits[:98] + burst.full_bits[166:]
-        )
+        # burst already holds FEC decoded info bits and parsed PDU, vocoder bursts (without slot type) carry none
         if burst.data_type == DataTypes.VoiceLCHeader:
-            self.log_info("voice header %s" % lc_info_bits.tobytes().hex())
-            self.process_voice_header(FullLinkControl.from_bits(lc_info_bits))
+            self.log_info(
+                "voice header %s" % burst.info_bits_deinterleaved.tobytes().hex()
+            )
+            self.process_voice_header(burst.data)
         elif burst.data_type == DataTypes.DataHeader:
-            self.process_data_header(DataHeader.from_bits(lc_info_bits))
+            self.process_data_header(burst.data)
         elif burst.data_type == DataTypes.CSBK:
-            self.process_csbk(CSBK.from_bits(lc_info_bits))
+            self.process_csbk(burst.data)
         elif burst.data_type == DataTypes.TerminatorWithLC:
-            self.log_info("voice terminator %s" % lc_info_bits.tobytes().hex())
+            self.log_info(
+                "voice terminator %s" % burst.info_bits_deinterleaved.tobytes().hex()
+            )
             self.blocks_received += 1
             self.end_voice_transmission()
         elif burst.data_type in [
@@ -247,7 +257,7 @@ class Transmission(WithObservers, LoggingTrait):
         elif burst.data_type == DataTypes.Rate12Data:
             self.process_data(
                 data=Rate12Data.from_bits_typed(
-                    bits=lc_info_bits,
+                    bits=burst.info_bits_deinterleaved,
                     data_type=Rate12DataTypes.resolve(
                         confirmed=self.confirmed, last=self.is_last_block(True)
                     ),
@@ -48,6 +48,7 @@ class TransmissionGenerator:
             )
             b_i = Burst(
                 burst_type=BurstTypes.DataAndControl,
+                lazy=True,
             )
             b_i.has_emb = False
             b_i.sync_or_embedded_signalling = sync_pattern
@@ -182,7 +183,7 @@ class TransmissionGenerator:
                 packet_type=block_type, data=userdata_slice, crc32=userdata_crc32
             )
             # TODO better burst from contained data init
-            burst = Burst(burst_type=BurstTypes.DataAndControl)
+            burst = Burst(burst_type=BurstTypes.DataAndControl, lazy=True)
             burst.has_emb = False
             burst.data = block
             burst.slot_type = SlotType(
@@ -195,7 +196,7 @@ class TransmissionGenerator:
 
     @staticmethod
     def generate_data_header_burst(data_header: DataHeader) -> Burst:
-        burst: Burst = Burst(burst_type=BurstTypes.DataAndControl)
+        burst: Burst = Burst(burst_type=BurstTypes.DataAndControl, lazy=True)
         burst.data = data_header
         burst.sync_or_embedded_signalling = SyncPatterns.BsSourcedData
         burst.slot_type = SlotType(colour_code=5, data_type=DataTypes.DataHeader)
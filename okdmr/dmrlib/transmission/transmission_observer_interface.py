@@ -30,6 +30,20 @@ class TransmissionObserverInterface:
         """
         pass
 
+    def data_transmission_user_data(
+        self, transmission_header: DataHeader, user_data: memoryview, crc32_ok: bool
+    ):
+        """
+        Get notified about re-assembled user data of completed (or ended) data transmission,
+        user_data is view into re-assembly buffer (including pad octets), copy it if it needs to outlive the call
+
+        @param transmission_header:
+        @param user_data:
+        @param crc32_ok: whether last block was received and CRC32 of user data matches
+        @return:
+        """
+        pass
+
     def voice_transmission_ended(
         self, voice_header: FullLinkControl, blocks: List[BitsInterface]
     ):
@@ -97,6 +111,22 @@ class WithObservers(TransmissionObserverInterface):
                     "data_transmission_ended observer raised following exception"
                 )
 
+    def data_transmission_user_data(
+        self, transmission_header: DataHeader, user_data: memoryview, crc32_ok: bool
+    ):
+        for observer in self.observers:
+            # noinspection PyBroadException
+            try:
+                observer.data_transmission_user_data(
+                    transmission_header=transmission_header,
+                    user_data=user_data,
+                    crc32_ok=crc32_ok,
+                )
+            except:
+                logging.getLogger(self.__class__.__name__).exception(
+                    "data_transmission_user_data observer raised following exception"
+                )
+
     def transmission_started(self, transmission_type: TransmissionTypes):
         for observer in self.observers:
             # noinspection PyBroadException
@@ -3,6 +3,7 @@ from typing import Dict, Optional, List
 from scapy.layers.inet import IP
 
 from okdmr.dmrlib.etsi.layer2.burst import Burst
+from okdmr.dmrlib.etsi.layer2.burst_cache import BurstDecodeCache
 from okdmr.dmrlib.hytera.hytera_ipsc_sync import HyteraIPSCSync
 from okdmr.dmrlib.hytera.hytera_ipsc_wakeup import HyteraIPSCWakeup
 from okdmr.dmrlib.transmission.terminal import Terminal
@@ -14,11 +15,26 @@ from okdmr.dmrlib.utils.logging_trait import LoggingTrait
 
 
 class TransmissionWatcher(LoggingTrait, WithObservers):
-    def __init__(self, observers: List[TransmissionObserverInterface] = ()) -> None:
+    def __init__(
+        self,
+        observers: List[TransmissionObserverInterface] = (),
+        decode_cache: Optional[BurstDecodeCache] = None,
+    ) -> None:
         super().__init__(observers=observers)
         self.terminals: Dict[int, Terminal] = {}
         self.last_stream_no: bytes = b""
         self.debug_voice_bytes: bool = False
+        self.decode_cache: Optional[BurstDecodeCache] = decode_cache
+
+    def set_decode_cache(
+        self, decode_cache: Optional[BurstDecodeCache] = None
+    ) -> "TransmissionWatcher":
+        """
+        :param decode_cache: cache of decoded bursts, None disables caching
+        :return: self
+        """
+        self.decode_cache = decode_cache
+        return self
 
     def set_debug_voice_bytes(self, do_debug: bool = True) -> "TransmissionWatcher":
         self.debug_voice_bytes = do_debug
@@ -33,7 +49,7 @@ class TransmissionWatcher(LoggingTrait, WithObservers):
         from okdmr.dmrlib.tools.pcap_tool import PcapTool
 
         burst: Optional[Burst] = PcapTool.debug_packet(
-            data=data, packet=packet, silent=True
+            data=data, packet=packet, silent=True, cache=self.decode_cache
         )
         if burst:
             processed_burst: Burst = self.process_burst(burst)
@@ -0,0 +1,220 @@
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from bitarray import bitarray
+from bitarray.util import ba2int, int2ba
+
+
+class BitField:
+    """
+    Single field of BitLayout, positions are counted from first (most significant) bit of layout
+
+    Field can be split into several segments (eg. pad octet count of data header), first segment
+    holds most significant bits of field value.
+    Fields without name are reserved bits, packed with constant value and ignored when unpacking.
+    """
+
+    __slots__ = ("name", "segments", "length", "decode", "encode", "signed", "value")
+
+    def __init__(
+        self,
+        name: Optional[str],
+        start: int,
+        length: int,
+        decode: Optional[Callable[[int], Any]] = None,
+        encode: Optional[Callable[[Any], int]] = None,
+        signed: bool = False,
+        value: int = 0,
+        more_segments: Sequence[Tuple[int, int]] = (),
+    ):
+        """
+        :param name: attribute (and constructor argument) name, None for reserved bits
+        :param start: position of first bit of field
+        :param length: number of bits
+        :param decode: int -> value (enum class, bool, ...), raw int is used if not provided
+        :param encode: value -> int, if not provided, int() is used for raw int/bool fields
+                       and .value for all other (enums, FragmentSequenceNumber, ...)
+        :param signed: value is two's complement
+        :param value: constant value of reserved (unnamed) field
+        :param more_segments: (start, length) of following less significant bits, for split fields
+        """
+        self.name: Optional[str] = name
+        self.segments: Tuple[Tuple[int, int], ...] = ((start, length),) + tuple(
+            more_segments
+        )
+        self.length: int = sum(segment[1] for segment in self.segments)
+        self.decode: Optional[Callable[[int], Any]] = decode
+        self.encode: Callable[[Any], int] = encode or (
+            int if decode in (None, bool, int) else attrgetter("value")
+        )
+        self.signed: bool = signed
+        self.value: int = value
+
+    def __repr__(self) -> str:
+        return f"[BitField {self.name or 'reserved'} {self.segments}]"
+
+
+class BitLayout:
+    """
+    Declarative description of fixed-length PDU (or its part), compiled into tables of shifts and masks
+
+    Whole PDU is extracted from (or packed into) single int, so fields are not sliced into temporary bitarrays.
+    Same layout provides as_dict for PDU objects, whose attributes are named after fields.
+    """
+
+    __slots__ = (
+        "length",
+        "fields",
+        "names",
+        "constant",
+        "_single",
+        "_split",
+        "_packers",
+    )
+
+    def __init__(self, length: int, *fields: BitField):
+        """
+        :param length: number of bits described by layout
+        :param fields: named fields and reserved bits, bits not covered by any field are packed as zero
+        """
+        self.length: int = length
+        self.fields: Tuple[BitField, ...] = fields
+        self.names: Tuple[str, ...] = tuple(
+            field.name for field in fields if field.name
+        )
+        self.constant: int = 0
+        # (name, shift, mask, decode, sign bit) of single segment fields, most fields are like that
+        self._single: List[Tuple[str, int, int, Optional[Callable], int]] = []
+        # (name, ((shift, mask, length), ...), decode, sign bit) of split fields
+        self._split: List[Tuple[str, Tuple, Optional[Callable], int]] = []
+        # (encode, ((shift, mask, number of less significant bits in following segments), ...)) in order of names
+        self._packers: List[Tuple[Callable, Tuple[Tuple[int, int, int], ...]]] = []
+
+        used: int = 0
+        for field in fields:
+            segments: List[Tuple[int, int, int]] = []
+            for start, segment_length in field.segments:
+                assert (
+                    segment_length > 0 and 0 <= start <= length - segment_length
+                ), f"{field} does not fit into {length} bits"
+                shift: int = length - start - segment_length
+                mask: int = (1 << segment_length) - 1
+                assert not (
+                    used & (mask << shift)
+                ), f"{field} overlaps with other field"
+                used |= mask << shift
+                segments.append((shift, mask, segment_length))
+
+            if not field.name:
+                assert (
+                    len(segments) == 1
+                ), f"Reserved bits must be single segment, got {field}"
+                self.constant |= (field.value & segments[0][1]) << segments[0][0]
+                continue
+
+            sign: int = (1 << (field.length - 1)) if field.signed else 0
+            if len(segments) == 1:
+                shift, mask, _ = segments[0]
+                self._single.append((field.name, shift, mask, field.decode, sign))
+            else:
+                self._split.append((field.name, tuple(segments), field.decode, sign))
+
+            remaining: int = field.length
+            packer: List[Tuple[int, int, int]] = []
+            for shift, mask, segment_length in segments:
+                remaining -= segment_length
+                packer.append((shift, mask, remaining))
+            self._packers.append((field.encode, tuple(packer)))
+
+        self._single = tuple(self._single)
+        self._split = tuple(self._split)
+        self._packers = tuple(self._packers)
+
+    def unpack(self, value: int) -> Dict[str, Any]:
+        """
+        :param value: int of BitLayout.length bits, first bit of layout being MSB
+        :return: decoded field values by name
+        """
+        decoded: Dict[str, Any] = {}
+        for name, shift, mask, decode, sign in self._single:
+            field: int = (value >> shift) & mask
+            if field & sign:
+                field -= sign << 1
+            decoded[name] = field if decode is None else decode(field)
+        for name, segments, decode, sign in self._split:
+            field: int = 0
+            for shift, mask, length in segments:
+                field = (field << length) | ((value >> shift) & mask)
+            if field & sign:
+                field -= sign << 1
+            decoded[name] = field if decode is None else decode(field)
+        return decoded
+
+    def unpack_bits(self, bits: bitarray) -> Dict[str, Any]:
+        """
+        :param bits: at least BitLayout.length bits, following bits (CRC, padding, ...) are ignored
+        :return: see unpack
+        """
+        return self.unpack(self.int_from_bits(bits))
+
+    def unpack_bytes(self, data: bytes) -> Dict[str, Any]:
+        """
+        :param data: at least BitLayout.length bits, following bits (CRC, padding, ...) are ignored
+        :return: see unpack
+        """
+        assert (
+            len(data) * 8 >= self.length
+        ), f"Layout needs {self.length} bits, got {len(data) * 8}"
+        return self.unpack(
+            int.from_bytes(data, byteorder="big") >> (len(data) * 8 - self.length)
+        )
+
+    def int_from_bits(self, bits: bitarray) -> int:
+        """
+        :param bits: at least BitLayout.length bits
+        :return: first BitLayout.length bits as int, without slicing the bitarray
+        """
+        assert (
+            len(bits) >= self.length
+        ), f"Layout needs {self.length} bits, got {len(bits)}"
+        return ba2int(bits) >> (len(bits) - self.length)
+
+    def pack(self, source: Any) -> int:
+        """
+        :param source: object with attributes named after fields (usually PDU instance)
+        :return: int of BitLayout.length bits, first bit of layout being MSB
+        """
+        return self._pack([getattr(source, name) for name in self.names])
+
+    def pack_dict(self, values: Mapping[str, Any]) -> int:
+        """
+        :param values: field values by name
+        :return: see pack
+        """
+        return self._pack([values[name] for name in self.names])
+
+    def pack_bits(self, source: Any) -> bitarray:
+        """
+        :param source: see pack
+        :return: BitLayout.length bits
+        """
+        return int2ba(self.pack(source), length=self.length)
+
+    def as_dict(self, source: Any) -> Dict[str, Any]:
+        """
+        :param source: see pack
+        :return: values of named fields (decoded form, as stored on source)
+        """
+        return {name: getattr(source, name) for name in self.names}
+
+    def _pack(self, values: List[Any]) -> int:
+        packed: int = self.constant
+        for (encode, segments), value in zip(self._packers, values):
+            field: int = encode(value)
+            # masking also converts negative (signed) values to two's complement
+            for shift, mask, less_significant in segments:
+                packed |= ((field >> less_significant) & mask) << shift
+        return packed
+
+    def __repr__(self) -> str:
+        return f"[BitLayout {self.length} bits] [{', '.join(self.names)}]"
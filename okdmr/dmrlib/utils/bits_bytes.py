@@ -25,6 +25,32 @@ def bits_to_bytes(bits: bitarray) -> bytes:
     return bits.tobytes()
 
 
+def bits_view(
+    buffer: Union[bytes, bytearray, memoryview, numpy.ndarray], endian: str = "big"
+) -> bitarray:
+    """
+    Creates bitarray sharing memory with buffer (no copy), bitarray is read-only if buffer is read-only
+    :param buffer: any contiguous object supporting buffer protocol
+    :param endian:
+    :return:
+    """
+    return bitarray(buffer=buffer, endian=endian)
+
+
+def byteswap_numpy(data: Union[bytes, bytearray, memoryview]) -> numpy.ndarray:
+    """
+    Swap bytes (endiannes) of 16-bit words through uint16 view, odd trailing byte is kept in place
+    :param data:
+    :return: uint8 array (single allocation), can be used as buffer of bits_view
+    """
+    source: numpy.ndarray = numpy.frombuffer(data, dtype=numpy.uint8)
+    if len(source) % 2 == 0:
+        return source.view(numpy.uint16).byteswap().view(numpy.uint8)
+    swapped: numpy.ndarray = source.copy()
+    swapped[:-1].view(numpy.uint16).byteswap(inplace=True)
+    return swapped
+
+
 def byteswap_bytes(data: bytes) -> bytes:
     """
     Swap bytes (endiannes)
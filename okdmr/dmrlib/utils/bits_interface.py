@@ -2,6 +2,8 @@ from bitarray import bitarray
 
 
 class BitsInterface:
+    __slots__ = ()
+
     @staticmethod
     def from_bits(bits: bitarray) -> "BitsInterface":
         """
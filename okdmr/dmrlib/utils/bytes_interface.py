@@ -6,6 +6,8 @@ class BytesInterface:
     Interface for byte-based protocols, calling from_bytes() and then as_bytes() should yield the original data bytes
     """
 
+    __slots__ = ()
+
     @staticmethod
     def from_bytes(
         data: bytes, endian: Literal["big", "little"] = "big"
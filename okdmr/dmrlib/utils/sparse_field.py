@@ -0,0 +1,35 @@
+from typing import Any, Dict, Optional
+
+
+class SparseField:
+    """
+    Descriptor for optional (per-opcode / per-format) PDU fields, owning class must have `_sparse` slot
+
+    Value is kept in instance `_sparse` dict only if it differs from default, so PDU instance carrying
+    just few of many optional fields, does not pay for all of them
+    """
+
+    __slots__ = ("name", "default")
+
+    def __init__(self, default: Any = None):
+        self.name: str = ""
+        self.default: Any = default
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Optional[object], owner: type) -> Any:
+        if instance is None:
+            return self
+        sparse: Optional[Dict[str, Any]] = instance._sparse
+        return self.default if sparse is None else sparse.get(self.name, self.default)
+
+    def __set__(self, instance: object, value: Any) -> None:
+        sparse: Optional[Dict[str, Any]] = instance._sparse
+        if type(value) is type(self.default) and value == self.default:
+            if sparse:
+                sparse.pop(self.name, None)
+        elif sparse is None:
+            instance._sparse = {self.name: value}
+        else:
+            sparse[self.name] = value
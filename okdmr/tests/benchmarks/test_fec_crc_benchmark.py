@@ -0,0 +1,53 @@
+import json
+
+from okdmr.benchmarks.fec_crc_benchmark import FecCrcBenchmark
+
+
+def test_cases_deterministic():
+    first = FecCrcBenchmark.cases(vectors=4)
+    second = FecCrcBenchmark.cases(vectors=4)
+    assert [case.name for case in first] == [case.name for case in second]
+    for a, b in zip(first, second):
+        assert a.vectors == b.vectors
+        # every vector must be accepted by its operation
+        for vector in a.vectors:
+            a.operation(vector)
+
+
+def test_run_and_compare():
+    results = FecCrcBenchmark.run(
+        FecCrcBenchmark.cases(vectors=2), min_time=0.0, repeat=1, only="crc16"
+    )
+    assert list(results["results"].keys()) == ["crc16.calculate"]
+    measured = results["results"]["crc16.calculate"]
+    assert measured["ops_per_sec"] > 0
+    assert measured["alloc_bytes_per_op"] >= 0
+
+    assert not FecCrcBenchmark.compare(results, results, tolerance=0.1)
+    faster = {
+        "results": {"crc16.calculate": {"ops_per_sec": measured["ops_per_sec"] * 2}}
+    }
+    assert len(FecCrcBenchmark.compare(results, faster, tolerance=0.25)) == 1
+    assert not FecCrcBenchmark.compare(results, faster, tolerance=0.6)
+
+
+def test_update_baseline_only(tmp_path):
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(
+        json.dumps(
+            {
+                "results": {
+                    "crc16.calculate": {"ops_per_sec": 1.0},
+                    "golay2087.correct/clean": {"ops_per_sec": 2.0},
+                }
+            }
+        )
+    )
+    arguments = ["--baseline", str(baseline), "--min-time", "0", "--repeat", "1"]
+    assert (
+        FecCrcBenchmark.main(arguments + ["--update-baseline", "--only", "crc16"]) == 0
+    )
+    results = json.loads(baseline.read_text())["results"]
+    # cases that were not measured keep their baseline
+    assert results["golay2087.correct/clean"] == {"ops_per_sec": 2.0}
+    assert results["crc16.calculate"]["ops_per_sec"] > 1.0
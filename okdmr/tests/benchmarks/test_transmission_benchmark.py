@@ -0,0 +1,33 @@
+from okdmr.benchmarks.fec_crc_benchmark import FecCrcBenchmark
+from okdmr.benchmarks.transmission_benchmark import TransmissionBenchmark
+from okdmr.dmrlib.etsi.layer2.burst import Burst
+from okdmr.dmrlib.etsi.layer2.pdu.full_link_control import FullLinkControl
+from okdmr.dmrlib.transmission.transmission import Transmission
+from okdmr.dmrlib.transmission.transmission_types import TransmissionTypes
+
+
+def test_stream_is_complete_traffic():
+    stream = TransmissionBenchmark.stream(superframes=2)
+    assert stream == TransmissionBenchmark.stream(superframes=2)
+
+    transmission: Transmission = Transmission()
+    types = []
+    for data, burst_type in stream:
+        burst: Burst = transmission.process_packet(Burst.from_bytes(data, burst_type))
+        if burst.has_emb:
+            assert burst.emb.emb_parity_ok
+        types.append(transmission.type)
+    assert types[0] == TransmissionTypes.VoiceTransmission
+    assert isinstance(Burst.from_bytes(*stream[0]).data, FullLinkControl)
+    # voice call and data transmission are both finished by their last burst
+    assert types[13] == TransmissionTypes.Idle
+    assert types[14] == TransmissionTypes.DataTransmission
+    assert types[-1] == TransmissionTypes.Idle
+
+
+def test_run_cases():
+    results = FecCrcBenchmark.run(
+        TransmissionBenchmark.cases(), min_time=0.0, repeat=1, only="transmission"
+    )
+    assert list(results["results"].keys()) == ["transmission.process_packet"]
+    assert results["results"]["transmission.process_packet"]["ops_per_sec"] > 0
@@ -1,8 +1,17 @@
 from bitarray import bitarray
-from bitarray.util import ba2int
+from bitarray.util import ba2int, int2ba, urandom
 from crc import Calculator, Crc16, Crc32
 
-from okdmr.dmrlib.etsi.crc.crc import BitCrcCalculator, BitCrcConfiguration
+from okdmr.dmrlib.etsi.crc.crc import (
+    BitCrcCalculator,
+    BitCrcConfiguration,
+    Crc7,
+    Crc8,
+    Crc9,
+    IntCrcCalculator,
+)
+from okdmr.dmrlib.etsi.crc.crc import Crc16 as Crc16Dmr
+from okdmr.dmrlib.etsi.crc.crc import Crc32 as Crc32Dmr
 from okdmr.dmrlib.utils.bits_bytes import bytes_to_bits
 
 
@@ -52,3 +61,39 @@ def test_feed_width():
     assert 9 == BitCrcConfiguration(polynomial=0x0, width_bits=9).feed_width_bits
     assert 1 == BitCrcConfiguration(polynomial=0x0, width_bits=1).feed_width_bits
     assert 8 == BitCrcConfiguration(polynomial=0x0, width_bits=16).feed_width_bits
+
+
+def test_int_crc_matches_bit_crc():
+    for configuration in (Crc7, Crc8, Crc9, Crc16Dmr, Crc32Dmr):
+        bit_calculator = BitCrcCalculator(configuration=configuration.ETSI_DMR)
+        int_calculator = IntCrcCalculator(configuration=configuration.ETSI_DMR)
+        for length in range(0, 100):
+            bits: bitarray = urandom(length, endian="big")
+            assert int_calculator.calculate_checksum(bits) == ba2int(
+                bit_calculator.calculate_checksum(bits.copy())
+            ), f"{configuration} differs for {bits}"
+
+
+def test_int_crc_bytes_and_tail():
+    crc32 = Calculator(optimized=True, configuration=Crc32.CRC32)
+    int_crc32 = IntCrcCalculator(
+        configuration=BitCrcConfiguration(
+            width_bits=32,
+            polynomial=0x04C11DB7,
+            init_value=0xFFFFFFFF,
+            final_xor_value=0xFFFFFFFF,
+            reverse_input_bytes=True,
+            reverse_output_bytes=True,
+        ),
+    )
+    data_bytes: bytes = b"\xAA\x88\x44\x00\x00"
+    assert crc32.checksum(data_bytes) == int_crc32.calculate_bytes(data_bytes)
+    assert crc32.checksum(data_bytes) == int_crc32.calculate_bytes(
+        memoryview(bytearray(data_bytes))
+    )
+
+    crc9 = IntCrcCalculator(configuration=Crc9.ETSI_DMR)
+    bits: bitarray = bytes_to_bits(data_bytes) + int2ba(0x55, length=7)
+    assert crc9.calculate_checksum(bits) == crc9.calculate_bytes(
+        data_bytes, tail=0x55, tail_bits=7
+    )
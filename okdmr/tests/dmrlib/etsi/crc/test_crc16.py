@@ -1,5 +1,7 @@
 from typing import Tuple, List
 
+import numpy
+
 from okdmr.dmrlib.etsi.crc.crc16 import CRC16
 from okdmr.dmrlib.etsi.layer2.elements.crc_masks import CrcMasks
 
@@ -25,3 +27,36 @@ def test_crc16():
             crc16=int.from_bytes(bytes.fromhex(crc16), byteorder="big"),
             mask=crc_mask,
         ), f"CRC16 does not match in {(databytes, crc16, crc_mask)}"
+
+
+def test_crc16_check_many():
+    blocks: numpy.ndarray = numpy.array(
+        [
+            list(bytes.fromhex("4da323383b23383b0560" + "8040")),
+            list(bytes.fromhex("bd0080180008fd23383b" + "b2ed")),
+            list(bytes.fromhex("211002177afc73000009" + "0dda")),
+            list(bytes.fromhex("211002177afc73000008" + "0dda")),
+        ],
+        dtype=numpy.uint8,
+    )
+    masks: numpy.ndarray = numpy.array(
+        [
+            CrcMasks.DataHeader.value,
+            CrcMasks.CSBK.value,
+            CrcMasks.PiHeader.value,
+            CrcMasks.PiHeader.value,
+        ]
+    )
+    assert CRC16.check_many(blocks, masks).tolist() == [True, True, True, False]
+    assert CRC16.check_many(blocks[1:2], CrcMasks.CSBK).tolist() == [True]
+
+    rng = numpy.random.default_rng(16)
+    random_blocks: numpy.ndarray = rng.integers(0, 256, (50, 12), dtype=numpy.uint8)
+    for block in random_blocks:
+        block[10:12] = list(
+            CRC16.calculate(block[:10].tobytes(), CrcMasks.CSBK).to_bytes(2, "big")
+        )
+    random_blocks[::2, 3] ^= 0x10
+    assert CRC16.check_many(random_blocks, CrcMasks.CSBK).tolist() == [
+        i % 2 == 1 for i in range(50)
+    ]
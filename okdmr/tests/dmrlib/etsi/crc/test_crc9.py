@@ -1,10 +1,14 @@
 from typing import Tuple, List, Union
 
+import numpy
 from bitarray.util import int2ba
 
 from okdmr.dmrlib.etsi.crc.crc import BitCrcCalculator, Crc9
 from okdmr.dmrlib.etsi.crc.crc9 import CRC9
 from okdmr.dmrlib.etsi.layer2.elements.crc_masks import CrcMasks
+from okdmr.dmrlib.etsi.layer2.pdu.rate12_data import Rate12Data, Rate12DataTypes
+from okdmr.dmrlib.etsi.layer2.pdu.rate1_data import Rate1Data, Rate1DataTypes
+from okdmr.dmrlib.etsi.layer2.pdu.rate34_data import Rate34Data, Rate34DataTypes
 
 
 def test_crc9():
@@ -60,3 +64,34 @@ def test_crc9_table():
         assert no_table.calculate_checksum(test_data) == with_table.calculate_checksum(
             test_data
         )
+
+
+def test_crc9_check_many():
+    rng = numpy.random.default_rng(9)
+    for rate, types, mask in (
+        (Rate12Data, Rate12DataTypes, CrcMasks.Rate12DataContinuation),
+        (Rate34Data, Rate34DataTypes, CrcMasks.Rate34DataContinuation),
+        (Rate1Data, Rate1DataTypes, CrcMasks.Rate1DataContinuation),
+    ):
+        blocks: List[bytes] = []
+        for dbsn in range(0, 20):
+            length: int = types.Confirmed.value
+            if dbsn % 4 == 3:
+                block = rate(
+                    data=rng.bytes(length - 4),
+                    dbsn=dbsn,
+                    crc32=rng.bytes(4),
+                    packet_type=types.ConfirmedLastBlock,
+                )
+            else:
+                block = rate(
+                    data=rng.bytes(length), dbsn=dbsn, packet_type=types.Confirmed
+                )
+            blocks.append(block.as_bits().tobytes())
+        array: numpy.ndarray = numpy.frombuffer(b"".join(blocks), dtype=numpy.uint8)
+        array = array.reshape(len(blocks), -1).copy()
+        assert CRC9.check_many(array, mask).all()
+        array[::3, -1] ^= 0x01
+        assert CRC9.check_many(array, numpy.full(len(blocks), mask.value)).tolist() == [
+            i % 3 != 0 for i in range(len(blocks))
+        ]
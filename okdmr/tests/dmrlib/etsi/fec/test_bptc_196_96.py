@@ -1,5 +1,6 @@
 from typing import Any, Dict, List
 
+import numpy
 from bitarray import bitarray
 from numpy import array_equal
 from okdmr.kaitai.etsi.dmr_csbk import DmrCsbk
@@ -125,3 +126,73 @@ def test_decode_encode():
             bits_deinterleaved=BPTC19696.deinterleave_all_bits(burst.info_bits_original)
         )
         assert encoded_full == original_info_bits
+
+
+def test_decode_corrections():
+    hex_bursts: List[str] = [
+        "53df0a83b7a8282c2509625014fdff57d75df5dcadde429028c87ae3341e24191c",
+        "51cf0ded894c0dec1ff8fcf294fdff57d75df5dcae7a16d064197982bf5824914c",
+    ]
+    for hex_burst in hex_bursts:
+        burst: Burst = Burst.from_bytes(
+            bytes.fromhex(hex_burst), burst_type=BurstTypes.DataAndControl
+        )
+        original: bitarray = burst.info_bits_original
+        expected: bitarray = BPTC19696.deinterleave_data_bits(
+            original, repair_if_necessary=False
+        )
+        assert BPTC19696.decode(original) == (expected, 0, False)
+
+        # single bit-flip in each row (excluding R(3) padding)
+        for row in range(0, 13):
+            corrupted: bitarray = original.copy()
+            corrupted.invert(int(BPTC19696.TABLE_INTERLEAVE_INDICES[row * 15 + row]))
+            assert BPTC19696.decode(corrupted) == (expected, 1, False)
+            assert BPTC19696.repair_if_necessary(corrupted) == original
+
+        # two bit-flips in single row are repaired by column corrections
+        corrupted: bitarray = original.copy()
+        corrupted.invert(int(BPTC19696.TABLE_INTERLEAVE_INDICES[17]))
+        corrupted.invert(int(BPTC19696.TABLE_INTERLEAVE_INDICES[20]))
+        decoded, corrected, uncorrectable = BPTC19696.decode(corrupted)
+        assert decoded == expected
+        assert not uncorrectable
+
+        # four bit-flips in rectangle cannot be repaired
+        corrupted: bitarray = original.copy()
+        for position in (17, 20, 32, 35):
+            corrupted.invert(int(BPTC19696.TABLE_INTERLEAVE_INDICES[position]))
+        decoded, corrected, uncorrectable = BPTC19696.decode(corrupted)
+        assert uncorrectable
+
+
+def test_decode_encode_batch():
+    rng = numpy.random.default_rng(seed=196)
+    data: numpy.ndarray = rng.integers(0, 2, size=(64, 96), dtype=numpy.uint8)
+    encoded: numpy.ndarray = BPTC19696.encode_batch(data)
+    assert encoded.shape == (64, 196)
+
+    for i in range(0, 4):
+        single: bitarray = BPTC19696.encode(bitarray(data[i].tolist()))
+        assert single.tolist() == encoded[i].tolist()
+
+    decoded, corrected, uncorrectable = BPTC19696.decode_batch(encoded)
+    assert numpy.array_equal(decoded, data)
+    assert not corrected.any()
+    assert not uncorrectable.any()
+
+    # single bit-flip per burst, on random position (excluding R(3) padding)
+    corrupted: numpy.ndarray = encoded.copy()
+    positions: numpy.ndarray = rng.integers(1, 196, size=64)
+    corrupted[numpy.arange(64), positions] ^= 1
+    decoded, corrected, uncorrectable = BPTC19696.decode_batch(corrupted)
+    assert numpy.array_equal(decoded, data)
+    assert numpy.array_equal(corrected, numpy.ones(64))
+    assert not uncorrectable.any()
+
+    for i in range(0, 4):
+        assert BPTC19696.decode(bitarray(corrupted[i].tolist())) == (
+            bitarray(data[i].tolist()),
+            1,
+            False,
+        )
@@ -0,0 +1,43 @@
+import numpy
+from bitarray import bitarray
+from bitarray.util import ba2int, int2ba
+
+from okdmr.dmrlib.etsi.fec.fec_utils import (
+    bits_to_vector,
+    vector_to_bits,
+    int_to_vector,
+    vector_to_int,
+    pack_vectors,
+    unpack_vectors,
+)
+
+
+def test_bits_vector_roundtrip():
+    bits: bitarray = bitarray("1011001110001")
+    vector: numpy.ndarray = bits_to_vector(bits)
+    assert vector.dtype == numpy.uint8
+    assert vector.tolist() == bits.tolist()
+    assert vector_to_bits(vector) == bits
+    # any integer dtype and non-contiguous views are accepted
+    assert vector_to_bits(vector.astype(int)[::-1]) == bits[::-1]
+
+
+def test_int_vector_roundtrip():
+    for value, length in ((0, 0), (0, 5), (0b1011, 4), (0xFFFFF, 20), (0x1A2B3, 17)):
+        vector: numpy.ndarray = int_to_vector(value, length)
+        assert len(vector) == length
+        if length:
+            assert vector.tolist() == int2ba(value, length=length).tolist()
+        assert vector_to_int(vector) == value
+
+
+def test_pack_unpack_vectors():
+    rng = numpy.random.default_rng(1234)
+    vectors: numpy.ndarray = rng.integers(0, 2, size=(10, 196), dtype=numpy.uint8)
+    packed: numpy.ndarray = pack_vectors(vectors)
+    assert packed.shape == (10, 25)
+    assert numpy.array_equal(unpack_vectors(packed, 196), vectors)
+    for vector, octets in zip(vectors, packed):
+        assert ba2int(vector_to_bits(vector)) << 4 == int.from_bytes(
+            octets.tobytes(), byteorder="big"
+        )
@@ -1,5 +1,6 @@
 import numpy
 from bitarray import bitarray
+from bitarray.util import ba2int, int2ba
 
 from okdmr.dmrlib.etsi.fec.golay_20_8_7 import Golay2087
 
@@ -19,3 +20,24 @@ def test_golay2087_check():
 def test_golay2087_generate():
     for valid in GOLAY_20_8_7_VALID_WORDS:
         assert numpy.array_equal(Golay2087.generate(bitarray(valid)[:8]), valid)
+
+
+def test_golay2087_correct_int():
+    for valid in GOLAY_20_8_7_VALID_WORDS:
+        codeword: int = ba2int(bitarray(valid))
+        assert Golay2087.correct_int(codeword) == (True, codeword, 0)
+        for errors in ((0,), (5, 19), (1, 10, 17)):
+            corrupted: int = codeword
+            for bit in errors:
+                corrupted ^= 1 << bit
+            assert Golay2087.correct_int(corrupted) == (True, codeword, len(errors))
+        ok, _, errors = Golay2087.correct_int(codeword ^ 0b1111)
+        assert not ok and errors == 4
+
+
+def test_golay2087_decode_table():
+    table: bytes = Golay2087.decode_table()
+    assert len(table) == 1 << 20
+    for data, codeword in enumerate(Golay2087.CODEWORDS):
+        assert table[codeword] == data
+        assert Golay2087.check(int2ba(codeword, length=20))
@@ -2,6 +2,7 @@ from random import randint
 
 import numpy
 from bitarray import bitarray
+from bitarray.util import ba2int
 
 from okdmr.dmrlib.etsi.fec.hamming_13_9_3 import Hamming1393
 
@@ -40,3 +41,16 @@ def test_hamming1393_unrepairable():
     assert valid != invalid
     assert not is_correct
     assert corrected == invalid
+
+
+def test_hamming1393_correct_int():
+    for valid in HAMMING_13_9_3_VALID_WORDS:
+        codeword: int = ba2int(bitarray(valid))
+        assert Hamming1393.generate_int(codeword >> (13 - 9)) == codeword
+        assert Hamming1393.correct_int(codeword) == (True, codeword, 0)
+        for position in range(0, 13):
+            assert Hamming1393.correct_int(codeword ^ (1 << position)) == (
+                True,
+                codeword,
+                1,
+            )
@@ -2,6 +2,7 @@ from random import randint
 
 import numpy
 from bitarray import bitarray
+from bitarray.util import ba2int
 
 from okdmr.dmrlib.etsi.fec.hamming_15_11_3 import Hamming15113
 
@@ -29,3 +30,16 @@ def test_hamming15113_repair():
         is_valid, corrected = Hamming15113.check_and_correct(invalid)
         assert is_valid, "single bit-flips should be repaired"
         assert bitarray(valid) == corrected
+
+
+def test_hamming15113_correct_int():
+    for valid in HAMMING_15_11_3_VALID_WORDS:
+        codeword: int = ba2int(bitarray(valid))
+        assert Hamming15113.generate_int(codeword >> (15 - 11)) == codeword
+        assert Hamming15113.correct_int(codeword) == (True, codeword, 0)
+        for position in range(0, 15):
+            assert Hamming15113.correct_int(codeword ^ (1 << position)) == (
+                True,
+                codeword,
+                1,
+            )
@@ -2,6 +2,7 @@ from random import randint
 
 import numpy
 from bitarray import bitarray
+from bitarray.util import ba2int
 
 from okdmr.dmrlib.etsi.fec.hamming_16_11_4 import Hamming16114
 
@@ -30,3 +31,23 @@ def test_hamming16114_repair():
         is_valid, corrected = Hamming16114.check_and_correct(invalid)
         assert is_valid, "single bit-flips should be repaired"
         assert bitarray(valid) == corrected
+
+
+def test_hamming16114_correct_int():
+    for valid in HAMMING_16_11_4_VALID_WORDS:
+        codeword: int = ba2int(bitarray(valid))
+        assert Hamming16114.generate_int(codeword >> (16 - 11)) == codeword
+        assert Hamming16114.correct_int(codeword) == (True, codeword, 0)
+        for position in range(0, 16):
+            assert Hamming16114.correct_int(codeword ^ (1 << position)) == (
+                True,
+                codeword,
+                1,
+            )
+
+
+def test_hamming16114_detects_double_errors():
+    for valid in HAMMING_16_11_4_VALID_WORDS:
+        codeword: int = ba2int(bitarray(valid))
+        invalid: int = codeword ^ 0b1000000000000001
+        assert Hamming16114.correct_int(invalid) == (False, invalid, 2)
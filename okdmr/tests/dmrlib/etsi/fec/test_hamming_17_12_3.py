@@ -2,6 +2,7 @@ from random import randint
 
 import numpy
 from bitarray import bitarray
+from bitarray.util import ba2int
 
 from okdmr.dmrlib.etsi.fec.hamming_17_12_3 import Hamming17123
 
@@ -30,3 +31,16 @@ def test_hamming17123_repair():
         is_valid, corrected = Hamming17123.check_and_correct(invalid)
         assert is_valid, "single bit-flips should be repaired"
         assert bitarray(valid) == corrected
+
+
+def test_hamming17123_correct_int():
+    for valid in HAMMING_17_12_3_VALID_WORDS:
+        codeword: int = ba2int(bitarray(valid))
+        assert Hamming17123.generate_int(codeword >> (17 - 12)) == codeword
+        assert Hamming17123.correct_int(codeword) == (True, codeword, 0)
+        for position in range(0, 17):
+            assert Hamming17123.correct_int(codeword ^ (1 << position)) == (
+                True,
+                codeword,
+                1,
+            )
@@ -2,6 +2,7 @@ from random import randint
 
 import numpy
 from bitarray import bitarray
+from bitarray.util import ba2int
 
 from okdmr.dmrlib.etsi.fec.hamming_7_4_3 import Hamming743
 
@@ -31,3 +32,16 @@ def test_hamming743_repair():
         is_valid, corrected = Hamming743.check_and_correct(invalid)
         assert is_valid, "single bit-flips should be repaired"
         assert bitarray(valid) == corrected
+
+
+def test_hamming743_correct_int():
+    for valid in HAMMING_7_4_3_VALID_WORDS:
+        codeword: int = ba2int(bitarray(valid))
+        assert Hamming743.generate_int(codeword >> (7 - 4)) == codeword
+        assert Hamming743.correct_int(codeword) == (True, codeword, 0)
+        for position in range(0, 7):
+            assert Hamming743.correct_int(codeword ^ (1 << position)) == (
+                True,
+                codeword,
+                1,
+            )
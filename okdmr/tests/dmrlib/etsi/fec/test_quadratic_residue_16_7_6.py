@@ -1,4 +1,5 @@
 from bitarray import bitarray
+from bitarray.util import ba2int, int2ba
 
 from okdmr.dmrlib.etsi.fec.quadratic_residue_16_7_6 import QuadraticResidue1676
 
@@ -14,3 +15,23 @@ def test_qr1676_generate():
     for valid_word in VALID_QR_16_7_6_WORDS:
         bits: bitarray = bitarray(valid_word)
         assert bits.tolist() == list(QuadraticResidue1676.generate(bits[:7]))
+
+
+def test_qr1676_correct_int():
+    for valid_word in VALID_QR_16_7_6_WORDS:
+        codeword: int = ba2int(bitarray(valid_word))
+        assert QuadraticResidue1676.correct_int(codeword) == (True, codeword, 0)
+        for errors in ((0,), (15,), (2, 11)):
+            corrupted: int = codeword
+            for bit in errors:
+                corrupted ^= 1 << bit
+            assert QuadraticResidue1676.correct_int(corrupted) == (
+                True,
+                codeword,
+                len(errors),
+            )
+    for data, codeword in enumerate(QuadraticResidue1676.CODEWORDS):
+        assert QuadraticResidue1676.decode_table()[codeword] == data
+        assert QuadraticResidue1676.check(int2ba(codeword, length=16))
+        ok, _, errors = QuadraticResidue1676.correct_int(codeword ^ 0b111)
+        assert not ok and errors == 3
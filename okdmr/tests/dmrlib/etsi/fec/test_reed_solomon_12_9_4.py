@@ -1,5 +1,7 @@
 from typing import Dict
 
+import numpy
+
 from okdmr.dmrlib.etsi.fec.reed_solomon_12_9_4 import ReedSolomon1294
 from okdmr.dmrlib.etsi.layer2.elements.crc_masks import CrcMasks
 
@@ -21,3 +23,60 @@ def test_rs1294_multiply():
     assert 0 == ReedSolomon1294.log_multiply(0, 0)
     assert 0 == ReedSolomon1294.log_multiply(0, 1)
     assert 0 == ReedSolomon1294.log_multiply(1, 0)
+    for a in range(0, 256):
+        for b in range(0, 256):
+            assert ReedSolomon1294.MULTIPLICATION_TABLE[a][
+                b
+            ] == ReedSolomon1294.log_multiply(a, b)
+
+
+def test_rs1294_decode():
+    mask: bytes = CrcMasks.VoiceLCHeader.value.to_bytes(3, byteorder="big")
+    valid: bytes = bytes.fromhex("0300002635a903d475cb8795")
+    assert ReedSolomon1294.syndromes(valid, mask) == [0, 0, 0]
+    assert ReedSolomon1294.decode(valid, mask) == (True, valid, 0)
+    for position in range(0, 12):
+        corrupted: bytearray = bytearray(valid)
+        corrupted[position] ^= 0x5A
+        assert ReedSolomon1294.decode(bytes(corrupted), mask) == (True, valid, 1)
+        # two errors are detected, but cannot be repaired without knowing positions
+        corrupted[(position + 5) % 12] ^= 0x01
+        assert not ReedSolomon1294.decode(bytes(corrupted), mask)[0]
+        assert ReedSolomon1294.decode(
+            bytes(corrupted), mask, erasures=[position, (position + 5) % 12]
+        ) == (True, valid, 2)
+        # one error and one erasure
+        assert ReedSolomon1294.decode(
+            bytes(corrupted), mask, erasures=[(position + 5) % 12]
+        ) == (True, valid, 2)
+        # three erasures
+        corrupted[(position + 9) % 12] ^= 0x33
+        assert ReedSolomon1294.decode(
+            bytes(corrupted),
+            mask,
+            erasures=[position, (position + 5) % 12, (position + 9) % 12],
+        ) == (True, valid, 3)
+
+
+def test_rs1294_decode_batch():
+    mask: bytes = CrcMasks.TerminatorWithLC.value.to_bytes(3, byteorder="big")
+    rng = numpy.random.default_rng(1294)
+    blocks: numpy.ndarray = numpy.array(
+        [
+            list(
+                ReedSolomon1294.generate(
+                    rng.integers(0, 256, size=9, dtype=numpy.uint8).tobytes(), mask
+                )
+            )
+            for _ in range(100)
+        ],
+        dtype=numpy.uint8,
+    )
+    corrupted: numpy.ndarray = blocks.copy()
+    corrupted[numpy.arange(50, 100), numpy.arange(50) % 12] ^= 0xA5
+    corrupted[:10, 3] ^= 0x01
+    corrupted[:10, 7] ^= 0x10
+    repaired, ok, errors = ReedSolomon1294.decode_batch(corrupted, mask)
+    assert not ok[:10].any() and ok[10:].all()
+    assert numpy.array_equal(repaired[10:], blocks[10:])
+    assert errors.tolist() == [0] * 50 + [1] * 50
@@ -1,6 +1,7 @@
 from array import array
 from typing import Dict, Any
 
+import numpy
 from bitarray import bitarray
 
 from okdmr.dmrlib.etsi.fec.trellis import Trellis34
@@ -57,6 +58,11 @@ def test_trellis_decode():
 def test_trellis_encode():
     for bitstring, bytestring in TRELLIS_TEST_DATA.items():
         assert Trellis34.encode(bytes.fromhex(bytestring)) == bitarray(bitstring)
+        # encoding follows bit order, regardless of bitarray endianness
+        decoded: bitarray = Trellis34.decode(bitarray(bitstring))
+        assert Trellis34.encode(bitarray(decoded, endian="little")) == bitarray(
+            bitstring
+        )
 
 
 def test_bits_dibits():
@@ -121,3 +127,49 @@ def test_deterministics():
     decoded = Trellis34.decode(on_air)
     encoded = Trellis34.encode(decoded)
     assert encoded == on_air
+
+
+def test_point_nibbles():
+    for point, nibble in enumerate(Trellis34.TRELLIS34_POINT_NIBBLES.tolist()):
+        dibits = Trellis34.TRELLIS34_CONSTELLATION_POINTS_REVERSE[point]
+        assert Trellis34.dibits_to_bits(array("b", dibits)).to01() == f"{nibble:04b}"
+
+
+def test_viterbi_decode():
+    for bitstring, bytestring in TRELLIS_TEST_DATA.items():
+        decoded, metric = Trellis34.viterbi_decode(bitarray(bitstring))
+        assert metric == 0
+        assert decoded.tobytes() == bytes.fromhex(bytestring)
+
+
+def test_viterbi_decode_corrections():
+    for bitstring, bytestring in TRELLIS_TEST_DATA.items():
+        for flips in ([0], [195], [17], [3, 100], [40, 150], [10, 90, 180]):
+            corrupted: bitarray = bitarray(bitstring)
+            for flip in flips:
+                corrupted.invert(flip)
+            decoded, metric = Trellis34.viterbi_decode(corrupted)
+            assert 0 < metric <= len(flips)
+            assert decoded.tobytes() == bytes.fromhex(bytestring)
+            assert Trellis34.decode(corrupted, as_bytes=True) == bytes.fromhex(
+                bytestring
+            )
+
+
+def test_encode_decode_random():
+    rng = numpy.random.default_rng(34)
+    for _ in range(50):
+        data: bytes = rng.integers(0, 256, size=18, dtype=numpy.uint8).tobytes()
+        bits: bitarray = bitarray(endian="big")
+        bits.frombytes(data)
+        encoded: bitarray = Trellis34.encode(data)
+        assert encoded == Trellis34.encode(bits)
+        # slow reference path
+        assert encoded == Trellis34.dibits_to_bits(
+            Trellis34.interleave(
+                Trellis34.points_to_dibits(
+                    Trellis34.tribits_to_points(Trellis34.bits_to_tribits(bits))
+                )
+            )
+        )
+        assert Trellis34.decode(encoded, as_bytes=True) == data
@@ -1,5 +1,6 @@
 from typing import List
 
+import numpy
 from bitarray import bitarray
 from bitarray.util import int2ba
 from okdmr.kaitai.etsi.full_link_control import FullLinkControl as KaitaiFullLinkControl
@@ -64,3 +65,42 @@ def test_extract_embedded_signalling():
         assert isinstance(mmdvm.command_data, Mmdvm2020.TypeDmrData)
         burst_info: Burst = Burst.from_mmdvm(mmdvm=mmdvm.command_data)
         assert burst_info.has_emb
+
+
+def test_vbptc_decode_corrections():
+    rng = numpy.random.default_rng(12873)
+    data: numpy.ndarray = rng.integers(0, 2, size=(20, 72), dtype=numpy.uint8)
+    encoded: numpy.ndarray = VBPTC12873.encode_batch(data)
+    for block, on_air in zip(data, encoded):
+        on_air_bits: bitarray = VBPTC12873.numpy_to_bits(on_air)
+        data_bits: bitarray = VBPTC12873.numpy_to_bits(block)
+        assert VBPTC12873.encode(data_bits) == on_air_bits
+        # checksum is placed MSB first (CS(4) in row 3)
+        assert VBPTC12873.deinterleave_cs5_bits(on_air_bits) == int2ba(
+            FiveBitChecksum.calculate(data_bits.tobytes()), length=5
+        )
+        assert VBPTC12873.decode(on_air_bits) == (
+            data_bits + VBPTC12873.deinterleave_cs5_bits(on_air_bits),
+            0,
+            False,
+        )
+        # single error in every row, and double error in one row repaired by column parity
+        corrupted: bitarray = on_air_bits.copy()
+        for cell in (0, 17, 34, 51, 68, 85, 98, 105):
+            corrupted.invert(VBPTC12873.CELL_INTERLEAVE_INDICES[cell])
+        decoded, corrected, uncorrectable = VBPTC12873.decode(corrupted)
+        assert decoded[:72] == data_bits
+        assert corrected == 8 and not uncorrectable
+
+    corrupted: numpy.ndarray = encoded.copy()
+    corrupted[:10, [3, 40, 77]] ^= 1
+    # double error in single row is repaired using column parity
+    corrupted[10:15, [0, 8]] ^= 1
+    # double errors in two rows
+    corrupted[15:, [1, 9, 2, 10]] ^= 1
+    decoded, corrected, uncorrectable = VBPTC12873.decode_batch(corrupted)
+    assert numpy.array_equal(decoded[:15, :72], data[:15])
+    assert corrected.tolist()[:15] == [3] * 10 + [2] * 5
+    assert uncorrectable.tolist() == [False] * 15 + [True] * 5
+    for block, expected in zip(corrupted, uncorrectable):
+        assert VBPTC12873.decode(VBPTC12873.numpy_to_bits(block))[2] == expected
@@ -1,5 +1,6 @@
 from typing import List
 
+import numpy
 from bitarray import bitarray
 from okdmr.dmrlib.etsi.fec.vbptc_32_11 import VBPTC3211
 
@@ -38,3 +39,19 @@ def test_encode_decode_vbptc():
         assert encoded_all_bits == encoded_data_bits
         assert encoded_data_bits == encoded_info_bits
         assert encoded_info_bits == on_air_bits
+
+
+def test_vbptc_decode_corrections():
+    on_air_bits = bitarray("00000100010110000000100010100100")
+    data_bits: bitarray = VBPTC3211.deinterleave_data_bits(on_air_bits)
+    for positions in ((0,), (31,), (4, 6)):
+        corrupted: bitarray = on_air_bits.copy()
+        for position in positions:
+            corrupted.invert(position)
+        assert VBPTC3211.decode(corrupted) == (data_bits, len(positions), False)
+
+    decoded, corrected, uncorrectable = VBPTC3211.decode_batch(
+        numpy.array([on_air_bits.tolist()] * 2, dtype=numpy.uint8)
+    )
+    assert (decoded == numpy.array(data_bits.tolist())).all()
+    assert corrected.tolist() == [0, 0] and not uncorrectable.any()
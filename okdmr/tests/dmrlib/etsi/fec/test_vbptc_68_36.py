@@ -1,5 +1,7 @@
+from itertools import combinations
 from typing import List
 
+import numpy
 from bitarray import bitarray
 from bitarray.util import int2ba
 
@@ -59,6 +61,7 @@ def test_encode_decode_vbptc():
         assert crc8_extracted == int2ba(crc8_calculated, length=8, endian="little")
         slc: ShortLinkControl = ShortLinkControl.from_bits(deinterleaved_info_bits)
         assert slc.slco == expected_slco
+        assert slc.as_dict()["slco"] == expected_slco
         assert slc.crc_8bit == int2ba(crc8_calculated, length=8, endian="little")
         assert slc.as_bits() == deinterleaved_info_bits
         assert len(repr(slc))
@@ -77,3 +80,55 @@ def test_encode_decode_vbptc():
         assert encoded_data_bits == encoded_info_bits
         assert encoded_info_bits == on_air_bits
         assert encoded_lc == on_air_bits
+
+
+def test_vbptc_decode_corrections():
+    on_air_bits = bitarray(
+        "00110000001110010011000000110000010101011010111111110101011010101001"
+    )
+    data_bits: bitarray = VBPTC6828.deinterleave_data_bits(
+        on_air_bits, include_crc8=False
+    )
+    for cells in ((0,), (1, 20, 40), (5, 60)):
+        corrupted: bitarray = on_air_bits.copy()
+        for cell in cells:
+            corrupted.invert(VBPTC6828.CELL_INTERLEAVE_INDICES[cell])
+        decoded, corrected, uncorrectable = VBPTC6828.decode(corrupted)
+        assert decoded[:28] == data_bits
+        assert corrected == len(cells) and not uncorrectable
+
+    encoded: numpy.ndarray = VBPTC6828.encode_batch(
+        numpy.array([data_bits.tolist()] * 4, dtype=numpy.uint8)
+    )
+    assert VBPTC6828.numpy_to_bits(encoded[0]) == on_air_bits
+    encoded[1:, 30] ^= 1
+    decoded, corrected, uncorrectable = VBPTC6828.decode_batch(encoded)
+    assert (decoded[:, :28] == numpy.array(data_bits.tolist())).all()
+    assert corrected.tolist() == [0, 1, 1, 1] and not uncorrectable.any()
+
+
+def test_vbptc_decode_two_bit_errors():
+    on_air_bits = bitarray(
+        "00110000001110010011000000110000010101011010111111110101011010101001"
+    )
+    data_bits: bitarray = VBPTC6828.deinterleave_data_bits(
+        on_air_bits, include_crc8=False
+    )
+    corrupted: numpy.ndarray = numpy.array(
+        [on_air_bits.tolist()] * (68 * 67 // 2), dtype=numpy.uint8
+    )
+    for block, (first, second) in enumerate(combinations(range(68), 2)):
+        corrupted[block, [first, second]] ^= 1
+
+    decoded, corrected, uncorrectable = VBPTC6828.decode_batch(corrupted.copy())
+    valid: numpy.ndarray = (decoded[:, :28] == numpy.array(data_bits.tolist())).all(
+        axis=1
+    )
+    # each block with 2 bit errors is either repaired or reported, never miscorrected silently
+    assert (valid | uncorrectable).all()
+
+    for block in range(len(corrupted)):
+        decoded, corrected, uncorrectable = VBPTC6828.decode(
+            VBPTC6828.numpy_to_bits(corrupted[block])
+        )
+        assert uncorrectable or decoded[:28] == data_bits
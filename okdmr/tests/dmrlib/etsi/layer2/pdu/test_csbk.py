@@ -7,7 +7,7 @@ from okdmr.kaitai.homebrew.mmdvm2020 import Mmdvm2020
 from okdmr.dmrlib.etsi.layer2.burst import Burst
 from okdmr.dmrlib.etsi.layer2.elements.csbk_opcodes import CsbkOpcodes
 from okdmr.dmrlib.etsi.layer2.elements.feature_set_ids import FeatureSetIDs
-from okdmr.dmrlib.etsi.layer2.pdu.csbk import CSBK
+from okdmr.dmrlib.etsi.layer2.pdu.csbk import CSBK, PreambleCSBK, HyteraIPSCSyncCSBK
 from okdmr.dmrlib.utils.bits_bytes import bytes_to_bits
 
 
@@ -109,3 +109,71 @@ class TestCSBKOs:
                 + bitarray([0] * 80)
             )
             CSBK.from_bits(bits)
+
+
+def test_csbk_records():
+    _bits = bitarray(
+        "101111010000000000000000000000010000000000000001100110100000000000000001100111000101011011001110"
+    )
+    csbk = CSBK.from_bits(_bits)
+    assert type(csbk) is PreambleCSBK
+    assert not hasattr(csbk, "__dict__")
+    assert csbk.crc_ok
+    assert csbk.as_dict() == {
+        "last_block": True,
+        "protect_flag": False,
+        "csbko": CsbkOpcodes.PreambleCSBK,
+        "feature_set": FeatureSetIDs.StandardizedFID,
+        "csbk_content_follows_preambles": True,
+        "target_address_is_individual": True,
+        "blocks_to_follow": 1,
+        "target_address": 410,
+        "source_address": 412,
+    }
+    # generic CSBK constructor uses the same registered layout
+    manual = CSBK(
+        csbko=CsbkOpcodes.PreambleCSBK,
+        crc=csbk.crc,
+        **{
+            key: value
+            for key, value in csbk.as_dict().items()
+            if key not in ("csbko", "feature_set")
+        },
+    )
+    assert manual.crc_ok
+    assert manual.as_bits() == _bits
+    assert repr(manual) == repr(csbk)
+
+    # CRC is checked against received bits, corrupted payload is kept as received
+    corrupted = _bits.copy()
+    corrupted[40] = not corrupted[40]
+    corrupted_csbk = CSBK.from_bits(corrupted)
+    assert not corrupted_csbk.crc_ok
+    assert corrupted_csbk.crc == csbk.crc
+    assert corrupted_csbk.as_bits() == corrupted
+    assert repr(corrupted_csbk).endswith("[CRC INVALID]")
+
+
+def test_csbk_registry():
+    preamble = CSBK.get_codec(
+        CsbkOpcodes.PreambleCSBK.value, FeatureSetIDs.StandardizedFID.value
+    )
+    assert preamble.record is PreambleCSBK
+    assert preamble.layout.names[:4] == CSBK.HEADER.names
+    # manufacturer specific CSBK is registered regardless of FID
+    assert (
+        CSBK.get_codec(
+            CsbkOpcodes.HyteraIPSCSync.value, FeatureSetIDs.MotorolaLtd.value
+        ).record
+        is HyteraIPSCSyncCSBK
+    )
+    assert (
+        CSBK.get_codec(CsbkOpcodes.Clear.value, FeatureSetIDs.StandardizedFID.value)
+        is None
+    )
+
+    # unregistered CSBKO is packed with header only
+    clear = CSBK(csbko=CsbkOpcodes.Clear)
+    assert clear.crc_ok
+    assert len(clear.as_bits()) == 96
+    assert clear.as_bits()[16:80] == bitarray([0] * 64)
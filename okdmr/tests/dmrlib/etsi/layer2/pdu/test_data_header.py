@@ -64,8 +64,11 @@ def test_data_headers():
         _bytes = bytes.fromhex(pduhex)
         _bits = bytes_to_bits(_bytes)
         dh: DataHeader = DataHeader.from_bits(_bits)
+        as_dict = dh.as_dict()
         for key, val in validations.items():
             assert getattr(dh, key) == val
+            assert key in as_dict, f"{key} missing in as_dict"
+            assert as_dict[key] == val
         # also tests for availability of __repr__ for given DPF
         assert len(repr(dh))
 
@@ -19,5 +19,29 @@ def test_embedded_signalling():
         assert e.emb_parity_ok
         assert (
             e.emb_parity
-            == EmbeddedSignalling.from_bits(bitarray(burst[:7] + ("0" * 9))).emb_parity
+            == EmbeddedSignalling(
+                colour_code=e.colour_code,
+                preemption_and_power_control_indicator=e.preemption_and_power_control_indicator.value,
+                link_control_start_stop=e.link_control_start_stop,
+            ).emb_parity
         )
+        # single bit error is corrected, as in EmbeddedSignalling.from_int
+        corrupted: bitarray = bitarray(burst)
+        corrupted.invert(2)
+        repaired: EmbeddedSignalling = EmbeddedSignalling.from_bits(corrupted)
+        assert repaired.emb_errors_corrected == 1
+        assert repaired.as_bits() == bitarray(burst)
+
+
+def test_embedded_signalling_from_int():
+    original: int = 0b0001001110010001
+    for errors in ((0,), (9, 14), (4,)):
+        corrupted: int = original
+        for bit in errors:
+            corrupted ^= 1 << bit
+        e: EmbeddedSignalling = EmbeddedSignalling.from_int(corrupted)
+        assert e.emb_parity_ok
+        assert e.emb_errors_corrected == len(errors)
+        assert e.as_bits() == bitarray("0001001110010001")
+        assert e.as_int() == original
+    assert not EmbeddedSignalling.from_int(original ^ 0b111).emb_parity_ok
@@ -74,8 +74,11 @@ def test_embedded_lc():
         except KeyError as e:
             assert False, f"{e}"
 
+        as_dict = lc.as_dict()
         for key, val in assertdict.items():
             assert getattr(lc, key) == val
+            assert key in as_dict, f"{key} missing in as_dict"
+            assert as_dict[key] == val
 
         assert lc.as_bits() == vbptc
 
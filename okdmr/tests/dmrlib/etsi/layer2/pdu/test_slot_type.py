@@ -1,7 +1,9 @@
 from typing import List, Tuple
 
 from bitarray import bitarray
+from bitarray.util import ba2int
 
+from okdmr.dmrlib.etsi.layer2.elements.data_types import DataTypes
 from okdmr.dmrlib.etsi.layer2.pdu.slot_type import SlotType
 
 
@@ -15,8 +17,28 @@ def test_encode_decode():
         assert slot.fec_parity_ok, "Parity does not match in test data"
         serialized_bits: bitarray = slot.as_bits()
         assert serialized_bits == original_bits
+        assert slot.as_int() == ba2int(original_bits)
         reconstructed: SlotType = SlotType(
             colour_code=slot.colour_code, data_type=slot.data_type
         )
         assert original_bits == reconstructed.as_bits()
         assert repr(reconstructed) == str_repr
+
+
+def test_error_correction():
+    original_bits: bitarray = bitarray("01010011111100101011")
+    for errors in ((0,), (3, 12), (0, 7, 19)):
+        corrupted: bitarray = original_bits.copy()
+        for bit in errors:
+            corrupted.invert(bit)
+        slot: SlotType = SlotType.from_bits(corrupted)
+        assert slot.fec_parity_ok
+        assert slot.fec_errors_corrected == len(errors)
+        assert slot.as_bits() == original_bits
+        assert slot.data_type == DataTypes.CSBK and slot.colour_code == 5
+
+    uncorrectable: SlotType = SlotType.from_bits(
+        original_bits ^ bitarray("1" * 4 + "0" * 16)
+    )
+    assert not uncorrectable.fec_parity_ok
+    assert "INVALID" in repr(uncorrectable)
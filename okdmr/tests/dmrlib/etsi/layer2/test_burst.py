@@ -1,15 +1,22 @@
 import sys
 from typing import List, Tuple
 
+from bitarray import bitarray
+from bitarray.util import ba2int
+
 from okdmr.dmrlib.etsi.layer2.burst import Burst
 from okdmr.dmrlib.etsi.layer2.elements.burst_types import BurstTypes
 from okdmr.dmrlib.etsi.layer2.elements.data_types import DataTypes
+from okdmr.dmrlib.etsi.layer2.elements.lcss import LCSS
 from okdmr.dmrlib.etsi.layer2.elements.sync_patterns import SyncPatterns
 from okdmr.dmrlib.etsi.layer2.elements.voice_bursts import VoiceBursts
+from okdmr.dmrlib.etsi.layer2.pdu.embedded_signalling import EmbeddedSignalling
+from okdmr.dmrlib.etsi.layer2.pdu.slot_type import SlotType
 from okdmr.dmrlib.hytera.hytera_ipsc_sync import HyteraIPSCSync
 from okdmr.dmrlib.hytera.hytera_ipsc_wakeup import HyteraIPSCWakeup
 from okdmr.dmrlib.transmission.transmission import Transmission
 from okdmr.dmrlib.transmission.transmission_types import TransmissionTypes
+from okdmr.dmrlib.utils.bits_bytes import byteswap_bytes
 from okdmr.kaitai.homebrew.mmdvm2020 import Mmdvm2020
 from okdmr.kaitai.hytera.ip_site_connect_protocol import IpSiteConnectProtocol
 
@@ -88,6 +95,7 @@ def test_burst_info_hytera():
             bytes.fromhex(burst_hex)
         )
         burst: Burst = Burst.from_hytera_ipsc(ipsc=ipsc)
+        assert burst.full_bits.tobytes() == byteswap_bytes(ipsc.ipsc_payload)[:-1]
         # slot type matching
         if ipsc.slot_type == IpSiteConnectProtocol.SlotTypes.slot_type_sync:
             assert isinstance(burst, HyteraIPSCSync)
@@ -206,3 +214,118 @@ if __name__ == "__main__":
     assert isinstance(ks_mmdvm.command_data, Mmdvm2020.TypeDmrData)
     m_burst_info: Burst = Burst.from_mmdvm(mmdvm=ks_mmdvm.command_data)
     m_burst_info.debug(printout=True)
+
+
+def test_burst_lazy():
+    bursts: List[str] = [
+        # BsSourcedData CSBK
+        "444d52440223383b2338630006690f632e40c70153df0a83b7a8282c2509625014fdff57d75df5dcadde429028c87ae3341e24191c003c",
+        # EmbeddedData
+        "444d52440320baef0000090020baef8100000001b9e881526173002a6bb9e8815261303000a0391173002a6bb9e881526173002a6b3334",
+        # MsSourcedData Rate 1/2 data
+        "444d5244022338630008fd0023383be76f944918117b3090722540f9233581a285ed5d7f77fd75709464602846c3022109c3050079002f",
+    ]
+    for burst_hex in bursts:
+        mmdvm: Mmdvm2020 = Mmdvm2020.from_bytes(bytes.fromhex(burst_hex))
+        eager: Burst = Burst.from_mmdvm(mmdvm=mmdvm.command_data)
+        lazy: Burst = Burst.from_mmdvm(mmdvm=mmdvm.command_data, lazy=True)
+        # cheap fields are available without decoding
+        assert lazy.sync_or_embedded_signalling == eager.sync_or_embedded_signalling
+        assert lazy.timeslot == eager.timeslot
+        assert lazy._data is Burst.UNDECODED
+        assert lazy._info_bits_deinterleaved is Burst.UNDECODED
+        # decoded on first access
+        assert lazy.colour_code == eager.colour_code
+        assert lazy.info_bits_deinterleaved == eager.info_bits_deinterleaved
+        assert repr(lazy.data) == repr(eager.data)
+        assert lazy._data is lazy.data
+        assert lazy.as_bytes() == eager.as_bytes()
+
+    # assigned values take precedence over not yet decoded ones
+    burst: Burst = Burst(burst_type=BurstTypes.DataAndControl, lazy=True)
+    burst.data = None
+    assert burst.data is None
+    assert burst._slot_type is Burst.UNDECODED
+    assert burst.decode()._slot_type is not Burst.UNDECODED
+
+
+def test_burst_slots():
+    bursts: List[str] = [
+        # BsSourcedData CSBK
+        "444d52440223383b2338630006690f632e40c70153df0a83b7a8282c2509625014fdff57d75df5dcadde429028c87ae3341e24191c003c",
+        # MsSourcedData Rate 1/2 data
+        "444d5244022338630008fd0023383be76f944918117b3090722540f9233581a285ed5d7f77fd75709464602846c3022109c3050079002f",
+    ]
+    for burst_hex in bursts:
+        burst: Burst = Burst.from_mmdvm(
+            mmdvm=Mmdvm2020.from_bytes(bytes.fromhex(burst_hex)).command_data
+        )
+        # neither burst nor its layer 2 parts carry per-instance __dict__
+        for part in (burst, burst.slot_type, burst.data):
+            assert not hasattr(part, "__dict__"), f"{type(part)} has __dict__"
+        assert burst.voice_bits == burst.full_bits[:108] + burst.full_bits[156:]
+        assert burst.info_bits_original == burst.full_bits[:98] + burst.full_bits[166:]
+        assert burst.embedded_signalling_bits == burst.full_bits[116:148]
+
+
+def test_burst_write_into():
+    data_hex: str = "53df0a83b7a8282c2509625014fdff57d75df5dcadde429028c87ae3341e24191c"
+    burst: Burst = Burst.from_bytes(
+        bytes.fromhex(data_hex), burst_type=BurstTypes.DataAndControl
+    )
+    buf: bytearray = bytearray(b"\xaa" * (2 * Burst.BYTES_LENGTH + 1))
+    assert burst.write_into(buf, offset=1) == 1 + Burst.BYTES_LENGTH
+    assert burst.write_into(buf, offset=1 + Burst.BYTES_LENGTH) == len(buf)
+    assert buf[0] == 0xAA
+    assert buf[1:] == bytes.fromhex(data_hex) * 2
+    assert burst.as_bytes() is burst.as_bytes(), "encoded form should be cached"
+    assert burst.as_bits().tobytes() == bytes.fromhex(data_hex)
+
+    # replaced slot type (different colour code) invalidates cached encoded form
+    burst.slot_type = SlotType(colour_code=7, data_type=burst.data_type)
+    rewritten: Burst = Burst.from_bytes(
+        burst.as_bytes(), burst_type=BurstTypes.DataAndControl
+    )
+    assert rewritten.colour_code == 7
+    assert rewritten.data.as_bits() == burst.data.as_bits()
+
+    # in-place change needs explicit invalidation, colour code is first 4 bits of SLOT
+    burst.slot_type.colour_code = 3
+    assert ba2int(burst.as_bits()[98:102]) == 7
+    assert ba2int(burst.invalidate_encoded().as_bits()[98:102]) == 3
+
+    # voice burst, EMB surrounds 32 bits of embedded signalling
+    emb: EmbeddedSignalling = EmbeddedSignalling(
+        colour_code=1,
+        preemption_and_power_control_indicator=0,
+        link_control_start_stop=LCSS.FirstFragmentLC,
+    )
+    emb_bits: bitarray = emb.as_bits()
+    voice_bits: bitarray = bitarray("1100" * 54)
+    full_bits: bitarray = (
+        voice_bits[:108]
+        + emb_bits[:8]
+        + bitarray("10" * 16)
+        + emb_bits[8:]
+        + voice_bits[108:]
+    )
+    voice: Burst = Burst(full_bits=full_bits, burst_type=BurstTypes.Vocoder)
+    assert voice.has_emb
+    assert voice.as_bytes() == full_bits.tobytes()
+    voice.emb = EmbeddedSignalling(
+        colour_code=9,
+        preemption_and_power_control_indicator=1,
+        link_control_start_stop=LCSS.LastFragmentLCorCSBK,
+    )
+    voice_buf: bytearray = bytearray(Burst.BYTES_LENGTH)
+    voice.write_into(voice_buf)
+    reparsed: Burst = Burst.from_bytes(bytes(voice_buf), BurstTypes.Vocoder)
+    assert reparsed.emb.colour_code == 9
+    assert reparsed.emb.link_control_start_stop == LCSS.LastFragmentLCorCSBK
+    assert reparsed.voice_bits == voice_bits
+    assert reparsed.embedded_signalling_bits == bitarray("10" * 16)
+
+    # IPSC Sync is written as received
+    ipsc_sync: HyteraIPSCSync = HyteraIPSCSync(full_bits=full_bits)
+    assert ipsc_sync.as_bytes() == full_bits.tobytes()
+    assert ipsc_sync.as_bits() == full_bits
@@ -0,0 +1,123 @@
+from typing import List
+
+import numpy
+from okdmr.kaitai.homebrew.mmdvm2020 import Mmdvm2020
+from okdmr.kaitai.hytera.ip_site_connect_protocol import IpSiteConnectProtocol
+
+from okdmr.dmrlib.etsi.layer2.burst import Burst
+from okdmr.dmrlib.etsi.layer2.burst_batch import BurstBatch
+from okdmr.dmrlib.etsi.layer2.elements.burst_types import BurstTypes
+from okdmr.dmrlib.etsi.layer2.sync_classifier import SyncClassifier
+
+
+def assert_batch_matches_bursts(batch: BurstBatch, bursts: List[Burst]) -> None:
+    sync_patterns = batch.sync_patterns()
+    data_types = batch.data_types()
+    colour_codes = batch.colour_codes()
+    has_emb = batch.has_emb()
+    is_data_or_control = batch.is_data_or_control()
+    is_voice_superframe_start = batch.is_voice_superframe_start()
+    for index, burst in enumerate(bursts):
+        assert sync_patterns[index] == burst.sync_or_embedded_signalling.value
+        assert data_types[index] == burst.data_type.value
+        assert has_emb[index] == burst.has_emb
+        assert is_data_or_control[index] == burst.is_data_or_control
+        assert is_voice_superframe_start[index] == burst.is_voice_superframe_start
+        if burst.has_emb or burst.has_slot_type:
+            assert colour_codes[index] == burst.colour_code
+        else:
+            assert colour_codes[index] == -1
+
+
+def test_burst_batch_mmdvm():
+    bursts: List[str] = [
+        # [MsSourcedVoice] [CC 0] [DATA TYPE Reserved]
+        "444d5244192807220000090028072290864b516baded847205ae0062959308849047f7d5dd57dfd9537a101efe3ed4206e153827e70139",
+        # [BsSourcedData] [CC 5] [DATA TYPE CSBK] [FEC 0f2b VERIFIED]
+        "444d52440223383b2338630006690f632e40c70153df0a83b7a8282c2509625014fdff57d75df5dcadde429028c87ae3341e24191c003c",
+        # [EmbeddedData] [CC 1] [DATA TYPE Reserved] [PI 0] [LCSS 3] [EMB Parity 0091 VERIFIED]
+        "444d52440320baef0000090020baef8100000001b9e881526173002a6bb9e8815261303000a0391173002a6bb9e881526173002a6b3334",
+        # [MsSourcedData] [DataTypes.Rate12Data] [CC: 1]
+        "444d5244022338630008fd0023383be76f944918117b3090722540f9233581a285ed5d7f77fd75709464602846c3022109c3050079002f",
+        # [MsSourcedData] [DataTypes.PIHeader] [CC: 1]
+        "444d52440128072200000900280722a02b2d896f167b90897c009bb941434301840d5d7f77fd757d9d6b51e02230cac7011f149419002f",
+    ]
+    # small capacity to test growing
+    batch: BurstBatch = BurstBatch(capacity=1)
+    expected: List[Burst] = []
+    for timestamp, burst_hex in enumerate(bursts):
+        mmdvm: Mmdvm2020 = Mmdvm2020.from_bytes(bytes.fromhex(burst_hex))
+        assert batch.append_mmdvm(mmdvm.command_data, timestamp=timestamp) == timestamp
+        expected.append(Burst.from_mmdvm(mmdvm.command_data))
+
+    assert len(batch) == len(bursts)
+    assert batch.capacity >= len(bursts)
+    assert batch.payloads.shape == (len(bursts), BurstBatch.BURST_BYTES)
+    assert numpy.array_equal(batch.timestamps, numpy.arange(len(bursts)))
+    assert_batch_matches_bursts(batch, expected)
+
+    for created, burst in zip(batch.bursts(), expected):
+        assert created.as_bytes() == burst.as_bytes()
+        assert repr(created) == repr(burst)
+        assert created.timeslot == burst.timeslot
+        assert created.sequence_no == burst.sequence_no
+        assert created.stream_no == burst.stream_no
+        assert created.source_radio_id == burst.source_radio_id
+        assert created.target_radio_id == burst.target_radio_id
+    assert batch.burst(-1, lazy=True).as_bytes() == expected[-1].as_bytes()
+    assert "BURSTS 5" in repr(batch)
+
+
+def test_burst_batch_hytera():
+    bursts: List[str] = [
+        # sync, skipped
+        "5a5a5a5a0000000042000501020000002222eeee555533334000bd0000008000150000000800fd00230038003b0038003b00b41200447eb7ffffef0844400000fd0800003b382300",
+        "5a5a5a5a0300000041000501020000002222999911110000100038d424a26d410436c0dda2f46165307000904607a54d4715ff8e3685dd23255501e3000001000900000022072800",
+        "5a5a5a5a8f00000043000501020000002222222255550000409c5e06ca0ac804e823d04aa04b9d1457ff5dd7dff52001600d7039003cc12d031c003cca0a01006f0000003c382300",
+        "5a5a5a5aff00000041000501020000002222bbbb1111000040548adb76e648040a81cad1c5ba0176635063f37200816df708c868af68a235db99008e76e601000900000022072800",
+        "5a5a5a5a02e0000001000501020000002222222211110000405c7b168990007cb99b434101430d847f5dfd777d756b9de0513022c7ca1f0194140000630201000900000022072800",
+    ]
+    batch: BurstBatch = BurstBatch()
+    expected: List[Burst] = []
+    for burst_hex in bursts:
+        ipsc: IpSiteConnectProtocol = IpSiteConnectProtocol.from_bytes(
+            bytes.fromhex(burst_hex)
+        )
+        if batch.append_hytera_ipsc(ipsc) >= 0:
+            expected.append(Burst.from_hytera_ipsc(ipsc))
+    assert len(batch) == len(bursts) - 1
+    assert_batch_matches_bursts(batch, expected)
+    for index, burst in enumerate(expected):
+        assert batch.payloads[index].tobytes() == burst.full_bits.tobytes()
+        assert batch.timeslots[index] == burst.timeslot
+        assert batch.target_ids[index] == burst.target_radio_id
+
+
+def test_burst_batch_noise():
+    rng: numpy.random.Generator = numpy.random.default_rng(42)
+    batch: BurstBatch = BurstBatch()
+    expected: List[Burst] = []
+    for index in range(200):
+        payload: bytes = rng.integers(0, 256, 33, dtype=numpy.uint8).tobytes()
+        burst_type: BurstTypes = (
+            BurstTypes.Vocoder if index % 2 else BurstTypes.DataAndControl
+        )
+        batch.append(payload, burst_type)
+        expected.append(Burst.from_bytes(payload, burst_type, lazy=True))
+    assert_batch_matches_bursts(batch, expected)
+
+    # SYNC patterns with up to 6 bit errors (bits 108-155)
+    for index in range(200):
+        payload: bytearray = bytearray(rng.integers(0, 256, 33, dtype=numpy.uint8))
+        sync: int = list(SyncClassifier.PATTERNS)[index % len(SyncClassifier.PATTERNS)]
+        for bit in rng.choice(48, size=index % 7, replace=False):
+            sync ^= 1 << int(bit)
+        center: int = int.from_bytes(payload[13:20], "big")
+        center = (center & ~(0xFFFFFFFFFFFF << 4)) | (sync << 4)
+        payload[13:20] = center.to_bytes(7, "big")
+        batch.append(bytes(payload), BurstTypes.Vocoder)
+        expected.append(Burst.from_bytes(bytes(payload), BurstTypes.Vocoder, lazy=True))
+    assert_batch_matches_bursts(batch, expected)
+    assert list(batch.classify_syncs()[1]) == [
+        burst.sync_distance for burst in expected
+    ]
@@ -0,0 +1,77 @@
+from typing import List
+
+from okdmr.kaitai.homebrew.mmdvm2020 import Mmdvm2020
+from okdmr.kaitai.hytera.ip_site_connect_protocol import IpSiteConnectProtocol
+
+from okdmr.dmrlib.etsi.layer2.burst import Burst
+from okdmr.dmrlib.etsi.layer2.burst_cache import BurstDecodeCache
+from okdmr.dmrlib.etsi.layer2.elements.burst_types import BurstTypes
+
+
+def test_burst_cache_mmdvm():
+    bursts: List[str] = [
+        # BsSourcedData CSBK
+        "444d52440223383b2338630006690f632e40c70153df0a83b7a8282c2509625014fdff57d75df5dcadde429028c87ae3341e24191c003c",
+        # EmbeddedData
+        "444d52440320baef0000090020baef8100000001b9e881526173002a6bb9e8815261303000a0391173002a6bb9e881526173002a6b3334",
+    ]
+    cache: BurstDecodeCache = BurstDecodeCache(maxsize=8)
+    for burst_hex in bursts:
+        mmdvm: Mmdvm2020 = Mmdvm2020.from_bytes(bytes.fromhex(burst_hex))
+        uncached: Burst = Burst.from_mmdvm(mmdvm=mmdvm.command_data)
+        first: Burst = Burst.from_mmdvm(mmdvm=mmdvm.command_data, cache=cache)
+        second: Burst = Burst.from_mmdvm(mmdvm=mmdvm.command_data, cache=cache)
+        assert repr(first) == repr(uncached)
+        assert first.as_bytes() == uncached.as_bytes()
+        assert first.timeslot == uncached.timeslot
+        assert first.sequence_no == uncached.sequence_no
+        assert first.target_radio_id == uncached.target_radio_id
+        # decoded contents are shared, metadata are not
+        assert first is not second
+        assert first.data is second.data
+        assert first.emb is second.emb
+        second.set_sequence_no(first.sequence_no + 1)
+        assert first.sequence_no != second.sequence_no
+
+    assert len(cache) == 2
+    assert cache.hits == 2 and cache.misses == 2
+    assert cache.hit_ratio == 0.5
+    assert "HITS 2" in repr(cache)
+    assert len(cache.clear()) == 0 and cache.hits == 0
+
+
+def test_burst_cache_eviction():
+    cache: BurstDecodeCache = BurstDecodeCache(maxsize=2)
+    payloads: List[bytes] = [bytes([i]) * 33 for i in range(3)]
+    cache.get(payloads[0], BurstTypes.Vocoder)
+    cache.get(payloads[1], BurstTypes.Vocoder)
+    # refresh first payload, so the second one is least recently used
+    cache.get(payloads[0], BurstTypes.Vocoder)
+    cache.get(payloads[2], BurstTypes.Vocoder)
+    assert len(cache) == 2
+    assert (payloads[1], BurstTypes.Vocoder) not in cache.entries
+    # same payload with different burst type is separate entry
+    cache.get(payloads[0], BurstTypes.DataAndControl)
+    assert cache.misses == 4 and cache.hits == 1
+
+
+def test_burst_cache_hytera():
+    bursts: List[str] = [
+        # sync, never cached
+        "5a5a5a5a0000000042000501020000002222eeee555533334000bd0000008000150000000800fd00230038003b0038003b00b41200447eb7ffffef0844400000fd0800003b382300",
+        # pi header
+        "5a5a5a5a02e0000001000501020000002222222211110000405c7b168990007cb99b434101430d847f5dfd777d756b9de0513022c7ca1f0194140000630201000900000022072800",
+    ]
+    cache: BurstDecodeCache = BurstDecodeCache()
+    for burst_hex in bursts:
+        ipsc: IpSiteConnectProtocol = IpSiteConnectProtocol.from_bytes(
+            bytes.fromhex(burst_hex)
+        )
+        uncached: Burst = Burst.from_hytera_ipsc(ipsc=ipsc)
+        cached: Burst = Burst.from_hytera_ipsc(ipsc=ipsc, cache=cache)
+        assert type(cached) == type(uncached)
+        assert repr(cached) == repr(uncached)
+        assert cached.timeslot == uncached.timeslot
+        assert cached.sequence_no == uncached.sequence_no
+    Burst.from_hytera_ipsc(ipsc=ipsc, cache=cache)
+    assert len(cache) == 1 and cache.hits == 1
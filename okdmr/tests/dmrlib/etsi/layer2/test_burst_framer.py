@@ -0,0 +1,187 @@
+import io
+from typing import List, Tuple
+
+import numpy
+
+from okdmr.dmrlib.etsi.layer2.burst import Burst
+from okdmr.dmrlib.etsi.layer2.burst_framer import BurstFramer
+from okdmr.dmrlib.etsi.layer2.elements.sync_patterns import SyncPatterns
+from okdmr.dmrlib.etsi.layer2.elements.voice_bursts import VoiceBursts
+
+# group voice call, single superframe
+VOICE_BURSTS: List[str] = [
+    # voice LC header
+    "07d439d6348022185231e1c3446dff57d75df5de332c4748fbf0b2a32dc279058d",
+    # voice burst A (SYNC)
+    "a1add98ac88edf96b7928549b9f755fd7df75f7ea4ceb4141cb502315068e37d7b",
+    # voice burst B
+    "de4aa902bea8724c14606f62d2d138f92121b911244d2e646d5d310f1b81d4643b",
+    # voice burst C
+    "a884a8f814b6b82c0c56912f48e171596d89674b9ad671432e321f237dcfda7bd4",
+    # voice burst D
+    "d6dba87be293009cdabc5ffd48817ae762f0a74177b9d943ea8be3cf08b3215e12",
+    # voice burst E
+    "41a33b9c9c5fcfc367496f5d1a015e9bab49c07112f4f4ba3f8aa037bdb055159e",
+    # voice burst F
+    "64b6b0b1f0f0f7abc65fae07db8170244781e742b8fb021a3da19cc7cd27a2327c",
+    # terminator with LC
+    "07bb3902343022605241e16344adff57d75df5d966384470fc90bee325c26005be",
+]
+
+# unconfirmed data transmission, 48 octets of user data
+DATA_BURSTS: List[str] = [
+    # preamble CSBK
+    "45a005bdbde426040c58b87084cdff57d75df5daca7a3608e5197841bfdb299a61",
+    # preamble CSBK
+    "45a7053fbd6c26240e19b4d284cdff57d75df5dacab25690e7987aa1bb1f381257",
+    # preamble CSBK
+    "45e705bdbc70243c0c28389284cdff57d75df5dacac276a0a7787901bedf311261",
+    # data header
+    "7a0f35c226aa79a9a2a36cab55bdff57d75df5d55c1c78e83337202241459337fb",
+    # rate 1/2 data
+    "403ac2229f81a30f358586a885edff57d75df5d0950e0f7ed47be76e92df3eb6b6",
+    # rate 1/2 data
+    "1c336f7fc0ea2570a93f7a0085edff57d75df5d097334056d6c39da2791656a30a",
+    # rate 1/2 data
+    "7e00cc1dec1b2cc2013a7d3845edff57d75df5d094f2a288a7d863a34c50e02233",
+    # rate 1/2 data
+    "55abf1f89cd90e679236a6f6c5edff57d75df5d09743de2161cb8a4926512f91fa",
+    # rate 1/2 data, last block
+    "005700fc030806f804c01a8005edff57d75df5d096ac0510030015c01280588049",
+]
+
+
+def on_air_stream(
+    rng: numpy.random.Generator, noise_bits: int = 1000
+) -> Tuple[numpy.ndarray, List[Tuple[int, bytes]]]:
+    """
+    Voice call on timeslot 1 and data transmission on timeslot 2, each burst preceded by 24 random (CACH) bits
+    :return: (stream bits, list of (timeslot, burst bytes))
+    """
+    voice: List[bytes] = [bytes.fromhex(burst) for burst in VOICE_BURSTS]
+    data: List[bytes] = [bytes.fromhex(burst) for burst in DATA_BURSTS]
+    slots: List[Tuple[int, bytes]] = []
+    for index in range(len(voice)):
+        slots.append((1, voice[index]))
+        slots.append((2, data[index % len(data)]))
+    chunks: List[numpy.ndarray] = [rng.integers(0, 2, noise_bits, dtype=numpy.uint8)]
+    for _, burst in slots:
+        chunks.append(rng.integers(0, 2, 24, dtype=numpy.uint8))
+        chunks.append(numpy.unpackbits(numpy.frombuffer(burst, dtype=numpy.uint8)))
+    return numpy.concatenate(chunks), slots
+
+
+def assert_bursts(bursts: List[Burst], slots: List[Tuple[int, bytes]]) -> None:
+    assert len(bursts) == len(slots)
+    for burst, (timeslot, burst_bytes) in zip(bursts, slots):
+        assert burst.full_bits.tobytes() == burst_bytes
+        assert burst.timeslot == timeslot
+
+
+def test_framer_chunks():
+    rng: numpy.random.Generator = numpy.random.default_rng(1)
+    bits, slots = on_air_stream(rng)
+    framer: BurstFramer = BurstFramer()
+    bursts: List[Burst] = []
+    position: int = 0
+    while position < len(bits):
+        size: int = int(rng.integers(1, 2000))
+        bursts += list(framer.feed_bits(bits[position : position + size]))
+        position += size
+        # only incomplete burst is buffered
+        assert len(framer.buffer) < size + BurstFramer.SLOT_BITS
+    assert framer.locked
+    assert_bursts(bursts, slots)
+
+    # voice superframes on timeslot 1
+    voice: List[VoiceBursts] = [
+        burst.voice_burst for burst in bursts if burst.timeslot == 1
+    ]
+    assert voice[1:7] == [
+        VoiceBursts.VoiceBurstA,
+        VoiceBursts.VoiceBurstB,
+        VoiceBursts.VoiceBurstC,
+        VoiceBursts.VoiceBurstD,
+        VoiceBursts.VoiceBurstE,
+        VoiceBursts.VoiceBurstF,
+    ]
+    assert voice[0] == VoiceBursts.Unknown
+    assert all(burst.is_vocoder for burst in bursts[2:14:2])
+
+
+def test_framer_read():
+    rng: numpy.random.Generator = numpy.random.default_rng(2)
+    bits, slots = on_air_stream(rng, noise_bits=1024)
+
+    packed: io.BytesIO = io.BytesIO(numpy.packbits(bits).tobytes())
+    assert_bursts(list(BurstFramer().read(packed, chunk_size=100)), slots)
+
+    unpacked: io.BytesIO = io.BytesIO(bits.tobytes())
+    assert_bursts(
+        list(BurstFramer().read(unpacked, input_format="bits", chunk_size=999)), slots
+    )
+
+    dibits: numpy.ndarray = (bits[0::2] << 1) | bits[1::2]
+    assert numpy.array_equal(BurstFramer.dibits_to_bits(dibits), bits)
+    assert_bursts(
+        list(BurstFramer().read(io.BytesIO(dibits.tobytes()), input_format="dibits")),
+        slots,
+    )
+
+
+def test_framer_sync_errors_and_lock_loss():
+    rng: numpy.random.Generator = numpy.random.default_rng(3)
+    bits, slots = on_air_stream(rng)
+    # 3 bit errors in SYNC of first burst (voice LC header on timeslot 1)
+    sync_start: int = 1000 + 24 + BurstFramer.SYNC_OFFSET
+    bits[[sync_start, sync_start + 20, sync_start + 47]] ^= 1
+    noise: numpy.ndarray = rng.integers(
+        0, 2, 50 * BurstFramer.SLOT_BITS, dtype=numpy.uint8
+    )
+
+    framer: BurstFramer = BurstFramer(max_slots_without_sync=10)
+    bursts: List[Burst] = list(framer.feed_bits(numpy.concatenate((bits, noise))))
+    assert bursts[0].sync_distance == 3
+    # SYNC errors are corrected, when burst is encoded again
+    assert bursts[0].as_bytes() == slots[0][1]
+    assert_bursts(bursts[1 : len(slots)], slots[1:])
+    # lock is dropped after noise bursts without SYNC
+    assert len(bursts) == len(slots) + 11
+    assert not framer.locked
+
+    # locks again, on next stream
+    again: List[Burst] = list(framer.feed_bits(bits))
+    assert_bursts(again[1:], slots[1:])
+
+    # exact SYNC matching misses the corrupted first burst, first locked burst is on timeslot 2
+    exact: List[Burst] = list(
+        BurstFramer(max_distance=0, first_timeslot=2).feed_bits(bits)
+    )
+    assert_bursts(exact, slots[1:])
+
+
+def test_framer_max_distance_applies_to_bursts():
+    rng: numpy.random.Generator = numpy.random.default_rng(4)
+    bits, slots = on_air_stream(rng)
+    # 5 bit errors in SYNC of first burst (voice LC header on timeslot 1), beyond default tolerance of Burst
+    sync_start: int = 1000 + 24 + BurstFramer.SYNC_OFFSET
+    bits[
+        [sync_start, sync_start + 10, sync_start + 20, sync_start + 30, sync_start + 40]
+    ] ^= 1
+
+    bursts: List[Burst] = list(BurstFramer(max_distance=6).feed_bits(bits))
+    assert bursts[0].sync_distance == 5
+    assert bursts[0].sync_or_embedded_signalling == SyncPatterns.BsSourcedData
+    assert bursts[0].is_data_or_control and not bursts[0].has_emb
+    assert bursts[0].as_bytes() == slots[0][1]
+    assert_bursts(bursts[1:], slots[1:])
+
+    # exact matching, 2 bit errors in SYNC of data burst on timeslot 2 are not tolerated either
+    bits, slots = on_air_stream(numpy.random.default_rng(4))
+    sync_start = 1000 + 3 * BurstFramer.SLOT_BITS + 24 + BurstFramer.SYNC_OFFSET
+    bits[[sync_start, sync_start + 47]] ^= 1
+    framer: BurstFramer = BurstFramer(max_distance=0)
+    exact: List[Burst] = list(framer.feed_bits(bits))
+    assert exact[3].timeslot == 2
+    assert exact[3].sync_or_embedded_signalling == SyncPatterns.EmbeddedSignalling
+    assert exact[3].sync_distance == 1
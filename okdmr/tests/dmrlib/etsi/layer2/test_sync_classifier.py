@@ -0,0 +1,60 @@
+from itertools import combinations
+
+from okdmr.kaitai.homebrew.mmdvm2020 import Mmdvm2020
+
+from okdmr.dmrlib.etsi.layer2.burst import Burst
+from okdmr.dmrlib.etsi.layer2.elements.data_types import DataTypes
+from okdmr.dmrlib.etsi.layer2.elements.sync_patterns import SyncPatterns
+from okdmr.dmrlib.etsi.layer2.sync_classifier import SyncClassifier
+
+
+def test_sync_classifier():
+    for pattern in SyncPatterns:
+        if pattern == SyncPatterns.EmbeddedSignalling:
+            continue
+        assert SyncClassifier.classify(pattern.value) == (pattern, 0)
+        assert SyncClassifier.classify_bytes(pattern.value.to_bytes(6, "big")) == (
+            pattern,
+            0,
+        )
+        for bits in combinations(range(0, 48, 5), 3):
+            corrupted: int = pattern.value ^ sum(1 << bit for bit in bits)
+            assert SyncClassifier.distance(corrupted, pattern.value) == 3
+            assert SyncClassifier.classify(corrupted) == (pattern, 3)
+            # exact match only
+            assert SyncClassifier.classify(corrupted, max_distance=0) == (
+                SyncPatterns.EmbeddedSignalling,
+                1,
+            )
+
+    # patterns are far enough from each other, to never confuse them within default distance
+    for first, second in combinations(SyncClassifier.PATTERNS, 2):
+        assert (
+            SyncClassifier.distance(first, second)
+            > 2 * SyncClassifier.DEFAULT_MAX_DISTANCE
+        )
+
+    assert SyncClassifier.classify(0) == (
+        SyncPatterns.EmbeddedSignalling,
+        SyncClassifier.DEFAULT_MAX_DISTANCE + 1,
+    )
+
+
+def test_burst_sync_errors():
+    # [BsSourcedData] [CC 5] [DATA TYPE CSBK]
+    mmdvm: Mmdvm2020 = Mmdvm2020.from_bytes(
+        bytes.fromhex(
+            "444d52440223383b2338630006690f632e40c70153df0a83b7a8282c2509625014fdff57d75df5dcadde429028c87ae3341e24191c003c"
+        )
+    )
+    payload: bytearray = bytearray(mmdvm.command_data.dmr_data)
+    # 3 bit errors in SYNC (bits 108-155)
+    payload[14] ^= 0x81
+    payload[17] ^= 0x08
+    burst: Burst = Burst.from_bytes(bytes(payload))
+    assert burst.sync_or_embedded_signalling == SyncPatterns.BsSourcedData
+    assert burst.sync_distance == 3
+    assert burst.data_type == DataTypes.CSBK
+    assert not burst.has_emb
+    # SYNC is re-generated without errors
+    assert burst.as_bytes() == Burst.from_mmdvm(mmdvm.command_data).as_bytes()
@@ -27,3 +27,5 @@ def test_reserved():
     e = ServiceOptions.from_bits(payload)
     assert e.as_bits() != null_reserved
     assert e.as_bits() == payload
+    assert e.as_int() == 0b00110000
+    assert ServiceOptions.from_int(e.as_int()).as_bits() == payload
@@ -34,6 +34,7 @@ def test_reconstruct(do_return: bool = False) -> Optional[UDPIPv4CompressedHeade
     msg_bytes: bytes = bytes.fromhex("d6790062620003bf0007")
     msg_pdu: UDPIPv4CompressedHeader = UDPIPv4CompressedHeader.from_bytes(msg_bytes)
     assert msg_pdu.as_bytes() == msg_bytes
+    assert msg_pdu.as_dict()["ipv4_identification"] == 0xD679
 
     tms: TextMessagingService = TextMessagingService(
         first_header=FirstHeader(
@@ -2,6 +2,8 @@ import sys
 from copy import copy
 from typing import Union, Callable
 
+from okdmr.dmrlib.etsi.layer2.burst_batch import BurstBatch
+from okdmr.dmrlib.etsi.layer2.elements.data_types import DataTypes
 from okdmr.dmrlib.tools.dmrlib_tool import DmrlibTool
 
 
@@ -59,3 +61,27 @@ def test_throwing_pdu(capsys):
     assert "ABCDEF" in captured.out
 
     sys.argv = argv_backup
+
+
+def test_read_dsdfme(tmp_path):
+    dsp_file = tmp_path / "dsp.txt"
+    dsp_file.write_text(
+        # CACH burst, skipped
+        "1 98 00000000000000000000000000000000000000000000000000000000000000000000\n"
+        # [BsSourcedData] [DataTypes.CSBK] [CC: 5]
+        "1 3 53df0a83b7a8282c2509625014fdff57d75df5dcadde429028c87ae3341e24191c\n"
+        # [MsSourcedVoice]
+        "2 10 aded847205ae0062959308849047f7d5dd57dfd9537a101efe3ed4206e153827e7\n"
+        "\n"
+        # malformed lines (invalid hex, short payload, invalid timeslot), skipped
+        "1 3 53df0a83b7a8282c2509625014fdff57d75df5dcadde429028c87ae3341e2419zz\n"
+        "1 3 53df0a83b7a8282c2509625014fdff57\n"
+        "x 3 53df0a83b7a8282c2509625014fdff57d75df5dcadde429028c87ae3341e24191c\n"
+    )
+    batch: BurstBatch = DmrlibTool.read_dsdfme(str(dsp_file))
+    assert len(batch) == 2
+    assert list(batch.timeslots) == [1, 2]
+    assert list(batch.timestamps) == [1, 2]
+    assert batch.data_types()[0] == DataTypes.CSBK.value
+    assert batch.colour_codes()[0] == 5
+    assert batch.is_voice_superframe_start()[1]
@@ -4,11 +4,15 @@ from argparse import ArgumentParser
 from typing import Tuple, List, Optional
 
 from _pytest.capture import CaptureFixture
+from okdmr.dmrlib.etsi.layer2.burst_batch import BurstBatch
+from okdmr.dmrlib.etsi.layer2.elements.data_types import DataTypes
 from okdmr.dmrlib.etsi.layer2.elements.flcos import FLCOs
 from okdmr.dmrlib.etsi.layer2.pdu.full_link_control import FullLinkControl
 from okdmr.dmrlib.tools.pcap_tool import PcapTool, EmbeddedExtractor, IPSCAnalyze
 from scapy.layers.inet import IP, UDP
+from scapy.layers.l2 import Ether
 from scapy.packet import Raw
+from scapy.utils import wrpcap
 
 
 class PcapCounterHelper:
@@ -185,3 +189,41 @@ def test_ipsc_analyze(capsys):
     captured = capsys.readouterr()
     assert len(captured.out)
     assert not len(captured.err)
+
+
+def test_read_burst_batch():
+    pkts: List[str] = [
+        # MMDVM CSBK
+        "444d52440223383b2338630006690f632e40c70153df0a83b7a8282c2509625014fdff57d75df5dcadde429028c87ae3341e24191c003c",
+        # IPSC sync, not on-air burst
+        "5a5a5a5a0000000042000501020000002222eeee555533334000bd0000008000150000000800fd00230038003b0038003b00b41200447eb7ffffef0844400000fd0800003b382300",
+        # IPSC PI header
+        "5a5a5a5a02e0000001000501020000002222222211110000405c7b168990007cb99b434101430d847f5dfd777d756b9de0513022c7ca1f0194140000630201000900000022072800",
+    ]
+    captured: List[Ether] = []
+    for index, pkt in enumerate(pkts):
+        frame: Ether = (
+            Ether()
+            / IP(src="192.168.0.1", dst="192.168.0.2")
+            / UDP(sport=62031, dport=62031)
+            / Raw(bytes.fromhex(pkt))
+        )
+        frame.time = 1000 + index
+        captured.append(frame)
+
+    tmpfile = tempfile.NamedTemporaryFile(suffix=".pcap", delete=False)
+    tmpfile.close()
+    try:
+        wrpcap(tmpfile.name, captured)
+        batch: BurstBatch = PcapTool.read_burst_batch(files=[tmpfile.name])
+        assert len(batch) == 2
+        assert list(batch.timestamps) == [1000, 1002]
+        assert list(batch.timeslots) == [1, 2]
+        assert list(batch.data_types()) == [
+            DataTypes.CSBK.value,
+            DataTypes.PIHeader.value,
+        ]
+        # appends to existing batch
+        assert len(PcapTool.read_burst_batch(files=[tmpfile.name], batch=batch)) == 4
+    finally:
+        os.unlink(tmpfile.name)
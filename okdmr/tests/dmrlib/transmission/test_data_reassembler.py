@@ -0,0 +1,47 @@
+import secrets
+
+from okdmr.dmrlib.etsi.layer2.pdu.rate12_data import Rate12Data
+from okdmr.dmrlib.etsi.layer2.pdu.rate1_data import Rate1Data
+from okdmr.dmrlib.etsi.layer2.pdu.rate34_data import Rate34Data
+from okdmr.dmrlib.transmission.data_reassembler import DataReassembler
+from okdmr.dmrlib.transmission.transmission_generator import TransmissionGenerator
+
+
+def test_reassemble_generated():
+    for packet_type in (Rate12Data, Rate34Data, Rate1Data):
+        for is_confirmed in (True, False):
+            for length in (1, 37, 250):
+                userdata: bytes = secrets.token_bytes(length)
+                bursts, pad_octets = TransmissionGenerator.generate_data_bursts(
+                    packet_type=packet_type,
+                    userdata=userdata,
+                    is_confirmed=is_confirmed,
+                )
+                reassembler = DataReassembler(blocks_to_follow=len(bursts))
+                finished: bool = False
+                for burst in bursts:
+                    assert not reassembler.finished
+                    finished = reassembler.add_block(burst.data)
+                assert finished and reassembler.finished
+                assert reassembler.crc32_ok
+                assert isinstance(reassembler.user_data, memoryview)
+                assert bytes(reassembler.user_data) == userdata + bytes(pad_octets)
+                assert len(reassembler.buffer) == len(bursts) * len(bursts[0].data.data)
+
+
+def test_reassemble_crc_mismatch():
+    bursts, _ = TransmissionGenerator.generate_data_bursts(
+        packet_type=Rate34Data, userdata=b"\x01" * 40, is_confirmed=False
+    )
+    # blocks to follow not announced, buffer grows as needed
+    reassembler = DataReassembler()
+    reassembler.add_block(Rate34Data(data=b"\x02" * 18))
+    for burst in bursts[1:]:
+        reassembler.add_block(burst.data)
+    assert reassembler.finished
+    assert not reassembler.crc32_ok
+    assert len(reassembler.user_data) == 18 * len(bursts) - 4
+
+    reassembler.reset(blocks_to_follow=2)
+    assert not reassembler.finished and not reassembler.crc32_ok
+    assert len(reassembler.user_data) == 0
@@ -8,6 +8,7 @@ from scapy.layers.inet import IP, UDP
 from scapy.packet import Raw
 
 from okdmr.dmrlib.etsi.layer2.burst import Burst
+from okdmr.dmrlib.etsi.layer2.burst_cache import BurstDecodeCache
 from okdmr.dmrlib.etsi.layer2.elements.burst_types import BurstTypes
 from okdmr.dmrlib.etsi.layer2.elements.csbk_opcodes import CsbkOpcodes
 from okdmr.dmrlib.etsi.layer2.elements.data_packet_formats import DataPacketFormats
@@ -29,6 +30,7 @@ from okdmr.dmrlib.etsi.layer3.pdu.udp_ipv4_compressed_header import (
     UDPIPv4CompressedHeader,
 )
 from okdmr.dmrlib.motorola.text_messaging_service import TextMessagingService
+from okdmr.dmrlib.transmission.transmission import Transmission
 from okdmr.dmrlib.transmission.transmission_generator import TransmissionGenerator
 from okdmr.dmrlib.transmission.transmission_observer_interface import (
     TransmissionObserverInterface,
@@ -181,6 +183,27 @@ def test_sms():
     assert tms.as_bytes() == uip_data_bytes
 
 
+def test_udt_header_data_block():
+    header: DataHeader = DataHeader.from_bits(
+        bytes_to_bits(bytes.fromhex("800500010627fce7001bacaf"))
+    )
+    assert header.data_packet_format == DataPacketFormats.UnifiedDataTransport
+    assert header.get_blocks_to_follow() is None
+
+    transmission: Transmission = Transmission()
+    transmission.process_data_header(header)
+    assert transmission.reassembler.blocks_to_follow == 0
+    transmission.process_data(
+        Rate12Data(
+            data=bytes(range(8)),
+            packet_type=Rate12DataTypes.UnconfirmedLastBlock,
+            crc32=0x01020304,
+        )
+    )
+    # last block ends data transmission
+    assert transmission.type == TransmissionTypes.Idle
+
+
 def test_process_burst(caplog):
     caplog.clear()
     caplog.set_level(logging.DEBUG)
@@ -227,6 +250,24 @@ def test_voice_bytes(caplog):
     print(caplog.messages)
 
 
+def test_watcher_decode_cache(capsys):
+    ipsc_in: bytes = bytes.fromhex(
+        "5a5a5a5a2003000041000501020000002222777755550000807325ef402209df1b7f9caf6575e774fd55f77d795f9f41364a68ca604641ec96a400b3402201006f000000fa372300"
+    )
+    ip_pkt: IP = IP() / UDP() / Raw(ipsc_in)
+    tw: TransmissionWatcher = TransmissionWatcher(
+        decode_cache=BurstDecodeCache(maxsize=4)
+    )
+    tw.process_packet(data=ipsc_in, packet=ip_pkt)
+    tw.process_packet(data=ipsc_in, packet=ip_pkt)
+    assert tw.decode_cache.misses == 1
+    assert tw.decode_cache.hits == 1
+    assert 111 in tw.terminals
+
+    assert tw.set_decode_cache(None).decode_cache is None
+    tw.process_packet(data=ipsc_in, packet=ip_pkt)
+
+
 def test_voice_transmission(capsys):
     voice_pkts: List[str] = [
         # voice lc header
@@ -265,6 +306,7 @@ class TestWatcher(TransmissionObserverInterface):
         self.transmission_ended: bool = False
         self.started: int = 0
         self.ended: int = 0
+        self.user_data_received: int = 0
 
     def transmission_started(self, transmission_type: TransmissionTypes):
         self.started += 1
@@ -285,6 +327,13 @@ class TestWatcher(TransmissionObserverInterface):
         )
         self.transmission_ended = True
 
+    def data_transmission_user_data(
+        self, transmission_header: DataHeader, user_data: memoryview, crc32_ok: bool
+    ):
+        self.user_data_received += 1
+        assert crc32_ok
+        assert len(user_data) == 20
+
     def test_watcher(self, capsys):
         watcher: TransmissionWatcher = TransmissionWatcher()
         # check observer added
@@ -311,6 +360,7 @@ class TestWatcher(TransmissionObserverInterface):
 
         assert self.started == 1
         assert self.ended == 1
+        assert self.user_data_received == 1
 
         for terminal_id, terminal in watcher.terminals.items():
             # returns
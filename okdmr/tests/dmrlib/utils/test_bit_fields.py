@@ -0,0 +1,45 @@
+from types import SimpleNamespace
+
+import pytest
+from bitarray import bitarray
+
+from okdmr.dmrlib.etsi.layer2.elements.flcos import FLCOs
+from okdmr.dmrlib.utils.bit_fields import BitField, BitLayout
+
+
+def test_bit_layout():
+    layout: BitLayout = BitLayout(
+        24,
+        BitField("flag", 0, 1, decode=bool),
+        BitField(None, 1, 1, value=1),
+        BitField("opcode", 2, 6, decode=FLCOs),
+        # split field, first segment holds most significant bits
+        BitField("count", 8, 2, more_segments=((20, 4),)),
+        BitField("offset", 10, 10, signed=True),
+    )
+    assert layout.names == ("flag", "opcode", "count", "offset")
+    pdu = SimpleNamespace(
+        flag=True, opcode=FLCOs.GroupVoiceChannelUser, count=0b101101, offset=-3
+    )
+    packed: int = layout.pack(pdu)
+    assert packed == int("1" "1" "000000" "10" "1111111101" "1101", 2)
+    assert layout.unpack(packed) == vars(pdu)
+    assert layout.pack_dict(vars(pdu)) == packed
+    assert layout.as_dict(pdu) == vars(pdu)
+    assert layout.pack_bits(pdu) == bitarray(format(packed, "024b"))
+
+    # following bits (CRC) are ignored
+    bits: bitarray = layout.pack_bits(pdu) + bitarray("1010")
+    assert layout.unpack_bits(bits) == vars(pdu)
+    assert layout.unpack_bytes(packed.to_bytes(3, "big") + b"\xff") == vars(pdu)
+    with pytest.raises(AssertionError):
+        layout.unpack_bits(bits[:20])
+
+
+def test_bit_layout_validation():
+    with pytest.raises(AssertionError):
+        BitLayout(8, BitField("a", 4, 5))
+    with pytest.raises(AssertionError):
+        BitLayout(8, BitField("a", 0, 4), BitField("b", 3, 2))
+    with pytest.raises(AssertionError):
+        BitLayout(8, BitField(None, 0, 1, more_segments=((4, 1),)))
@@ -4,7 +4,9 @@ from bitarray import bitarray
 from numpy import array_equal
 
 from okdmr.dmrlib.utils.bits_bytes import (
+    bits_view,
     byteswap_bytes,
+    byteswap_numpy,
     numpy_array_to_bitarray,
     bitarray_to_numpy_array,
 )
@@ -20,6 +22,28 @@ def test_byteswap_odd():
     assert testdata[-1] == swap[-1]
 
 
+def test_byteswap_numpy():
+    for length in range(0, 40):
+        testdata: bytes = bytes(range(length))
+        swapped: numpy.ndarray = byteswap_numpy(testdata)
+        assert swapped.dtype == numpy.uint8
+        assert swapped.tobytes() == byteswap_bytes(testdata)
+
+
+def test_bits_view():
+    store: bytearray = bytearray(b"\x0F\xF0")
+    bits: bitarray = bits_view(store)
+    assert bits == bitarray("0000111111110000")
+    # shares memory in both directions
+    bits[0] = 1
+    assert store[0] == 0x8F
+    store[1] = 0x00
+    assert bits == bitarray("1000111100000000")
+
+    swapped: bitarray = bits_view(byteswap_numpy(b"\x01\x02\x03")[:-1])
+    assert swapped.tobytes() == b"\x02\x01"
+
+
 class TestBitsBytes:
     def test_shape(self):
         with pytest.raises(ValueError):
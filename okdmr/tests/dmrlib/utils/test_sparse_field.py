@@ -0,0 +1,39 @@
+from typing import Dict, Optional
+
+from okdmr.dmrlib.utils.sparse_field import SparseField
+
+
+class SparsePDU:
+    __slots__ = ("opcode", "_sparse")
+    address: int = SparseField(0)
+    name: str = SparseField("")
+
+    def __init__(self, opcode: int = 0, address: int = 0, name: str = ""):
+        self._sparse: Optional[Dict] = None
+        self.opcode: int = opcode
+        self.address: int = address
+        self.name: str = name
+
+
+def test_sparse_field():
+    pdu: SparsePDU = SparsePDU(opcode=1)
+    # defaults are not stored at all
+    assert pdu._sparse is None
+    assert pdu.address == 0
+    assert pdu.name == ""
+    assert isinstance(SparsePDU.address, SparseField)
+
+    pdu.address = 2308094
+    assert pdu.address == 2308094
+    assert pdu._sparse == {"address": 2308094}
+
+    # setting back to default removes the value
+    pdu.address = 0
+    assert pdu.address == 0
+    assert pdu._sparse == {}
+
+    # value equal to default, but of different type, is kept
+    pdu.address = False
+    assert pdu.address is False
+
+    assert SparsePDU(name="abc")._sparse == {"name": "abc"}